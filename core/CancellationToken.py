@@ -0,0 +1,59 @@
+
+from typing import Type
+from typing import cast
+
+from threading import Event
+from threading import Timer
+
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+
+class CancellationToken:
+    """
+    Shared between the host and a running plugin job.  The host (or a timer) cancels it
+    from any thread;  Long running plugin code checks it at natural boundaries, for
+    example once per parsed file or once per layout iteration, and stops by raising a
+    `PluginCancelledException`
+    """
+    def __init__(self):
+
+        self._cancelled:      Event                          = Event()
+        self._timer:          Timer                          = cast(Timer, None)
+        self._reason:         str                            = ''
+        self._exceptionClass: Type[PluginCancelledException] = PluginCancelledException
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def reason(self) -> str:
+        return self._reason
+
+    def cancel(self, reason: str = '', exceptionClass: Type[PluginCancelledException] = PluginCancelledException):
+        """
+        Args:
+            reason:         Optional;  Why the job was cancelled
+            exceptionClass: What `raiseIfCancelled` raises;  The first cancel wins
+        """
+        if self._cancelled.is_set() is False:
+            self._reason         = reason
+            self._exceptionClass = exceptionClass
+        self._cancelled.set()
+
+    def cancelAfter(self, seconds: float):
+        """
+        Cancel automatically if the job takes too long
+
+        Args:
+            seconds:  The time budget
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = Timer(seconds, self.cancel)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def raiseIfCancelled(self):
+        if self._cancelled.is_set() is True:
+            raise self._exceptionClass(self._reason if self._reason != '' else 'Plugin job cancelled')
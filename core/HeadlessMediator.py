@@ -0,0 +1,131 @@
+
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+from typing import cast
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from os import getcwd
+
+from core.CancellationToken import CancellationToken
+from core.IMediator import IMediator
+from core.InMemoryDiagram import InMemoryDiagram
+from core.RefreshScheduler import Bounds
+
+from core.types.PluginProgress import PluginProgress
+from core.types.PluginProgress import ProgressListener
+
+from plugins.common.Types import OglClasses
+
+if TYPE_CHECKING:
+    from miniogl.DiagramFrame import DiagramFrame
+    from ogl.OglLink import OglLink
+    from ogl.OglObject import OglObject
+
+
+class HeadlessMediator(IMediator):
+    """
+    A mediator for batch jobs, build servers and benchmarks.  Shapes go to an
+    `InMemoryDiagram` instead of a `DiagramFrame`;  There is no window, no event loop
+    and nothing is repainted;  Refresh requests are not deferred, there is no event
+    loop to defer them to.
+
+    Plugins that test for a UML frame get the diagram instead;  Plugins that show
+    dialogs or draw on the frame (e.g. the image exporter) cannot run headless.
+    Use `executeImportFiles` to import without a file dialog;  Progress is logged.
+    Errors are logged and collected in `errors` so that the caller can fail the job
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    def __init__(self, currentDirectory: str = '', diagram: InMemoryDiagram = cast(InMemoryDiagram, None)):
+        """
+
+        Args:
+            currentDirectory:   Defaults to the working directory
+            diagram:            Defaults to an empty diagram
+        """
+        self._diagram: InMemoryDiagram = InMemoryDiagram() if diagram is None else diagram
+        self._errors:  List[str]       = []
+
+        super().__init__(currentDirectory=getcwd() if currentDirectory == '' else currentDirectory, umlFrame=cast('DiagramFrame', self._diagram))
+
+    @property
+    def diagram(self) -> InMemoryDiagram:
+        return self._diagram
+
+    @property
+    def errors(self) -> List[str]:
+        """
+        Returns:  A copy of the errors the plugins reported, oldest first
+        """
+        return list(self._errors)
+
+    @property
+    def selectedOglObjects(self) -> OglClasses:
+        return OglClasses(self._diagram.selectedShapes)
+
+    def selectAllOglObjects(self):
+        self._diagram.selectAll()
+
+    def deselectAllOglObjects(self):
+        self._diagram.deselectAll()
+
+    def addShape(self, shape: Union['OglObject', 'OglLink']):
+        self._diagram.addShape(shape)
+
+    def addShapes(self, shapes: Iterable[Union['OglObject', 'OglLink']]):
+        self._diagram.addShapes(shapes)
+
+    def processPendingEvents(self):
+        """
+        There is no event loop to service
+        """
+        pass
+
+    @contextmanager
+    def busyCursor(self) -> Iterator[None]:
+        """
+        There is no cursor
+        """
+        yield
+
+    @contextmanager
+    def progressDisplay(self, title: str, cancellationToken: CancellationToken) -> Iterator[ProgressListener]:
+
+        def logProgress(progress: PluginProgress):
+            HeadlessMediator.clsLogger.debug(f'{title}: {progress.current}/{progress.total} {progress.unit.value} {progress.message}')
+
+        yield logProgress
+
+    def reportError(self, message: str, caption: str):
+        """
+        There is nobody to show a dialog to
+        """
+        HeadlessMediator.clsLogger.error(f'{caption}: {message}')
+        self._errors.append(f'{caption}: {message}')
+
+    def _refresh(self, region: Optional[Bounds] = None):
+        self._diagram.refresh()
+
+    def _dispatchRefresh(self, flush: Callable[[], None]):
+        flush()
+
+    def _paintedShapes(self) -> Optional[Iterable]:
+        """
+        Nothing is painted, so nothing is tracked
+        """
+        return None
+
+    def _freeze(self):
+        pass
+
+    def _thaw(self):
+        pass
@@ -1,23 +1,55 @@
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
 from typing import Union
+from typing import TYPE_CHECKING
 
-from miniogl.DiagramFrame import DiagramFrame
-from ogl.OglLink import OglLink
+from contextlib import contextmanager
 
-from ogl.OglObject import OglObject
+from core.CancellationToken import CancellationToken
+from core.RefreshScheduler import Bounds
+from core.RefreshScheduler import RefreshScheduler
+from core.SelectionSnapshot import SelectionSnapshot
+
+from core.types.PluginProgress import ProgressListener
 
 from plugins.common.Types import OglClasses
 
+if TYPE_CHECKING:
+    from miniogl.DiagramFrame import DiagramFrame
+    from ogl.OglLink import OglLink
+    from ogl.OglObject import OglObject
+
 
 class IMediator:
     """
     This the interface specification that allows the plugins to manipulate the Pyut UML Frame
     The Pyut application must implement this
+
+    Plugins that add or move many shapes wrap the work in `batchUpdate`;  The frame is
+    frozen and `refreshFrame` is deferred until the outermost batch ends
+
+    `refreshFrame` does not repaint at once.  The `RefreshScheduler` merges the requests
+    made before the next event loop tick and then repaints only the region where shapes
+    moved
+
+    Every plugin's progress is shown with `progressDisplay` and its errors are reported with
+    `reportError`
+
+    wx is imported only by the methods that use it, so plugins and headless hosts import
+    this module without the GUI toolkit
     """
-    def __init__(self, currentDirectory: str, umlFrame: DiagramFrame):
+    def __init__(self, currentDirectory: str, umlFrame: 'DiagramFrame'):
 
-        self._umlFrame:         DiagramFrame = umlFrame
+        self._umlFrame:         'DiagramFrame' = umlFrame
         self._currentDirectory: str          = currentDirectory
 
+        self._batchDepth:     int  = 0
+        self._refreshPending: bool = False
+
+        self._refreshScheduler: RefreshScheduler = RefreshScheduler(painter=self._refresh, dispatcher=self._dispatchRefresh, shapeProvider=self._paintedShapes)
+
     @property
     def currentDirectory(self) -> str:
         return self._currentDirectory
@@ -27,15 +59,33 @@ class IMediator:
         self._currentDirectory = theNewValue
 
     @property
-    def umlFrame(self) -> DiagramFrame:
+    def umlFrame(self) -> 'DiagramFrame':
         return self._umlFrame
 
+    @property
+    def refreshScheduler(self) -> RefreshScheduler:
+        return self._refreshScheduler
+
     @property
     def selectedOglObjects(self) -> OglClasses:
         return self._umlFrame.GetSelectedShapes()
 
+    def selectionSnapshot(self) -> SelectionSnapshot:
+        """
+        Fetch the selection once and partition it;  Plugins take one snapshot per invocation
+
+        Returns:  The current selection
+        """
+        return SelectionSnapshot(self.selectedOglObjects)
+
     def refreshFrame(self):
-        self._umlFrame.Refresh()
+        """
+        Ask for a repaint;  Requests are merged and the repaint happens on the next event loop tick
+        """
+        if self._batchDepth > 0:
+            self._refreshPending = True
+        else:
+            self._refreshScheduler.requestRefresh()
 
     def selectAllOglObjects(self):
         pass
@@ -43,7 +93,124 @@ class IMediator:
     def deselectAllOglObjects(self):
         self._umlFrame.DeselectAllShapes()
 
-    def addShape(self, shape: Union[OglObject, OglLink]):
+    def processPendingEvents(self):
+        """
+        Called while a plugin waits on long running work so that the UI stays responsive
+        """
+        from wx import Yield as wxYield
+
+        wxYield()
+
+    @contextmanager
+    def busyCursor(self) -> Iterator[None]:
+        """
+        Show the busy cursor while a plugin works on the UI thread
+        """
+        from wx import BeginBusyCursor
+        from wx import EndBusyCursor
+        from wx import Yield as wxYield
+
+        BeginBusyCursor()
+        wxYield()
+        try:
+            yield
+        finally:
+            EndBusyCursor()
+
+    def addShape(self, shape: Union['OglObject', 'OglLink']):
 
         diagram = self._umlFrame.GetDiagram()
         diagram.AddShape(shape)
+
+    def addShapes(self, shapes: Iterable[Union['OglObject', 'OglLink']]):
+        """
+        Add many shapes;  The diagram is looked up once
+
+        Args:
+            shapes:  The shapes in the order they are to be drawn
+        """
+        diagram = self._umlFrame.GetDiagram()
+        for shape in shapes:
+            diagram.AddShape(shape)
+
+    @contextmanager
+    def batchUpdate(self) -> Iterator['IMediator']:
+        """
+        Hold redraws while shapes are added or moved;  Batches nest.  The frame is refreshed
+        once when the outermost batch ends if anyone asked for a refresh during the batch
+        """
+        if self._batchDepth == 0:
+            self._freeze()
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._thaw()
+                if self._refreshPending is True:
+                    self._refreshPending = False
+                    self._refreshScheduler.requestRefresh()
+
+    @contextmanager
+    def progressDisplay(self, title: str, cancellationToken: CancellationToken) -> Iterator[ProgressListener]:
+        """
+        Show the progress of a long running plugin operation.  The default is a progress
+        dialog whose cancel button cancels the token
+
+        Args:
+            title:              What the plugin is doing
+            cancellationToken:  The plugin's token
+
+        Returns:  The progress listener that renders the progress;  It is removed when the operation ends
+        """
+        from core.PluginProgressDialog import PluginProgressDialog
+
+        dialog: PluginProgressDialog = PluginProgressDialog(title=title, cancellationToken=cancellationToken)
+        try:
+            yield dialog
+        finally:
+            dialog.destroy()
+
+    def reportError(self, message: str, caption: str):
+        """
+        Tell the user that a plugin operation failed.  The default is a modal error dialog
+
+        Args:
+            message:    What went wrong
+            caption:    The operation that failed
+        """
+        from wx import ICON_ERROR
+        from wx import OK
+        from wx import MessageDialog
+
+        booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption=caption, style=OK | ICON_ERROR)
+        booBoo.ShowModal()
+
+    def _refresh(self, region: Optional[Bounds] = None):
+        """
+        Args:
+            region:  The diagram region to repaint;  None for the whole frame
+        """
+        if region is None:
+            self._umlFrame.Refresh()
+        else:
+            from wx import Rect
+
+            left, top, right, bottom = region
+            x, y = self._umlFrame.CalcScrolledPosition(left, top)
+            self._umlFrame.RefreshRect(Rect(x, y, right - left, bottom - top))
+
+    def _dispatchRefresh(self, flush: Callable[[], None]):
+        from wx import CallAfter
+
+        CallAfter(flush)
+
+    def _paintedShapes(self) -> Optional[Iterable]:
+        return self._umlFrame.GetDiagram().GetShapes()
+
+    def _freeze(self):
+        self._umlFrame.Freeze()
+
+    def _thaw(self):
+        self._umlFrame.Thaw()
@@ -1,11 +1,34 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
 
 from abc import ABC
 from abc import abstractmethod
 
+from concurrent.futures import Future
 
+from core.CancellationToken import CancellationToken
+from core.ImportCache import ImportCache
+from core.ModelParserProcess import ModelParser
+from core.ModelParserProcess import ModelParserProcess
+from core.PluginAsyncExecutor import PluginAsyncExecutor
 from core.PluginInterface import PluginInterface
+from core.PluginPreferences import PluginPreferences
+from core.SelectionSnapshot import SelectionSnapshot
 from core.IMediator import IMediator
+from core.exceptions.ModelParserException import ModelParserException
+from core.exceptions.PluginCancelledException import PluginCancelledException
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
 from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import ReadMode
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+from plugins.common.Types import OglClasses
+from plugins.common.Types import OglLinks
 from plugins.common.Types import OglObjects
 
 
@@ -32,11 +55,73 @@ class IOPluginInterface(PluginInterface, ABC):
         `doImport`
         `doExport`
 
+    Plugins that can import files chosen by the host, instead of asking the
+    user, also implement `setImportFiles`;  The host then calls `executeImportFiles`.
+    Likewise, plugins that can export to a destination chosen by the host implement
+    `setExportDestination` and the host calls `executeExportTo`
+
+    Reverse engineering plugins can split `read` in two: a parser (`createModelParser`)
+    that builds a `ReverseEngineeredModel` and `materialize` which turns it into shapes.
+    In the `ReadMode.OUT_OF_PROCESS` read mode the parser runs on a process of the shared
+    `WorkerPool` and only `materialize` runs on the UI thread.
+
+    `executeImportAsync` and `executeExportAsync` are the non-blocking variants of the
+    execute methods.  The options are set on the calling thread;  The model parser (or
+    `write`, for plugins that set `WRITE_IN_BACKGROUND`) runs on a worker thread and
+    everything else on the UI thread.  A plugin without a model parser adds its shapes
+    as it reads, so its `read` runs on the UI thread.
+
+    Parsers that read many files consult the `ImportCache` given by `importCache` before
+    parsing each file
     """
+    READ_MODE:           ReadMode = ReadMode.IN_PROCESS
+    WRITE_IN_BACKGROUND: bool     = False     # True if `write` does not touch the UI
+
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, mediator: IMediator):
 
         super().__init__(mediator)
 
+        self._readMode:           ReadMode = self.READ_MODE
+        self._importCacheEnabled: bool     = PluginPreferences().importCacheEnabled
+
+    @property
+    def readMode(self) -> ReadMode:
+        """
+        Implementations set the class attribute `READ_MODE` for their default
+
+        Returns:  Where the plugin parses its input
+        """
+        return self._readMode
+
+    @readMode.setter
+    def readMode(self, readMode: ReadMode):
+        self._readMode = readMode
+
+    @property
+    def importCacheEnabled(self) -> bool:
+        return self._importCacheEnabled
+
+    @importCacheEnabled.setter
+    def importCacheEnabled(self, importCacheEnabled: bool):
+        self._importCacheEnabled = importCacheEnabled
+
+    def importCache(self, options: Dict[str, Any] = cast(Dict[str, Any], None)) -> Optional[ImportCache]:
+        """
+        Args:
+            options:    The import options that change what is extracted from a file
+
+        Returns:  The cache of this plugin's version for these options;  `None` if caching is disabled
+        """
+        if self._importCacheEnabled is False:
+            return None
+
+        preferences: PluginPreferences = PluginPreferences()
+
+        return ImportCache(pluginName=self.name, pluginVersion=self.version, options=options,
+                           cacheDirectory=preferences.importCacheDirectory, maximumSize=preferences.importCacheSize)
+
     def executeImport(self):
         """
         Called by Pyut to begin the import process.  Checks to see if an import format is
@@ -46,13 +131,42 @@ class IOPluginInterface(PluginInterface, ABC):
         Returns:
             None if cancelled, else a list of OglObjects
         """
-        if self.inputFormat is None:
-            self._oglObjects = None
-        else:
-            if self.setImportOptions() is True:
-                self._oglObjects = self.read()
+        self._cancellationToken = CancellationToken()
+        self._addedShapes       = []
+        with self._watchResources(), self._span('executeImport'):
+            if self.inputFormat is None:
+                self._oglObjects = None
             else:
+                with self._span('setImportOptions'):
+                    proceed: bool = self.setImportOptions()
+                if proceed is True:
+                    self._oglObjects = self._read()
+                else:
+                    self._oglObjects = None
+
+        return self._oglObjects
+
+    def executeImportFiles(self, response: MultipleFileRequestResponse):
+        """
+        Import files chosen by the host, e.g. every `.java` file in a mixed source tree,
+        in a single read without asking the user for them
+
+        Args:
+            response:   The directory and the file names relative to it
+
+        Returns:
+            None if the plugin cannot import the files, else a list of OglObjects
+        """
+        self._cancellationToken = CancellationToken()
+        self._addedShapes       = []
+        with self._watchResources(), self._span('executeImportFiles', fileCount=len(response.fileList)):
+            if self.inputFormat is None:
                 self._oglObjects = None
+            else:
+                if self.setImportFiles(response) is True:
+                    self._oglObjects = self._read()
+                else:
+                    self._oglObjects = None
 
         return self._oglObjects
 
@@ -60,25 +174,110 @@ class IOPluginInterface(PluginInterface, ABC):
         """
         Called by Pyut to begin the export process.
         """
-        if self._mediator.umlFrame is None:
-            self.displayNoUmlFrame()
-        else:
-            outputFormat: OutputFormat = self.outputFormat      # TODO this is probably not needed Pyut groups appropriately
-            if outputFormat is None:
-                pass
-            else:
-                if self.setExportOptions() is False:
-                    pass
-                else:
-                    # prefs: PyutPreferences = PyutPreferences()
-                    # if prefs.pyutIoPluginAutoSelectAll is True:       TODO:  Need plugin preferences
-                    #    mediator.selectAllShapes()
-                    oglObjects = self._mediator.selectedOglObjects
-                    if len(oglObjects) == 0:
-                        self.displayNoSelectedOglObjects()
-                    else:
-                        self.write(oglObjects)
-                        self._mediator.deselectAllOglObjects()
+        self._cancellationToken = CancellationToken()
+        with self._watchResources(), self._span('executeExport'):
+            oglObjects: Optional[OglObjects] = self._prepareExport()
+            if oglObjects is not None and self._writeUnlessCancelled(oglObjects) is True:
+                self._mediator.deselectAllOglObjects()
+
+    def executeExportTo(self, destination: str, selection: SelectionSnapshot = cast(SelectionSnapshot, None)) -> bool:
+        """
+        Export the selected objects to a destination chosen by the host, without asking
+        the user;  Suitable for batch jobs
+
+        Args:
+            destination:    See `setExportDestination`
+            selection:      Optional;  The objects to export, e.g. handed on by a `PluginPipeline`.
+            Defaults to the mediator's selection, which is cleared after the export
+
+        Returns:  True if the objects were written
+        """
+        self._cancellationToken = CancellationToken()
+        with self._watchResources(), self._span('executeExportTo', destination=destination):
+            if self.outputFormat is None or self.setExportDestination(destination) is False:
+                return False
+
+            self._selection = self._mediator.selectionSnapshot() if selection is None else selection
+            if len(self._selection) == 0:
+                self.clsLogger.warning(f'{self.name}: nothing selected to export to {destination}')
+                return False
+
+            if self._writeUnlessCancelled(self._selection.oglObjects) is False:
+                return False
+            if selection is None:
+                self._mediator.deselectAllOglObjects()
+
+        return True
+
+    def executeImportAsync(self, cancellationToken: CancellationToken = cast(CancellationToken, None)) -> Future:
+        """
+        The non-blocking variant of `executeImport`;  Call it on the UI thread.  Only plugins
+        with a model parser parse in the background;  The others read on the UI thread
+
+        Args:
+            cancellationToken:  Cancel it to stop the parse
+
+        Returns:  A job that completes with the result of the read;  `None` if the import options
+        were not set, `False` if the import was cancelled or failed
+        """
+        self._cancellationToken = CancellationToken() if cancellationToken is None else cancellationToken
+        self._addedShapes       = []
+        if self.inputFormat is None:
+            return PluginAsyncExecutor().completed(None)
+        with self._span('setImportOptions'):
+            proceed: bool = self.setImportOptions()
+        if proceed is False:
+            return PluginAsyncExecutor().completed(None)
+
+        modelParser: Optional[ModelParser] = self.createModelParser()
+        if modelParser is None:
+            return self._executeAsync(name='executeImportAsync', uiWork=lambda _: self._read(), cancelledResult=False)
+
+        parseErrors: List[ModelParserException] = []
+
+        def parseInBackground() -> Optional[ReverseEngineeredModel]:
+            try:
+                return self._parseModel(modelParser=modelParser)
+            except ModelParserException as e:
+                parseErrors.append(e)
+                return None
+
+        def materializeOnUiThread(model: Optional[ReverseEngineeredModel]) -> bool:
+            if model is None:
+                self._reportParseError(parseErrors[0])
+                return False
+            return self.materialize(model=model)
+
+        return self._executeAsync(name='executeImportAsync', backgroundWork=parseInBackground, uiWork=materializeOnUiThread, cancelledResult=False)
+
+    def executeExportAsync(self, cancellationToken: CancellationToken = cast(CancellationToken, None)) -> Future:
+        """
+        The non-blocking variant of `executeExport`;  Call it on the UI thread
+
+        Args:
+            cancellationToken:  Cancel it to stop the write
+
+        Returns:  A job that completes with `True` once the objects are written;  `None` if there
+        was nothing to export, `False` if the export was cancelled
+        """
+        self._cancellationToken = CancellationToken() if cancellationToken is None else cancellationToken
+
+        oglObjects: Optional[OglObjects] = self._prepareExport()
+        if oglObjects is None:
+            return PluginAsyncExecutor().completed(None)
+
+        def deselectOnUiThread(_) -> bool:
+            self._mediator.deselectAllOglObjects()
+            return True
+
+        if self.WRITE_IN_BACKGROUND is True:
+            return self._executeAsync(name='executeExportAsync', backgroundWork=lambda: self._write(oglObjects), uiWork=deselectOnUiThread, cancelledResult=False)
+
+        def writeOnUiThread(_) -> bool:
+            self._write(oglObjects)
+            return deselectOnUiThread(None)
+
+        return self._executeAsync(name='executeExportAsync', uiWork=writeOnUiThread, cancelledResult=False)
 
     @abstractmethod
     def setImportOptions(self) -> bool:
@@ -91,6 +290,33 @@ class IOPluginInterface(PluginInterface, ABC):
         """
         pass
 
+    def setImportFiles(self, response: MultipleFileRequestResponse) -> bool:
+        """
+        Prepare for an import of files the host already chose.  The default is to refuse;
+        Plugins that support it remember the files the same way `setImportOptions` does
+
+        Args:
+            response:   The directory and the file names relative to it
+
+        Returns:
+            if False, the import is cancelled
+        """
+        return False
+
+    def setExportDestination(self, destination: str) -> bool:
+        """
+        Prepare for an export to a destination the host already chose.  The default is to
+        refuse;  Plugins that write one file treat the destination as the file name and add
+        their extension if it has none.  Plugins that write many files treat it as a directory
+
+        Args:
+            destination:    A file or directory name
+
+        Returns:
+            if False, the export is cancelled
+        """
+        return False
+
     @abstractmethod
     def setExportOptions(self) -> bool:
         """
@@ -110,6 +336,41 @@ class IOPluginInterface(PluginInterface, ABC):
         """
         pass
 
+    def createModelParser(self) -> Optional[ModelParser]:
+        """
+        Called after the import options are set.  Plugins that support the out of process
+        read mode return a picklable callable, e.g. a `functools.partial` of a classmethod,
+        that parses the chosen files and returns a `ReverseEngineeredModel`.  The default is
+        `None`;  The plugin is then always read in process with `read`
+
+        In the in process read mode `executeImportAsync` calls the parser with the keyword
+        arguments `cancellationToken` and `progressCallback`;  Parsers check the token once
+        per file
+
+        Returns:  The parser or `None`
+        """
+        return None
+
+    def materialize(self, model: ReverseEngineeredModel) -> bool:
+        """
+        Create the Ogl shapes for a parsed model and add them to the UML frame;  Runs on the UI thread
+
+        Args:
+            model:  The model returned by the model parser
+
+        Returns:  True if the shapes were added
+        """
+        from plugins.common.OglMaterializer import OglMaterializer
+
+        with self._span('materialize', classCount=len(model.pyutClasses), linkCount=len(model.links)):
+            oglClasses, oglLinks = OglMaterializer().materialize(model=model)
+
+            with self._mediator.batchUpdate():
+                self._layoutUmlClasses(oglClasses=OglClasses(oglClasses))
+                self._layoutLinks(oglLinks=OglLinks(oglLinks))
+
+        return True
+
     @abstractmethod
     def write(self, oglObjects: OglObjects):
         """
@@ -121,3 +382,93 @@ class IOPluginInterface(PluginInterface, ABC):
 
         """
         pass
+
+    def _read(self):
+
+        if self._readMode == ReadMode.OUT_OF_PROCESS:
+            modelParser: Optional[ModelParser] = self.createModelParser()
+            if modelParser is not None:
+                return self._readOutOfProcess(modelParser=modelParser)
+
+        try:
+            with self._span('read'):
+                return self.read()
+        except PluginCancelledException:
+            self.clsLogger.info(f'{self.name}: read cancelled')
+            return False
+
+    def _prepareExport(self) -> Optional[OglObjects]:
+        """
+        Returns:  The selected objects to export or `None` if the export is cancelled
+        """
+        if self._mediator.umlFrame is None:
+            self.displayNoUmlFrame()
+            return None
+
+        outputFormat: OutputFormat = self.outputFormat      # TODO this is probably not needed Pyut groups appropriately
+        if outputFormat is None:
+            return None
+        with self._span('setExportOptions'):
+            if self.setExportOptions() is False:
+                return None
+        self._selection = self._mediator.selectionSnapshot()
+        if len(self._selection) == 0 and PluginPreferences().autoSelectAll is True:
+            self._mediator.selectAllOglObjects()
+            self._selection = self._mediator.selectionSnapshot()
+        if len(self._selection) == 0:
+            self.displayNoSelectedOglObjects()
+            return None
+
+        return self._selection.oglObjects
+
+    def _write(self, oglObjects: OglObjects):
+
+        self._countObjects(len(oglObjects))
+        with self._span('write', objectCount=len(oglObjects)):
+            self.write(oglObjects)
+
+    def _writeUnlessCancelled(self, oglObjects: OglObjects) -> bool:
+        """
+        Returns:  False if the write was cancelled
+        """
+        try:
+            self._write(oglObjects)
+        except PluginCancelledException:
+            self.clsLogger.info(f'{self.name}: write cancelled')
+            return False
+
+        return True
+
+    def _parseModel(self, modelParser: ModelParser) -> ReverseEngineeredModel:
+        """
+        Runs on a worker thread
+        """
+        with self._span('parse', readMode=self._readMode.value):
+            if self._readMode == ReadMode.OUT_OF_PROCESS:
+                return ModelParserProcess(workerPool=self._sharedWorkerPool()).parse(modelParser=modelParser, cancellationToken=self._cancellationToken)
+
+            return modelParser(cancellationToken=self._cancellationToken, progressCallback=self._reportProgress)
+
+    def _readOutOfProcess(self, modelParser: ModelParser) -> bool:
+
+        try:
+            with self._span('parse', readMode=self._readMode.value), self._trackProgress(title=f'{self.name}: Parsing') as tracker:
+
+                def whileWaiting():
+                    tracker.update(0, 'Parsing')
+                    self._mediator.processPendingEvents()
+
+                model: ReverseEngineeredModel = ModelParserProcess(workerPool=self._sharedWorkerPool()).parse(modelParser=modelParser, whileWaiting=whileWaiting,
+                                                                                                  cancellationToken=self._cancellationToken)
+            return self.materialize(model=model)
+        except PluginCancelledException:
+            self.clsLogger.info(f'{self.name}: parse cancelled')
+            return False
+        except ModelParserException as e:
+            self._reportParseError(e)
+            return False
+
+    def _reportParseError(self, e: ModelParserException):
+
+        self.clsLogger.error(f'{self.name} failed to parse: {e}')
+        self.displayImportError(f'{e}')
@@ -0,0 +1,185 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+
+from os import makedirs
+from os import remove as osRemove
+from os import replace as osReplace
+from os import scandir
+from os import utime
+from os.path import expanduser
+from os.path import join as osPathJoin
+
+from pickle import HIGHEST_PROTOCOL
+from pickle import UnpicklingError
+from pickle import dumps as pickleDumps
+from pickle import loads as pickleLoads
+
+from secrets import token_hex
+
+from zlib import compress
+from zlib import decompress
+from zlib import error as ZLibError
+
+DEFAULT_CACHE_DIRECTORY: str = osPathJoin(expanduser('~'), '.cache', 'pyutplugins', 'imports')
+DEFAULT_MAXIMUM_SIZE:    int = 64 * 1024 * 1024       # bytes
+
+MODEL_FORMAT_VERSION: int = 1        # Bump whenever the shape of the cached models changes
+
+FileParser = Callable[[], Any]
+
+CacheEntry = Tuple[str, int, float]     # path, size, last use
+
+
+class ImportCache:
+    """
+    A content addressed, on disk cache of what an input plugin extracted from each file.
+    The key is the SHA-256 of the file's content, the `MODEL_FORMAT_VERSION`, the plugin's
+    name and version and the import options;  Changing any of them misses the cache, so
+    entries never go stale, they are only evicted.
+
+    Entries are pickled and compressed.  When the cache outgrows its size cap the least
+    recently used entries are removed.
+
+    The cache is picklable, so parsers that run in a child process can use it.  Several
+    processes may share a cache directory;  Entries are written atomically
+    """
+    def __init__(self, pluginName: str, pluginVersion: str,
+                 options:        Dict[str, Any] = cast(Dict[str, Any], None),
+                 cacheDirectory: str            = DEFAULT_CACHE_DIRECTORY,
+                 maximumSize:    int            = DEFAULT_MAXIMUM_SIZE):
+        """
+
+        Args:
+            pluginName:     Part of the key
+            pluginVersion:  Part of the key;  Bump it when the extracted model changes
+            options:        Optional;  The import options, part of the key
+            cacheDirectory: Where the entries are stored
+            maximumSize:    The size cap in bytes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: str = cacheDirectory
+        self._maximumSize:    int = maximumSize
+
+        self._keyPrefix: bytes = jsonDumps([MODEL_FORMAT_VERSION, pluginName, pluginVersion, options], sort_keys=True, default=str).encode()
+        self._size:      int   = -1        # Unknown until the directory is scanned
+
+        self.hits:   int = 0
+        self.misses: int = 0
+
+    @property
+    def cacheDirectory(self) -> str:
+        return self._cacheDirectory
+
+    def fetch(self, fileName: str, fileParser: FileParser) -> Any:
+        """
+        Args:
+            fileName:   The file to look up
+            fileParser: Parses the file on a cache miss;  Its result must be picklable
+
+        Returns:  The cached or freshly parsed result
+        """
+        key:       str = self.key(fileName)
+        entryPath: str = self._entryPath(key)
+        try:
+            with open(entryPath, 'rb') as entryFile:
+                value: Any = pickleLoads(decompress(entryFile.read()))
+            utime(entryPath)
+            self.hits += 1
+            return value
+        except FileNotFoundError:
+            pass
+        except (OSError, ZLibError, UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError) as e:
+            self.logger.warning(f'Discarding unreadable cache entry for {fileName}: {e}')
+
+        self.misses += 1
+        value = fileParser()
+        self._store(key, value)
+
+        return value
+
+    def key(self, fileName: str) -> str:
+
+        fileHash = sha256(self._keyPrefix)
+        with open(fileName, 'rb') as sourceFile:
+            fileHash.update(sourceFile.read())
+
+        return fileHash.hexdigest()
+
+    def clear(self):
+
+        for entryPath, _, _ in self._entries():
+            self._remove(entryPath)
+        self._size = 0
+
+    def _store(self, key: str, value: Any):
+
+        data:          bytes = compress(pickleDumps(value, protocol=HIGHEST_PROTOCOL))
+        entryPath:     str   = self._entryPath(key)
+        temporaryPath: str   = f'{entryPath}.{token_hex(4)}.tmp'
+        try:
+            makedirs(osPathJoin(self._cacheDirectory, key[:2]), exist_ok=True)
+            with open(temporaryPath, 'wb') as entryFile:
+                entryFile.write(data)
+            osReplace(temporaryPath, entryPath)
+        except OSError as e:
+            self.logger.warning(f'Could not write cache entry {entryPath}: {e}')
+            return
+
+        if self._size < 0:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+
+        if self._size > self._maximumSize:
+            self._evict()
+
+    def _evict(self):
+        """
+        Remove the least recently used entries until the cache is below its cap
+        """
+        entries: List[CacheEntry] = sorted(self._entries(), key=lambda entry: entry[2])
+
+        self._size = sum(size for _, size, _ in entries)
+        for entryPath, size, _ in entries:
+            if self._size <= self._maximumSize:
+                break
+            self._remove(entryPath)
+            self._size -= size
+
+    def _entries(self) -> List[CacheEntry]:
+
+        entries: List[CacheEntry] = []
+        try:
+            for subDirectory in scandir(self._cacheDirectory):
+                if subDirectory.is_dir() is False:
+                    continue
+                for entry in scandir(subDirectory.path):
+                    if entry.name.endswith('.tmp') is False:
+                        entryStat = entry.stat()
+                        entries.append((entry.path, entryStat.st_size, entryStat.st_mtime))
+        except FileNotFoundError:
+            pass        # Another process cleared the cache
+
+        return entries
+
+    def _entryPath(self, key: str) -> str:
+        return osPathJoin(self._cacheDirectory, key[:2], key)
+
+    def _remove(self, entryPath: str):
+        try:
+            osRemove(entryPath)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,97 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Type
+from typing import Union
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ogl.OglLink import OglLink
+    from ogl.OglObject import OglObject
+
+Shape  = Union['OglObject', 'OglLink']
+Shapes = List[Shape]
+
+ShapeIndex = Dict[int, Shape]   # id(shape) -> shape, in the order the shapes were added or selected
+
+
+class InMemoryDiagram:
+    """
+    The diagram behind the `HeadlessMediator`.  It keeps the shapes in the order they
+    were added and tracks which of them are selected;  Nothing is drawn.  Shapes are
+    indexed by identity so that membership tests do not scan large diagrams
+    """
+    def __init__(self):
+
+        self._shapes:       ShapeIndex = {}
+        self._selected:     ShapeIndex = {}
+        self._refreshCount: int        = 0
+
+    @property
+    def shapes(self) -> Shapes:
+        """
+        Returns:  A copy of the shapes in the order they were added
+        """
+        return list(self._shapes.values())
+
+    @property
+    def selectedShapes(self) -> Shapes:
+        return list(self._selected.values())
+
+    @property
+    def refreshCount(self) -> int:
+        """
+        Returns:  How often a plugin asked for a repaint
+        """
+        return self._refreshCount
+
+    def addShape(self, shape: Shape):
+        self._shapes[id(shape)] = shape
+
+    def addShapes(self, shapes: Iterable[Shape]):
+        self._shapes.update((id(shape), shape) for shape in shapes)
+
+    def removeShape(self, shape: Shape):
+        """
+        Raises:  ValueError if the shape is not in this diagram
+        """
+        if self._shapes.pop(id(shape), None) is None:
+            raise ValueError(f'{shape} is not in the diagram')
+        self._selected.pop(id(shape), None)
+
+    def shapesOfType(self, shapeType: Type) -> Shapes:
+        """
+        Args:
+            shapeType:  An Ogl class, e.g. `OglClass` or `OglLink`
+
+        Returns:  The shapes that are instances of the type
+        """
+        return [shape for shape in self._shapes.values() if isinstance(shape, shapeType)]
+
+    def select(self, shapes: Iterable[Shape]):
+        """
+        Add shapes of this diagram to the selection
+        """
+        for shape in shapes:
+            if id(shape) in self._shapes:
+                self._selected.setdefault(id(shape), shape)
+
+    def selectAll(self):
+        self._selected = dict(self._shapes)
+
+    def deselectAll(self):
+        self._selected = {}
+
+    def refresh(self):
+        self._refreshCount += 1
+
+    def clear(self):
+        self._shapes   = {}
+        self._selected = {}
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __contains__(self, shape: Shape) -> bool:
+        return id(shape) in self._shapes
@@ -0,0 +1,32 @@
+
+from typing import TextIO
+
+from dataclasses import asdict
+
+from json import dumps as jsonDumps
+
+from threading import Lock
+
+from core.SpanSink import SpanSink
+from core.types.PluginSpan import PluginSpan
+
+
+class JsonLinesSpanSink(SpanSink):
+    """
+    Appends one JSON object per span to a file
+    """
+    def __init__(self, fileName: str):
+
+        self._lock: Lock   = Lock()
+        self._file: TextIO = open(fileName, 'a')
+
+    def export(self, span: PluginSpan):
+
+        line: str = jsonDumps({**asdict(span), 'duration': span.duration}, default=str)
+        with self._lock:
+            self._file.write(f'{line}\n')
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
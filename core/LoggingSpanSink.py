@@ -0,0 +1,23 @@
+
+from logging import INFO
+from logging import Logger
+from logging import getLogger
+
+from core.SpanSink import SpanSink
+from core.types.PluginSpan import PluginSpan
+
+
+class LoggingSpanSink(SpanSink):
+    """
+    Logs one line per span
+    """
+    def __init__(self, logger: Logger = getLogger(__name__), level: int = INFO):
+
+        self._logger: Logger = logger
+        self._level:  int    = level
+
+    def export(self, span: PluginSpan):
+
+        if self._logger.isEnabledFor(self._level):
+            status: str = '' if span.error == '' else f' FAILED: {span.error}'
+            self._logger.log(self._level, f'{span.name} {span.duration * 1000:.3f} ms {span.attributes}{status}')
@@ -0,0 +1,128 @@
+
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from core.CancellationToken import CancellationToken
+from core.WorkerPool import WorkerPool
+from core.exceptions.ModelParserException import ModelParserException
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+ModelParser    = Callable[..., Any]     # Must be picklable, e.g. a functools.partial of a module level function or classmethod
+WaitingHandler = Callable[[], None]
+
+
+def _runModelParser(modelParser: ModelParser, connection: Connection):
+    """
+    The child process entry point;  Exceptions may not be picklable, so failures are
+    sent back as text
+    """
+    try:
+        connection.send((True, modelParser()))
+    except BaseException as e:
+        connection.send((False, f'{type(e).__name__}: {e}'))
+    finally:
+        connection.close()
+
+
+class ModelParserProcess:
+    """
+    Runs the parsing half of an import in a child process and returns the model it
+    produces.  The parser must be picklable and must not touch the UI;  Its result must
+    be picklable too.
+
+    Child processes are spawned, never forked;  Forking a process that runs a wx main loop
+    is unsafe.  A parser that crashes or is killed (for example by running out of memory)
+    only takes the child process down;  The caller gets a `ModelParserException`.  A cancelled
+    parse terminates the child process.
+
+    Given a `WorkerPool` the parser runs on one of its warmed up worker processes instead
+    of a new child process;  The pool is shared, so a cancelled parse only cancels its own
+    job.  If the job already started it finishes in the background and its result is dropped
+    """
+    DEFAULT_POLL_INTERVAL: float = 0.1     # seconds
+
+    def __init__(self, pollInterval: float = DEFAULT_POLL_INTERVAL, workerPool: Optional[WorkerPool] = None):
+        """
+
+        Args:
+            pollInterval:   How often the child process is checked, in seconds
+            workerPool:     Optional;  Run the parser on this pool's worker processes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._pollInterval: float                = pollInterval
+        self._workerPool:   Optional[WorkerPool] = workerPool
+
+    def parse(self, modelParser: ModelParser,
+              whileWaiting:      WaitingHandler    = cast(WaitingHandler, None),
+              cancellationToken: CancellationToken = cast(CancellationToken, None)) -> Any:
+        """
+        Args:
+            modelParser:        The parser to run in the child process
+            whileWaiting:       Called on the calling thread every poll interval until the parser is done;
+                                Use it to keep the UI responsive, e.g. `wx.Yield`
+            cancellationToken:  Checked every poll interval;  A `PluginCancelledException` is raised
+                                once it is cancelled
+
+        Returns:  The parser's result
+        """
+        if self._workerPool is not None:
+            return self._parseInWorkerPool(workerPool=self._workerPool, modelParser=modelParser, whileWaiting=whileWaiting, cancellationToken=cancellationToken)
+
+        context = get_context('spawn')
+
+        parentConnection, childConnection = context.Pipe(duplex=False)
+        process = context.Process(target=_runModelParser, args=(modelParser, childConnection), name='ModelParser', daemon=True)
+        process.start()
+        childConnection.close()
+        try:
+            while parentConnection.poll(self._pollInterval) is False:
+                if process.is_alive() is False and parentConnection.poll() is False:
+                    self.logger.error(f'Model parser process died with exit code {process.exitcode}')
+                    raise ModelParserException(f'Model parser process died with exit code {process.exitcode}')
+                if cancellationToken is not None:
+                    cancellationToken.raiseIfCancelled()
+                if whileWaiting is not None:
+                    whileWaiting()
+            try:
+                succeeded, payload = parentConnection.recv()
+            except EOFError:
+                raise ModelParserException('Model parser process died before sending its result')
+        finally:
+            if process.is_alive() is True:
+                process.terminate()
+            process.join()
+            parentConnection.close()
+
+        if succeeded is False:
+            self.logger.error(f'Model parser failed: {payload}')
+            raise ModelParserException(payload)
+
+        return payload
+
+    def _parseInWorkerPool(self, workerPool: WorkerPool, modelParser: ModelParser, whileWaiting: WaitingHandler, cancellationToken: CancellationToken) -> Any:
+
+        job: Future = workerPool.submitToProcess(modelParser)
+        try:
+            return workerPool.waitFor(job=job, cancellationToken=cancellationToken, whileWaiting=whileWaiting)
+        except PluginCancelledException:
+            if job.cancel() is False:
+                self.logger.info('The cancelled parse already started;  It finishes in the background')
+            raise
+        except BrokenProcessPool as e:
+            self.logger.error(f'Model parser worker process died: {e}')
+            raise ModelParserException(f'Model parser worker process died: {e}')
+        except Exception as e:
+            self.logger.error(f'Model parser failed: {e}')
+            raise ModelParserException(f'{type(e).__name__}: {e}')
@@ -0,0 +1,87 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import TextIO
+
+from json import dumps as jsonDumps
+
+from threading import Lock
+
+from core.SpanSink import SpanSink
+from core.types.PluginSpan import PluginSpan
+
+DEFAULT_SERVICE_NAME: str = 'pyutplugins'
+
+STATUS_CODE_OK:    int = 1
+STATUS_CODE_ERROR: int = 2
+
+SPAN_KIND_INTERNAL: int = 1
+
+
+class OtlpJsonSpanSink(SpanSink):
+    """
+    Writes spans in the OTLP/JSON trace format, one export request per line, the layout
+    the OpenTelemetry collector file exporter writes and its `otlpjsonfile` receiver reads.
+    No OpenTelemetry package is needed
+    """
+    SCOPE_NAME: str = 'core.PluginTracer'
+
+    def __init__(self, fileName: str, serviceName: str = DEFAULT_SERVICE_NAME):
+
+        self._serviceName: str    = serviceName
+        self._lock:        Lock   = Lock()
+        self._file:        TextIO = open(fileName, 'a')
+
+    def export(self, span: PluginSpan):
+
+        line: str = jsonDumps(self.toExportRequest(span))
+        with self._lock:
+            self._file.write(f'{line}\n')
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def toExportRequest(self, span: PluginSpan) -> Dict[str, Any]:
+        """
+        Returns:  An OTLP `ExportTraceServiceRequest` with the single span
+        """
+        otlpSpan: Dict[str, Any] = {
+            'traceId':           span.traceId,
+            'spanId':            span.spanId,
+            'name':              span.name,
+            'kind':              SPAN_KIND_INTERNAL,
+            'startTimeUnixNano': str(span.startTime),
+            'endTimeUnixNano':   str(span.endTime),
+            'attributes':        self._toAttributes(span.attributes),
+            'status':            {'code': STATUS_CODE_OK} if span.error == '' else {'code': STATUS_CODE_ERROR, 'message': span.error},
+        }
+        if span.parentSpanId != '':
+            otlpSpan['parentSpanId'] = span.parentSpanId
+
+        return {
+            'resourceSpans': [
+                {
+                    'resource':   {'attributes': self._toAttributes({'service.name': self._serviceName})},
+                    'scopeSpans': [{'scope': {'name': OtlpJsonSpanSink.SCOPE_NAME}, 'spans': [otlpSpan]}],
+                }
+            ]
+        }
+
+    def _toAttributes(self, attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+
+        otlpAttributes: List[Dict[str, Any]] = []
+        for key, value in attributes.items():
+            if isinstance(value, bool):
+                otlpValue: Dict[str, Any] = {'boolValue': value}
+            elif isinstance(value, int):
+                otlpValue = {'intValue': str(value)}
+            elif isinstance(value, float):
+                otlpValue = {'doubleValue': value}
+            else:
+                otlpValue = {'stringValue': str(value)}
+            otlpAttributes.append({'key': key, 'value': otlpValue})
+
+        return otlpAttributes
@@ -0,0 +1,134 @@
+
+from typing import Any
+from typing import Callable
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import Future as AsyncioFuture
+from asyncio import wrap_future
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from core.PluginPreferences import PluginPreferences
+from core.Singleton import Singleton
+
+BackgroundWork = Callable[[], Any]
+UiWork         = Callable[[Any], Any]
+UiDispatcher   = Callable[[Callable[[], None]], None]
+
+
+class PluginAsyncExecutor(Singleton):
+    """
+    Runs the non-blocking plugin entry points.  Work that does not touch the UI runs on
+    a small thread pool;  Work that does is handed to the UI thread with the UI dispatcher,
+    `wx.CallAfter` by default.  Hosts without a wx main loop (tests, scripts) replace the
+    dispatcher, e.g. with one that calls the work immediately.
+
+    Every job is a `concurrent.futures.Future`;  Use `awaitable` to await one from an
+    asyncio event loop
+    """
+    def init(self, maxWorkers: int = cast(int, None)):
+        """
+
+        Args:
+            maxWorkers: The size of the thread pool;  Defaults to `PluginPreferences.asyncWorkers`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if maxWorkers is None:
+            maxWorkers = PluginPreferences().asyncWorkers
+
+        self._executor:     ThreadPoolExecutor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='PluginJob')
+        self._uiDispatcher: UiDispatcher       = cast(UiDispatcher, None)
+
+    @property
+    def uiDispatcher(self) -> UiDispatcher:
+        """
+        wx is imported the first time the default dispatcher is needed
+        """
+        if self._uiDispatcher is None:
+            from wx import CallAfter
+
+            self._uiDispatcher = CallAfter
+
+        return self._uiDispatcher
+
+    @uiDispatcher.setter
+    def uiDispatcher(self, uiDispatcher: UiDispatcher):
+        self._uiDispatcher = uiDispatcher
+
+    def submit(self, backgroundWork: BackgroundWork, uiWork: UiWork = cast(UiWork, None)) -> Future:
+        """
+        Args:
+            backgroundWork: Runs on a worker thread
+            uiWork:         Optional;  Runs on the UI thread with the result of the background work
+
+        Returns:  Completes with the result of the UI work, or of the background work if there is no UI work
+        """
+        future: Future = Future()
+
+        def runInBackground():
+            if future.set_running_or_notify_cancel() is False:
+                return
+            try:
+                result: Any = backgroundWork()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            if uiWork is None:
+                future.set_result(result)
+            else:
+                self.uiDispatcher(lambda: self._complete(future, uiWork, result))
+
+        self._executor.submit(runInBackground)
+
+        return future
+
+    def callOnUiThread(self, uiWork: Callable[[], Any]) -> Future:
+        """
+        Args:
+            uiWork: Runs on the UI thread
+
+        Returns:  Completes with the result of the UI work
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+
+        self.uiDispatcher(lambda: self._complete(future, lambda _: uiWork(), None))
+
+        return future
+
+    def completed(self, result: Any = None) -> Future:
+        """
+        Returns:  An already completed job;  Used when a plugin is cancelled before any work starts
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        future.set_result(result)
+
+        return future
+
+    def awaitable(self, future: Future) -> AsyncioFuture:
+        """
+        Must be called from a coroutine or a callback of the running event loop
+
+        Args:
+            future: A plugin job
+
+        Returns:  An asyncio future for the job
+        """
+        return wrap_future(future)
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _complete(self, future: Future, uiWork: UiWork, result: Any):
+
+        try:
+            future.set_result(uiWork(result))
+        except BaseException as e:
+            self.logger.error(f'Plugin UI work failed: {e}')
+            future.set_exception(e)
@@ -0,0 +1,228 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from json import dumps as jsonDumps
+
+from os import makedirs
+from os import walk as osWalk
+from os.path import basename
+from os.path import join as osPathJoin
+from os.path import normpath
+
+from time import perf_counter
+
+from concurrent.futures import ProcessPoolExecutor
+
+from multiprocessing import get_context
+
+from click import Path as ClickPath
+from click import argument
+from click import command
+from click import echo
+from click import option
+from click import version_option
+
+from core.HeadlessMediator import HeadlessMediator
+from core.PluginManager import PluginManager
+from core.PluginPipeline import PluginPipeline
+from core.PluginPreferences import PluginPreferences
+from core.exceptions.BatchJobException import BatchJobException
+from core.types.BatchJob import BatchJob
+from core.types.BatchJobResult import BatchJobResult
+from core.types.PipelineResult import PipelineResult
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginList
+from core.types.PluginDataTypes import PluginName
+
+__version__ = "0.1.0"
+
+EXIT_SUCCESS: int = 0
+EXIT_FAILURE: int = 1
+
+
+class PluginBatch:
+    """
+    Runs batch jobs without a UI:  Each job imports every file of a directory tree that
+    an input plugin reads, runs tools over the resulting diagram and exports it.  Jobs
+    run in worker processes when there is more than one worker.
+
+    Ogl shapes still need a wx application object;  Each process creates one, but never
+    shows a window or runs the main loop.  wx cannot create one without a display, so a
+    job fails with a `BatchJobException` instead;  Run under a virtual display, e.g. Xvfb,
+    on a headless host.  Only tools and exporters that do not ask the user for options
+    can run in a batch
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    _app: Any = None
+
+    def __init__(self, workers: int = 1):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._workers: int = workers
+
+    def run(self, jobs: List[BatchJob]) -> List[BatchJobResult]:
+        """
+        Args:
+            jobs:   The jobs to run
+
+        Returns:  The job results in the order of the jobs
+        """
+        if self._workers <= 1 or len(jobs) <= 1:
+            return [PluginBatch.runJob(job) for job in jobs]
+
+        # Spawn, never fork, a process that imported wx
+        with ProcessPoolExecutor(max_workers=self._workers, mp_context=get_context('spawn')) as executor:
+            return list(executor.map(PluginBatch.runJob, jobs))
+
+    @classmethod
+    def runJob(cls, job: BatchJob) -> BatchJobResult:
+        """
+        Runs in the calling process;  Failures are reported in the result
+
+        Args:
+            job:    The job to run
+
+        Returns:  The job result
+        """
+        result:    BatchJobResult = BatchJobResult(directoryName=job.directoryName)
+        startTime: float          = perf_counter()
+        try:
+            cls._runSteps(job=job, result=result)
+            result.succeeded = True
+        except Exception as e:      # A failed job must not stop the batch
+            cls.clsLogger.error(f'{job.directoryName}: {e}')
+            result.error = f'{type(e).__name__}: {e}'
+
+        result.timings['total'] = perf_counter() - startTime
+
+        return result
+
+    @classmethod
+    def summary(cls, results: List[BatchJobResult], wallTime: float) -> Dict[str, Any]:
+        """
+        Returns:  A JSON serializable summary of a batch run
+        """
+        return {
+            'wallTime': wallTime,
+            'jobCount': len(results),
+            'failures': len([result for result in results if result.succeeded is False]),
+            'jobs': [
+                {
+                    'directoryName': result.directoryName,
+                    'succeeded':     result.succeeded,
+                    'error':         result.error,
+                    'fileCount':     result.fileCount,
+                    'shapeCount':    result.shapeCount,
+                    'timings':       result.timings,
+                }
+                for result in results
+            ]
+        }
+
+    @classmethod
+    def collectFiles(cls, directoryName: str) -> List[str]:
+        """
+        Returns:  Every file in the directory tree, in a stable order
+        """
+        fileNames: List[str] = []
+        for dirPath, dirNames, files in osWalk(directoryName):
+            dirNames.sort()
+            fileNames.extend(osPathJoin(dirPath, fileName) for fileName in sorted(files))
+
+        return fileNames
+
+    @classmethod
+    def _runSteps(cls, job: BatchJob, result: BatchJobResult):
+
+        cls._createApp()
+
+        pluginManager: PluginManager    = PluginManager()
+        mediator:      HeadlessMediator = HeadlessMediator(currentDirectory=job.directoryName)
+
+        fileNames: List[str] = cls.collectFiles(job.directoryName)
+        result.fileCount = len(fileNames)
+
+        pipeline: PluginPipeline = PluginPipeline(mediator=mediator, pluginManager=pluginManager).importFiles(fileNames)
+        for toolName in job.toolNames:
+            pipeline.tool(toolName)
+
+        if job.exportExtension != '':
+            exporters: PluginList = pluginManager.outputPluginsByExtension(job.exportExtension)
+            if len(exporters) == 0:
+                raise BatchJobException(f'No output plugin writes .{job.exportExtension.lstrip(".")} files')
+            makedirs(job.outputDirectory, exist_ok=True)
+            pipeline.export(exporters[0], destination=osPathJoin(job.outputDirectory, basename(normpath(job.directoryName))))
+
+        pipelineResult: PipelineResult = pipeline.run()
+        result.timings.update({stageName: duration for stageName, duration in pipelineResult.timings.items() if stageName != 'total'})
+        if pipelineResult.succeeded is False:
+            raise BatchJobException(pipelineResult.error)
+        if len(mediator.errors) > 0:
+            raise BatchJobException('  '.join(mediator.errors))
+
+        result.shapeCount = len(mediator.diagram)
+
+    @classmethod
+    def _createApp(cls):
+        """
+        Ogl needs an application object;  It is never shown nor run
+
+        Raises:  BatchJobException when there is no display;  wx would abort the process
+        """
+        if cls._app is None:
+            from wx import App
+
+            if App.IsDisplayAvailable() is False:
+                raise BatchJobException('No display is available for the wx application object that Ogl needs;  Run the batch under a virtual display, e.g. xvfb-run')
+
+            cls._app = App(redirect=False)
+
+
+@command()
+@version_option(version=f'{__version__}', message='%(version)s')
+@argument('directories', nargs=-1, required=True, type=ClickPath(exists=True, file_okay=False))
+@option('-t', '--tool',    'toolNames',       multiple=True, help='The name of a tool plugin to run, e.g. "Sugiyama Automatic Layout";  Repeat for more tools')
+@option('-e', '--export',  'exportExtension', default='',    help='The extension of the output plugin to export with, e.g. gml')
+@option('-o', '--output',  'outputDirectory', default='.',   type=ClickPath(file_okay=False), help='Where the exports are written')
+@option('-w', '--workers', 'workers',         default=None,  type=int, help='The number of worker processes;  Defaults to the batchWorkers preference')
+@option('-s', '--summary', 'summaryFileName', default=None,  type=ClickPath(dir_okay=False), help='Write the JSON timing summary to this file instead of standard output')
+def commandHandler(directories: List[str], toolNames: List[str], exportExtension: str, outputDirectory: str, workers: int, summaryFileName: str):
+    """
+    Reverse engineer each DIRECTORIES tree into a diagram, run the tools over it and export it.
+    Exits with a non-zero status if any job fails
+    """
+    jobs: List[BatchJob] = [
+        BatchJob(directoryName=directoryName,
+                 toolNames=[PluginName(toolName) for toolName in toolNames],
+                 exportExtension=PluginExtension(exportExtension),
+                 outputDirectory=outputDirectory)
+        for directoryName in directories
+    ]
+    if workers is None:
+        workers = PluginPreferences().batchWorkers
+
+    startTime: float                = perf_counter()
+    results:   List[BatchJobResult] = PluginBatch(workers=workers).run(jobs)
+
+    summary: str = jsonDumps(PluginBatch.summary(results=results, wallTime=perf_counter() - startTime), indent=4)
+    if summaryFileName is None:
+        echo(summary)
+    else:
+        with open(summaryFileName, 'w') as summaryFile:
+            summaryFile.write(summary)
+
+    failed: bool = any(result.succeeded is False for result in results)
+
+    raise SystemExit(EXIT_FAILURE if failed is True else EXIT_SUCCESS)
+
+
+if __name__ == "__main__":
+
+    commandHandler()
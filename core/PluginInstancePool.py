@@ -0,0 +1,126 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from threading import Lock
+
+from core.IMediator import IMediator
+from core.types.PluginDataTypes import PluginType
+
+IdleInstances       = NewType('IdleInstances',       Dict[type, List[Any]])           # plugin class -> instances not in use
+CheckedOutInstance  = Tuple[type, Any]                                                # plugin class, plugin instance
+CheckedOutInstances = NewType('CheckedOutInstances', Dict[int, CheckedOutInstance])   # id(plugin instance) -> checked out instance
+
+
+class PluginInstancePool:
+    """
+    Keeps plugin instances between invocations so that expensive, reusable plugin resources
+    (compiled regular expressions, parser objects) survive.
+
+    An instance is checked out by `acquire` and checked back in by `release`;  While it is
+    checked out no other caller gets it, so overlapping runs of the same plugin, e.g. async
+    imports or pipeline exports, each run on an instance of their own.  Before an idle instance
+    is handed out again it is bound to the caller's mediator and its `reset()` hook is called
+    to clear the state of the previous invocation.  The pool holds on to the instances it
+    handed out, so an instance's id cannot be reused while it is checked out
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._idle:       IdleInstances       = IdleInstances({})
+        self._checkedOut: CheckedOutInstances = CheckedOutInstances({})
+        self._lock:       Lock                = Lock()
+
+    def acquire(self, pluginClass: PluginType, mediator: IMediator):
+        """
+        Args:
+            pluginClass:    The plugin (or plugin proxy) class
+            mediator:       The mediator for this invocation
+
+        Returns:  A plugin instance that is ready to execute;  Give it back with `release`
+        """
+        pluginType: type = cast(type, pluginClass)
+        with self._lock:
+            idleInstances: List[Any] = self._idle.get(pluginType, [])
+            instance:      Any       = idleInstances.pop() if len(idleInstances) > 0 else None
+            if instance is None:
+                instance = pluginType(mediator)
+                self._checkedOut[id(instance)] = (pluginType, instance)
+                return instance
+            self._checkedOut[id(instance)] = (pluginType, instance)
+
+        instance.mediator = mediator
+        instance.reset()
+
+        return instance
+
+    def release(self, instance: Any):
+        """
+        Check an instance back in once its invocation is over;  Instances that were not
+        handed out by `acquire`, or whose class was discarded, are dropped
+
+        Args:
+            instance:   A plugin instance from `acquire`
+        """
+        with self._lock:
+            checkedOut: Optional[CheckedOutInstance] = self._checkedOut.get(id(instance))
+            if checkedOut is None or checkedOut[1] is not instance:
+                return
+            del self._checkedOut[id(instance)]
+            self._idle.setdefault(checkedOut[0], []).append(instance)
+
+    @contextmanager
+    def checkedOut(self, pluginClass: PluginType, mediator: IMediator) -> Iterator[Any]:
+        """
+        `acquire` and `release` around a synchronous invocation, e.g.
+
+            with pool.checkedOut(pluginClass, mediator) as plugin:
+                plugin.executeTool()
+        """
+        instance: Any = self.acquire(pluginClass=pluginClass, mediator=mediator)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def isPooled(self, pluginClass: PluginType) -> bool:
+        """
+        Returns:  `True` if an idle instance is waiting to be reused
+        """
+        with self._lock:
+            return len(self._idle.get(cast(type, pluginClass), [])) > 0
+
+    def discard(self, pluginClass: PluginType):
+        """
+        Drop the pooled instances, e.g. after one failed and may be in a bad state;  The
+        instances that are checked out are dropped when they are released
+        """
+        pluginType: type = cast(type, pluginClass)
+        with self._lock:
+            self._idle.pop(pluginType, None)
+            for instanceId in [instanceId for instanceId, (checkedOutType, _) in self._checkedOut.items() if checkedOutType is pluginType]:
+                del self._checkedOut[instanceId]
+
+    def clear(self):
+        with self._lock:
+            self._idle       = IdleInstances({})
+            self._checkedOut = CheckedOutInstances({})
+
+    def __len__(self) -> int:
+        """
+        Returns:  The number of idle and checked out instances
+        """
+        with self._lock:
+            return sum(len(idleInstances) for idleInstances in self._idle.values()) + len(self._checkedOut)
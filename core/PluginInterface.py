@@ -1,24 +1,30 @@
 
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import cast
 
-from wx import DD_NEW_DIR_BUTTON
-from wx import FD_OPEN
-from wx import FD_MULTIPLE
-from wx import FD_CHANGE_DIR
-from wx import FD_FILE_MUST_EXIST
-from wx import FD_OVERWRITE_PROMPT
-from wx import FD_SAVE
-from wx import ICON_ERROR
-from wx import ID_CANCEL
-from wx import OK
-
-from wx import DirDialog
-from wx import FileDialog
-from wx import FileSelector
-from wx import MessageDialog
-from wx import Yield as wxYield
+from logging import Logger
+from logging import getLogger
 
+from contextlib import ExitStack
+from contextlib import contextmanager
+
+from concurrent.futures import Future
+
+from core.CancellationToken import CancellationToken
 from core.IMediator import IMediator
+from core.PluginAsyncExecutor import PluginAsyncExecutor
+from core.PluginPreferences import PluginPreferences
+from core.PluginTracer import PluginTracer
+from core.PluginWatchdog import PluginWatchdog
+from core.ProgressTracker import ProgressTracker
+from core.SelectionSnapshot import SelectionSnapshot
+from core.WorkerPool import WorkerInitializers
+from core.WorkerPool import WorkerPool
+from core.exceptions.PluginCancelledException import PluginCancelledException
 
 from core.types.InputFormat import InputFormat
 from core.types.OutputFormat import OutputFormat
@@ -30,6 +36,12 @@ from core.types.PluginDataTypes import PluginDescription
 from core.types.PluginDataTypes import PluginExtension
 from core.types.PluginDataTypes import FormatName
 from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ProgressUnit
+from core.types.PluginProgress import PluginProgress
+from core.types.PluginProgress import ProgressListener
+from core.types.PluginSpan import PluginSpan
+from core.types.ResourceLimits import ResourceLimits
+from core.types.ResourceViolation import ResourceViolation
 from core.types.SingleFileRequestResponse import SingleFileRequestResponse
 from plugins.common.Types import OglClasses
 from plugins.common.Types import OglLinks
@@ -44,10 +56,21 @@ class PluginInterface:
     This is meant to provide base properties and methods for the Input/Output
     plugins and the Tool Plugins
 
-    Implementations set the protected variables at class construction
-
     There should be no implementations of this interface
+
+    Implementations declare their metadata as class attributes so that the plugin
+    manager can read it without constructing the plugin.  A format that is not
+    supported is declared as `None`.  Plugins that run work on the shared worker
+    processes list what each worker should import or call first in `WORKER_INITIALIZERS`
     """
+    PLUGIN_NAME:         PluginName         = PluginName('Implementor must provide the plugin name')
+    PLUGIN_AUTHOR:       str                = 'Implementor must provide the plugin author'
+    PLUGIN_VERSION:      str                = 'Implementor must provide the version'
+    INPUT_FORMAT:        InputFormat        = InputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
+    OUTPUT_FORMAT:       OutputFormat       = OutputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
+    WORKER_INITIALIZERS: WorkerInitializers = ()
+
+    clsLogger: Logger = getLogger(__name__)
 
     def __init__(self, mediator: IMediator):
         """
@@ -57,17 +80,90 @@ class PluginInterface:
         """
         self._mediator: IMediator = mediator
         #
-        # To be set by implementor constructor and read by property
-        self._name:         PluginName = PluginName('Implementor must provide the plugin name')
-        self._author:       str = 'Implementor must provide the plugin author'
-        self._version:      str = 'Implementor must provide the version'
-        self._inputFormat:  InputFormat  = InputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
-        self._outputFormat: OutputFormat = OutputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
+        # Initialized from the class metadata and read by property
+        self._name:         PluginName   = self.PLUGIN_NAME
+        self._author:       str          = self.PLUGIN_AUTHOR
+        self._version:      str          = self.PLUGIN_VERSION
+        self._inputFormat:  InputFormat  = self.INPUT_FORMAT
+        self._outputFormat: OutputFormat = self.OUTPUT_FORMAT
+
+        self._cancellationToken: CancellationToken      = CancellationToken()
+        self._progressListeners: List[ProgressListener] = []
+        self._selection:         SelectionSnapshot      = cast(SelectionSnapshot, None)
+        self._progressTracker:   ProgressTracker        = cast(ProgressTracker, None)
+        self._addedShapes:       List[Any]              = []
+
+        preferences: PluginPreferences = PluginPreferences()
+
+        self._resourceLimits:    ResourceLimits    = ResourceLimits(wallTime=preferences.wallTimeLimit, peakMemory=preferences.memoryLimit,
+                                                                    maximumObjects=preferences.objectLimit)
+        self._watchdog:          PluginWatchdog    = cast(PluginWatchdog, None)
+        self._resourceViolation: ResourceViolation = cast(ResourceViolation, None)
+
+    @property
+    def mediator(self) -> IMediator:
+        return self._mediator
+
+    @mediator.setter
+    def mediator(self, mediator: IMediator):
+        """
+        Pooled plugin instances are re-bound to the mediator of each invocation
+        """
+        self._mediator = mediator
+
+    @property
+    def cancellationToken(self) -> CancellationToken:
+        """
+        Long running plugin code checks this token;  The execute methods replace it for each
+        invocation
+        """
+        return self._cancellationToken
+
+    @cancellationToken.setter
+    def cancellationToken(self, cancellationToken: CancellationToken):
+        self._cancellationToken = cancellationToken
+
+    @property
+    def resourceLimits(self) -> ResourceLimits:
+        """
+        The budget of each invocation;  Defaults to the limits in the `PluginPreferences`
+        """
+        return self._resourceLimits
+
+    @resourceLimits.setter
+    def resourceLimits(self, resourceLimits: ResourceLimits):
+        self._resourceLimits = resourceLimits
+
+    @property
+    def resourceViolation(self) -> Optional[ResourceViolation]:
+        """
+        Returns:  The limit the last invocation exceeded and the phase it was in;  `None` if it stayed within its limits
+        """
+        return self._resourceViolation
+
+    @property
+    def selection(self) -> SelectionSnapshot:
+        """
+        The execute methods take a snapshot of the selection when the plugin is invoked;
+        Outside an invocation a fresh snapshot is taken
+
+        Returns:  The selection, partitioned and indexed
+        """
+        if self._selection is None:
+            return self._mediator.selectionSnapshot()
+        return self._selection
+
+    @property
+    def addedShapes(self) -> List[Any]:
+        """
+        Returns:  A copy of the shapes the last import added to the diagram, in the order they were added
+        """
+        return list(self._addedShapes)
 
     @property
     def name(self) -> PluginName:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute `PLUGIN_NAME`
 
         Returns:  The plugin name
         """
@@ -76,7 +172,7 @@ class PluginInterface:
     @property
     def author(self) -> str:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute `PLUGIN_AUTHOR`
 
         Returns:  The author's name
         """
@@ -85,7 +181,7 @@ class PluginInterface:
     @property
     def version(self) -> str:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute `PLUGIN_VERSION`
 
         Returns: The plugin version string
         """
@@ -94,7 +190,7 @@ class PluginInterface:
     @property
     def inputFormat(self) -> InputFormat:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute `INPUT_FORMAT`
 
         Returns: The input format type; Plugins should return `None` if they do
         not support input operations
@@ -104,22 +200,57 @@ class PluginInterface:
     @property
     def outputFormat(self) -> OutputFormat:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute `OUTPUT_FORMAT`
 
         Returns: The output format type;  Plugins should return `None` if they do
         not support output operations
         """
         return self._outputFormat
 
+    @classmethod
+    def warmUp(cls):
+        """
+        Pre-initialize expensive, shareable plugin resources before the plugin is first used;
+        Called on a background thread by the `PluginWarmUpScheduler`, so implementations must
+        not touch the UI.  The default is to do nothing;  Importing the plugin module is already
+        done by the time this is called
+        """
+        pass
+
+    def reset(self):
+        """
+        The plugin manager keeps one instance per plugin and calls this before the instance
+        is reused.  Implementations clear the state of the previous invocation (file names,
+        options, collected objects) but keep expensive reusable resources (compiled expressions,
+        parsers, workspaces).  The default is to do nothing
+        """
+        pass
+
+    def addProgressListener(self, listener: ProgressListener):
+        """
+        Listeners are called on the thread that does the work
+
+        Args:
+            listener:   Called with a `PluginProgress` as the plugin makes progress
+        """
+        self._progressListeners.append(listener)
+
+    def removeProgressListener(self, listener: ProgressListener):
+        self._progressListeners.remove(listener)
+
     @classmethod
     def displayNoUmlFrame(cls):
-        booBoo: MessageDialog = MessageDialog(parent=None, message='No UML frame', caption='Try Again!', style=OK | ICON_ERROR)
-        booBoo.ShowModal()
+        cls._displayError(message='No UML frame', caption='Try Again!')
 
     @classmethod
     def displayNoSelectedOglObjects(cls):
-        booBoo: MessageDialog = MessageDialog(parent=None, message='No selected UML objects', caption='Try Again!', style=OK | ICON_ERROR)
-        booBoo.ShowModal()
+        cls._displayError(message='No selected UML objects', caption='Try Again!')
+
+    def displayImportError(self, message: str):
+        """
+        Reported through the mediator so that headless runs log the error instead of showing a dialog
+        """
+        self._mediator.reportError(message=message, caption='Import Failed')
 
     def askForFileToImport(self, startDirectory: str = None) -> SingleFileRequestResponse:
         """
@@ -130,6 +261,11 @@ class PluginInterface:
 
         Returns:  The request response
         """
+        from wx import FD_CHANGE_DIR
+        from wx import FD_FILE_MUST_EXIST
+        from wx import FD_OPEN
+        from wx import FileSelector
+
         defaultDir:  Optional[str] = startDirectory
 
         if defaultDir is None:
@@ -160,6 +296,13 @@ class PluginInterface:
 
         Returns:  The request response
         """
+        from wx import FD_CHANGE_DIR
+        from wx import FD_FILE_MUST_EXIST
+        from wx import FD_MULTIPLE
+        from wx import FD_OPEN
+        from wx import ID_CANCEL
+        from wx import FileDialog
+
         defaultDir:  Optional[str] = startDirectory
 
         if defaultDir is None:
@@ -191,7 +334,12 @@ class PluginInterface:
 
         Returns: The appropriate response object
         """
-        wxYield()
+        from wx import FD_CHANGE_DIR
+        from wx import FD_OVERWRITE_PROMPT
+        from wx import FD_SAVE
+        from wx import FileSelector
+
+        self._mediator.processPendingEvents()
 
         outputFormat: OutputFormat = self.outputFormat
 
@@ -217,6 +365,10 @@ class PluginInterface:
         Returns:  The appropriate response object;  The directory name is valid only if
         response.cancelled is True
         """
+        from wx import DD_NEW_DIR_BUTTON
+        from wx import ID_CANCEL
+        from wx import DirDialog
+
         dirDialog: DirDialog = DirDialog(self._mediator.umlFrame,
                                          "Choose a directory to import",
                                          defaultPath=self._mediator.currentDirectory,
@@ -244,6 +396,9 @@ class PluginInterface:
         Returns:  The appropriate response object;  The directory name is valid only if
         response.cancelled is True
         """
+        from wx import ID_CANCEL
+        from wx import DirDialog
+
         if preferredDefaultPath is None:
             defaultPath: str = self._mediator.currentDirectory
         else:
@@ -264,6 +419,208 @@ class PluginInterface:
 
         return response
 
+    @classmethod
+    def _displayError(cls, message: str, caption: str):
+        """
+        The dialog helpers import wx when they are called so that plugins import without it
+        """
+        from wx import ICON_ERROR
+        from wx import OK
+        from wx import MessageDialog
+
+        booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption=caption, style=OK | ICON_ERROR)
+        booBoo.ShowModal()
+
+    def _reportProgress(self, current: int, message: str):
+        """
+        Implementations call this as they make progress
+
+        Args:
+            current:    A count of the work done so far, e.g. the number of parsed files
+            message:    What the plugin is doing
+        """
+        if self._progressTracker is None:
+            self._publishProgress(PluginProgress(pluginName=self.name, current=current, message=message))
+        else:
+            self._progressTracker.update(current, message)
+
+    @contextmanager
+    def _trackProgress(self, title: str, total: int = 0,
+                       weights: List[int]   = cast(List[int], None),
+                       unit:    ProgressUnit = ProgressUnit.STEPS) -> Iterator[ProgressTracker]:
+        """
+        Show the progress of a long running operation the way the host shows all plugin
+        progress (see `IMediator.progressDisplay`).  While the operation runs `_reportProgress`
+        updates the tracker;  Reports are throttled.  If the user cancels, the next update
+        raises a `PluginCancelledException`
+
+        Args:
+            title:      What the plugin is doing
+            total:      The units of work
+            weights:    Optional;  The units of each item of work, e.g. `ProgressTracker.fileWeights`
+            unit:       What the units are
+
+        Returns:  The tracker
+        """
+        with self._mediator.progressDisplay(title=title, cancellationToken=self._cancellationToken) as display:
+            self.addProgressListener(display)
+            self._progressTracker = ProgressTracker(listener=self._publishProgress, pluginName=self.name,
+                                                    total=total, weights=weights, unit=unit,
+                                                    cancellationToken=self._cancellationToken,
+                                                    minimumInterval=PluginPreferences().progressInterval)
+            try:
+                yield self._progressTracker
+                self._progressTracker.finish()
+            finally:
+                self._progressTracker = cast(ProgressTracker, None)
+                self.removeProgressListener(display)
+
+    def _publishProgress(self, progress: PluginProgress):
+
+        for listener in list(self._progressListeners):
+            listener(progress)
+
+    @contextmanager
+    def _span(self, name: str, **attributes: Any) -> Iterator[PluginSpan]:
+        """
+        Time a phase of this plugin with the `PluginTracer`;  While the resources are watched
+        the phase is the one a `ResourceViolation` reports
+
+        Args:
+            name:           The phase
+            **attributes:   e.g. object counts, bytes processed
+
+        Returns:  The span
+        """
+        with PluginTracer().span(name, plugin=self.name, **attributes) as span:
+            if self._watchdog is None:
+                yield span
+            else:
+                with self._watchdog.inPhase(name):
+                    yield span
+
+    @contextmanager
+    def _watchResources(self) -> Iterator[Optional[PluginWatchdog]]:
+        """
+        Enforce the `resourceLimits` on an invocation;  The execute methods wrap themselves in
+        this once they have replaced the cancellation token.  A limit that is exceeded cancels
+        the token with a `ResourceLimitExceededException` and is kept as the `resourceViolation`
+
+        Returns:  The watchdog, or `None` if the invocation is not limited
+        """
+        self._resourceViolation = cast(ResourceViolation, None)
+        if self._resourceLimits.unlimited is True or self._watchdog is not None:
+            yield self._watchdog
+            return
+
+        watchdog: PluginWatchdog = PluginWatchdog(limits=self._resourceLimits, cancellationToken=self._cancellationToken)
+        self._watchdog = watchdog
+        watchdog.start()
+        try:
+            yield watchdog
+        finally:
+            watchdog.stop()
+            self._watchdog          = cast(PluginWatchdog, None)
+            self._resourceViolation = cast(ResourceViolation, watchdog.violation)
+
+    def _executeAsync(self, name: str,
+                      backgroundWork:  Callable[[], Any]    = cast(Callable[[], Any], None),
+                      uiWork:          Callable[[Any], Any] = cast(Callable[[Any], Any], None),
+                      cancelledResult: Any                  = None) -> Future:
+        """
+        Run an invocation the way the execute methods do, but without blocking the UI thread:
+        Under the `resourceLimits`, timed, and a cancelled invocation is logged rather than failed.
+        Call it on the UI thread once the options are set
+
+        Args:
+            name:               The invocation, e.g. `executeToolAsync`;  Names the spans
+            backgroundWork:     Optional;  Runs on a worker thread and must not touch the UI
+            uiWork:             Optional;  Runs on the UI thread with the result of the background work
+            cancelledResult:    The job's result if the invocation is cancelled
+
+        Returns:  A job that completes with the result of the UI work, or of the background work
+        if there is no UI work;  It fails if the work fails
+        """
+        executor:  PluginAsyncExecutor = PluginAsyncExecutor()
+        resources: ExitStack           = ExitStack()
+        resources.enter_context(self._watchResources())
+
+        def runInBackground() -> Any:
+            with self._span(name, thread='background'):
+                return backgroundWork()
+
+        def runOnUiThread(result: Any) -> Any:
+            with self._span(name, thread='ui'):
+                return uiWork(result)
+
+        if backgroundWork is None:
+            job: Future = executor.callOnUiThread(lambda: runOnUiThread(None))
+        else:
+            job = executor.submit(backgroundWork=runInBackground, uiWork=None if uiWork is None else runOnUiThread)
+
+        invocation: Future = Future()
+
+        def finish(finishedJob: Future):
+            resources.close()
+            try:
+                invocation.set_result(finishedJob.result())
+            except PluginCancelledException:
+                self.clsLogger.info(f'{self.name}: {name} cancelled')
+                invocation.set_result(cancelledResult)
+            except BaseException as e:
+                invocation.set_exception(e)
+
+        job.add_done_callback(finish)
+
+        return invocation
+
+    def _countObjects(self, count: int):
+        """
+        Count objects against the `resourceLimits`;  Raises a `ResourceLimitExceededException`
+        once there are too many
+
+        Args:
+            count:  The number of objects the plugin created or is about to work on
+        """
+        if self._watchdog is not None:
+            self._watchdog.addObjects(count)
+
+    def _preference(self, name: str, default: Any) -> Any:
+        """
+        Read a setting from this plugin's namespace of the `PluginPreferences`
+
+        Args:
+            name:       The setting
+            default:    Used when the setting is missing or of another type
+
+        Returns:  The setting
+        """
+        return PluginPreferences().value(self.name, name, default)
+
+    def _workerPool(self, itemCount: int) -> Optional[WorkerPool]:
+        """
+        The worker processes and threads shared by all plugins;  See `PluginManager.workerPool`
+
+        Args:
+            itemCount:  The number of items of work, e.g. files, the plugin would spread over the workers
+
+        Returns:  The pool, or `None` if spreading the work would not pay off
+        """
+        workerPool: WorkerPool = self._sharedWorkerPool()
+        if itemCount < 2 or workerPool.processWorkers < 2:
+            return None
+
+        return workerPool
+
+    def _sharedWorkerPool(self) -> WorkerPool:
+        """
+        Returns:  The shared pool, with this plugin's `WORKER_INITIALIZERS` registered
+        """
+        workerPool: WorkerPool = WorkerPool()
+        workerPool.registerWorkerInitializers(self.WORKER_INITIALIZERS)
+
+        return workerPool
+
     def _layoutUmlClasses(self, oglClasses: OglClasses):
         """
         Organize by vertical descending sizes
@@ -271,6 +628,7 @@ class PluginInterface:
         Args:
             oglClasses
         """
+        self._countObjects(len(oglClasses))
         # Sort by descending height
         # noinspection PyProtectedMember
         sortedOglClasses = sorted(oglClasses, key=lambda oglClassToSort: oglClassToSort._height, reverse=True)
@@ -278,6 +636,8 @@ class PluginInterface:
         x: int = 20
         y: int = 20
 
+        wrapWidth: int = PluginPreferences().layoutWrapWidth
+
         incY: int = 0
         for oglClass in sortedOglClasses:
             incX, sy = oglClass.GetSize()
@@ -285,21 +645,25 @@ class PluginInterface:
             sy += 20
             incY = max(incY, int(sy))
             # find good coordinates
-            if x + incX >= 3000:
+            if x + incX >= wrapWidth:
                 x = 20
                 y += incY
                 incY = int(sy)
             oglClass.SetPosition(x, y)
             x += incX
-            self._mediator.addShape(shape=oglClass)
-        self._mediator.refreshFrame()
 
-    def _layoutLinks(self, oglLinks: OglLinks):
+        with self._mediator.batchUpdate():
+            self._mediator.addShapes(sortedOglClasses)
+            self._mediator.refreshFrame()
+        self._addedShapes.extend(sortedOglClasses)
 
-        for oglLink in oglLinks:
-            self._mediator.addShape(oglLink)
+    def _layoutLinks(self, oglLinks: OglLinks):
 
-        self._mediator.refreshFrame()
+        self._countObjects(len(oglLinks))
+        with self._mediator.batchUpdate():
+            self._mediator.addShapes(oglLinks)
+            self._mediator.refreshFrame()
+        self._addedShapes.extend(oglLinks)
 
     def __composeWildCardSpecification(self) -> str:
 
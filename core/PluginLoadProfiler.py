@@ -0,0 +1,164 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from json import dumps as jsonDumps
+
+from time import perf_counter
+
+from threading import Lock
+
+import tracemalloc
+
+from core.Singleton import Singleton
+from core.types.PluginLoadMeasurement import PluginLoadMeasurement
+from core.types.PluginLoadMeasurement import PluginLoadPhase
+
+PhaseMeasurements  = NewType('PhaseMeasurements',  Dict[PluginLoadPhase, PluginLoadMeasurement])
+ModuleMeasurements = NewType('ModuleMeasurements', Dict[str, PhaseMeasurements])     # Key is the module name
+
+
+class PluginLoadProfiler(Singleton):
+    """
+    Records what plugin discovery and plugin loading cost.
+
+    For each plugin module we keep the wall time and memory delta of the module
+    import, the plugin class lookup and the first plugin instantiation.  Only the
+    first measurement of a phase is kept;  That is the one that pays for the
+    module's top level imports.
+
+    Memory deltas need `tracemalloc`;  Call `startMemoryProfiling()` (or create the
+    plugin manager with `profileMemory=True`) before discovery to get them, and
+    `stopMemoryProfiling()` when done.  Plugins load concurrently, so the
+    measurements are guarded by a lock.
+    """
+    def init(self, *args, **kwargs):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._measurementsLock: Lock               = Lock()
+        self._measurements:     ModuleMeasurements = ModuleMeasurements({})
+        self._discoveryTime:    float              = 0.0
+        self._startedTrace:     bool               = False
+
+    @property
+    def discoveryTime(self) -> float:
+        """
+        Returns:  The wall time in seconds of the last plugin discovery
+        """
+        return self._discoveryTime
+
+    @property
+    def measurements(self) -> ModuleMeasurements:
+        """
+        Returns:  A copy of the measurements taken so far
+        """
+        with self._measurementsLock:
+            return ModuleMeasurements({moduleName: PhaseMeasurements(dict(phases)) for moduleName, phases in self._measurements.items()})
+
+    def startMemoryProfiling(self):
+        if tracemalloc.is_tracing() is False:
+            tracemalloc.start()
+            self._startedTrace = True
+
+    def stopMemoryProfiling(self):
+        """
+        Stop tracing memory;  Leaves alone a trace that someone else started
+        """
+        if self._startedTrace is True:
+            tracemalloc.stop()
+            self._startedTrace = False
+
+    @contextmanager
+    def measure(self, moduleName: str, phase: PluginLoadPhase) -> Iterator[None]:
+        """
+        Measure a single load phase of a plugin module, e.g.
+
+            with profiler.measure(moduleName, PluginLoadPhase.IMPORT):
+                import_module(moduleName)
+
+        Args:
+            moduleName: The fully qualified plugin module name
+            phase:      The load phase
+        """
+        startMemory: int   = self._tracedMemory()
+        startTime:   float = perf_counter()
+        try:
+            yield
+        finally:
+            measurement: PluginLoadMeasurement = PluginLoadMeasurement(phase=phase,
+                                                                       wallTime=perf_counter() - startTime,
+                                                                       memoryDelta=self._tracedMemory() - startMemory)
+            with self._measurementsLock:
+                phases: PhaseMeasurements = self._measurements.setdefault(moduleName, PhaseMeasurements({}))
+                phases.setdefault(phase, measurement)
+
+    @contextmanager
+    def measureDiscovery(self) -> Iterator[None]:
+        startTime: float = perf_counter()
+        try:
+            yield
+        finally:
+            self._discoveryTime = perf_counter() - startTime
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns:  A JSON serializable report of the discovery time and the per module,
+        per phase costs;  Times are in seconds, memory deltas in bytes
+        """
+        modules: Dict[str, Any] = {}
+        for moduleName, phases in self.measurements.items():
+            modules[moduleName] = {
+                'totalWallTime': self._totalWallTime(phases),
+                'phases': {
+                    phase.value: {'wallTime': measurement.wallTime, 'memoryDelta': measurement.memoryDelta}
+                    for phase, measurement in phases.items()
+                }
+            }
+        return {
+            'discoveryTime':   self._discoveryTime,
+            'memoryProfiling': tracemalloc.is_tracing(),
+            'modules':         modules,
+        }
+
+    def toJson(self) -> str:
+        return jsonDumps(self.report(), indent=2)
+
+    def logSummary(self):
+        """
+        Log the discovery time and the modules ordered from most to least expensive
+        """
+        self.logger.debug(f'Plugin discovery took {self._discoveryTime * 1000:.1f} ms')
+
+        measurements: ModuleMeasurements = self.measurements
+
+        modules: List[str] = sorted(measurements.keys(), key=lambda moduleName: self._totalWallTime(measurements[moduleName]), reverse=True)
+        for moduleName in modules:
+            phases: PhaseMeasurements = measurements[moduleName]
+            details: str = ', '.join(
+                f'{phase.value}={measurement.wallTime * 1000:.1f} ms/{measurement.memoryDelta / 1024:.1f} KiB'
+                for phase, measurement in phases.items()
+            )
+            self.logger.debug(f'{moduleName}: {details}')
+
+    def reset(self):
+        with self._measurementsLock:
+            self._measurements  = ModuleMeasurements({})
+        self._discoveryTime = 0.0
+
+    def _totalWallTime(self, phases: PhaseMeasurements) -> float:
+        return sum(measurement.wallTime for measurement in phases.values())
+
+    def _tracedMemory(self) -> int:
+        if tracemalloc.is_tracing() is True:
+            current, _ = tracemalloc.get_traced_memory()
+            return current
+        return 0
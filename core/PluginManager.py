@@ -1,30 +1,53 @@
 
-from typing import Callable
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from pkgutil import ModuleInfo
-from pkgutil import iter_modules
-
-from importlib import import_module
-
-from wx import NewIdRef
-
+from os.path import abspath
+from os.path import commonpath
+from os.path import dirname
+from os.path import relpath
+from os.path import splitext
+
+from threading import RLock
+
+from core.IMediator import IMediator
+from core.PluginInstancePool import PluginInstancePool
+from core.PluginLoadProfiler import PluginLoadProfiler
+from core.PluginManifest import IO_PLUGIN_ENTRY_POINT_GROUP
+from core.PluginManifest import TOOL_PLUGIN_ENTRY_POINT_GROUP
+from core.PluginManifest import ManifestEntryList
+from core.PluginManifest import PluginManifest
+from core.PluginProxy import PluginProxy
+from core.PluginRegistry import PluginRegistry
+from core.PluginWarmUpScheduler import HIGH_WARM_UP_PRIORITY
+from core.PluginWarmUpScheduler import PluginWarmUpScheduler
 from core.Singleton import Singleton
+from core.WorkerPool import WorkerPool
+from core.types.FileRoutes import FileRoutes
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
+from core.types.PluginDataTypes import FormatName
 from core.types.PluginDataTypes import IOPluginMap
 from core.types.PluginDataTypes import IOPluginMapType
+from core.types.PluginDataTypes import PluginExtension
 from core.types.PluginDataTypes import PluginList
 from core.types.PluginDataTypes import PluginIDMap
+from core.types.PluginDataTypes import PluginName
 from core.types.PluginDataTypes import PluginType
 
 import plugins.io
 import plugins.tools
 
-TOOL_PLUGIN_NAME_PREFIX: str = 'Tool'
-IO_PLUGIN_NAME_PREFIX:   str = 'IO'
+WarmUpPlugins = Dict[PluginName, int]      # plugin name -> warm up priority
+
+DEFAULT_WARM_UP_PLUGINS: WarmUpPlugins = {
+    PluginName('IOPython'): HIGH_WARM_UP_PRIORITY,
+}
 
 
 class PluginManager(Singleton):
@@ -44,53 +67,95 @@ class PluginManager(Singleton):
     By convention prefix the plugin tool module name with the characters 'Tool'
     By convention prefix the plugin I/O module with the characters 'IO'
 
+    The plugin lists and maps do not contain the real plugin classes.  They contain
+    `PluginProxy` classes built from the plugin manifest;  A plugin module is only
+    imported when the plugin is first executed.
+
+    Besides the plugins in the `plugins.io` and `plugins.tools` packages, installed
+    distributions may contribute plugins through the `pyutplugins.io` and
+    `pyutplugins.tools` entry point groups.
+
+    Plugin discovery and plugin loading are profiled;  See `loadReport()`
+
+    PluginManager is safe to use from plugin jobs on worker threads.  The lazily built
+    lists and maps are built once, under a lock;  Once built they are read without one
+
+    Plugins that need parallelism submit their work to the shared `workerPool` rather
+    than starting their own;  The host calls `shutdown()` when it exits
+
+    Hosts should get plugin instances from `pluginInstance()` rather than constructing
+    a new one per menu action, and give them back with `releasePluginInstance()` when the
+    invocation is over;  Instances are pooled and `reset()` between invocations
+
     """
 
     def init(self,  *args, **kwargs):
+        """
+
+        Args:
+            *args:
+            **kwargs:   `manifestFileName` overrides the default plugin manifest location;  See `PluginManifest`
+                        `profileMemory` when `True` also records the memory cost of loading plugins
+        """
 
         self.logger: Logger = getLogger(__name__)
 
-        # These are built later on
+        self._loadProfiler: PluginLoadProfiler = PluginLoadProfiler()
+        if kwargs.get('profileMemory', False) is True:
+            self._loadProfiler.startMemoryProfiling()
+
+        self._manifest: PluginManifest = PluginManifest(manifestFileName=kwargs.get('manifestFileName'))
+
+        # These are built later on, under the lock
+        self._lazyLock:         RLock        = RLock()
         self._toolPluginsIDMap:   PluginIDMap  = cast(PluginIDMap, None)
         self._inputPluginsMap:  IOPluginMap  = cast(IOPluginMap, None)
         self._outputPluginsMap: IOPluginMap  = cast(IOPluginMap, None)
+        self._inputPlugins:     PluginList   = cast(PluginList, None)
+        self._outputPlugins:    PluginList   = cast(PluginList, None)
+
+        self._registry:        PluginRegistry        = PluginRegistry()
+        self._instancePool:    PluginInstancePool    = PluginInstancePool()
+        self._workerPool:      WorkerPool            = WorkerPool()
+        self._warmUpScheduler: PluginWarmUpScheduler = cast(PluginWarmUpScheduler, None)
+
+        with self._loadProfiler.measureDiscovery():
+            self._loadIOPlugins()
+            self._loadToolPlugins()
 
-        self._ioPluginClasses:   PluginList = PluginList([])
-        self._toolPluginClasses: PluginList = PluginList([])
+            self._manifest.save()
 
-        self._loadIOPlugins()
-        self._loadToolPlugins()
+        self._loadProfiler.logSummary()
 
     @property
     def inputPlugins(self) -> PluginList:
         """
-        Get the input plugins.
+        Get the input plugins.  Decided from the class metadata;  No plugin is
+        instantiated
 
         Returns:  A list of classes (the plugins classes).
         """
+        if self._inputPlugins is None:
+            with self._lazyLock:
+                if self._inputPlugins is None:
+                    self._inputPlugins = PluginList([plugin for plugin in self._registry.ioPlugins if plugin.INPUT_FORMAT is not None])
 
-        pluginList = cast(PluginList, [])
-        for plugin in self._ioPluginClasses:
-            pluginClass = cast(type, plugin)
-            classInstance = pluginClass(None)
-            if classInstance.inputFormat is not None:
-                pluginList.append(plugin)
-        return pluginList
+        return self._inputPlugins
 
     @property
     def outputPlugins(self) -> PluginList:
         """
-        Get the output plugins.
+        Get the output plugins.  Decided from the class metadata;  No plugin is
+        instantiated
 
         Returns:  A list of classes (the plugins classes).
         """
-        pluginList = cast(PluginList, [])
-        for plugin in self._ioPluginClasses:
-            pluginClass = cast(type, plugin)
-            classInstance = pluginClass(None)
-            if classInstance.outputFormat is not None:
-                pluginList.append(plugin)
-        return pluginList
+        if self._outputPlugins is None:
+            with self._lazyLock:
+                if self._outputPlugins is None:
+                    self._outputPlugins = PluginList([plugin for plugin in self._registry.ioPlugins if plugin.OUTPUT_FORMAT is not None])
+
+        return self._outputPlugins
 
     @property
     def toolPlugins(self) -> PluginList:
@@ -99,22 +164,46 @@ class PluginManager(Singleton):
 
         Returns:    A list of classes (the plugins classes).
         """
-        return self._toolPluginClasses
+        return self._registry.toolPlugins
+
+    @property
+    def registry(self) -> PluginRegistry:
+        return self._registry
+
+    @property
+    def loadProfiler(self) -> PluginLoadProfiler:
+        return self._loadProfiler
+
+    def loadReport(self) -> Dict[str, Any]:
+        """
+        The cost of plugin discovery plus, for each plugin module loaded so far, the
+        wall time and memory delta of its import, class lookup and first instantiation.
+        Plugins that are still proxies do not appear until they are loaded
+
+        Returns:  A JSON serializable report
+        """
+        return self._loadProfiler.report()
 
     @property
     def toolPluginsIDMap(self) -> PluginIDMap:
         if self._toolPluginsIDMap is None:
-            self._toolPluginsIDMap = self.__mapWxIdsToPlugins(self._toolPluginClasses)
+            with self._lazyLock:
+                if self._toolPluginsIDMap is None:
+                    self._toolPluginsIDMap = self.__mapWxIdsToPlugins(self._registry.toolPlugins)
         return self._toolPluginsIDMap
 
     @property
     def inputPluginsMap(self) -> IOPluginMap:
 
         if self._inputPluginsMap is None:
-            self._inputPluginsMap = IOPluginMap()
+            with self._lazyLock:
+                if self._inputPluginsMap is None:
+                    inputPluginsMap: IOPluginMap = IOPluginMap()
+
+                    inputPluginsMap.mapType     = IOPluginMapType.INPUT_MAP
+                    inputPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(self.inputPlugins)
 
-            self._inputPluginsMap.mapType     = IOPluginMapType.INPUT_MAP
-            self._inputPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(self.inputPlugins)
+                    self._inputPluginsMap = inputPluginsMap
 
         return self._inputPluginsMap
 
@@ -122,58 +211,193 @@ class PluginManager(Singleton):
     def outputPluginsMap(self) -> IOPluginMap:
 
         if self._outputPluginsMap is None:
-            self._outputPluginsMap = IOPluginMap()
+            with self._lazyLock:
+                if self._outputPluginsMap is None:
+                    outputPluginsMap: IOPluginMap = IOPluginMap()
 
-            self._outputPluginsMap.mapType     = IOPluginMapType.OUTPUT_MAP
-            self._outputPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(self.outputPlugins)
+                    outputPluginsMap.mapType     = IOPluginMapType.OUTPUT_MAP
+                    outputPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(self.outputPlugins)
+
+                    self._outputPluginsMap = outputPluginsMap
 
         return self._outputPluginsMap
 
-    def _loadIOPlugins(self):
-        self._ioPluginClasses = self.__loadPlugins(plugins.io)
+    @property
+    def warmUpScheduler(self) -> PluginWarmUpScheduler:
+        if self._warmUpScheduler is None:
+            with self._lazyLock:
+                if self._warmUpScheduler is None:
+                    self._warmUpScheduler = PluginWarmUpScheduler()
+        return self._warmUpScheduler
+
+    def scheduleWarmUp(self, warmUpPlugins: WarmUpPlugins = cast(WarmUpPlugins, None)) -> PluginWarmUpScheduler:
+        """
+        Queue plugins to be imported and pre-initialized after start up.  Nothing runs until
+        the host either calls `start()` on the returned scheduler or drives it with `runNext()`
+        from an idle handler, e.g.
 
-    def _loadToolPlugins(self):
-        self._toolPluginClasses = self.__loadPlugins(plugins.tools)
+            PluginManager().scheduleWarmUp().start()
 
-    def _iterateNameSpace(self, pluginPackage):
-        self.logger.debug(f'{dir(pluginPackage)}')
-        return iter_modules(pluginPackage.__path__, pluginPackage.__name__ + ".")
+        Args:
+            warmUpPlugins:  The plugin names and their priorities;  Defaults to the plugins
+            with a `warmUp` that does real work (the Python parser)
 
-    def __loadPlugins(self, pluginPackage) -> PluginList:
+        Returns:  The warm-up scheduler
+        """
+        if warmUpPlugins is None:
+            warmUpPlugins = DEFAULT_WARM_UP_PLUGINS
 
-        pluginList: PluginList = PluginList([])
-        for info in self._iterateNameSpace(pluginPackage):
-            moduleInfo: ModuleInfo = cast(ModuleInfo, info)
+        scheduler: PluginWarmUpScheduler = self.warmUpScheduler
+        for pluginName, priority in warmUpPlugins.items():
+            pluginClass: Optional[PluginType] = self._registry.pluginByName(pluginName)
+            if pluginClass is None:
+                self.logger.warning(f'Cannot warm up unknown plugin: {pluginName}')
+            else:
+                scheduler.schedule(pluginClass=pluginClass, priority=priority)
+
+        return scheduler
+
+    @property
+    def workerPool(self) -> WorkerPool:
+        """
+        The process and thread workers shared by all plugins;  Nothing is started until
+        a plugin submits work
+        """
+        return self._workerPool
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the shared workers and the memory profiling;  Also done when the host exits
+        """
+        self._workerPool.shutdown(wait=wait)
+        self._loadProfiler.stopMemoryProfiling()
 
-            loadedModule = import_module(moduleInfo.name)
+    @property
+    def instancePool(self) -> PluginInstancePool:
+        return self._instancePool
 
-            moduleName:  str      = moduleInfo.name
-            className:   str      = self.__computePluginClassNameFromModuleName(moduleName=moduleName)
-            if className.startswith(IO_PLUGIN_NAME_PREFIX) is True or className.startswith(TOOL_PLUGIN_NAME_PREFIX):
+    def pluginInstance(self, pluginClass: PluginType, mediator: IMediator):
+        """
+        Use this instead of `pluginClass(mediator)`, e.g.
 
-                pluginClass: Callable = getattr(loadedModule, className)
+            plugin = PluginManager().pluginInstance(pluginManager.inputPluginsMap.pluginIdMap[wxId], mediator)
+            try:
+                plugin.executeImport()
+            finally:
+                PluginManager().releasePluginInstance(plugin)
 
-                self.logger.debug(f'{type(pluginClass)=}')
-                pluginList.append(cast(PluginType, pluginClass))
-        return pluginList
+        An async invocation releases the instance when its job is done
+
+        Args:
+            pluginClass:    A plugin class from one of the plugin lists or maps
+            mediator:       The mediator for this invocation
+
+        Returns:  A plugin instance that no other invocation is using, reset and bound to `mediator`
+        """
+        return self._instancePool.acquire(pluginClass=pluginClass, mediator=mediator)
+
+    def releasePluginInstance(self, plugin):
+        """
+        Args:
+            plugin: An instance from `pluginInstance()` whose invocation is over
+        """
+        self._instancePool.release(plugin)
+
+    def routeFiles(self, fileNames: List[str]) -> FileRoutes:
+        """
+        Group a mixed list of files by the input plugin that reads them;  The plugin is
+        chosen by file extension.  When several input plugins read the same extension
+        the first one registered wins
+
+        Args:
+            fileNames:  File paths, e.g. every file in a source tree
 
-    def __computePluginClassNameFromModuleName(self, moduleName: str) -> str:
+        Returns:  For each plugin one request with the common directory and the file names
+        relative to it, plus the files no plugin reads
+        """
+        fileRoutes:   FileRoutes                  = FileRoutes()
+        pluginGroups: Dict[PluginType, List[str]] = {}
+
+        for fileName in fileNames:
+            extension: PluginExtension = PluginExtension(splitext(fileName)[1])
+            candidates: PluginList     = self._registry.inputPluginsByExtension(extension)
+            if len(candidates) == 0:
+                fileRoutes.unrouted.append(fileName)
+            else:
+                pluginGroups.setdefault(candidates[0], []).append(abspath(fileName))
+
+        for pluginClass, groupFileNames in pluginGroups.items():
+            directoryName: str = commonpath([dirname(fileName) for fileName in groupFileNames])
+
+            fileRoutes.routes[pluginClass] = MultipleFileRequestResponse(cancelled=False,
+                                                                         directoryName=directoryName,
+                                                                         fileList=[relpath(fileName, directoryName) for fileName in groupFileNames])
+        return fileRoutes
+
+    def importFiles(self, fileNames: List[str], mediator: IMediator) -> Dict[PluginName, Any]:
         """
-        Typical module names are:
-            * plugins.io.IoDTD
-            * plugins.tools.ToAscii
+        Route the files and run each input plugin once with all of its files
+
         Args:
-            moduleName: A fully qualified module name
+            fileNames:  File paths, e.g. every file in a source tree
+            mediator:   The mediator for the imports
 
-        Returns: A string that is the contained class name
+        Returns:  The result of each plugin's import keyed by plugin name
         """
+        fileRoutes: FileRoutes = self.routeFiles(fileNames)
+        for fileName in fileRoutes.unrouted:
+            self.logger.warning(f'No input plugin reads {fileName}')
+
+        results: Dict[PluginName, Any] = {}
+        for pluginClass, response in fileRoutes.routes.items():
+            with self._instancePool.checkedOut(pluginClass=pluginClass, mediator=mediator) as plugin:
+                self.logger.info(f'{pluginClass.PLUGIN_NAME} importing {len(response.fileList)} files from {response.directoryName}')
+                results[pluginClass.PLUGIN_NAME] = plugin.executeImportFiles(response)
+
+        return results
+
+    def pluginByName(self, pluginName: PluginName) -> Optional[PluginType]:
+        return self._registry.pluginByName(pluginName)
+
+    def pluginsByFormatName(self, formatName: FormatName) -> PluginList:
+        return self._registry.pluginsByFormatName(formatName)
+
+    def inputPluginsByExtension(self, extension: PluginExtension) -> PluginList:
+        return self._registry.inputPluginsByExtension(extension)
+
+    def outputPluginsByExtension(self, extension: PluginExtension) -> PluginList:
+        return self._registry.outputPluginsByExtension(extension)
+
+    def _loadIOPlugins(self):
+        entries: ManifestEntryList = self._manifest.entries(plugins.io)
+        entries.extend(self._manifest.entryPointEntries(group=IO_PLUGIN_ENTRY_POINT_GROUP))
+
+        for pluginClass in self.__createProxies(entries):
+            self._registry.registerIOPlugin(pluginClass)
+
+    def _loadToolPlugins(self):
+        entries: ManifestEntryList = self._manifest.entries(plugins.tools)
+        entries.extend(self._manifest.entryPointEntries(group=TOOL_PLUGIN_ENTRY_POINT_GROUP))
+
+        for pluginClass in self.__createProxies(entries):
+            self._registry.registerToolPlugin(pluginClass)
 
-        splitName: List[str] = moduleName.split('.')
-        className: str       = splitName[len(splitName) - 1]
+    def __createProxies(self, entries: ManifestEntryList) -> PluginList:
 
-        return className
+        pluginList: PluginList = PluginList([])
+        for entry in entries:
+            proxyClass: type = PluginProxy.createProxyClass(manifestEntry=entry)
+
+            self.logger.debug(f'{entry.moduleName=} {proxyClass=}')
+            pluginList.append(cast(PluginType, proxyClass))
+        return pluginList
 
     def __mapWxIdsToPlugins(self, pluginList: PluginList) -> PluginIDMap:
+        """
+        Only the menus need wx ids;  The maps are built on first use so that headless
+        hosts never import wx
+        """
+        from wx import NewIdRef
 
         pluginMap: PluginIDMap = cast(PluginIDMap, {})
 
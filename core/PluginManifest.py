@@ -0,0 +1,368 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Set
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import dump as jsonDump
+from json import load as jsonLoad
+
+from os import environ
+from os import makedirs
+from os import sep as osSep
+from os import stat as osStat
+
+from os.path import dirname
+from os.path import expanduser
+from os.path import join as osPathJoin
+
+from pkgutil import ModuleInfo
+from pkgutil import iter_modules
+
+from importlib import import_module
+
+from importlib.metadata import EntryPoint
+from importlib.metadata import entry_points
+
+from importlib.util import find_spec
+
+from core.PluginLoadProfiler import PluginLoadProfiler
+from core.types.BaseFormat import BaseFormat
+from core.types.InputFormat import InputFormat
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginDescription
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginLoadMeasurement import PluginLoadPhase
+from core.types.PluginManifestEntry import PluginManifestEntry
+
+TOOL_PLUGIN_NAME_PREFIX: str = 'Tool'
+IO_PLUGIN_NAME_PREFIX:   str = 'IO'
+
+IO_PLUGIN_ENTRY_POINT_GROUP:   str = 'pyutplugins.io'
+TOOL_PLUGIN_ENTRY_POINT_GROUP: str = 'pyutplugins.tools'
+
+MANIFEST_VERSION:           int = 3
+DEFAULT_MANIFEST_FILENAME:  str = osPathJoin(expanduser('~'), '.pyut', 'pyutPluginManifest.json')
+MANIFEST_FILENAME_VARIABLE: str = 'PYUT_PLUGIN_MANIFEST'       # Overrides the default location, e.g. for test runs
+
+PluginManifestEntries = NewType('PluginManifestEntries', Dict[str, PluginManifestEntry])   # Key is `module:class`
+ManifestEntryList     = NewType('ManifestEntryList',     List[PluginManifestEntry])
+
+
+class PluginManifest:
+    """
+    A cache of plugin metadata that is persisted between runs.
+
+    The first time a plugin module is seen (or whenever its file modification
+    time changes) the module is imported and its metadata recorded.  On every
+    other start the metadata is read from the manifest file and the plugin module
+    is not imported at all.  The entries of plugins that are no longer found are
+    dropped when their package or entry point group is scanned.
+    """
+    def __init__(self, manifestFileName: str = cast(str, None)):
+        """
+
+        Args:
+            manifestFileName:   Defaults to the `MANIFEST_FILENAME_VARIABLE` environment variable,
+            else to `DEFAULT_MANIFEST_FILENAME`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if manifestFileName is None:
+            manifestFileName = environ.get(MANIFEST_FILENAME_VARIABLE, DEFAULT_MANIFEST_FILENAME)
+
+        self._manifestFileName: str                   = manifestFileName
+        self._entries:          PluginManifestEntries = self._loadManifest()
+        self._dirty:            bool                  = False
+
+    @property
+    def manifestFileName(self) -> str:
+        return self._manifestFileName
+
+    def entries(self, pluginPackage) -> ManifestEntryList:
+        """
+        Get the manifest entries for the plugins in a package; Stale or missing
+        entries are rebuilt by importing the plugin module
+
+        Args:
+            pluginPackage:  The package that contains the plugin modules
+
+        Returns:  The up-to-date entries for that package
+        """
+        entryList: ManifestEntryList = ManifestEntryList([])
+        seenKeys:  Set[str]          = set()
+
+        for info in iter_modules(pluginPackage.__path__, f'{pluginPackage.__name__}.'):
+            moduleInfo: ModuleInfo = cast(ModuleInfo, info)
+            moduleName: str        = moduleInfo.name
+            className:  str        = self.computeClassName(moduleName=moduleName)
+
+            if moduleInfo.ispkg is True:
+                continue
+            if className.startswith(IO_PLUGIN_NAME_PREFIX) is False and className.startswith(TOOL_PLUGIN_NAME_PREFIX) is False:
+                continue
+
+            modificationTime: float = self._modificationTime(moduleInfo=moduleInfo, className=className)
+            entryKey: str = self._entryKey(moduleName=moduleName, className=className)
+            entry: Optional[PluginManifestEntry] = self._entries.get(entryKey)
+            if entry is None or modificationTime == 0.0 or entry.modificationTime != modificationTime or entry.entryPointGroup != '':
+                self.logger.info(f'Rebuilding plugin manifest entry for {moduleName}')
+                entry = self.createEntry(moduleName=moduleName, className=className)
+                entry.modificationTime = modificationTime
+
+                self._entries[entryKey] = entry
+                self._dirty = True
+
+            seenKeys.add(entryKey)
+            entryList.append(entry)
+
+        packagePrefix: str = f'{pluginPackage.__name__}.'
+        self._dropMissing(seenKeys=seenKeys, scanned=lambda entry: entry.entryPointGroup == '' and entry.moduleName.startswith(packagePrefix))
+
+        return entryList
+
+    def entryPointEntries(self, group: str) -> ManifestEntryList:
+        """
+        Get the manifest entries for the plugins that installed distributions register
+        under an entry point group, e.g.
+
+            [options.entry_points]
+            pyutplugins.io =
+                IOMyFormat = mypackage.IOMyFormat:IOMyFormat
+
+        Reading the entry points does not import anything;  As with package plugins
+        a module is only imported when its entry is missing or stale
+
+        Args:
+            group:  The entry point group name
+
+        Returns:  The up-to-date entries for that group
+        """
+        entryList: ManifestEntryList = ManifestEntryList([])
+        seenKeys:  Set[str]          = set()
+
+        for entryPoint in self._entryPoints(group=group):
+            moduleName: str = entryPoint.module
+            className:  str = entryPoint.attr
+            if className is None or className == '':
+                self.logger.warning(f'Entry point {entryPoint.name} must name a plugin class: `{entryPoint.value}`')
+                continue
+
+            modificationTime: float = self._originModificationTime(moduleName=moduleName)
+            entryKey:         str   = self._entryKey(moduleName=moduleName, className=className)
+            entry: Optional[PluginManifestEntry] = self._entries.get(entryKey)
+            try:
+                if entry is None or modificationTime == 0.0 or entry.modificationTime != modificationTime or entry.entryPointGroup != group:
+                    self.logger.info(f'Rebuilding plugin manifest entry for entry point {entryPoint.name}')
+                    entry = self.createEntry(moduleName=moduleName, className=className)
+                    entry.modificationTime = modificationTime
+                    entry.entryPointGroup  = group
+
+                    self._entries[entryKey] = entry
+                    self._dirty = True
+            except (ImportError, AttributeError) as e:
+                self.logger.error(f'Cannot load plugin entry point {entryPoint.name}: {e}')
+                continue
+
+            seenKeys.add(entryKey)
+            entryList.append(entry)
+
+        self._dropMissing(seenKeys=seenKeys, scanned=lambda entry: entry.entryPointGroup == group)
+
+        return entryList
+
+    def save(self):
+        """
+        Write the manifest if anything changed;  A manifest that cannot be written
+        is not fatal, we just pay the import cost again next time
+        """
+        if self._dirty is False:
+            return
+        try:
+            makedirs(dirname(self._manifestFileName), exist_ok=True)
+            with open(self._manifestFileName, 'w') as manifestFile:
+                jsonDump(self._toJson(), manifestFile, indent=2)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f'Unable to write plugin manifest {self._manifestFileName}: {e}')
+
+    def createEntry(self, moduleName: str, className: str) -> PluginManifestEntry:
+        """
+        Import the plugin module and record its class metadata;  The plugin is
+        not instantiated
+
+        Args:
+            moduleName: The fully qualified module name
+            className:  The plugin class in that module
+
+        Returns:  A new entry
+        """
+        profiler: PluginLoadProfiler = PluginLoadProfiler()
+        with profiler.measure(moduleName, PluginLoadPhase.IMPORT):
+            module = import_module(moduleName)
+        with profiler.measure(moduleName, PluginLoadPhase.CLASS_LOOKUP):
+            pluginClass = getattr(module, className)
+
+        entry: PluginManifestEntry = PluginManifestEntry(moduleName=moduleName, className=className)
+
+        entry.pluginName   = pluginClass.PLUGIN_NAME
+        entry.author       = pluginClass.PLUGIN_AUTHOR
+        entry.version      = pluginClass.PLUGIN_VERSION
+        entry.menuTitle    = getattr(pluginClass, 'MENU_TITLE', '')
+        entry.inputFormat  = pluginClass.INPUT_FORMAT
+        entry.outputFormat = pluginClass.OUTPUT_FORMAT
+
+        return entry
+
+    def computeClassName(self, moduleName: str) -> str:
+        """
+        Typical module names are:
+            * plugins.io.IoDTD
+            * plugins.tools.ToAscii
+        Args:
+            moduleName: A fully qualified module name
+
+        Returns: A string that is the contained class name
+        """
+        splitName: List[str] = moduleName.split('.')
+        className: str       = splitName[len(splitName) - 1]
+
+        return className
+
+    def _entryKey(self, moduleName: str, className: str) -> str:
+        """
+        A module may define more than one plugin, e.g. entry points that name different
+        classes in the same module
+        """
+        return f'{moduleName}:{className}'
+
+    def _dropMissing(self, seenKeys: Set[str], scanned: Callable[[PluginManifestEntry], bool]):
+        """
+        Drop the entries of a scan's plugins that the scan no longer found
+
+        Args:
+            seenKeys:   The keys of the entries the scan found
+            scanned:    True for the entries the scan covers, e.g. those of one package
+        """
+        for entryKey in [entryKey for entryKey, entry in self._entries.items() if entryKey not in seenKeys and scanned(entry)]:
+            self.logger.info(f'Dropping plugin manifest entry for {entryKey}')
+            del self._entries[entryKey]
+            self._dirty = True
+
+    def _modificationTime(self, moduleInfo: ModuleInfo, className: str) -> float:
+        """
+        Returns:  The module's file modification time or 0.0 if the module is not a plain
+        file (in which case we always rebuild)
+        """
+        finderPath: str = getattr(moduleInfo.module_finder, 'path', '')
+        try:
+            return osStat(f'{finderPath}{osSep}{className}.py').st_mtime
+        except OSError:
+            return 0.0
+
+    def _originModificationTime(self, moduleName: str) -> float:
+        """
+        Locating the module imports its parent packages, but not the module itself
+
+        Returns:  The module's file modification time or 0.0 if it cannot be determined
+        """
+        try:
+            spec = find_spec(moduleName)
+            if spec is None or spec.origin is None:
+                return 0.0
+            return osStat(spec.origin).st_mtime
+        except (ImportError, ValueError, OSError):
+            return 0.0
+
+    def _entryPoints(self, group: str) -> List[EntryPoint]:
+        """
+        `entry_points()` grew a `select` API in Python 3.10;  Python 3.9 returns a dictionary
+        """
+        allEntryPoints = entry_points()
+        if hasattr(allEntryPoints, 'select') is True:
+            return list(allEntryPoints.select(group=group))
+        return list(allEntryPoints.get(group, []))
+
+    def _loadManifest(self) -> PluginManifestEntries:
+
+        entries: PluginManifestEntries = PluginManifestEntries({})
+        try:
+            with open(self._manifestFileName, 'r') as manifestFile:
+                manifestDictionary: Dict[str, Any] = jsonLoad(manifestFile)
+        except (OSError, ValueError):
+            return entries
+
+        if manifestDictionary.get('version') != MANIFEST_VERSION:
+            self.logger.info(f'Ignoring plugin manifest with version {manifestDictionary.get("version")}')
+            return entries
+        try:
+            for entryKey, entryDictionary in manifestDictionary['entries'].items():
+                entries[entryKey] = self._entryFromJson(entryDictionary)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            self.logger.warning(f'Ignoring corrupt plugin manifest: {e}')
+            entries = PluginManifestEntries({})
+
+        return entries
+
+    def _toJson(self) -> Dict[str, Any]:
+
+        jsonEntries: Dict[str, Any] = {}
+        for entryKey, entry in self._entries.items():
+            jsonEntries[entryKey] = {
+                'moduleName':       entry.moduleName,
+                'className':        entry.className,
+                'pluginName':       entry.pluginName,
+                'author':           entry.author,
+                'version':          entry.version,
+                'menuTitle':        entry.menuTitle,
+                'inputFormat':      self._formatToJson(entry.inputFormat),
+                'outputFormat':     self._formatToJson(entry.outputFormat),
+                'modificationTime': entry.modificationTime,
+                'entryPointGroup':  entry.entryPointGroup,
+            }
+        return {'version': MANIFEST_VERSION, 'entries': jsonEntries}
+
+    def _entryFromJson(self, entryDictionary: Dict[str, Any]) -> PluginManifestEntry:
+
+        entry: PluginManifestEntry = PluginManifestEntry(
+            moduleName=entryDictionary['moduleName'],
+            className=entryDictionary['className'],
+            pluginName=PluginName(entryDictionary['pluginName']),
+            author=entryDictionary['author'],
+            version=entryDictionary['version'],
+            menuTitle=entryDictionary['menuTitle'],
+            modificationTime=entryDictionary['modificationTime'],
+            entryPointGroup=entryDictionary['entryPointGroup']
+        )
+        inputFormat:  Optional[Dict[str, str]] = entryDictionary['inputFormat']
+        outputFormat: Optional[Dict[str, str]] = entryDictionary['outputFormat']
+        if inputFormat is not None:
+            entry.inputFormat = InputFormat(formatName=FormatName(inputFormat['formatName']),
+                                            extension=PluginExtension(inputFormat['extension']),
+                                            description=PluginDescription(inputFormat['description']))
+        if outputFormat is not None:
+            entry.outputFormat = OutputFormat(formatName=FormatName(outputFormat['formatName']),
+                                              extension=PluginExtension(outputFormat['extension']),
+                                              description=PluginDescription(outputFormat['description']))
+        return entry
+
+    def _formatToJson(self, pluginFormat: Union[BaseFormat, None]) -> Optional[Dict[str, str]]:
+
+        if pluginFormat is None:
+            return None
+
+        return {
+            'formatName':  pluginFormat.formatName,
+            'extension':   pluginFormat.extension,
+            'description': pluginFormat.description,
+        }
@@ -0,0 +1,263 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from functools import partial
+
+from concurrent.futures import Future
+from concurrent.futures import wait as waitForJobs
+
+from core.IMediator import IMediator
+from core.PluginAsyncExecutor import PluginAsyncExecutor
+from core.PluginManager import PluginManager
+from core.SelectionSnapshot import SelectionSnapshot
+from core.exceptions.ModelParserException import ModelParserException
+from core.exceptions.PluginCancelledException import PluginCancelledException
+from core.exceptions.PluginPipelineException import PluginPipelineException
+from core.types.FileRoutes import FileRoutes
+from core.types.PipelineResult import PipelineResult
+from core.types.PipelineStage import PipelineStage
+from core.types.PluginDataTypes import PipelineStageType
+from core.types.PluginDataTypes import PluginList
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import PluginType
+
+PluginReference = Union[PluginName, PluginType]
+StageGroups     = List[List[PipelineStage]]
+
+
+class PluginPipeline:
+    """
+    Chains plugins into one job, e.g.
+
+        result: PipelineResult = (
+            PluginPipeline(mediator)
+            .importFiles(fileNames)
+            .tool(PluginName('Sugiyama Automatic Layout'))
+            .tool(PluginName('Arrange Links'))
+            .export(PluginName('GML'), destination='/tmp/diagram.gml')
+            .run()
+        )
+
+    The pipeline's objects are snapshotted once and handed from stage to stage;  No
+    stage re-reads the selection.  After an import they are the shapes the pipeline's
+    imports added, before any import the current selection.  Imports and tools change the diagram, so they run
+    in order in one `batchUpdate`;  The frame is refreshed once, when they are done.
+
+    Export stages only read the objects.  Consecutive exports whose plugin sets
+    `WRITE_IN_BACKGROUND` run concurrently on the `PluginAsyncExecutor`;  The others run
+    on the calling thread.  Run the pipeline on the UI thread, like the plugins it runs
+    """
+    def __init__(self, mediator: IMediator, pluginManager: PluginManager = cast(PluginManager, None)):
+        """
+
+        Args:
+            mediator:       The mediator every stage runs with
+            pluginManager:  Resolves plugin names and hands out plugin instances
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._mediator:      IMediator     = mediator
+        self._pluginManager: PluginManager = PluginManager() if pluginManager is None else pluginManager
+
+        self._stages: List[PipelineStage] = []
+
+    @property
+    def stages(self) -> List[PipelineStage]:
+        return list(self._stages)
+
+    def importFiles(self, fileNames: List[str]) -> 'PluginPipeline':
+        """
+        Each input plugin reads its files in one invocation;  Files no plugin reads are skipped
+
+        Args:
+            fileNames:  File paths, e.g. every file in a source tree
+        """
+        self._stages.append(PipelineStage(stageType=PipelineStageType.IMPORT, fileNames=list(fileNames)))
+        return self
+
+    def tool(self, plugin: PluginReference) -> 'PluginPipeline':
+        """
+        Args:
+            plugin:     A tool plugin or its name;  It must not ask the user for options
+        """
+        pluginClass: PluginType = self._resolve(plugin=plugin, plugins=self._pluginManager.toolPlugins)
+
+        self._stages.append(PipelineStage(stageType=PipelineStageType.TOOL, pluginClass=pluginClass))
+        return self
+
+    def export(self, plugin: PluginReference, destination: str) -> 'PluginPipeline':
+        """
+        Args:
+            plugin:         An output plugin or its name
+            destination:    See `IOPluginInterface.setExportDestination`
+        """
+        pluginClass: PluginType = self._resolve(plugin=plugin, plugins=self._pluginManager.outputPlugins)
+
+        self._stages.append(PipelineStage(stageType=PipelineStageType.EXPORT, pluginClass=pluginClass, destination=destination))
+        return self
+
+    def run(self) -> PipelineResult:
+        """
+        Run the stages;  The first stage that fails stops the pipeline and is reported in the result
+
+        Returns:  The per stage timings
+        """
+        result:    PipelineResult = PipelineResult()
+        startTime: float          = perf_counter()
+        try:
+            self._runStages(result=result)
+            result.succeeded = True
+        except (PluginPipelineException, PluginCancelledException, ModelParserException, OSError) as e:
+            self.logger.error(f'Pipeline failed: {e}')
+            result.error = f'{type(e).__name__}: {e}'
+
+        result.timings['total'] = perf_counter() - startTime
+
+        return result
+
+    def _runStages(self, result: PipelineResult):
+
+        selection:      SelectionSnapshot = cast(SelectionSnapshot, None)
+        importedShapes: List[Any]         = []
+        for stageGroup in self._groupStages():
+            if stageGroup[0].stageType == PipelineStageType.EXPORT:
+                selection = self._objects(selection)
+                self._runExports(stageGroup=stageGroup, selection=selection, result=result)
+                continue
+
+            with self._mediator.batchUpdate():
+                for stage in stageGroup:
+                    if stage.stageType == PipelineStageType.IMPORT:
+                        self._timeStage(stage=stage, result=result, stageWork=lambda: importedShapes.extend(self._runImport(stage)))
+                        selection = SelectionSnapshot(importedShapes)
+                    else:
+                        selection = self._objects(selection)
+                        self._timeStage(stage=stage, result=result, stageWork=lambda: self._runTool(stage=stage, selection=selection))
+                self._mediator.refreshFrame()
+
+        if selection is not None:
+            result.objectCount = len(selection)
+
+    def _runImport(self, stage: PipelineStage) -> List[Any]:
+        """
+        Returns:  The shapes the input plugins added to the diagram
+        """
+        importedShapes: List[Any] = []
+
+        fileRoutes: FileRoutes = self._pluginManager.routeFiles(stage.fileNames)
+        for fileName in fileRoutes.unrouted:
+            self.logger.warning(f'No input plugin reads {fileName}')
+
+        for pluginClass, response in fileRoutes.routes.items():
+            with self._pluginManager.instancePool.checkedOut(pluginClass=pluginClass, mediator=self._mediator) as plugin:
+                imported = plugin.executeImportFiles(response)
+                self._raiseIfLimitExceeded(plugin)
+                importedShapes.extend(plugin.addedShapes)
+            if imported in (None, False):
+                raise PluginPipelineException(f'{pluginClass.PLUGIN_NAME} could not import {len(response.fileList)} files')
+
+        return importedShapes
+
+    def _runTool(self, stage: PipelineStage, selection: SelectionSnapshot):
+
+        with self._pluginManager.instancePool.checkedOut(pluginClass=stage.pluginClass, mediator=self._mediator) as plugin:
+            plugin.executeTool(selection)
+            self._raiseIfLimitExceeded(plugin)
+
+    def _raiseIfLimitExceeded(self, plugin):
+        """
+        A plugin that exceeds its resource limits stops cleanly;  The pipeline fails with the limit
+        """
+        if plugin.resourceViolation is not None:
+            raise PluginPipelineException(f'{plugin.name}: {plugin.resourceViolation.message}')
+
+    def _runExports(self, stageGroup: List[PipelineStage], selection: SelectionSnapshot, result: PipelineResult):
+        """
+        The exports that write in the background are started first, then the others run
+        here;  Waits for all of them
+        """
+        executor: PluginAsyncExecutor = PluginAsyncExecutor()
+        exports:  List[Tuple[PipelineStage, Any]] = [(stage, self._pluginInstance(stage)) for stage in stageGroup]
+
+        jobs: List[Future] = [
+            executor.submit(partial(self._export, stage=stage, plugin=plugin, selection=selection, result=result))
+            for stage, plugin in exports if plugin.WRITE_IN_BACKGROUND is True
+        ]
+        try:
+            for stage, plugin in exports:
+                if plugin.WRITE_IN_BACKGROUND is False:
+                    self._export(stage=stage, plugin=plugin, selection=selection, result=result)
+        finally:
+            waitForJobs(jobs)
+            for _, plugin in exports:
+                self._pluginManager.releasePluginInstance(plugin)
+
+        for job in jobs:
+            job.result()
+
+    def _export(self, stage: PipelineStage, plugin, selection: SelectionSnapshot, result: PipelineResult):
+
+        def exportWork():
+            exported: bool = plugin.executeExportTo(stage.destination, selection)
+            self._raiseIfLimitExceeded(plugin)
+            if exported is False:
+                raise PluginPipelineException(f'{plugin.name} did not export to {stage.destination}')
+
+        self._timeStage(stage=stage, result=result, stageWork=exportWork)
+
+    def _groupStages(self) -> StageGroups:
+        """
+        Consecutive stages that change the diagram form one group;  So do consecutive
+        exports, each of which runs on a plugin instance of its own
+        """
+        stageGroups: StageGroups = []
+        for stage in self._stages:
+            isExport: bool = stage.stageType == PipelineStageType.EXPORT
+            if len(stageGroups) > 0 and (stageGroups[-1][0].stageType == PipelineStageType.EXPORT) is isExport:
+                stageGroups[-1].append(stage)
+            else:
+                stageGroups.append([stage])
+
+        return stageGroups
+
+    def _objects(self, selection: SelectionSnapshot) -> SelectionSnapshot:
+        """
+        Returns:  The pipeline's snapshot;  Before the first import, the current selection
+        """
+        if selection is None:
+            selection = self._mediator.selectionSnapshot()
+
+        return selection
+
+    def _timeStage(self, stage: PipelineStage, result: PipelineResult, stageWork: Callable[[], None]):
+
+        timingName: str = stage.name
+        if timingName in result.timings:
+            timingName = f'{timingName}#{[id(pipelineStage) for pipelineStage in self._stages].index(id(stage))}'
+
+        startTime: float = perf_counter()
+        stageWork()
+        result.timings[timingName] = perf_counter() - startTime
+
+    def _pluginInstance(self, stage: PipelineStage):
+        return self._pluginManager.pluginInstance(pluginClass=stage.pluginClass, mediator=self._mediator)
+
+    def _resolve(self, plugin: PluginReference, plugins: PluginList) -> PluginType:
+
+        if isinstance(plugin, str):
+            pluginClass: PluginType = cast(PluginType, self._pluginManager.pluginByName(PluginName(plugin)))
+            if pluginClass is None or pluginClass not in plugins:
+                raise PluginPipelineException(f'No plugin named {plugin}')
+            return pluginClass
+
+        return plugin
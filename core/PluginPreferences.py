@@ -0,0 +1,267 @@
+
+from typing import Any
+from typing import Dict
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from json import dump as jsonDump
+from json import load as jsonLoad
+
+from os import cpu_count
+from os import makedirs
+
+from os.path import dirname
+from os.path import expanduser
+from os.path import join as osPathJoin
+
+from core.ImportCache import DEFAULT_CACHE_DIRECTORY
+from core.ImportCache import DEFAULT_MAXIMUM_SIZE
+from core.ProgressTracker import ProgressTracker
+from core.Singleton import Singleton
+
+DEFAULT_PREFERENCES_FILENAME: str = osPathJoin(expanduser('~'), '.pyut', 'pyutPluginPreferences.json')
+
+PreferencesNamespace  = NewType('PreferencesNamespace',  Dict[str, Any])
+PreferencesNamespaces = NewType('PreferencesNamespaces', Dict[str, PreferencesNamespace])
+
+
+class PluginPreferences(Singleton):
+    """
+    Settings that tune plugin throughput per machine, kept in a small JSON file that is
+    read once.  The core settings live in the `core` namespace;  Each plugin has its own
+    namespace, its name, which it reads with `PluginInterface._preference`.
+
+    A setting missing from the file, of the wrong type or out of range falls back to the
+    default given by the code that reads it, so the file only holds what an operator
+    changed.  Changes are written by `save`
+    """
+    CORE_NAMESPACE: str = 'core'
+
+    def init(self, preferencesFileName: str = DEFAULT_PREFERENCES_FILENAME):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._preferencesFileName: str                   = preferencesFileName
+        self._namespaces:          PreferencesNamespaces = self._loadPreferences()
+        self._dirty:               bool                  = False
+
+    @property
+    def preferencesFileName(self) -> str:
+        return self._preferencesFileName
+
+    def load(self, preferencesFileName: str):
+        """
+        Discard unsaved changes and read another preferences file
+        """
+        self._preferencesFileName = preferencesFileName
+        self._namespaces          = self._loadPreferences()
+        self._dirty               = False
+
+    def value(self, namespace: str, name: str, default: Any) -> Any:
+        """
+        Args:
+            namespace:  `CORE_NAMESPACE` or a plugin name
+            name:       The setting
+            default:    Used when the setting is missing or of another type
+
+        Returns:  The setting
+        """
+        storedValue: Any = self._namespaces.get(namespace, PreferencesNamespace({})).get(name, default)
+        if default is None or storedValue is default:
+            return storedValue
+        if isinstance(default, float) and isinstance(storedValue, int) and not isinstance(storedValue, bool):
+            return float(storedValue)
+        if type(storedValue) is not type(default):
+            self.logger.warning(f'Ignoring {namespace}.{name}={storedValue!r};  Expected a {type(default).__name__}')
+            return default
+
+        return storedValue
+
+    def boundedValue(self, namespace: str, name: str, default: Any, minimum: Any) -> Any:
+        """
+        Args:
+            namespace:  `CORE_NAMESPACE` or a plugin name
+            name:       The setting
+            default:    Used when the setting is missing, of another type or below the minimum
+            minimum:    The smallest valid setting
+
+        Returns:  The setting
+        """
+        storedValue: Any = self.value(namespace=namespace, name=name, default=default)
+        if storedValue < minimum:
+            self.logger.warning(f'Ignoring {namespace}.{name}={storedValue!r};  Expected at least {minimum}')
+            return default
+
+        return storedValue
+
+    def setValue(self, namespace: str, name: str, value: Any):
+
+        self._namespaces.setdefault(namespace, PreferencesNamespace({}))[name] = value
+        self._dirty = True
+
+    def save(self):
+        """
+        Write the preferences if anything changed;  Failing to write them is not fatal
+        """
+        if self._dirty is False:
+            return
+        try:
+            makedirs(dirname(self._preferencesFileName), exist_ok=True)
+            with open(self._preferencesFileName, 'w') as preferencesFile:
+                jsonDump(self._namespaces, preferencesFile, indent=2, sort_keys=True)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f'Unable to write plugin preferences {self._preferencesFileName}: {e}')
+
+    @property
+    def asyncWorkers(self) -> int:
+        """
+        The size of the thread pool that runs the non-blocking plugin entry points
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'asyncWorkers', 2, minimum=1)
+
+    @asyncWorkers.setter
+    def asyncWorkers(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'asyncWorkers', newValue)
+
+    @property
+    def batchWorkers(self) -> int:
+        """
+        The number of worker processes of a batch run, unless given on the command line
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'batchWorkers', 1, minimum=1)
+
+    @batchWorkers.setter
+    def batchWorkers(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'batchWorkers', newValue)
+
+    @property
+    def processWorkers(self) -> int:
+        """
+        The number of worker processes the plugins share;  Defaults to one less than the number of CPUs
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'processWorkers', max(1, (cpu_count() or 2) - 1), minimum=1)
+
+    @processWorkers.setter
+    def processWorkers(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'processWorkers', newValue)
+
+    @property
+    def threadWorkers(self) -> int:
+        """
+        The number of worker threads the plugins share
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'threadWorkers', 4, minimum=1)
+
+    @threadWorkers.setter
+    def threadWorkers(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'threadWorkers', newValue)
+
+    @property
+    def wallTimeLimit(self) -> float:
+        """
+        The seconds a plugin run may take;  Zero is no limit
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'wallTimeLimit', 0.0, minimum=0.0)
+
+    @wallTimeLimit.setter
+    def wallTimeLimit(self, newValue: float):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'wallTimeLimit', newValue)
+
+    @property
+    def memoryLimit(self) -> int:
+        """
+        The bytes a plugin run may grow the process by;  Zero is no limit
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'memoryLimit', 0, minimum=0)
+
+    @memoryLimit.setter
+    def memoryLimit(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'memoryLimit', newValue)
+
+    @property
+    def objectLimit(self) -> int:
+        """
+        The number of objects a plugin run may create or work on;  Zero is no limit
+        """
+        return self.boundedValue(PluginPreferences.CORE_NAMESPACE, 'objectLimit', 0, minimum=0)
+
+    @objectLimit.setter
+    def objectLimit(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'objectLimit', newValue)
+
+    @property
+    def importCacheEnabled(self) -> bool:
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'importCacheEnabled', True)
+
+    @importCacheEnabled.setter
+    def importCacheEnabled(self, newValue: bool):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'importCacheEnabled', newValue)
+
+    @property
+    def importCacheDirectory(self) -> str:
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'importCacheDirectory', DEFAULT_CACHE_DIRECTORY)
+
+    @importCacheDirectory.setter
+    def importCacheDirectory(self, newValue: str):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'importCacheDirectory', newValue)
+
+    @property
+    def importCacheSize(self) -> int:
+        """
+        The size cap of the import cache in bytes
+        """
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'importCacheSize', DEFAULT_MAXIMUM_SIZE)
+
+    @importCacheSize.setter
+    def importCacheSize(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'importCacheSize', newValue)
+
+    @property
+    def progressInterval(self) -> float:
+        """
+        The minimum time in seconds between progress updates
+        """
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'progressInterval', ProgressTracker.DEFAULT_MINIMUM_INTERVAL)
+
+    @progressInterval.setter
+    def progressInterval(self, newValue: float):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'progressInterval', newValue)
+
+    @property
+    def layoutWrapWidth(self) -> int:
+        """
+        Imported classes are laid out in rows;  A row wraps at this width in pixels
+        """
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'layoutWrapWidth', 3000)
+
+    @layoutWrapWidth.setter
+    def layoutWrapWidth(self, newValue: int):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'layoutWrapWidth', newValue)
+
+    @property
+    def autoSelectAll(self) -> bool:
+        """
+        If True, exporting with nothing selected exports the whole diagram
+        """
+        return self.value(PluginPreferences.CORE_NAMESPACE, 'autoSelectAll', False)
+
+    @autoSelectAll.setter
+    def autoSelectAll(self, newValue: bool):
+        self.setValue(PluginPreferences.CORE_NAMESPACE, 'autoSelectAll', newValue)
+
+    def _loadPreferences(self) -> PreferencesNamespaces:
+
+        try:
+            with open(self._preferencesFileName, 'r') as preferencesFile:
+                namespaces: Any = jsonLoad(preferencesFile)
+        except (OSError, ValueError):
+            return PreferencesNamespaces({})
+
+        if isinstance(namespaces, dict) is False or all(isinstance(namespace, dict) for namespace in namespaces.values()) is False:
+            self.logger.warning(f'Ignoring corrupt plugin preferences {self._preferencesFileName}')
+            return PreferencesNamespaces({})
+
+        return PreferencesNamespaces(namespaces)
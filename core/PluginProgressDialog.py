@@ -0,0 +1,61 @@
+
+from typing import cast
+
+from wx import PD_APP_MODAL
+from wx import PD_CAN_ABORT
+from wx import PD_ELAPSED_TIME
+
+from wx import CallAfter
+from wx import IsMainThread
+from wx import ProgressDialog
+
+from core.CancellationToken import CancellationToken
+
+from core.types.PluginProgress import PluginProgress
+
+
+class PluginProgressDialog:
+    """
+    How the host shows the progress of every long running plugin operation:  A progress
+    dialog with the estimated time left and a cancel button that cancels the plugin.
+
+    It is a progress listener;  Progress reported on a worker thread is handed to the
+    UI thread
+    """
+    RANGE: int = 1000
+
+    def __init__(self, title: str, cancellationToken: CancellationToken):
+
+        self._cancellationToken: CancellationToken = cancellationToken
+        self._dialog:            ProgressDialog    = ProgressDialog(title, 'Starting', maximum=PluginProgressDialog.RANGE, parent=None,
+                                                                    style=PD_APP_MODAL | PD_ELAPSED_TIME | PD_CAN_ABORT)
+
+    def __call__(self, progress: PluginProgress):
+
+        if IsMainThread() is True:
+            self._update(progress)
+        else:
+            CallAfter(self._update, progress)
+
+    def destroy(self):
+
+        if self._dialog is not None:
+            self._dialog.Destroy()
+            self._dialog = cast(ProgressDialog, None)
+
+    def _update(self, progress: PluginProgress):
+
+        if self._dialog is None:
+            return
+
+        message: str = progress.message
+        if progress.eta >= 0:
+            message = f'{message}  ({progress.eta:.0f} seconds left)'
+
+        if progress.total > 0:
+            keepGoing, _ = self._dialog.Update(round(progress.fraction * PluginProgressDialog.RANGE), message)
+        else:
+            keepGoing, _ = self._dialog.Pulse(message)
+
+        if keepGoing is False:
+            self._cancellationToken.cancel()
@@ -0,0 +1,167 @@
+
+from typing import Any
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from importlib import import_module
+
+from threading import RLock
+
+from core.IMediator import IMediator
+from core.PluginLoadProfiler import PluginLoadProfiler
+from core.SelectionSnapshot import SelectionSnapshot
+
+from core.types.InputFormat import InputFormat
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginLoadMeasurement import PluginLoadPhase
+from core.types.PluginManifestEntry import PluginManifestEntry
+
+
+class PluginProxy:
+    """
+    A lightweight stand-in for a plugin class.
+
+    The plugin manager hands out subclasses of this class (one per plugin) in place of
+    the real plugin classes.  The plugin metadata is answered from the manifest entry;
+    the real plugin module is imported the first time the plugin is executed or the first
+    time some other plugin attribute is requested.
+
+    Do not instantiate this class directly;  Use `createProxyClass`
+    """
+    manifestEntry: PluginManifestEntry = cast(PluginManifestEntry, None)
+    _pluginClass:  type                = cast(type, None)
+
+    clsLogger: Logger = getLogger(__name__)
+    loadLock:  RLock  = RLock()       # Serializes the loading of plugin modules
+
+    def __init__(self, mediator: IMediator):
+
+        self._mediator: IMediator = mediator
+        self._plugin:   Any       = None
+
+    @classmethod
+    def createProxyClass(cls, manifestEntry: PluginManifestEntry) -> type:
+        """
+        Args:
+            manifestEntry:  The description of the plugin to proxy
+
+        Returns:  A new proxy class for the plugin;  It carries the same class metadata
+        attributes as the real plugin class
+        """
+        classAttributes = {
+            'manifestEntry':  manifestEntry,
+            '_pluginClass':   None,
+            'PLUGIN_NAME':    manifestEntry.pluginName,
+            'PLUGIN_AUTHOR':  manifestEntry.author,
+            'PLUGIN_VERSION': manifestEntry.version,
+            'MENU_TITLE':     manifestEntry.menuTitle,
+            'INPUT_FORMAT':   manifestEntry.inputFormat,
+            'OUTPUT_FORMAT':  manifestEntry.outputFormat,
+        }
+        return type(manifestEntry.className, (cls, ), classAttributes)
+
+    @classmethod
+    def pluginClass(cls) -> type:
+        """
+        Import (once) the real plugin class;  Safe to call from several threads
+
+        Returns:  The real plugin class
+        """
+        if cls.__dict__.get('_pluginClass') is None:
+            with PluginProxy.loadLock:
+                if cls.__dict__.get('_pluginClass') is None:
+                    entry:    PluginManifestEntry = cls.manifestEntry
+                    profiler: PluginLoadProfiler  = PluginLoadProfiler()
+                    cls.clsLogger.info(f'Loading plugin {entry.moduleName}')
+                    with profiler.measure(entry.moduleName, PluginLoadPhase.IMPORT):
+                        module = import_module(entry.moduleName)
+                    with profiler.measure(entry.moduleName, PluginLoadPhase.CLASS_LOOKUP):
+                        cls._pluginClass = getattr(module, entry.className)
+
+        return cls._pluginClass
+
+    @classmethod
+    def isLoaded(cls) -> bool:
+        return cls.__dict__.get('_pluginClass') is not None
+
+    @property
+    def plugin(self):
+        """
+        Returns:  The real plugin instance; Created on first access
+        """
+        if self._plugin is None:
+            pluginClass: type = self.pluginClass()
+            with PluginLoadProfiler().measure(self.manifestEntry.moduleName, PluginLoadPhase.INSTANTIATION):
+                self._plugin = pluginClass(self._mediator)
+        return self._plugin
+
+    @property
+    def name(self) -> PluginName:
+        return self.manifestEntry.pluginName
+
+    @property
+    def author(self) -> str:
+        return self.manifestEntry.author
+
+    @property
+    def version(self) -> str:
+        return self.manifestEntry.version
+
+    @property
+    def inputFormat(self) -> InputFormat:
+        return self.manifestEntry.inputFormat
+
+    @property
+    def outputFormat(self) -> OutputFormat:
+        return self.manifestEntry.outputFormat
+
+    @property
+    def menuTitle(self) -> str:
+        return self.manifestEntry.menuTitle
+
+    @property
+    def mediator(self) -> IMediator:
+        return self._mediator
+
+    @mediator.setter
+    def mediator(self, mediator: IMediator):
+        self._mediator = mediator
+        if self._plugin is not None:
+            self._plugin.mediator = mediator
+
+    def reset(self):
+        """
+        Nothing to reset until the real plugin exists
+        """
+        if self._plugin is not None:
+            self._plugin.reset()
+
+    def executeImport(self):
+        return self.plugin.executeImport()
+
+    def executeImportFiles(self, response: MultipleFileRequestResponse):
+        return self.plugin.executeImportFiles(response)
+
+    def executeExport(self):
+        return self.plugin.executeExport()
+
+    def executeExportTo(self, destination: str, selection: SelectionSnapshot = cast(SelectionSnapshot, None)):
+        return self.plugin.executeExportTo(destination, selection)
+
+    def executeTool(self, selection: SelectionSnapshot = cast(SelectionSnapshot, None)):
+        return self.plugin.executeTool(selection)
+
+    def __getattr__(self, attributeName: str):
+        """
+        Anything not answered by the manifest is delegated to the real plugin
+        """
+        if attributeName.startswith('__') or attributeName in ('_mediator', '_plugin'):
+            raise AttributeError(attributeName)
+        return getattr(self.plugin, attributeName)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} proxy loaded={self.isLoaded()}>'
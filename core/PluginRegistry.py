@@ -0,0 +1,147 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Lock
+
+from core.types.BaseFormat import BaseFormat
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginList
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import PluginType
+
+PluginNameIndex = NewType('PluginNameIndex', Dict[PluginName, PluginType])
+PluginIndex     = NewType('PluginIndex',     Dict[str, PluginList])
+
+
+class PluginRegistry:
+    """
+    Holds the plugin classes (usually `PluginProxy` classes) and indexes them by plugin name,
+    by format name and by file extension.  Only the class metadata is used to build the indices
+    so registering a plugin never imports or instantiates it.
+
+    Format names and extensions are indexed case-insensitively.
+
+    Registering is serialized and copy-on-write:  A registration builds new lists and
+    indices and then publishes them, so lookups from any thread take no lock and never
+    see a half registered plugin
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._registrationLock: Lock = Lock()
+
+        self._ioPlugins:   PluginList = PluginList([])
+        self._toolPlugins: PluginList = PluginList([])
+
+        self._byName:            PluginNameIndex = PluginNameIndex({})
+        self._byFormatName:      PluginIndex     = PluginIndex({})
+        self._inputByExtension:  PluginIndex     = PluginIndex({})
+        self._outputByExtension: PluginIndex     = PluginIndex({})
+
+    @property
+    def ioPlugins(self) -> PluginList:
+        return self._ioPlugins
+
+    @property
+    def toolPlugins(self) -> PluginList:
+        return self._toolPlugins
+
+    def registerIOPlugin(self, pluginClass: PluginType) -> bool:
+        """
+        Args:
+            pluginClass: The I/O plugin class
+
+        Returns:  `True` if registered, `False` if a plugin with the same name is already registered
+        """
+        with self._registrationLock:
+            if self._indexName(pluginClass) is False:
+                return False
+
+            inputFormat:  BaseFormat = pluginClass.INPUT_FORMAT
+            outputFormat: BaseFormat = pluginClass.OUTPUT_FORMAT
+            if inputFormat is not None:
+                self._byFormatName     = self._addToIndex(self._byFormatName,     inputFormat.formatName, pluginClass)
+                self._inputByExtension = self._addToIndex(self._inputByExtension, inputFormat.extension,  pluginClass)
+            if outputFormat is not None:
+                if inputFormat is None or inputFormat.formatName != outputFormat.formatName:
+                    self._byFormatName = self._addToIndex(self._byFormatName, outputFormat.formatName, pluginClass)
+                self._outputByExtension = self._addToIndex(self._outputByExtension, outputFormat.extension, pluginClass)
+
+            self._ioPlugins = PluginList(self._ioPlugins + [pluginClass])
+
+        return True
+
+    def registerToolPlugin(self, pluginClass: PluginType) -> bool:
+        """
+        Args:
+            pluginClass: The tool plugin class
+
+        Returns:  `True` if registered, `False` if a plugin with the same name is already registered
+        """
+        with self._registrationLock:
+            if self._indexName(pluginClass) is False:
+                return False
+
+            self._toolPlugins = PluginList(self._toolPlugins + [pluginClass])
+
+        return True
+
+    def pluginByName(self, pluginName: PluginName) -> Optional[PluginType]:
+        return self._byName.get(pluginName)
+
+    def pluginsByFormatName(self, formatName: FormatName) -> PluginList:
+        return self._lookup(self._byFormatName, formatName)
+
+    def inputPluginsByExtension(self, extension: PluginExtension) -> PluginList:
+        """
+        Args:
+            extension:  A file extension with or without the leading '.'
+
+        Returns:  The input plugins that read files with that extension
+        """
+        return self._lookup(self._inputByExtension, extension.lstrip('.'))
+
+    def outputPluginsByExtension(self, extension: PluginExtension) -> PluginList:
+        """
+        Args:
+            extension:  A file extension with or without the leading '.'
+
+        Returns:  The output plugins that write files with that extension
+        """
+        return self._lookup(self._outputByExtension, extension.lstrip('.'))
+
+    def _indexName(self, pluginClass: PluginType) -> bool:
+
+        pluginName: PluginName = pluginClass.PLUGIN_NAME
+        if pluginName in self._byName:
+            self.logger.warning(f'Duplicate plugin name `{pluginName}`; ignoring {pluginClass}')
+            return False
+
+        self._byName = PluginNameIndex({**self._byName, pluginName: pluginClass})
+        return True
+
+    def _addToIndex(self, index: PluginIndex, key: str, pluginClass: PluginType) -> PluginIndex:
+        """
+        Returns:  A copy of the index with the plugin added
+        """
+        indexKey: str = key.lower()
+
+        return PluginIndex({**index, indexKey: PluginList(index.get(indexKey, []) + [pluginClass])})
+
+    def _lookup(self, index: PluginIndex, key: str) -> PluginList:
+        return PluginList(list(index.get(key.lower(), [])))
+
+    def __len__(self) -> int:
+        return len(self._byName)
+
+    def __repr__(self) -> str:
+        names: List[str] = [str(name) for name in self._byName.keys()]
+        return f'<PluginRegistry {names}>'
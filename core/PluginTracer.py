@@ -0,0 +1,113 @@
+
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from secrets import token_hex
+
+from threading import Lock
+from threading import local
+
+from time import time_ns
+
+from core.Singleton import Singleton
+from core.SpanSink import SpanSink
+from core.types.PluginSpan import PluginSpan
+
+
+class PluginTracer(Singleton):
+    """
+    Times plugin invocations and their phases.  A span started while another span is
+    open on the same thread becomes its child.  Finished spans go to the registered
+    sinks;  Without a sink the spans are neither timed nor recorded, so instrumented code
+    costs next to nothing.
+
+    Spans of parsers that run in a child process are not collected
+    """
+    def init(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._sinks:       List[SpanSink] = []
+        self._sinksLock:   Lock           = Lock()
+        self._threadLocal: local          = local()
+
+    @property
+    def enabled(self) -> bool:
+        return len(self._sinks) > 0
+
+    def addSink(self, sink: SpanSink):
+        with self._sinksLock:
+            self._sinks = self._sinks + [sink]
+
+    def removeSink(self, sink: SpanSink):
+        with self._sinksLock:
+            self._sinks = [registered for registered in self._sinks if registered is not sink]
+
+    def close(self):
+        """
+        Close and remove every sink
+        """
+        with self._sinksLock:
+            sinks: List[SpanSink] = self._sinks
+            self._sinks = []
+        for sink in sinks:
+            sink.close()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[PluginSpan]:
+        """
+        Time the enclosed block
+
+        Args:
+            name:           The phase, e.g. `read` or `sugiyama.barycenter`
+            **attributes:   Initial attributes;  Add more to the yielded span's `attributes`
+
+        Returns:  The span
+        """
+        if len(self._sinks) == 0:
+            yield PluginSpan(name=name, attributes=attributes)
+            return
+
+        openSpans: List[PluginSpan] = self._openSpans()
+        parent:    PluginSpan       = openSpans[-1] if len(openSpans) > 0 else PluginSpan(traceId=token_hex(16))
+
+        span: PluginSpan = PluginSpan(name=name,
+                                      traceId=parent.traceId,
+                                      spanId=token_hex(8),
+                                      parentSpanId=parent.spanId,
+                                      startTime=time_ns(),
+                                      attributes=attributes)
+        openSpans.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            span.endTime = time_ns()
+            openSpans.pop()
+            self._export(span)
+
+    def _openSpans(self) -> List[PluginSpan]:
+
+        openSpans: Optional[List[PluginSpan]] = getattr(self._threadLocal, 'openSpans', None)
+        if openSpans is None:
+            openSpans = []
+            self._threadLocal.openSpans = openSpans
+
+        return openSpans
+
+    def _export(self, span: PluginSpan):
+
+        for sink in self._sinks:
+            try:
+                sink.export(span)
+            except (OSError, Exception) as e:
+                self.logger.error(f'{sink.__class__.__name__} failed to export {span.name}: {e}')
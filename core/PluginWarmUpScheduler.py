@@ -0,0 +1,152 @@
+
+from typing import Any
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from heapq import heappop
+from heapq import heappush
+
+from threading import Event
+from threading import Lock
+from threading import Thread
+
+from core.types.PluginDataTypes import PluginList
+from core.types.PluginDataTypes import PluginType
+
+HIGH_WARM_UP_PRIORITY:    int = 0
+DEFAULT_WARM_UP_PRIORITY: int = 50
+LOW_WARM_UP_PRIORITY:     int = 100
+
+
+@dataclass(order=True)
+class WarmUpRequest:
+    """
+    Lower priority values are warmed up first;  Requests of equal priority are
+    warmed up in the order they were scheduled
+    """
+    priority:    int        = DEFAULT_WARM_UP_PRIORITY
+    sequence:    int        = 0
+    pluginClass: PluginType = field(default=cast(PluginType, None), compare=False)
+
+
+WarmUpQueue = NewType('WarmUpQueue', List[WarmUpRequest])
+
+
+class PluginWarmUpScheduler:
+    """
+    Imports and pre-initializes plugins off the critical path so that the first
+    use of a heavy plugin does not stall the UI.
+
+    The host either calls `start()` once its main window is shown, which warms up
+    the scheduled plugins on a daemon thread, or calls `runNext()` from an idle
+    handler to warm up one plugin per idle event.  `cancel()` stops either mode
+    after the plugin that is currently warming up.
+
+    Warming up a plugin loads its real class (for a `PluginProxy`) and then calls the
+    plugin class `warmUp()` hook.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._queue:     WarmUpQueue = WarmUpQueue([])
+        self._sequence:  int         = 0
+        self._lock:      Lock        = Lock()
+        self._cancelled: Event       = Event()
+        self._thread:    Thread      = cast(Thread, None)
+
+        self._warmedUp: PluginList = PluginList([])
+
+    @property
+    def pendingCount(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    @property
+    def warmedUp(self) -> PluginList:
+        """
+        Returns:  The plugin classes that were successfully warmed up
+        """
+        return PluginList(list(self._warmedUp))
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def schedule(self, pluginClass: PluginType, priority: int = DEFAULT_WARM_UP_PRIORITY):
+        """
+        Scheduling new work re-arms a cancelled scheduler
+
+        Args:
+            pluginClass:    The plugin (or plugin proxy) class to warm up
+            priority:       Lower values are warmed up first
+        """
+        self._cancelled.clear()
+        with self._lock:
+            heappush(self._queue, WarmUpRequest(priority=priority, sequence=self._sequence, pluginClass=pluginClass))
+            self._sequence += 1
+
+    def start(self) -> Thread:
+        """
+        Warm up all scheduled plugins on a background daemon thread
+
+        Returns:  The warm-up thread
+        """
+        if self._thread is None or self._thread.is_alive() is False:
+            self._cancelled.clear()
+            self._thread = Thread(target=self._runAll, name='PluginWarmUp', daemon=True)
+            self._thread.start()
+
+        return self._thread
+
+    def runNext(self) -> bool:
+        """
+        Warm up the next plugin on the calling thread;  Suitable for an idle callback
+
+        Returns:  `True` if there is more work to do
+        """
+        if self._cancelled.is_set() is True:
+            return False
+
+        with self._lock:
+            if len(self._queue) == 0:
+                return False
+            request: WarmUpRequest = heappop(self._queue)
+
+        self._warmUp(request.pluginClass)
+
+        return self.pendingCount > 0 and self._cancelled.is_set() is False
+
+    def cancel(self):
+        """
+        Discard the plugins that have not been warmed up yet
+        """
+        self._cancelled.set()
+        with self._lock:
+            self._queue = WarmUpQueue([])
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _runAll(self):
+        while self.runNext() is True:
+            pass
+
+    def _warmUp(self, pluginClass: PluginType):
+
+        try:
+            realClass: Any = pluginClass.pluginClass() if hasattr(pluginClass, 'pluginClass') else pluginClass
+            realClass.warmUp()
+            self._warmedUp.append(pluginClass)
+            self.logger.info(f'Warmed up {realClass.__name__}')
+        except Exception as e:      # Warming up is best effort;  The plugin fails again, visibly, when it is used
+            self.logger.error(f'Unable to warm up {pluginClass}: {e}')
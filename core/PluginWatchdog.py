@@ -0,0 +1,204 @@
+
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from threading import Event
+from threading import Thread
+
+from time import perf_counter
+
+import tracemalloc
+
+from core.CancellationToken import CancellationToken
+from core.exceptions.ResourceLimitExceededException import ResourceLimitExceededException
+from core.types.PluginDataTypes import ResourceLimitType
+from core.types.ResourceLimits import ResourceLimits
+from core.types.ResourceViolation import ResourceViolation
+
+STATM_FILENAME: str = '/proc/self/statm'
+
+Phases = Tuple[str, ...]
+
+
+class PluginWatchdog:
+    """
+    Enforces the `ResourceLimits` of one plugin run.  A daemon thread samples the elapsed
+    time and the memory growth;  Objects are counted by the plugin as it creates them.  The
+    first limit exceeded is recorded as the `violation` and cancels the run's token with a
+    `ResourceLimitExceededException`, so the run stops cleanly at its next cancellation check.
+
+    The plugin marks its phases with `inPhase`;  The violation names the innermost one
+    """
+    def __init__(self, limits: ResourceLimits, cancellationToken: CancellationToken, phase: str = ''):
+        """
+
+        Args:
+            limits:             The run's budget
+            cancellationToken:  The run's token
+            phase:              The phase the run starts in
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._limits:            ResourceLimits    = limits
+        self._cancellationToken: CancellationToken = cancellationToken
+
+        self._phases:       Phases            = (phase, )
+        self._objectCount:  int               = 0
+        self._peakMemory:   int               = 0
+        self._violation:    ResourceViolation = cast(ResourceViolation, None)
+        self._startTime:    float             = 0.0
+        self._baseMemory:   int               = 0
+        self._tracing:      bool              = False     # Memory is measured with tracemalloc
+        self._startedTrace: bool              = False
+        self._stopSampling: Event             = Event()
+        self._sampler:      Thread            = cast(Thread, None)
+
+    @property
+    def violation(self) -> Optional[ResourceViolation]:
+        """
+        Returns:  The first limit exceeded, or `None`
+        """
+        return self._violation
+
+    @property
+    def phase(self) -> str:
+        return self._phases[-1]
+
+    @property
+    def objectCount(self) -> int:
+        return self._objectCount
+
+    @property
+    def peakMemory(self) -> int:
+        """
+        Returns:  The largest memory growth sampled, in bytes
+        """
+        return self._peakMemory
+
+    @property
+    def elapsedTime(self) -> float:
+        return perf_counter() - self._startTime
+
+    def start(self):
+
+        self._startTime = perf_counter()
+        if self._limits.peakMemory > 0:
+            self._tracing = self._limits.traceAllocations is True or self._residentMemory() is None
+            if self._tracing is True and tracemalloc.is_tracing() is False:
+                tracemalloc.start()
+                self._startedTrace = True
+            self._baseMemory = self._memory(peak=False)
+            if self._tracing is True:
+                tracemalloc.reset_peak()
+
+        if self._limits.wallTime > 0 or self._limits.peakMemory > 0:
+            self._stopSampling.clear()
+            self._sampler = Thread(target=self._sample, name='PluginWatchdog', daemon=True)
+            self._sampler.start()
+
+    def stop(self):
+        """
+        Stop sampling;  A last sample is taken, so a short run that exceeded a limit is
+        still reported
+        """
+        if self._sampler is not None:
+            self._stopSampling.set()
+            self._sampler.join()
+            self._sampler = cast(Thread, None)
+        if self._startedTrace is True:
+            tracemalloc.stop()
+            self._startedTrace = False
+
+    @contextmanager
+    def inPhase(self, phase: str) -> Iterator[str]:
+        """
+        Args:
+            phase:  What the plugin is about to do
+
+        Returns:  The phase
+        """
+        self._phases = self._phases + (phase, )
+        try:
+            yield phase
+        finally:
+            self._phases = self._phases[:-1]
+
+    def addObjects(self, count: int):
+        """
+        Count objects the plugin created or works on
+
+        Args:
+            count:  The number of new objects
+        """
+        self._objectCount += count
+        if 0 < self._limits.maximumObjects < self._objectCount:
+            self._exceeded(limitType=ResourceLimitType.OBJECT_COUNT, measured=self._objectCount, maximum=self._limits.maximumObjects)
+            self._cancellationToken.raiseIfCancelled()
+
+    def __enter__(self) -> 'PluginWatchdog':
+        self.start()
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.stop()
+
+    def _sample(self):
+        """
+        Runs on the sampling thread until stopped or a limit is exceeded
+        """
+        stopped: bool = False
+        while stopped is False and self._violation is None:
+            stopped = self._stopSampling.wait(self._limits.sampleInterval)
+
+            elapsedTime: float = self.elapsedTime
+            if 0 < self._limits.wallTime < elapsedTime:
+                self._exceeded(limitType=ResourceLimitType.WALL_TIME, measured=round(elapsedTime, 3), maximum=self._limits.wallTime)
+            if self._limits.peakMemory > 0:
+                self._peakMemory = max(self._peakMemory, self._memory(peak=True) - self._baseMemory)
+                if self._peakMemory > self._limits.peakMemory:
+                    self._exceeded(limitType=ResourceLimitType.PEAK_MEMORY, measured=self._peakMemory, maximum=self._limits.peakMemory)
+
+    def _exceeded(self, limitType: ResourceLimitType, measured: Union[float, int], maximum: Union[float, int]):
+
+        if self._violation is not None:
+            return
+        self._violation = ResourceViolation(limitType=limitType, phase=self.phase, measured=measured, maximum=maximum)
+        self.logger.warning(self._violation.message)
+        self._cancellationToken.cancel(reason=self._violation.message, exceptionClass=ResourceLimitExceededException)
+
+    def _memory(self, peak: bool) -> int:
+        """
+        Args:
+            peak:   With tracemalloc, the peak since the last sample instead of the current size
+
+        Returns:  The traced or resident memory in bytes
+        """
+        if self._tracing is True:
+            current, peakSize = tracemalloc.get_traced_memory()
+            if peak is True:
+                tracemalloc.reset_peak()
+                return peakSize
+            return current
+
+        return cast(int, self._residentMemory())
+
+    def _residentMemory(self) -> Optional[int]:
+        """
+        Returns:  The resident set size in bytes;  `None` where /proc is not available
+        """
+        try:
+            from os import sysconf
+
+            with open(STATM_FILENAME, 'r') as statmFile:
+                residentPages: int = int(statmFile.read().split()[1])
+            return residentPages * sysconf('SC_PAGE_SIZE')
+        except (ImportError, OSError, ValueError, IndexError):
+            return None
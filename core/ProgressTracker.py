@@ -0,0 +1,151 @@
+
+from typing import List
+from typing import cast
+
+from os.path import getsize
+
+from time import perf_counter
+
+from core.CancellationToken import CancellationToken
+
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ProgressUnit
+from core.types.PluginProgress import PluginProgress
+from core.types.PluginProgress import ProgressListener
+
+
+class ProgressTracker:
+    """
+    Tracks the progress of one long running operation and reports it to a listener.
+
+    Work is counted in units (steps, files or bytes).  When the items of work differ
+    in size, give their weights, e.g. the file sizes;  `update` then takes the number
+    of items done and reports the weighted units done.
+
+    Reports are throttled to one per `minimumInterval`;  Updating a progress dialog per
+    file is a measurable cost on large imports.  The first and the final report are
+    always sent.  Every update checks the cancellation token, so plugins that report
+    progress can be cancelled
+    """
+    DEFAULT_MINIMUM_INTERVAL: float = 0.25      # seconds
+
+    def __init__(self, listener: ProgressListener,
+                 pluginName:        PluginName        = PluginName(''),
+                 total:             int               = 0,
+                 weights:           List[int]         = cast(List[int], None),
+                 unit:              ProgressUnit      = ProgressUnit.STEPS,
+                 cancellationToken: CancellationToken = cast(CancellationToken, None),
+                 minimumInterval:   float             = DEFAULT_MINIMUM_INTERVAL):
+        """
+
+        Args:
+            listener:           Called with the throttled progress
+            pluginName:         Reported with the progress
+            total:              The units of work;  Ignored when there are weights
+            weights:            Optional;  The units of each item of work
+            unit:               What the units are
+            cancellationToken:  Optional;  Checked on every update
+            minimumInterval:    The minimum time in seconds between reports
+        """
+        self._listener:          ProgressListener  = listener
+        self._pluginName:        PluginName        = pluginName
+        self._unit:              ProgressUnit      = unit
+        self._cancellationToken: CancellationToken = cancellationToken
+        self._minimumInterval:   float             = minimumInterval
+
+        self._cumulativeWeights: List[int] = []
+        if weights is not None:
+            runningTotal: int = 0
+            for weight in weights:
+                self._cumulativeWeights.append(runningTotal)
+                runningTotal += weight
+            self._cumulativeWeights.append(runningTotal)
+            total = runningTotal
+
+        self._total:      int   = total
+        self._completed:  int   = 0
+        self._startTime:  float = perf_counter()
+        self._lastReport: float = -1.0
+
+    @classmethod
+    def fileWeights(cls, fileNames: List[str]) -> List[int]:
+        """
+        Returns:  The size of each file;  0 for files that cannot be read
+        """
+        weights: List[int] = []
+        for fileName in fileNames:
+            try:
+                weights.append(getsize(fileName))
+            except OSError:
+                weights.append(0)
+
+        return weights
+
+    @property
+    def completed(self) -> int:
+        return self._completed
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self._startTime
+
+    @property
+    def eta(self) -> float:
+        """
+        Assumes the remaining units go as fast as the completed ones
+
+        Returns:  The estimated seconds to completion;  -1.0 until it can be estimated
+        """
+        if self._completed <= 0 or self._total <= 0:
+            return -1.0
+
+        return self.elapsed * max(self._total - self._completed, 0) / self._completed
+
+    def update(self, itemsDone: int, message: str = ''):
+        """
+        Args:
+            itemsDone:  The number of items done;  Weighted if the tracker has weights
+            message:    What the plugin is doing
+        """
+        if len(self._cumulativeWeights) > 0:
+            itemsDone = min(max(itemsDone, 0), len(self._cumulativeWeights) - 1)
+            self._completed = self._cumulativeWeights[itemsDone]
+        else:
+            self._completed = itemsDone
+
+        self._report(message=message, force=False)
+
+    def advance(self, units: int = 1, message: str = ''):
+        """
+        Args:
+            units:      The units of work just done
+            message:    What the plugin is doing
+        """
+        self._completed += units
+
+        self._report(message=message, force=False)
+
+    def finish(self, message: str = 'Done'):
+        """
+        Report the work as complete, regardless of the throttle and the cancellation token
+        """
+        self._completed = max(self._completed, self._total)
+
+        self._report(message=message, force=True)
+
+    def _report(self, message: str, force: bool):
+
+        if force is False and self._cancellationToken is not None:
+            self._cancellationToken.raiseIfCancelled()
+
+        now: float = perf_counter()
+        if force is False and self._lastReport >= 0 and now - self._lastReport < self._minimumInterval:
+            return
+        self._lastReport = now
+
+        self._listener(PluginProgress(pluginName=self._pluginName, current=self._completed, message=message,
+                                      total=self._total, unit=self._unit, eta=self.eta))
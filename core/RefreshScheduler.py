@@ -0,0 +1,152 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+Bounds        = Tuple[int, int, int, int]          # left, top, right, bottom
+ShapeBounds   = Dict[int, Optional[Bounds]]        # id(shape) -> its bounds;  None if unknown
+Painter       = Callable[[Optional[Bounds]], None]      # Repaints the region;  None for the whole frame
+Dispatcher    = Callable[[Callable[[], None]], None]    # Runs the flush on the next event loop tick
+ShapeProvider = Callable[[], Optional[Iterable[Any]]]   # The painted shapes;  None if they cannot be tracked
+
+
+class RefreshScheduler:
+    """
+    Coalesces refresh requests.  The first request schedules a flush with the dispatcher,
+    e.g. `wx.CallAfter`;  Requests made before it runs are merged into it, so a plugin that
+    refreshes after every layout step repaints once per event loop tick.
+
+    The flush compares the bounds of the shapes with those they had at the previous
+    flush and repaints the union of the old and new bounds of the shapes that moved,
+    appeared or disappeared.  The whole frame is repainted on the first flush, when any
+    shape's bounds are unknown, when nothing moved (something else changed) and after
+    `invalidateAll`
+    """
+    MARGIN: int = 8     # Pixels around a shape for selection handles, arrow heads and line widths
+
+    def __init__(self, painter: Painter, dispatcher: Dispatcher, shapeProvider: ShapeProvider):
+        """
+
+        Args:
+            painter:        Repaints a region
+            dispatcher:     Schedules the flush
+            shapeProvider:  Returns the shapes whose movement is tracked
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._painter:       Painter       = painter
+        self._dispatcher:    Dispatcher    = dispatcher
+        self._shapeProvider: ShapeProvider = shapeProvider
+
+        self._scheduled:     bool        = False
+        self._invalidateAll: bool        = False
+        self._paintedBounds: ShapeBounds = cast(ShapeBounds, None)
+
+        self.requestCount: int = 0
+        self.paintCount:   int = 0
+
+    @property
+    def scheduled(self) -> bool:
+        return self._scheduled
+
+    def requestRefresh(self):
+        """
+        Schedule a flush unless one is already scheduled
+        """
+        self.requestCount += 1
+        if self._scheduled is False:
+            self._scheduled = True
+            self._dispatcher(self.flush)
+
+    def invalidateAll(self):
+        """
+        Repaint the whole frame on the next flush
+        """
+        self._invalidateAll = True
+        self.requestRefresh()
+
+    def flush(self):
+        """
+        Repaint what changed since the previous flush;  Does nothing if no refresh was requested
+        """
+        if self._scheduled is False:
+            return
+        self._scheduled = False
+
+        currentBounds: ShapeBounds      = self._shapeBounds()
+        region:        Optional[Bounds] = None
+        if self._invalidateAll is False and self._paintedBounds is not None and currentBounds is not None:
+            region = self._dirtyRegion(paintedBounds=self._paintedBounds, currentBounds=currentBounds)
+
+        self._paintedBounds = currentBounds
+        self._invalidateAll = False
+        self.paintCount += 1
+
+        self._painter(region)
+
+    @classmethod
+    def shapeBounds(cls, shape: Any) -> Optional[Bounds]:
+        """
+        Args:
+            shape:  A line, rectangle or point shape
+
+        Returns:  The shape's bounds, widened by `MARGIN`;  None for other shapes
+        """
+        if hasattr(shape, 'GetSegments'):
+            points = shape.GetSegments()
+            if len(points) == 0:
+                return None
+            left:   int = min(int(x) for x, _ in points)
+            top:    int = min(int(y) for _, y in points)
+            right:  int = max(int(x) for x, _ in points)
+            bottom: int = max(int(y) for _, y in points)
+        elif hasattr(shape, 'GetTopLeft') and hasattr(shape, 'GetSize'):
+            x, y          = shape.GetTopLeft()
+            width, height = shape.GetSize()
+            left, top, right, bottom = int(x), int(y), int(x + width), int(y + height)
+        elif hasattr(shape, 'GetPosition'):
+            x, y = shape.GetPosition()
+            left, top, right, bottom = int(x), int(y), int(x), int(y)
+        else:
+            return None
+
+        margin: int = RefreshScheduler.MARGIN
+
+        return left - margin, top - margin, right + margin, bottom + margin
+
+    def _shapeBounds(self) -> ShapeBounds:
+
+        shapes: Optional[Iterable[Any]] = self._shapeProvider()
+        if shapes is None:
+            return cast(ShapeBounds, None)
+
+        return {id(shape): RefreshScheduler.shapeBounds(shape) for shape in shapes}
+
+    def _dirtyRegion(self, paintedBounds: ShapeBounds, currentBounds: ShapeBounds) -> Optional[Bounds]:
+        """
+        Returns:  The union of the changed bounds;  None if the whole frame must be repainted
+        """
+        if None in paintedBounds.values() or None in currentBounds.values():
+            return None
+
+        region: Optional[Bounds] = None
+        for shapeId in paintedBounds.keys() | currentBounds.keys():
+            before: Optional[Bounds] = paintedBounds.get(shapeId)
+            after:  Optional[Bounds] = currentBounds.get(shapeId)
+            if before == after:
+                continue
+            for bounds in (before, after):
+                if bounds is not None:
+                    region = bounds if region is None else self._union(region, bounds)
+
+        return region
+
+    def _union(self, first: Bounds, second: Bounds) -> Bounds:
+        return min(first[0], second[0]), min(first[1], second[1]), max(first[2], second[2]), max(first[3], second[3])
@@ -0,0 +1,95 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from plugins.common.Types import OglClasses
+from plugins.common.Types import OglLinks
+from plugins.common.Types import OglObjects
+
+if TYPE_CHECKING:
+    from ogl.OglClass import OglClass
+    from ogl.OglNote import OglNote
+
+OglNotes         = NewType('OglNotes',         List['OglNote'])
+ShapesById       = NewType('ShapesById',       Dict[int, Any])
+OglClassesByName = NewType('OglClassesByName', Dict[str, 'OglClass'])
+
+
+class SelectionSnapshot:
+    """
+    The selected shapes at the moment a plugin was invoked, split by kind and indexed by
+    Pyut id and, for classes, by Pyut name.  The selection is fetched and partitioned once;
+    Later changes to the selection are not reflected.
+
+    Shapes that are neither classes, notes nor links (e.g. lollipop interfaces) are kept
+    in `others`
+    """
+    def __init__(self, oglObjects: OglObjects):
+
+        from ogl.OglClass import OglClass
+        from ogl.OglLink import OglLink
+        from ogl.OglNote import OglNote
+
+        self._oglObjects: List[Any]  = list(oglObjects)
+        self._oglClasses: OglClasses = OglClasses([])
+        self._oglNotes:   OglNotes   = OglNotes([])
+        self._oglLinks:   OglLinks   = OglLinks([])
+        self._others:     List[Any]  = []
+
+        self._byId:   ShapesById       = ShapesById({})
+        self._byName: OglClassesByName = OglClassesByName({})
+
+        for oglObject in self._oglObjects:
+            if isinstance(oglObject, OglClass):
+                self._oglClasses.append(oglObject)
+                self._byName[oglObject.pyutObject.name] = oglObject
+            elif isinstance(oglObject, OglNote):
+                self._oglNotes.append(oglObject)
+            elif isinstance(oglObject, OglLink):
+                self._oglLinks.append(oglObject)
+            else:
+                self._others.append(oglObject)
+
+            pyutObject = getattr(oglObject, 'pyutObject', None)
+            if pyutObject is not None:
+                self._byId[pyutObject.id] = oglObject
+
+    @property
+    def oglObjects(self) -> OglObjects:
+        """
+        Returns:  Every selected shape in selection order
+        """
+        return self._oglObjects
+
+    @property
+    def oglClasses(self) -> OglClasses:
+        return self._oglClasses
+
+    @property
+    def oglNotes(self) -> OglNotes:
+        return self._oglNotes
+
+    @property
+    def oglLinks(self) -> OglLinks:
+        return self._oglLinks
+
+    @property
+    def others(self) -> List[Any]:
+        return self._others
+
+    def shapeById(self, pyutId: int) -> Optional[Any]:
+        return self._byId.get(pyutId)
+
+    def oglClassByName(self, className: str) -> Optional['OglClass']:
+        return self._byName.get(className)
+
+    def __len__(self) -> int:
+        return len(self._oglObjects)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._oglObjects)
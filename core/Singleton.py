@@ -1,3 +1,8 @@
+from typing import Dict
+
+from threading import Lock
+from threading import RLock
+
 from types import MethodType
 
 
@@ -29,7 +34,14 @@ class Singleton(object):
         class B(Singleton):
             def __init__(self, theNewValue):
                 self.theNewValue = theNewValue
+
+    The instance is created once even if several threads ask for it at the same time;
+    They wait until `init` returns.  Each class has its own lock, so one singleton's
+    `init` may use another singleton.  Once the instance exists no lock is taken
     """
+    _classLocks:     Dict[type, RLock] = {}
+    _classLocksLock: Lock              = Lock()
+
     def __new__(cls, *args, **kwargs):
         """
         New operator of a singleton class.
@@ -38,15 +50,21 @@ class Singleton(object):
         """
         instance = cls.__dict__.get("__instance__")
         if instance is None:
-            instance = object.__new__(cls)
-            assert type(instance.__init__) != MethodType, f"Error, your singleton class {cls} cannot contain a __init__ method."
-            try:
-                instance.init(*args, **kwargs)
-            except Exception as e:
-                raise e
-            cls.__instance__ = instance
+            with Singleton._classLock(cls):
+                instance = cls.__dict__.get("__instance__")
+                if instance is None:
+                    instance = object.__new__(cls)
+                    assert type(instance.__init__) != MethodType, f"Error, your singleton class {cls} cannot contain a __init__ method."
+                    instance.init(*args, **kwargs)
+                    cls.__instance__ = instance
         return instance
 
+    @staticmethod
+    def _classLock(singletonClass: type) -> RLock:
+
+        with Singleton._classLocksLock:
+            return Singleton._classLocks.setdefault(singletonClass, RLock())
+
     def init(self, *args, **kwargs):
         """
         Constructor of a singleton class.
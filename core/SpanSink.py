@@ -0,0 +1,21 @@
+
+from abc import ABC
+from abc import abstractmethod
+
+from core.types.PluginSpan import PluginSpan
+
+
+class SpanSink(ABC):
+    """
+    Receives the finished spans of the `PluginTracer`.  Sinks are called on the thread
+    that finished the span;  Implementations must be thread safe
+    """
+    @abstractmethod
+    def export(self, span: PluginSpan):
+        pass
+
+    def close(self):
+        """
+        Flush and release resources;  The default is to do nothing
+        """
+        pass
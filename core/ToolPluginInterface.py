@@ -1,8 +1,19 @@
+from typing import Any
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
 
 from abc import ABC
 from abc import abstractmethod
 
+from concurrent.futures import Future
+
+from core.CancellationToken import CancellationToken
+from core.PluginAsyncExecutor import PluginAsyncExecutor
 from core.PluginInterface import PluginInterface
+from core.SelectionSnapshot import SelectionSnapshot
+from core.exceptions.PluginCancelledException import PluginCancelledException
 
 from core.IMediator import IMediator
 
@@ -11,22 +22,86 @@ class ToolPluginInterface(PluginInterface, ABC):
     """
     This interface defines the methods and properties that Pyut Tool
     plugins must implement.
+
+    Tools rearrange the diagram, so by default `executeToolAsync` runs `doAction` on the UI
+    thread.  Tools that set `COMPUTE_IN_BACKGROUND` split their action in two:  `computeAction`
+    only reads the selection and runs on a worker thread, `applyAction` changes the diagram
+    and runs on the UI thread.  Long running tools check the cancellation token so that the
+    host (or a timeout) can stop them from another thread
     """
+    MENU_TITLE:            str  = 'Not Set'
+    COMPUTE_IN_BACKGROUND: bool = False         # True if the tool implements `computeAction` and `applyAction`
+
+    clsLogger: Logger = getLogger(__name__)
 
     def __init__(self, mediator: IMediator):
 
         super().__init__(mediator)
 
-        self._menuTitle: str = 'Not Set'
+        self._menuTitle: str = self.MENU_TITLE
 
-    def executeTool(self):
+    def executeTool(self, selection: SelectionSnapshot = cast(SelectionSnapshot, None)):
         """
         This is used by Pyut to invoke the tool.  This should NOT
         be overridden
+
+        Args:
+            selection:  Optional;  The objects to work on, e.g. handed on by a `PluginPipeline`.
+            Defaults to the mediator's selection
+        """
+        self._cancellationToken = CancellationToken()
+        with self._watchResources(), self._span('executeTool'):
+            with self._span('setOptions'):
+                proceed: bool = self.setOptions()
+            if proceed is True:
+                self._selection = self._mediator.selectionSnapshot() if selection is None else selection
+                try:
+                    self._doAction()
+                except PluginCancelledException:
+                    self.clsLogger.info(f'{self.name}: cancelled')
+
+    def executeToolAsync(self, cancellationToken: CancellationToken = cast(CancellationToken, None),
+                         selection: SelectionSnapshot = cast(SelectionSnapshot, None)) -> Future:
+        """
+        The non-blocking variant of `executeTool`;  Call it on the UI thread
+
+        Args:
+            cancellationToken:  Cancel it to stop the tool
+            selection:          Optional;  The objects to work on.  Defaults to the mediator's selection
+
+        Returns:  A job that completes once the tool is done, or was cancelled
+        """
+        self._cancellationToken = CancellationToken() if cancellationToken is None else cancellationToken
+        with self._span('setOptions'):
+            proceed: bool = self.setOptions()
+        if proceed is False:
+            return PluginAsyncExecutor().completed(None)
+
+        self._selection = self._mediator.selectionSnapshot() if selection is None else selection
+
+        if self.COMPUTE_IN_BACKGROUND is True:
+            return self._executeAsync(name='executeToolAsync', backgroundWork=self._computeAction, uiWork=self._applyAction)
+
+        return self._executeAsync(name='executeToolAsync', uiWork=lambda _: self._doAction())
+
+    def computeAction(self) -> Any:
+        """
+        Tools that set `COMPUTE_IN_BACKGROUND` do their computation here;  `executeToolAsync`
+        runs it on a worker thread, so it may read the selected shapes but must not change
+        them or touch the UI
+
+        Returns:  What `applyAction` needs to change the diagram
+        """
+        return None
+
+    def applyAction(self, result: Any):
+        """
+        Change the diagram with the result of `computeAction`;  Runs on the UI thread
+
+        Args:
+            result: What `computeAction` returned
         """
-        if self.setOptions() is True:
-            selectedShapes = self._mediator.selectedOglObjects
-            self.doAction(self._oglClasses, selectedShapes)
+        pass
 
     @property
     def menuTitle(self) -> str:
@@ -45,6 +120,24 @@ class ToolPluginInterface(PluginInterface, ABC):
     @abstractmethod
     def doAction(self):
         """
-        Do the tool's action
+        Do the tool's action;  Tools that set `COMPUTE_IN_BACKGROUND` usually do
+        `self.applyAction(self.computeAction())`
         """
         pass
+
+    def _doAction(self):
+
+        self._countObjects(len(self._selection))
+        with self._span('doAction', objectCount=len(self._selection)):
+            self.doAction()
+
+    def _computeAction(self) -> Any:
+
+        self._countObjects(len(self._selection))
+        with self._span('computeAction', objectCount=len(self._selection)):
+            return self.computeAction()
+
+    def _applyAction(self, result: Any):
+
+        with self._span('applyAction'):
+            self.applyAction(result)
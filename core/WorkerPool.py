@@ -0,0 +1,251 @@
+
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from atexit import register as atExitRegister
+
+from importlib import import_module
+
+from multiprocessing import get_context
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from threading import Lock
+
+from core.CancellationToken import CancellationToken
+from core.PluginPreferences import PluginPreferences
+from core.Singleton import Singleton
+
+WorkerInitializer  = str        # 'module' or 'module:callable', e.g. 'plugins.io.java.JavaReader'
+WorkerInitializers = Tuple[WorkerInitializer, ...]
+
+
+def _initializeWorker(workerInitializers: WorkerInitializers):
+    """
+    The process worker initializer;  A failing initializer would break the pool, so
+    failures are only logged
+    """
+    logger: Logger = getLogger(__name__)
+    for workerInitializer in workerInitializers:
+        moduleName, _, attributeName = workerInitializer.partition(':')
+        try:
+            initializer: Any = import_module(moduleName)
+            if attributeName != '':
+                for name in attributeName.split('.'):
+                    initializer = getattr(initializer, name)
+                initializer()
+        except Exception as e:
+            logger.warning(f'Worker initializer {workerInitializer} failed: {e}')
+
+
+class WorkerPool(Singleton):
+    """
+    The process and thread workers that plugins share;  The host reaches it through
+    `PluginManager.workerPool`.  Neither pool is started until work is first submitted
+    to it, and both are shut down when the host exits.
+
+    Process workers are spawned, never forked, and each runs the registered worker
+    initializers once when it starts;  Plugins register theirs, e.g. to import their parser
+    modules, with `registerWorkerInitializers`.  Work submitted to the workers, its arguments
+    and its result must be picklable.  A worker that dies breaks its pool;  The work it ran
+    fails with a `BrokenProcessPool` and the next submit starts new workers.
+
+    Thread workers suit work that releases the GIL, e.g. image encoding
+    """
+    POLL_INTERVAL: float = 0.1     # seconds
+
+    def init(self, processWorkers: int = cast(int, None), threadWorkers: int = cast(int, None), workerInitializers: WorkerInitializers = ()):
+        """
+
+        Args:
+            processWorkers:     The number of worker processes;  Defaults to `PluginPreferences.processWorkers`
+            threadWorkers:      The number of worker threads;  Defaults to `PluginPreferences.threadWorkers`
+            workerInitializers: What each worker process imports, or calls, when it starts
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        preferences: PluginPreferences = PluginPreferences()
+
+        self._processWorkers:     int                     = preferences.processWorkers if processWorkers is None else processWorkers
+        self._threadWorkers:      int                     = preferences.threadWorkers if threadWorkers is None else threadWorkers
+        self._workerInitializers: List[WorkerInitializer] = list(workerInitializers)
+
+        self._lock:              Lock                = Lock()
+        self._processPool:       ProcessPoolExecutor = cast(ProcessPoolExecutor, None)
+        self._threadPool:        ThreadPoolExecutor  = cast(ThreadPoolExecutor, None)
+        self._shutdownScheduled: bool                = False
+
+    @property
+    def processWorkers(self) -> int:
+        return self._processWorkers
+
+    @property
+    def threadWorkers(self) -> int:
+        return self._threadWorkers
+
+    @property
+    def processesStarted(self) -> bool:
+        return self._processPool is not None
+
+    @property
+    def threadsStarted(self) -> bool:
+        return self._threadPool is not None
+
+    @property
+    def workerInitializers(self) -> WorkerInitializers:
+        return tuple(self._workerInitializers)
+
+    def registerWorkerInitializers(self, workerInitializers: Iterable[WorkerInitializer]):
+        """
+        Add to what each worker process runs when it starts;  Registering an initializer
+        again does nothing.  Worker processes that are already running are not initialized
+        again, so plugins register before they first submit work
+
+        Args:
+            workerInitializers: 'module' or 'module:callable' names
+        """
+        with self._lock:
+            for workerInitializer in workerInitializers:
+                if workerInitializer not in self._workerInitializers:
+                    self._workerInitializers.append(workerInitializer)
+
+    def submitToProcess(self, work: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Args:
+            work:       A module level function or a class method
+            *args:      Passed on to the work
+            **kwargs:   Passed on to the work
+
+        Returns:  The job
+        """
+        try:
+            return self._processes().submit(work, *args, **kwargs)
+        except BrokenProcessPool:
+            self.logger.warning('A worker process died;  Restarting the worker processes')
+            self.restartProcesses()
+            return self._processes().submit(work, *args, **kwargs)
+
+    def submitToThread(self, work: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Args:
+            work:       Must not touch the UI
+            *args:      Passed on to the work
+            **kwargs:   Passed on to the work
+
+        Returns:  The job
+        """
+        return self._threads().submit(work, *args, **kwargs)
+
+    def mapInProcesses(self, work: Callable[[Any], Any], items: List[Any],
+                       cancellationToken: CancellationToken = cast(CancellationToken, None)) -> Generator[Any, None, None]:
+        """
+        Run the work on every item at the same time;  Results are yielded in the order of
+        the items.  Closing the iterator, or a failed item, cancels the items that have not
+        started;  Those that have finish in the background
+
+        Args:
+            work:               Called with one item;  A module level function or a class method
+            items:              The picklable items
+            cancellationToken:  Checked while waiting;  Raises `PluginCancelledException` once cancelled
+
+        Returns:  The results
+        """
+        jobs: List[Future] = [self.submitToProcess(work, item) for item in items]
+        try:
+            for job in jobs:
+                yield self.waitFor(job=job, cancellationToken=cancellationToken)
+        finally:
+            for job in jobs:
+                job.cancel()
+
+    def waitFor(self, job: Future, cancellationToken: CancellationToken = cast(CancellationToken, None),
+                whileWaiting: Callable[[], None] = cast(Callable[[], None], None)) -> Any:
+        """
+        Args:
+            job:                A job from this pool
+            cancellationToken:  Checked every poll interval;  Raises `PluginCancelledException` once cancelled
+            whileWaiting:       Optional;  Called every poll interval until the job is done
+
+        Returns:  The job's result
+        """
+        while True:
+            try:
+                return job.result(timeout=WorkerPool.POLL_INTERVAL)
+            except FutureTimeoutError:
+                if cancellationToken is not None:
+                    cancellationToken.raiseIfCancelled()
+                if whileWaiting is not None:
+                    whileWaiting()
+
+    def restartProcesses(self):
+        """
+        Stop the worker processes, including those still running work;  The next submit
+        starts new ones
+        """
+        with self._lock:
+            processPool: ProcessPoolExecutor = self._processPool
+            self._processPool = cast(ProcessPoolExecutor, None)
+        if processPool is None:
+            return
+
+        # The executor has no public way to stop a busy worker
+        processes: List = list((getattr(processPool, '_processes', None) or {}).values())
+        processPool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive() is True:
+                process.terminate()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop both pools;  Work that has not started is cancelled.  Submitting more work
+        starts them again
+        """
+        with self._lock:
+            processPool: ProcessPoolExecutor = self._processPool
+            threadPool:  ThreadPoolExecutor  = self._threadPool
+
+            self._processPool = cast(ProcessPoolExecutor, None)
+            self._threadPool  = cast(ThreadPoolExecutor, None)
+
+        if processPool is not None:
+            processPool.shutdown(wait=wait, cancel_futures=True)
+        if threadPool is not None:
+            threadPool.shutdown(wait=wait, cancel_futures=True)
+
+    def _processes(self) -> ProcessPoolExecutor:
+
+        with self._lock:
+            if self._processPool is None:
+                self.logger.info(f'Starting {self._processWorkers} worker processes')
+                self._processPool = ProcessPoolExecutor(max_workers=self._processWorkers, mp_context=get_context('spawn'),
+                                                        initializer=_initializeWorker, initargs=(tuple(self._workerInitializers),))
+                self._scheduleShutdown()
+            return self._processPool
+
+    def _threads(self) -> ThreadPoolExecutor:
+
+        with self._lock:
+            if self._threadPool is None:
+                self._threadPool = ThreadPoolExecutor(max_workers=self._threadWorkers, thread_name_prefix='PluginWorker')
+                self._scheduleShutdown()
+            return self._threadPool
+
+    def _scheduleShutdown(self):
+        """
+        Called with the lock held
+        """
+        if self._shutdownScheduled is False:
+            atExitRegister(self.shutdown)
+            self._shutdownScheduled = True
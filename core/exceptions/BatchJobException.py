@@ -0,0 +1,3 @@
+
+class BatchJobException(Exception):
+    pass
@@ -0,0 +1,3 @@
+
+class ModelParserException(Exception):
+    pass
@@ -0,0 +1,3 @@
+
+class PluginCancelledException(Exception):
+    pass
@@ -0,0 +1,3 @@
+
+class PluginPipelineException(Exception):
+    pass
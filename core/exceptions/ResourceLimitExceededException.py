@@ -0,0 +1,6 @@
+
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+
+class ResourceLimitExceededException(PluginCancelledException):
+    pass
@@ -0,0 +1,21 @@
+
+from typing import List
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginName
+
+
+@dataclass
+class BatchJob:
+    """
+    Reverse engineer one directory tree, run tools over the diagram and optionally
+    export it.  An empty `exportExtension` means no export
+    """
+    directoryName:   str              = ''
+    toolNames:       List[PluginName] = field(default_factory=list)
+    exportExtension: PluginExtension  = PluginExtension('')
+    outputDirectory: str              = ''
+
@@ -0,0 +1,23 @@
+
+from typing import Dict
+
+from dataclasses import dataclass
+from dataclasses import field
+
+
+def createTimingsFactory() -> Dict[str, float]:
+    return {}
+
+
+@dataclass
+class BatchJobResult:
+    """
+    The timings are in seconds, keyed by step name:  `import`, `tool:<plugin name>`,
+    `export:<plugin name>` and `total`;  See `PipelineResult`
+    """
+    directoryName: str              = ''
+    succeeded:     bool             = False
+    error:         str              = ''
+    fileCount:     int              = 0
+    shapeCount:    int              = 0
+    timings:       Dict[str, float] = field(default_factory=createTimingsFactory)
@@ -0,0 +1,24 @@
+
+from typing import Dict
+from typing import List
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
+from core.types.PluginDataTypes import PluginType
+
+
+def createRoutesFactory() -> Dict[PluginType, MultipleFileRequestResponse]:
+    return {}
+
+
+@dataclass
+class FileRoutes:
+    """
+    The result of routing a mixed list of files to the input plugins.  Each plugin
+    gets all of its files as one request;  Files that no input plugin reads are
+    `unrouted`
+    """
+    routes:   Dict[PluginType, MultipleFileRequestResponse] = field(default_factory=createRoutesFactory)
+    unrouted: List[str]                                      = field(default_factory=list)
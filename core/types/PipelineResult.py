@@ -0,0 +1,22 @@
+
+from typing import Dict
+
+from dataclasses import dataclass
+from dataclasses import field
+
+
+def createTimingsFactory() -> Dict[str, float]:
+    return {}
+
+
+@dataclass
+class PipelineResult:
+    """
+    The timings are in seconds, keyed by stage name (see `PipelineStage.name`), plus
+    `total`.  A stage that appears more than once is suffixed with its position, e.g.
+    `tool:Arrange Links#3`
+    """
+    succeeded:   bool             = False
+    error:       str              = ''
+    objectCount: int              = 0
+    timings:     Dict[str, float] = field(default_factory=createTimingsFactory)
@@ -0,0 +1,32 @@
+
+from typing import List
+from typing import cast
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from core.types.PluginDataTypes import PipelineStageType
+from core.types.PluginDataTypes import PluginType
+
+
+@dataclass
+class PipelineStage:
+    """
+    One step of a `PluginPipeline`.  An import stage routes its files to the input plugins
+    by extension;  A tool stage runs its plugin over the pipeline's objects;  An export
+    stage writes them to its destination
+    """
+    stageType:   PipelineStageType = PipelineStageType.TOOL
+    pluginClass: PluginType        = cast(PluginType, None)     # None for an import stage
+    fileNames:   List[str]         = field(default_factory=list)
+    destination: str               = ''
+
+    @property
+    def name(self) -> str:
+        """
+        Returns:  The key of the stage's timing, e.g. `tool:Sugiyama Automatic Layout`
+        """
+        if self.stageType == PipelineStageType.IMPORT:
+            return 'import'
+
+        return f'{self.stageType.value.lower()}:{self.pluginClass.PLUGIN_NAME}'
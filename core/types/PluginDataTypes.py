@@ -10,8 +10,6 @@ from enum import Enum
 from dataclasses import dataclass
 from dataclasses import field
 
-from wx import NewIdRef
-
 if TYPE_CHECKING:
     from core.IOPluginInterface import IOPluginInterface
     from core.ToolPluginInterface import ToolPluginInterface
@@ -22,7 +20,7 @@ PluginType = Union['ToolPluginInterface', 'IOPluginInterface']
 #  Both of these hold the class types for the Plugins
 #
 PluginList   = NewType('PluginList',  List[PluginType])
-PluginIDMap  = NewType('PluginIDMap', Dict[NewIdRef, PluginType])
+PluginIDMap  = NewType('PluginIDMap', Dict[int, PluginType])     # wx ids
 
 
 def createPlugIdMapFactory() -> PluginIDMap:
@@ -35,6 +33,41 @@ PluginExtension   = NewType('PluginExtension', str)
 PluginDescription = NewType('PluginDescription', str)
 
 
+class ReadMode(Enum):
+    """
+    Where an input plugin parses its files
+    """
+    IN_PROCESS     = 'InProcess'
+    OUT_OF_PROCESS = 'OutOfProcess'
+
+
+class ProgressUnit(Enum):
+    """
+    What a plugin's progress is measured in
+    """
+    STEPS = 'Steps'
+    FILES = 'Files'
+    BYTES = 'Bytes'
+
+
+class PipelineStageType(Enum):
+    """
+    What a stage of a `PluginPipeline` does
+    """
+    IMPORT = 'Import'
+    TOOL   = 'Tool'
+    EXPORT = 'Export'
+
+
+class ResourceLimitType(Enum):
+    """
+    Which of a plugin run's `ResourceLimits` was exceeded
+    """
+    WALL_TIME    = 'WallTime'
+    PEAK_MEMORY  = 'PeakMemory'
+    OBJECT_COUNT = 'ObjectCount'
+
+
 class IOPluginMapType(Enum):
     INPUT_MAP  = 'InputMap'
     OUTPUT_MAP = 'OutputMap'
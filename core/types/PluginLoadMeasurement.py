@@ -0,0 +1,21 @@
+
+from enum import Enum
+
+from dataclasses import dataclass
+
+
+class PluginLoadPhase(Enum):
+    IMPORT        = 'import'
+    CLASS_LOOKUP  = 'classLookup'
+    INSTANTIATION = 'instantiation'
+
+
+@dataclass
+class PluginLoadMeasurement:
+    """
+    The cost of one plugin load phase.  The memory delta is only measured
+    while `tracemalloc` is tracing;  Otherwise it is reported as 0
+    """
+    phase:       PluginLoadPhase = PluginLoadPhase.IMPORT
+    wallTime:    float           = 0.0      # seconds
+    memoryDelta: int             = 0        # bytes
@@ -0,0 +1,27 @@
+
+from typing import cast
+
+from dataclasses import dataclass
+
+from core.types.InputFormat import InputFormat
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import PluginName
+
+
+@dataclass
+class PluginManifestEntry:
+    """
+    Everything the plugin manager needs to know about a plugin without
+    importing the plugin's module;  `entryPointGroup` is empty for the plugins
+    found in a plugin package
+    """
+    moduleName:       str          = ''
+    className:        str          = ''
+    pluginName:       PluginName   = PluginName('')
+    author:           str          = ''
+    version:          str          = ''
+    menuTitle:        str          = ''
+    inputFormat:      InputFormat  = cast(InputFormat, None)
+    outputFormat:     OutputFormat = cast(OutputFormat, None)
+    modificationTime: float        = 0.0
+    entryPointGroup:  str          = ''
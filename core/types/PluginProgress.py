@@ -0,0 +1,33 @@
+
+from typing import Callable
+
+from dataclasses import dataclass
+
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ProgressUnit
+
+
+@dataclass
+class PluginProgress:
+    """
+    Sent to the progress listeners of a plugin.  Listeners are called on the thread that
+    does the work;  UI listeners must hand the event to the UI thread themselves
+    """
+    pluginName: PluginName   = PluginName('')
+    current:    int          = 0
+    message:    str          = ''
+    total:      int          = 0                    # 0 when the plugin does not know how much work there is
+    unit:       ProgressUnit = ProgressUnit.STEPS
+    eta:        float        = -1.0                 # seconds;  Negative until it can be estimated
+
+    @property
+    def fraction(self) -> float:
+        """
+        Returns:  The fraction of the work done, 0.0 if the total is unknown
+        """
+        if self.total <= 0:
+            return 0.0
+        return min(self.current / self.total, 1.0)
+
+
+ProgressListener = Callable[[PluginProgress], None]
@@ -0,0 +1,34 @@
+
+from typing import Any
+from typing import Dict
+
+from dataclasses import dataclass
+from dataclasses import field
+
+
+def createAttributesFactory() -> Dict[str, Any]:
+    return {}
+
+
+@dataclass
+class PluginSpan:
+    """
+    One timed phase of a plugin invocation.  Spans nest;  The ids follow the OpenTelemetry
+    conventions (hex strings) so that they can be exported as is.  Times are nanoseconds
+    since the epoch
+    """
+    name:         str            = ''
+    traceId:      str            = ''
+    spanId:       str            = ''
+    parentSpanId: str            = ''
+    startTime:    int            = 0
+    endTime:      int            = 0
+    error:        str            = ''
+    attributes:   Dict[str, Any] = field(default_factory=createAttributesFactory)    # e.g. object counts, bytes processed
+
+    @property
+    def duration(self) -> float:
+        """
+        Returns:  The duration in seconds
+        """
+        return (self.endTime - self.startTime) / 1_000_000_000
@@ -0,0 +1,22 @@
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ResourceLimits:
+    """
+    The budget of one plugin run;  A limit of zero is no limit.  Memory is the growth of
+    the process's resident size while the plugin runs, sampled every `sampleInterval`
+    seconds, or, with `traceAllocations`, the peak of the Python allocations that
+    `tracemalloc` sees.  Objects are those the plugin creates or works on, e.g. the shapes
+    it lays out
+    """
+    wallTime:         float = 0.0       # seconds
+    peakMemory:       int   = 0         # bytes
+    maximumObjects:   int   = 0
+    sampleInterval:   float = 0.1       # seconds
+    traceAllocations: bool  = False
+
+    @property
+    def unlimited(self) -> bool:
+        return self.wallTime <= 0 and self.peakMemory <= 0 and self.maximumObjects <= 0
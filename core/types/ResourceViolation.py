@@ -0,0 +1,24 @@
+
+from typing import Union
+
+from dataclasses import dataclass
+
+from core.types.PluginDataTypes import ResourceLimitType
+
+
+@dataclass
+class ResourceViolation:
+    """
+    The limit a plugin run exceeded and the phase (see `PluginInterface._span`) it was in
+    """
+    limitType: ResourceLimitType = ResourceLimitType.WALL_TIME
+    phase:     str               = ''
+    measured:  Union[float, int] = 0
+    maximum:   Union[float, int] = 0
+
+    @property
+    def message(self) -> str:
+        """
+        Returns:  e.g. `PeakMemory limit exceeded in parse: 104857600 > 52428800`
+        """
+        return f'{self.limitType.value} limit exceeded in {self.phase}: {self.measured} > {self.maximum}'
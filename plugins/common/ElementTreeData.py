@@ -1,21 +1,31 @@
 
 from typing import List
+from typing import TYPE_CHECKING
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
 from pyutmodel.PyutClass import PyutClass
-from ogl.OglClass import OglClass
+
+if TYPE_CHECKING:
+    from ogl.OglClass import OglClass
 
 
 class ElementTreeData:
 
-    def __init__(self, pyutClass: PyutClass, oglClass: OglClass):
+    def __init__(self, pyutClass: PyutClass, oglClass: 'OglClass' = cast('OglClass', None)):
+        """
+
+        Args:
+            pyutClass:  The element's class
+            oglClass:   Optional;  Importers that create the Ogl classes lazily set it later
+        """
 
         self.logger: Logger = getLogger(__name__)
 
         self.pyutClass:         PyutClass  = pyutClass
-        self.oglClass:          OglClass   = oglClass
+        self.oglClass:          'OglClass' = oglClass
         self._childElementNames: List[str] = []
 
     def addChild(self, childClassName: str):
@@ -30,7 +40,8 @@ class ElementTreeData:
         self._childElementNames = theNewValues
 
     def __str__(self):
-        retStr: str = f'ElementTreeData - ClassName: {self.pyutClass.name} oglClass position: {self.oglClass.GetPosition()}\n'
+        position: str = 'not created' if self.oglClass is None else f'{self.oglClass.GetPosition()}'
+        retStr:   str = f'ElementTreeData - ClassName: {self.pyutClass.name} oglClass position: {position}\n'
 
         for childName in self.childElementNames:
             retStr += f'\t\tchildName: {childName}\n'
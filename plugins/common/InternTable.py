@@ -0,0 +1,165 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from dataclasses import dataclass
+
+from sys import getsizeof
+
+from threading import Lock
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutType import PyutType
+
+from core.Singleton import Singleton
+
+
+@dataclass
+class InternStatistics:
+    """
+    A snapshot of the `InternTable` counters
+    """
+    names:      int = 0     # Distinct names in the table
+    types:      int = 0     # Distinct PyutType instances in the cache
+    hits:       int = 0     # Lookups answered from the table
+    misses:     int = 0     # Lookups that added an entry
+    savedBytes: int = 0     # Approximately;  The size of the duplicates that were not kept
+
+
+class InternTable(Singleton):
+    """
+    The reverse engineers create the same names and types over and over, e.g. `self`,
+    `int`, `List[str]`.  They share one copy of each name, and one `PyutType` per type
+    name;  `PyutType` is read-only, so the instances can be shared by every field,
+    parameter and method.
+
+    Classes that were pickled, i.e. parsed on a worker process or read from the import
+    cache, come back with copies of their own;  `internClasses` shares them again when
+    they are merged.  The table lives as long as the process;  `clear` empties it
+    """
+    def init(self):
+
+        self._lock:  Lock                = Lock()
+        self._names: Dict[str, str]      = {}
+        self._types: Dict[str, PyutType] = {}
+
+        self._hits:       int = 0
+        self._misses:     int = 0
+        self._savedBytes: int = 0
+
+        self._typeSize: int = self._instanceSize(PyutType())
+
+    @property
+    def statistics(self) -> InternStatistics:
+        with self._lock:
+            return InternStatistics(names=len(self._names), types=len(self._types), hits=self._hits, misses=self._misses, savedBytes=self._savedBytes)
+
+    def intern(self, name: str) -> str:
+        """
+        Args:
+            name:   A class, method, field, parameter or type name
+
+        Returns:  The shared copy of the name
+        """
+        with self._lock:
+            return self._intern(name)
+
+    def pyutType(self, value: str) -> PyutType:
+        """
+        Use instead of creating a `PyutType`
+
+        Args:
+            value:  The type name, e.g. `List[str]`
+
+        Returns:  The shared type
+        """
+        with self._lock:
+            pyutType: Optional[PyutType] = self._types.get(value)
+            if pyutType is None:
+                pyutType = PyutType(value=self._intern(value))
+                self._types[pyutType.value] = pyutType
+                self._misses += 1
+            else:
+                self._hits       += 1
+                self._savedBytes += self._typeSize
+
+            return pyutType
+
+    def internType(self, pyutType: PyutType) -> PyutType:
+        """
+        Args:
+            pyutType:   A type that may have been created elsewhere, e.g. unpickled
+
+        Returns:  The shared type with the same value;  The type itself if it is the first of its value
+        """
+        value: str = str(pyutType)
+        with self._lock:
+            sharedType: Optional[PyutType] = self._types.get(value)
+            if sharedType is None:
+                self._types[value] = pyutType
+                self._misses += 1
+                return pyutType
+
+            self._hits += 1
+            if sharedType is not pyutType:
+                self._savedBytes += self._typeSize
+
+            return sharedType
+
+    def internClasses(self, pyutClasses: Iterable[PyutClass]):
+        """
+        Share the names and types of classes that come with copies of their own
+
+        Args:
+            pyutClasses:    Updated in place
+        """
+        for pyutClass in pyutClasses:
+            pyutClass.name = self.intern(pyutClass.name)
+            for pyutField in pyutClass.fields:
+                self._internParameter(pyutField)
+            for pyutMethod in pyutClass.methods:
+                pyutMethod.name       = self.intern(pyutMethod.name)
+                pyutMethod.returnType = self.internType(pyutMethod.returnType)
+                for pyutParameter in pyutMethod.parameters:
+                    self._internParameter(pyutParameter)
+
+    def clear(self):
+
+        with self._lock:
+            self._names.clear()
+            self._types.clear()
+
+            self._hits       = 0
+            self._misses     = 0
+            self._savedBytes = 0
+
+    def _intern(self, name: str) -> str:
+        """
+        Called with the lock held
+        """
+        internedName: Optional[str] = self._names.get(name)
+        if internedName is None:
+            self._names[name] = name
+            self._misses += 1
+            return name
+
+        self._hits += 1
+        if internedName is not name:
+            self._savedBytes += getsizeof(name)
+
+        return internedName
+
+    def _internParameter(self, pyutParameter: PyutParameter):
+        """
+        Fields are parameters too
+        """
+        pyutParameter.name = self.intern(pyutParameter.name)
+        if isinstance(pyutParameter.type, PyutType):
+            pyutParameter.type = self.internType(pyutParameter.type)
+        else:
+            pyutParameter.type = self.pyutType(str(pyutParameter.type))
+
+    def _instanceSize(self, pyutType: PyutType) -> int:
+        return getsizeof(pyutType) + getsizeof(vars(pyutType))
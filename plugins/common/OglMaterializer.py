@@ -0,0 +1,72 @@
+
+from typing import Dict
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from ogl.OglClass import OglClass
+from ogl.OglLink import OglLink
+
+from pyutmodel.PyutLinkType import PyutLinkType
+
+from plugins.common.LinkMakerMixin import LinkMakerMixin
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+from plugins.common.Types import OglClasses
+from plugins.common.Types import OglLinks
+
+OglClassesByName = NewType('OglClassesByName', Dict[str, OglClass])
+
+
+class OglMaterializer(LinkMakerMixin):
+    """
+    Turns a `ReverseEngineeredModel` into Ogl classes and links.  This is the part of
+    a reverse engineering import that must run on the UI thread
+    """
+    def __init__(self):
+
+        super().__init__()
+        self.logger: Logger = getLogger(__name__)
+
+    def materialize(self, model: ReverseEngineeredModel) -> Tuple[OglClasses, OglLinks]:
+        """
+        Args:
+            model:  The parsed model
+
+        Returns:  The Ogl classes and the Ogl links between them
+        """
+        oglClassesByName: OglClassesByName = self.createOglClasses(model=model)
+        oglLinks:         OglLinks         = self.createOglLinks(model=model, oglClassesByName=oglClassesByName)
+
+        return OglClasses(list(oglClassesByName.values())), oglLinks
+
+    def createOglClasses(self, model: ReverseEngineeredModel) -> OglClassesByName:
+
+        oglClassesByName: OglClassesByName = OglClassesByName({})
+        for className, pyutClass in model.pyutClasses.items():
+            try:
+                oglClassesByName[className] = OglClass(pyutClass)
+            except (ValueError, Exception) as e:
+                self.logger.error(f"Error while creating class {className},  {e}")
+
+        return oglClassesByName
+
+    def createOglLinks(self, model: ReverseEngineeredModel, oglClassesByName: OglClassesByName) -> OglLinks:
+
+        oglLinks: OglLinks = OglLinks([])
+        for modelLink in model.links:
+            try:
+                source:      OglClass = oglClassesByName[modelLink.sourceName]
+                destination: OglClass = oglClassesByName[modelLink.destinationName]
+            except KeyError as ke:
+                self.logger.warning(f'Apparently we are not tracking this class:  {ke}')
+                continue
+
+            if modelLink.linkType == PyutLinkType.INTERFACE:
+                oglLink: OglLink = self.createInterfaceLink(src=source, dst=destination)
+            else:
+                oglLink = self.createLink(src=source, dst=destination, linkType=modelLink.linkType)
+            oglLinks.append(oglLink)
+
+        return oglLinks
@@ -0,0 +1,34 @@
+
+from typing import Dict
+from typing import List
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutLinkType import PyutLinkType
+
+
+@dataclass
+class ModelLink:
+    """
+    A relationship between two reverse engineered classes, by class name
+    """
+    sourceName:      str          = ''
+    destinationName: str          = ''
+    linkType:        PyutLinkType = PyutLinkType.INHERITANCE
+
+
+def createPyutClassesFactory() -> Dict[str, PyutClass]:
+    return {}
+
+
+@dataclass
+class ReverseEngineeredModel:
+    """
+    The result of parsing source files, before any Ogl object exists.  It only holds
+    Pyut model objects so it can be pickled and sent back from a parser process;  The
+    `OglMaterializer` turns it into shapes on the UI thread
+    """
+    pyutClasses: Dict[str, PyutClass] = field(default_factory=createPyutClassesFactory)     # Key is the class name
+    links:       List[ModelLink]      = field(default_factory=list)
@@ -1,18 +1,25 @@
 
+from typing import List
+from typing import Optional
 from typing import cast
 
-from plugins.common.Types import OglClasses
-from plugins.common.Types import OglLinks
+from os import sep as osSep
+
+from functools import partial
+
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.common.Types import OglObjects
 
 from plugins.io.dtd.DTDParser import DTDParser
 
 from core.IMediator import IMediator
 from core.IOPluginInterface import IOPluginInterface
+from core.ModelParserProcess import ModelParser
 
 from core.types.InputFormat import InputFormat
 from core.types.OutputFormat import OutputFormat
 
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
 from core.types.PluginDataTypes import PluginDescription
 from core.types.PluginDataTypes import PluginExtension
 from core.types.PluginDataTypes import FormatName
@@ -26,17 +33,19 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('W3C DTD 1.0 file form
 
 class IODTD(IOPluginInterface):
 
+    PLUGIN_NAME:    PluginName   = PluginName('IoDTD')
+    PLUGIN_AUTHOR:  str          = "C.Dutoit <dutoitc@hotmail.com>"
+    PLUGIN_VERSION: str          = '1.0'
+    INPUT_FORMAT:   InputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT:  OutputFormat = cast(OutputFormat, None)
+
     def __init__(self, mediator: IMediator):
         super().__init__(mediator)
 
-        # from super class
-        self._name    = PluginName('IoDTD')
-        self._author  = "C.Dutoit <dutoitc@hotmail.com>"
-        self._version = '1.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = cast(OutputFormat, None)
+        self._filesToImport: List[str] = []
 
-        self._fileToImport: str = ''
+    def reset(self):
+        self._filesToImport = []
 
     def setImportOptions(self) -> bool:
         """
@@ -48,35 +57,32 @@ class IODTD(IOPluginInterface):
         if response.cancelled is True:
             return False
         else:
-            self._fileToImport = response.fileName
+            self._filesToImport = [response.fileName]
+
+        return True
+
+    def setImportFiles(self, response: MultipleFileRequestResponse) -> bool:
+        self._filesToImport = [f'{response.directoryName}{osSep}{fileName}' for fileName in response.fileList]
 
         return True
 
     def setExportOptions(self) -> bool:
         return False
 
+    def createModelParser(self) -> Optional[ModelParser]:
+        return partial(DTDParser.parseFiles, fileNames=self._filesToImport, importCache=self.importCache())
+
     def read(self) -> bool:
         """
+        The DTD files are parsed into a model;  Its Ogl classes and links are created once,
+        in bulk, when they are placed on the frame
 
         Returns:  True if import succeeded, False if error or cancelled
         """
-        filename: str = self._fileToImport
+        model: ReverseEngineeredModel = DTDParser.parseFiles(fileNames=self._filesToImport, cancellationToken=self._cancellationToken,
+                                                             progressCallback=self._reportProgress, importCache=self.importCache())
 
-        dtdParser: DTDParser = DTDParser()
-
-        dtdParser.open(filename=filename)
-
-        oglClasses: OglClasses = dtdParser.oglClasses
-        for oglClass in oglClasses:
-            self._mediator.addShape(oglClass)
-
-        oglLinks: OglLinks = dtdParser.links
-        for oglLink in oglLinks:
-            self._mediator.addShape(oglLink)
-
-        self._mediator.refreshFrame()
-
-        return True
+        return self.materialize(model=model)
 
     def write(self, oglObjects: OglObjects):
         """
@@ -4,6 +4,8 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
+from os.path import splitext
+
 from plugins.common.Types import OglObjects
 
 from plugins.io.gml.GMLExporter import GMLExporter
@@ -29,6 +31,13 @@ class IOGML(IOPluginInterface):
     """
     Sample class for input/output plug-ins.
     """
+    PLUGIN_NAME:         PluginName   = PluginName('Output GML')
+    PLUGIN_AUTHOR:       str          = "Humberto A. Sanchez II"
+    PLUGIN_VERSION:      str          = GMLExporter.VERSION
+    INPUT_FORMAT:        InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT:       OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    WRITE_IN_BACKGROUND: bool         = True
+
     def __init__(self, mediator: IMediator):
         """
 
@@ -39,14 +48,10 @@ class IOGML(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('Output GML')
-        self._author  = "Humberto A. Sanchez II"
-        self._version = GMLExporter.VERSION
-
         self._exportResponse: SingleFileRequestResponse = cast(SingleFileRequestResponse, None)
 
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    def reset(self):
+        self._exportResponse = cast(SingleFileRequestResponse, None)
 
     def setImportOptions(self) -> bool:
         """
@@ -73,6 +78,14 @@ class IOGML(IOPluginInterface):
         else:
             return True
 
+    def setExportDestination(self, destination: str) -> bool:
+
+        if splitext(destination)[1] == '':
+            destination = f'{destination}.{PLUGIN_EXTENSION}'
+        self._exportResponse = SingleFileRequestResponse(cancelled=False, fileName=destination)
+
+        return True
+
     def read(self) -> bool:
         """
         Read data from filename.
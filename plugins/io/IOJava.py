@@ -1,16 +1,19 @@
 from logging import Logger
 from logging import getLogger
 from typing import List
-from typing import cast
+from typing import Optional
 
+from os import makedirs
 from os import sep as osSep
 
-from wx import BeginBusyCursor
-from wx import EndBusyCursor as wxEndBusyCursor
-from wx import Yield as wxYield
+from functools import partial
 
 from core.IMediator import IMediator
 from core.IOPluginInterface import IOPluginInterface
+from core.ModelParserProcess import ModelParser
+from core.ProgressTracker import ProgressTracker
+from core.WorkerPool import WorkerInitializers
+from core.exceptions.PluginCancelledException import PluginCancelledException
 
 from core.types.ExportDirectoryResponse import ExportDirectoryResponse
 from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
@@ -21,10 +24,10 @@ from core.types.PluginDataTypes import FormatName
 from core.types.PluginDataTypes import PluginDescription
 from core.types.PluginDataTypes import PluginExtension
 from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ProgressUnit
+from core.types.PluginDataTypes import ReadMode
 
-from plugins.common.Types import OglClasses
-from plugins.common.Types import OglLinks
-
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.common.Types import OglObjects
 
 from plugins.io.java.JavaReader import JavaReader
@@ -43,6 +46,14 @@ class IOJava(IOPluginInterface):
 
     In the original implementation these were two different I/O Plugins
     """
+    PLUGIN_NAME:         PluginName         = PluginName('Java Code Reader and Writer')
+    PLUGIN_AUTHOR:       str                = "C.Dutoit <dutoitc@hotmail.com> and N. Dubois <nicdub@gmx.ch"
+    PLUGIN_VERSION:      str                = '1.0'
+    INPUT_FORMAT:        InputFormat        = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT:       OutputFormat       = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    READ_MODE:           ReadMode           = ReadMode.OUT_OF_PROCESS
+    WRITE_IN_BACKGROUND: bool               = True
+    WORKER_INITIALIZERS: WorkerInitializers = ('plugins.io.java.JavaReader', )
 
     def __init__(self, mediator: IMediator):
 
@@ -50,17 +61,15 @@ class IOJava(IOPluginInterface):
 
         super().__init__(mediator)
 
-        # from super class
-        self._name    = PluginName('Java Code Reader and Writer')
-        self._author  = "C.Dutoit <dutoitc@hotmail.com> and N. Dubois <nicdub@gmx.ch"
-        self._version = '1.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._exportDirectoryName: str         = ''
         self._importDirectoryName: str         = ''
         self._filesToImport:       List['str'] = []
 
+    def reset(self):
+        self._exportDirectoryName = ''
+        self._importDirectoryName = ''
+        self._filesToImport       = []
+
     def setImportOptions(self) -> bool:
 
         response: MultipleFileRequestResponse = self.askToImportMultipleFiles()
@@ -72,6 +81,12 @@ class IOJava(IOPluginInterface):
 
         return True
 
+    def setImportFiles(self, response: MultipleFileRequestResponse) -> bool:
+        self._importDirectoryName = response.directoryName
+        self._filesToImport       = response.fileList
+
+        return True
+
     def setExportOptions(self) -> bool:
         response: ExportDirectoryResponse = self.askForExportDirectoryName()
         if response.cancelled is True:
@@ -81,26 +96,37 @@ class IOJava(IOPluginInterface):
 
         return True
 
-    def read(self) -> bool:
-        BeginBusyCursor()
-        wxYield()
-
-        directoryName: str        = self._importDirectoryName
-        importFiles:   List[str]  = self._filesToImport
-        javaReader:    JavaReader = JavaReader()
+    def setExportDestination(self, destination: str) -> bool:
 
-        for importFile in importFiles:
-            fqFileName: str = f'{directoryName}{osSep}{importFile}'
-            javaReader.parseFile(fqFileName)
+        makedirs(destination, exist_ok=True)
+        self._exportDirectoryName = destination
 
-        assert javaReader.reversedClasses is not None, 'Something is broken'
+        return True
 
-        oglClasses: OglClasses = OglClasses(list(javaReader.reversedClasses.values()))
-        self._layoutUmlClasses(oglClasses=oglClasses)
-        self._layoutLinks(oglLinks=cast(OglLinks, javaReader.reversedLinks))
+    def createModelParser(self) -> Optional[ModelParser]:
+        return partial(JavaReader.parseFiles, fileNames=self._fullyQualifiedImportFiles(), importCache=self.importCache())
 
-        wxEndBusyCursor()
-        return True
+    def read(self) -> bool:
+        """
+        The in process read;  Reports progress per file, weighted by file size.  The files
+        are parsed at the same time on the shared worker processes
+
+        Returns:  False if the read was cancelled
+        """
+        fileNames: List[str] = self._fullyQualifiedImportFiles()
+        try:
+            with self._mediator.busyCursor():
+                with self._trackProgress(title='Parsing Java Files', weights=ProgressTracker.fileWeights(fileNames), unit=ProgressUnit.BYTES):
+                    model: ReverseEngineeredModel = JavaReader.parseFiles(fileNames=fileNames, cancellationToken=self._cancellationToken,
+                                                                          progressCallback=self._reportProgress,
+                                                                          importCache=self.importCache(),
+                                                                          workerPool=self._workerPool(itemCount=len(fileNames)))
+                status: bool = self.materialize(model=model)
+        except PluginCancelledException:
+            self.logger.info('Java import cancelled')
+            status = False
+
+        return status
 
     def write(self, oglObjects: OglObjects):
 
@@ -108,3 +134,6 @@ class IOJava(IOPluginInterface):
         javaWriter:    JavaWriter = JavaWriter(writeDirectory=directoryName)
 
         javaWriter.write(oglObjects=oglObjects)
+
+    def _fullyQualifiedImportFiles(self) -> List[str]:
+        return [f'{self._importDirectoryName}{osSep}{importFile}' for importFile in self._filesToImport]
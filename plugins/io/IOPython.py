@@ -1,31 +1,24 @@
 
-from typing import cast
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from logging import Logger
 from logging import getLogger
 
+from os import makedirs
 from os import sep as osSep
 
-from ogl.OglClass import OglClass
+from functools import partial
 
 from pyutmodel.PyutClass import PyutClass
 
-from wx import ICON_ERROR
-from wx import OK
-from wx import PD_APP_MODAL
-from wx import PD_ELAPSED_TIME
-
-from wx import MessageBox
-from wx import BeginBusyCursor
-from wx import EndBusyCursor
-from wx import ProgressDialog
-
-from wx import Yield as wxYield
-
 from core.IMediator import IMediator
 from core.IOPluginInterface import IOPluginInterface
+from core.ModelParserProcess import ModelParser
+from core.ProgressTracker import ProgressTracker
+from core.WorkerPool import WorkerInitializers
+from core.exceptions.PluginCancelledException import PluginCancelledException
 
 from core.types.ExportDirectoryResponse import ExportDirectoryResponse
 from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
@@ -36,9 +29,10 @@ from core.types.PluginDataTypes import PluginDescription
 from core.types.PluginDataTypes import PluginExtension
 from core.types.PluginDataTypes import FormatName
 from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ProgressUnit
+from core.types.PluginDataTypes import ReadMode
 
-from plugins.common.Types import OglClasses
-from plugins.common.Types import OglLinks
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.common.Types import OglObjects
 
 from plugins.io.python.PyutToPython import MethodsCodeType
@@ -52,24 +46,37 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Python code generatio
 
 class IOPython(IOPluginInterface):
 
+    PLUGIN_NAME:         PluginName         = PluginName('IOPython')
+    PLUGIN_AUTHOR:       str                = 'Humberto A. Sanchez II'
+    PLUGIN_VERSION:      str                = '1.0'
+    INPUT_FORMAT:        InputFormat        = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT:       OutputFormat       = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    READ_MODE:           ReadMode           = ReadMode.OUT_OF_PROCESS
+    WRITE_IN_BACKGROUND: bool               = True
+    WORKER_INITIALIZERS: WorkerInitializers = ('plugins.io.python.ReverseEngineerPython2:ReverseEngineerPython2.warmUpParser', )
+
     def __init__(self, mediator: IMediator):
 
         super().__init__(mediator)
 
         self.logger: Logger = getLogger(__name__)
 
-        # from super class
-        self._name    = PluginName('IOPython')
-        self._author  = 'Humberto A. Sanchez II'
-        self._version = '1.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._exportDirectoryName: str         = ''
         self._importDirectoryName: str         = ''
         self._filesToImport:       List['str'] = []
 
-        self._readProgressDlg: ProgressDialog = cast(ProgressDialog, None)
+    @classmethod
+    def warmUp(cls):
+        """
+        Importing the parser deserializes the ANTLR ATN;  Parsing a small sample also
+        fills the shared DFA cache that the first real parse would otherwise build
+        """
+        ReverseEngineerPython2.warmUpParser()
+
+    def reset(self):
+        self._exportDirectoryName = ''
+        self._importDirectoryName = ''
+        self._filesToImport       = []
 
     def setImportOptions(self) -> bool:
         """
@@ -86,6 +93,12 @@ class IOPython(IOPluginInterface):
 
         return True
 
+    def setImportFiles(self, response: MultipleFileRequestResponse) -> bool:
+        self._importDirectoryName = response.directoryName
+        self._filesToImport       = response.fileList
+
+        return True
+
     def setExportOptions(self) -> bool:
         response: ExportDirectoryResponse = self.askForExportDirectoryName()
         if response.cancelled is True:
@@ -94,41 +107,48 @@ class IOPython(IOPluginInterface):
             self._exportDirectoryName = response.directoryName
             return True
 
+    def setExportDestination(self, destination: str) -> bool:
+
+        makedirs(destination, exist_ok=True)
+        self._exportDirectoryName = destination
+
+        return True
+
+    def createModelParser(self) -> Optional[ModelParser]:
+        return partial(ReverseEngineerPython2.parseFiles, directoryName=self._importDirectoryName, files=self._filesToImport, importCache=self.importCache())
+
     def read(self) -> bool:
         """
+        The in process read;  Reports progress per file, weighted by file size.  The files
+        are parsed at the same time on the shared worker processes
 
-        Returns:
+        Returns:  False if the read failed or was cancelled
         """
-        BeginBusyCursor()
-        wxYield()
         status: bool = True
         try:
-            reverseEngineer: ReverseEngineerPython2 = ReverseEngineerPython2()
-
-            fileCount: int       = len(self._filesToImport)
-            self._readProgressDlg = ProgressDialog('Parsing Files', 'Starting',  parent=None, style=PD_APP_MODAL | PD_ELAPSED_TIME)
-            self._readProgressDlg.SetRange(fileCount)
-
-            reverseEngineer.reversePython(directoryName=self._importDirectoryName, files=self._filesToImport, progressCallback=self._readProgressCallback)
-            oglClasses: OglClasses = reverseEngineer.oglClasses
-            oglLinks:   OglLinks   = reverseEngineer.oglLinks()
-
-            self.logger.warning(f'Classes: {oglClasses}')
-            self.logger.warning(f'Links:   {oglLinks}')
-
-            self._layoutUmlClasses(oglClasses=oglClasses)
-            self._layoutLinks(oglLinks=oglLinks)
+            with self._mediator.busyCursor():
+                reverseEngineer: ReverseEngineerPython2 = ReverseEngineerPython2()
+
+                weights: List[int] = ProgressTracker.fileWeights(self._fullyQualifiedImportFiles())
+                with self._trackProgress(title='Parsing Files', weights=weights, unit=ProgressUnit.BYTES):
+                    model: ReverseEngineeredModel = reverseEngineer.parsePython(directoryName=self._importDirectoryName, files=self._filesToImport,
+                                                                                progressCallback=self._reportProgress,
+                                                                                cancellationToken=self._cancellationToken,
+                                                                                importCache=self.importCache(),
+                                                                                workerPool=self._workerPool(itemCount=len(self._filesToImport)))
+                status = self.materialize(model=model)
+        except PluginCancelledException:
+            self.logger.info('Python import cancelled')
+            status = False
         except (ValueError, Exception) as e:
-            self._readProgressDlg.Destroy()
-            MessageBox(f'{e}', 'Error', OK | ICON_ERROR)
+            self.displayImportError(f'{e}')
             status = False
-        else:
-            self._readProgressDlg.Destroy()
-            EndBusyCursor()
         return status
 
     def write(self, oglObjects: OglObjects):
 
+        from ogl.OglClass import OglClass
+
         directoryName: str = self._exportDirectoryName
 
         self.logger.info("IoPython Saving...")
@@ -181,12 +201,5 @@ class IOPython(IOPluginInterface):
 
         file.close()
 
-    def _readProgressCallback(self, currentFileCount: int, msg: str):
-        """
-
-        Args:
-            currentFileCount:   The current file # we are working pm
-            msg:    An updated message
-        """
-
-        self._readProgressDlg.Update(currentFileCount, msg)
+    def _fullyQualifiedImportFiles(self) -> List[str]:
+        return [f'{self._importDirectoryName}{osSep}{importFile}' for importFile in self._filesToImport]
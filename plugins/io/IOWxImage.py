@@ -37,6 +37,12 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('png, bmp, gif, or jpg
 
 class IOWxImage(IOPluginInterface):
 
+    PLUGIN_NAME:    PluginName   = PluginName('Wx Image')
+    PLUGIN_AUTHOR:  str          = 'Humberto A. Sanchez II'
+    PLUGIN_VERSION: str          = '0.9c'
+    INPUT_FORMAT:   InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT:  OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+
     def __init__(self, mediator: IMediator):
         """
 
@@ -47,13 +53,6 @@ class IOWxImage(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('Wx Image')
-        self._author  = 'Humberto A. Sanchez II'
-        self._version = '0.9c'
-
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
     def setImportOptions(self) -> bool:
         return False
 
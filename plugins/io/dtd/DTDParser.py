@@ -1,29 +1,34 @@
 
+from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import Tuple
 from typing import List
 from typing import NewType
+from typing import Optional
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
+from functools import partial
+
 from xml.parsers.expat import ParserCreate
 from pyexpat import XMLParserType
 
-from pyutmodel.PyutType import PyutType
 from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
 from pyutmodel.PyutClass import PyutClass
 from pyutmodel.PyutField import PyutField
-from pyutmodel.PyutLink import PyutLink
 
 from pyutmodel.PyutLinkType import PyutLinkType
 
-from ogl.OglClass import OglClass
+from core.CancellationToken import CancellationToken
+from core.ImportCache import ImportCache
 
 from plugins.common.ElementTreeData import ElementTreeData
-from plugins.common.LinkMakerMixin import LinkMakerMixin
-from plugins.common.Types import ClassPair
+from plugins.common.InternTable import InternTable
+from plugins.common.ReverseEngineeredModel import ModelLink
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.common.Types import ClassTree
 from plugins.common.Types import OglClasses
 from plugins.common.Types import OglLinks
@@ -34,8 +39,20 @@ from plugins.io.dtd.DTDElementTypes import DTDElementTypes
 DTDElements   = NewType('DTDElements',   Dict[str, Tuple])
 DTDAttributes = NewType('DTDAttributes', List[DTDAttribute])
 
+DTDDeclarations = NewType('DTDDeclarations', Tuple[DTDElements, DTDAttributes, bool])     # What is read from a file;  Cached by content
+
+ClassPositions = NewType('ClassPositions', Dict[str, Tuple[int, int]])      # Key is the class name
+
+if TYPE_CHECKING:
+    from plugins.common.OglMaterializer import OglClassesByName
 
-class DTDParser(LinkMakerMixin):
+
+class DTDParser:
+    """
+    Parsing only builds Pyut model objects (see the `model` property), so it does not need
+    ogl;  The Ogl properties (`oglClasses` and `links`) are created from the model on first
+    access
+    """
 
     MODEL_CHILD_ELEMENT_TYPE_INDEX:                int = 0
     MODEL_CHILD_ELEMENT_NAME_INDEX:                int = 2
@@ -50,14 +67,19 @@ class DTDParser(LinkMakerMixin):
         some kind of C language binder;
 
         """
-        super().__init__()
         self.logger:    Logger                = getLogger(__name__)
 
-        self._elementTypes:   DTDElements    = DTDElements({})
-        self._attributes:     DTDAttributes  = DTDAttributes([])
-        self._classTree:      ClassTree      = ClassTree({})
-        self._links:          OglLinks       = OglLinks([])
-        self._oglClasses:     OglClasses     = OglClasses([])
+        self._elementTypes:   DTDElements     = DTDElements({})
+        self._attributes:     DTDAttributes   = DTDAttributes([])
+        self._classTree:      ClassTree       = ClassTree({})
+        self._positions:      ClassPositions  = ClassPositions({})
+        self._modelLinks:     List[ModelLink] = []
+        self._links:          OglLinks        = cast(OglLinks, None)
+        self._oglClasses:     OglClasses      = cast(OglClasses, None)
+
+        self._oglClassesByName: 'OglClassesByName' = cast('OglClassesByName', None)
+
+        self._internTable: InternTable = InternTable()
 
         # noinspection SpellCheckingInspection
         """
@@ -74,22 +96,64 @@ class DTDParser(LinkMakerMixin):
         # noinspection SpellCheckingInspection
         self._dtdParser.AttlistDeclHandler      = self.attributeListHandler
         # noinspection SpellCheckingInspection
-        self._dtdParser.EndDoctypeDeclHandler   = self.endDocumentTypeHandler
+        self._dtdParser.EndDoctypeDeclHandler   = self._endDocumentTypeDeclaration
 
-    def open(self, filename: str) -> bool:
+        self._documentTypeEnded: bool = False
+
+    @classmethod
+    def parseFiles(cls, fileNames: List[str],
+                   cancellationToken: CancellationToken     = cast(CancellationToken, None),
+                   progressCallback:  Callable              = cast(Callable, None),
+                   importCache:       Optional[ImportCache] = None) -> ReverseEngineeredModel:
+        """
+        Suitable for running in a child process
+
+        Args:
+            fileNames:          The fully qualified names of the DTD files to parse
+            cancellationToken:  Checked before each file;  Raises `PluginCancelledException` once cancelled
+            progressCallback:   Optional;  Called with the number of parsed files and a message
+            importCache:        Optional;  Files whose content is unchanged are not parsed again
+
+        Returns:  The elements of every file and the aggregations between them
+        """
+        model: ReverseEngineeredModel = ReverseEngineeredModel()
+        for fileCount, fileName in enumerate(fileNames):
+            if cancellationToken is not None:
+                cancellationToken.raiseIfCancelled()
+            if progressCallback is not None:
+                progressCallback(fileCount, f'Processing: {fileName}')
+
+            dtdParser: DTDParser = DTDParser()
+            dtdParser.open(filename=fileName, importCache=importCache)
+
+            fileModel: ReverseEngineeredModel = dtdParser.model
+            model.pyutClasses.update(fileModel.pyutClasses)
+            for modelLink in fileModel.links:
+                if modelLink not in model.links:        # An element declared again is the same class
+                    model.links.append(modelLink)
+
+        return model
+
+    def open(self, filename: str, importCache: Optional[ImportCache] = None) -> bool:
         """
 
         Args:
             filename:
+            importCache:    Optional;  The declarations of a file whose content is unchanged are not parsed again
 
         Returns:  'True' if opened and parsed correctly else 'False'
 
         """
         self.logger.info(f'filename: {filename}')
 
-        with open(filename, "r") as dataFile:
-            dtdData: str = dataFile.read()
-            self._dtdParser.Parse(dtdData)
+        if importCache is None:
+            declarations: DTDDeclarations = self._readDeclarations(filename)
+        else:
+            declarations = importCache.fetch(filename, partial(self._readDeclarations, filename))
+
+        self._elementTypes, self._attributes, documentTypeEnded = declarations
+        if documentTypeEnded is True:
+            self.endDocumentTypeHandler()
 
         return True
 
@@ -98,19 +162,32 @@ class DTDParser(LinkMakerMixin):
         assert len(self._classTree) != 0, 'You should call open first'
         return self._classTree
 
+    @property
+    def model(self) -> ReverseEngineeredModel:
+        """
+        Returns:  The elements as classes, with their attributes as fields, and the aggregations between them
+        """
+        pyutClasses: Dict[str, PyutClass] = {className: elementTreeData.pyutClass for className, elementTreeData in self._classTree.items()}
+
+        return ReverseEngineeredModel(pyutClasses=pyutClasses, links=list(self._modelLinks))
+
     @property
     def oglClasses(self) -> OglClasses:
-        if len(self._oglClasses) == 0:
-            classTree: ClassTree = self.classTree
-            for className in classTree.keys():
-                elementTreeData: ElementTreeData = classTree[className]
-                self._oglClasses.append(elementTreeData.oglClass)
+        """
+        Created on first access, laid out in the order the elements are declared
+        """
+        if self._oglClasses is None:
+            self._oglClasses = OglClasses(list(self._materializeClasses().values()))
 
         return self._oglClasses
 
     @property
     def links(self) -> OglLinks:
         assert len(self._classTree) != 0, 'You should call open first'  # Maybe does not have any links
+        if self._links is None:
+            from plugins.common.OglMaterializer import OglMaterializer
+
+            self._links = OglMaterializer().createOglLinks(model=self.model, oglClassesByName=self._materializeClasses())
         return self._links
 
     def startDocumentTypeHandler(self, docTypeName, sysId, pubId, hasInternalSubset):
@@ -148,6 +225,9 @@ class DTDParser(LinkMakerMixin):
 
         self._attributes.append(dtdAttribute)
 
+    def _endDocumentTypeDeclaration(self):
+        self._documentTypeEnded = True
+
     def endDocumentTypeHandler(self):
 
         self._classTree = self._createClassTree()
@@ -157,6 +237,14 @@ class DTDParser(LinkMakerMixin):
 
         self.logger.info(f'attributes: {self._attributes}')
 
+    def _readDeclarations(self, filename: str) -> DTDDeclarations:
+
+        with open(filename, "r") as dataFile:
+            dtdData: str = dataFile.read()
+            self._dtdParser.Parse(dtdData)
+
+        return DTDDeclarations((self._elementTypes, self._attributes, self._documentTypeEnded))
+
     def _createClassTree(self) -> ClassTree:
 
         elementsTree: ClassTree = ClassTree({})
@@ -165,11 +253,11 @@ class DTDParser(LinkMakerMixin):
 
         for eltName in list(self._elementTypes.keys()):
 
-            classPair: ClassPair = self._createClassPair(name=eltName, x=x, y=y)
-            pyutClass: PyutClass = classPair.pyutClass
-            oglClass:  OglClass  = classPair.oglClass
+            pyutClass: PyutClass = PyutClass(name=self._internTable.intern(eltName))
 
-            elementTreeData: ElementTreeData = ElementTreeData(pyutClass=pyutClass, oglClass=oglClass)
+            self._positions[eltName] = (x, y)
+
+            elementTreeData: ElementTreeData = ElementTreeData(pyutClass=pyutClass)
 
             model = self._elementTypes[eltName]
             # noinspection SpellCheckingInspection
@@ -178,7 +266,7 @@ class DTDParser(LinkMakerMixin):
 
             elementsTree[eltName] = elementTreeData
 
-            # Carefully, update the graphics layout
+            # Carefully, update the graphics layout;  Applied once the Ogl classes are created
             if x < 800:
                 x += 80
             else:
@@ -197,13 +285,9 @@ class DTDParser(LinkMakerMixin):
 
                 self.logger.info(f'{className} associated with {associatedClassName}')
 
-                parent:      OglClass = eltTreeData.oglClass
-                dstTreeData: ElementTreeData = self._classTree[associatedClassName]
-                child:       OglClass = dstTreeData.oglClass
-
-                link: PyutLink = self.createLink(parent, child, PyutLinkType.AGGREGATION)
+                modelLink: ModelLink = ModelLink(sourceName=className, destinationName=associatedClassName, linkType=PyutLinkType.AGGREGATION)
 
-                self._links.append(link)
+                self._modelLinks.append(modelLink)
 
     def _addAttributesToClasses(self):
 
@@ -215,8 +299,8 @@ class DTDParser(LinkMakerMixin):
             attrType: str             = typedAttr.attributeType
             attrValue: str            = typedAttr.attributeValue
 
-            pyutField: PyutField = PyutField(name=attrName,
-                                             fieldType=PyutType(value=attrType),
+            pyutField: PyutField = PyutField(name=self._internTable.intern(attrName),
+                                             fieldType=self._internTable.pyutType(attrType),
                                              defaultValue=attrValue,
                                              visibility=PyutVisibilityEnum.PUBLIC)
 
@@ -250,28 +334,19 @@ class DTDParser(LinkMakerMixin):
         self.logger.info(f'Children names: {chillunNames}')
         return chillunNames
 
-    def _createClassPair(self, name: str, x: int, y: int) -> ClassPair:
+    def _materializeClasses(self) -> 'OglClassesByName':
         """
-        Create a pair of classes (pyutClass and oglClass)
+        Create the Ogl classes in bulk, at their declared positions, the first time they are needed
 
-        TODO:  This method may belong in a common place for plugin development.
-
-        Args:
-            name: Class Name
-
-            x:  x-coordinate on the uml frame  oglClass
-            y:  y coordinate on the uml frame  oglClass
-
-        Returns: The class pair
+        Returns:  The Ogl classes by element name
         """
-        pyutClass: PyutClass = PyutClass()
-        pyutClass.name = name
-
-        oglClass: OglClass = OglClass(pyutClass, 50, 50)
-        # To make this code capable of being debugged
-        oglClass.SetPosition(x=x, y=y)
-        # self.addShape(oglClass, x, y)     # TODO:  adding to UML frame does not belong here
+        if self._oglClassesByName is None:
+            from plugins.common.OglMaterializer import OglMaterializer
 
-        classPair: ClassPair = ClassPair(pyutClass=pyutClass, oglClass=oglClass)
+            self._oglClassesByName = OglMaterializer().createOglClasses(model=self.model)
+            for className, oglClass in self._oglClassesByName.items():
+                x, y = self._positions[className]
+                oglClass.SetPosition(x=x, y=y)
+                self._classTree[className].oglClass = oglClass
 
-        return classPair
+        return self._oglClassesByName
@@ -2,25 +2,25 @@
 from typing import Set
 from typing import Tuple
 from typing import cast
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
-from miniogl.AnchorPoint import AnchorPoint
-from miniogl.LinePoint import LinePoint
-from miniogl.LineShape import ControlPoints
-
 from pyutmodel.PyutObject import PyutObject
 
-from ogl.OglObject import OglObject
-from ogl.OglClass import OglClass
-from ogl.OglLink import OglLink
-from ogl.OglNote import OglNote
-
 from plugins.common.Types import OglObjects
 
 from plugins.io.gml.UnsupportedOperation import UnsupportedOperation
 
+if TYPE_CHECKING:
+    from miniogl.AnchorPoint import AnchorPoint
+    from miniogl.LinePoint import LinePoint
+    from miniogl.LineShape import ControlPoints
+
+    from ogl.OglObject import OglObject
+    from ogl.OglLink import OglLink
+
 
 class GMLExporter:
 
@@ -104,10 +104,13 @@ class GMLExporter:
 
     def _generateNodes(self, umlObjects: OglObjects, gml: str) -> str:
 
+        from ogl.OglClass import OglClass
+        from ogl.OglNote import OglNote
+
         nodeGml: str = ''
         for umlClass in umlObjects:
             if isinstance(umlClass, OglClass) or isinstance(umlClass, OglNote):
-                oglObject:  OglObject  = cast(OglObject, umlClass)
+                oglObject:  OglObject  = cast('OglObject', umlClass)
                 pyutObject: PyutObject = oglObject.pyutObject
                 nodeGml = (
                     f'{nodeGml}'
@@ -119,7 +122,7 @@ class GMLExporter:
                 )
         return f'{gml}{nodeGml}'
 
-    def _generateNodeGraphicsSection(self, oglObject: OglObject) -> str:
+    def _generateNodeGraphicsSection(self, oglObject: 'OglObject') -> str:
 
         pos = oglObject.GetPosition()
         x = pos[0]
@@ -166,11 +169,14 @@ class GMLExporter:
 
     def _generateUniqueEdges(self, umlObjects: OglObjects, gml: str) -> str:
 
+        from ogl.OglClass import OglClass
+        from ogl.OglNote import OglNote
+
         linkSet:  Set    = set()        # Concatenated str link ids;  e.g, 1-2
 
         for umlClass in umlObjects:
             if isinstance(umlClass, OglClass) or isinstance(umlClass, OglNote):
-                oglObject: OglObject = cast(OglObject, umlClass)
+                oglObject: OglObject = cast('OglObject', umlClass)
                 links = oglObject.getLinks()
                 self.logger.info(f'links: {links}')
                 for oglLink in links:
@@ -183,7 +189,7 @@ class GMLExporter:
 
         return gml
 
-    def __generateUniqueEdge(self, oglLink: OglLink, gml: str) -> str:
+    def __generateUniqueEdge(self, oglLink: 'OglLink', gml: str) -> str:
 
         srcOglId:  int = oglLink.getSourceShape().GetID()
         destOglId: int = oglLink.getDestinationShape().GetID()
@@ -200,7 +206,7 @@ class GMLExporter:
 
         return gml
 
-    def __generateEdgeGraphicsSection(self, oglLink: OglLink) -> str:
+    def __generateEdgeGraphicsSection(self, oglLink: 'OglLink') -> str:
 
         srcAnchor:  AnchorPoint = oglLink.sourceAnchor
         destAnchor: AnchorPoint = oglLink.destinationAnchor
@@ -221,7 +227,7 @@ class GMLExporter:
 
         return edgeGml
 
-    def __generatePoints(self, points: ControlPoints) -> str:
+    def __generatePoints(self, points: 'ControlPoints') -> str:
 
         pointsGml: str = ''
         for point in points:
@@ -231,7 +237,7 @@ class GMLExporter:
 
         return pointsGml
 
-    def __generatePoint(self, linePoint: LinePoint) -> str:
+    def __generatePoint(self, linePoint: 'LinePoint') -> str:
 
         position: Tuple[int, int] = linePoint.GetPosition()
 
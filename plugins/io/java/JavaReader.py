@@ -1,19 +1,25 @@
 
+from typing import Callable
 from typing import Dict
+from typing import Generator
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import Set
 from typing import TextIO
+from typing import Tuple
+from typing import TYPE_CHECKING
 from typing import Union
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from ogl.OglInterface import OglInterface
-from ogl.OglLink import OglLink
-from ogl.OglClass import OglClass
-from ogl.OglInterface2 import OglInterface2
+from os.path import getsize
+
+from contextlib import closing
+
+from functools import partial
 
 from pyutmodel.PyutClass import PyutClass
 from pyutmodel.PyutField import PyutField
@@ -23,16 +29,32 @@ from pyutmodel.PyutParameter import PyutParameter
 from pyutmodel.PyutType import PyutType
 from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
 
-from plugins.common.LinkMakerMixin import LinkMakerMixin
+from core.CancellationToken import CancellationToken
+from core.ImportCache import ImportCache
+from core.PluginTracer import PluginTracer
+from core.WorkerPool import WorkerPool
+
+from plugins.common.InternTable import InternTable
+from plugins.common.ReverseEngineeredModel import ModelLink
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+
+if TYPE_CHECKING:
+    from ogl.OglClass import OglClass
+    from ogl.OglInterface2 import OglInterface2
+    from ogl.OglLink import OglLink
 
-Implementors = NewType('Implementors', Set[OglClass])
-Extenders    = NewType('Extenders', Set[OglClass])
+Implementors = NewType('Implementors', Set['OglClass'])
+Extenders    = NewType('Extenders', Set['OglClass'])
 
-Links           = Union[OglLink, OglInterface2]
-ReversedClasses = NewType('ReversedClasses', Dict[str, OglClass])
+Links           = Union['OglLink', 'OglInterface2']
+ReversedClasses = NewType('ReversedClasses', Dict[str, 'OglClass'])
 ReversedLinks   = NewType('ReversedLinks', List[Links])
-SubClassMap     = NewType('SubClassMap', Dict[OglClass, Extenders])
-InterfaceMap    = NewType('InterfaceMap', Dict[OglClass, Implementors])
+SubClassMap     = NewType('SubClassMap', Dict['OglClass', Extenders])
+InterfaceMap    = NewType('InterfaceMap', Dict['OglClass', Implementors])
+
+PyutClassesByName = NewType('PyutClassesByName', Dict[str, PyutClass])
+ClassNameMap      = NewType('ClassNameMap',      Dict[str, List[str]])     # super class or interface name -> class names
+JavaFileModel     = NewType('JavaFileModel',     Tuple[PyutClassesByName, ClassNameMap, ClassNameMap])      # classes, extenders, implementors
 
 # Constants
 CLASS_MODIFIER   = ["public", "protected", "private", "abstract", "final", "static", "strictfp"]
@@ -40,37 +62,162 @@ FIELD_MODIFIERS  = ["public", "protected", "private", "static", "final", "transi
 METHOD_MODIFIERS = ["public", "protected", "private", "abstract", "static", "final", "synchronized", "native", "strictfp"]
 
 
-class JavaReader(LinkMakerMixin):
+class JavaReader:
     """
+    Parsing only builds Pyut model objects (see the `model` property), so it does not need
+    ogl and can run in a separate process.  The Ogl properties (`reversedClasses`, `subClassMap`,
+    `interfaceMap` and `reversedLinks`) are created from the model on first access
+
     TODO:  Figure out how to do associations
     """
 
     def __init__(self):
 
-        super().__init__()
         self.logger: Logger = getLogger(__name__)
 
-        self._classes:       ReversedClasses = ReversedClasses({})
-        self._subClassMap:   SubClassMap     = SubClassMap({})
-        self._interfaceMap:  InterfaceMap    = InterfaceMap({})
-        self._reversedLinks: ReversedLinks   = cast(ReversedLinks, None)
+        self._pyutClasses:  PyutClassesByName = PyutClassesByName({})
+        self._extenders:    ClassNameMap      = ClassNameMap({})
+        self._implementors: ClassNameMap      = ClassNameMap({})
+
+        self._reversedClasses: ReversedClasses = cast(ReversedClasses, None)
+        self._reversedLinks:   ReversedLinks   = cast(ReversedLinks, None)
+
+        self._internTable: InternTable = InternTable()
+
+    @classmethod
+    def parseFiles(cls, fileNames: List[str],
+                   cancellationToken: CancellationToken     = cast(CancellationToken, None),
+                   progressCallback:  Callable              = cast(Callable, None),
+                   importCache:       Optional[ImportCache] = None,
+                   workerPool:        Optional[WorkerPool]  = None) -> ReverseEngineeredModel:
+        """
+        Suitable for running in a child process
+
+        Args:
+            fileNames:          The fully qualified names of the java files to parse
+            cancellationToken:  Checked before each file;  Raises `PluginCancelledException` once cancelled
+            progressCallback:   Optional;  Called with the number of parsed files and a message
+            importCache:        Optional;  Files whose content is unchanged are not parsed again
+            workerPool:         Optional;  Parse the files at the same time on its worker processes;  The
+                                results are still merged in file order
+
+        Returns:  The reverse engineered model
+        """
+        fetchFileModel: Callable = partial(JavaReader.fetchFileModel, importCache=importCache)
+        if workerPool is None:
+            fileModels: Generator[JavaFileModel, None, None] = (fetchFileModel(fileName) for fileName in fileNames)
+        else:
+            fileModels = workerPool.mapInProcesses(fetchFileModel, fileNames, cancellationToken=cancellationToken)
+
+        javaReader: JavaReader = JavaReader()
+        with closing(fileModels):
+            for fileCount, fileName in enumerate(fileNames):
+                if cancellationToken is not None:
+                    cancellationToken.raiseIfCancelled()
+                if progressCallback is not None:
+                    progressCallback(fileCount, f'Processing: {fileName}')
+                with PluginTracer().span('parseFile', fileName=fileName, bytes=getsize(fileName)):
+                    javaReader.addFileModel(next(fileModels))
+
+        return javaReader.model
+
+    @classmethod
+    def fetchFileModel(cls, fileName: str, importCache: Optional[ImportCache] = None) -> JavaFileModel:
+        """
+        Parse a single file on its own unless the import cache has it;  Suitable for running
+        on a worker process
+
+        Args:
+            fileName:       The java file to parse
+            importCache:    Optional;  Consulted before the file is parsed
+
+        Returns:  What the file declares;  See `addFileModel`
+        """
+        if importCache is None:
+            return JavaReader.parseFileModel(fileName)
+
+        return importCache.fetch(fileName, partial(JavaReader.parseFileModel, fileName))
+
+    @classmethod
+    def parseFileModel(cls, fileName: str) -> JavaFileModel:
+        """
+        Parse a single file on its own
+
+        Args:
+            fileName:  The java file to parse
+
+        Returns:  What the file declares;  See `addFileModel`
+        """
+        javaReader: JavaReader = JavaReader()
+        javaReader.parseFile(fileName)
+
+        return JavaFileModel((javaReader._pyutClasses, javaReader._extenders, javaReader._implementors))
+
+    def addFileModel(self, fileModel: JavaFileModel):
+        """
+        Merge what a file declares into the classes and relationships parsed so far
+
+        Args:
+            fileModel:  See `parseFileModel`
+        """
+        pyutClasses, extenders, implementors = fileModel
+
+        self._reversedClasses = cast(ReversedClasses, None)
+        self._reversedLinks   = cast(ReversedLinks, None)
+
+        self._internTable.internClasses(pyutClasses.values())       # Copies, if parsed on a worker or cached
+        for className, pyutClass in pyutClasses.items():
+            # A class named by another file (e.g. as a super class) collects the members from every file
+            knownClass: PyutClass = self._pyutClasses.setdefault(className, pyutClass)
+            if knownClass is not pyutClass:
+                for pyutField in pyutClass.fields:
+                    knownClass.addField(pyutField)
+                for pyutMethod in pyutClass.methods:
+                    knownClass.addMethod(pyutMethod)
+        for superClassName, classNames in extenders.items():
+            self._extenders.setdefault(superClassName, []).extend(classNames)
+        for interfaceName, classNames in implementors.items():
+            self._implementors.setdefault(interfaceName, []).extend(classNames)
+
+    @property
+    def model(self) -> ReverseEngineeredModel:
+        """
+        Returns:  The classes parsed so far and their inheritance and interface relationships
+        """
+        links: List[ModelLink] = []
+        for superClassName, classNames in self._extenders.items():
+            for className in classNames:
+                links.append(ModelLink(sourceName=className, destinationName=superClassName, linkType=PyutLinkType.INHERITANCE))
+        for interfaceName, classNames in self._implementors.items():
+            for className in classNames:
+                links.append(ModelLink(sourceName=className, destinationName=interfaceName, linkType=PyutLinkType.INTERFACE))
+
+        return ReverseEngineeredModel(pyutClasses=dict(self._pyutClasses), links=links)
 
     @property
     def reversedClasses(self) -> ReversedClasses:
-        return self._classes
+        if self._reversedClasses is None:
+            from plugins.common.OglMaterializer import OglMaterializer
+
+            self._reversedClasses = ReversedClasses(OglMaterializer().createOglClasses(model=self.model))
+        return self._reversedClasses
 
     @property
     def subClassMap(self) -> SubClassMap:
-        return self._subClassMap
+        return SubClassMap({oglClass: Extenders(subClasses) for oglClass, subClasses in self._toOglClassMap(self._extenders).items()})
 
     @property
     def interfaceMap(self) -> InterfaceMap:
-        return self._interfaceMap
+        return InterfaceMap({oglClass: Implementors(classes) for oglClass, classes in self._toOglClassMap(self._implementors).items()})
 
     @property
     def reversedLinks(self) -> ReversedLinks:
         if self._reversedLinks is None:
-            self._reversedLinks = self._connectLinks()
+            from plugins.common.OglMaterializer import OglMaterializer
+            from plugins.common.OglMaterializer import OglClassesByName
+
+            oglClassesByName: OglClassesByName = OglClassesByName(self.reversedClasses)
+            self._reversedLinks = ReversedLinks(OglMaterializer().createOglLinks(model=self.model, oglClassesByName=oglClassesByName))
         return self._reversedLinks
 
     def parseFile(self, filename: str):
@@ -83,6 +230,8 @@ class JavaReader(LinkMakerMixin):
             filename:  The java file to parse
 
         """
+        self._reversedClasses = cast(ReversedClasses, None)
+        self._reversedLinks   = cast(ReversedLinks, None)
         # Read the file into a list of strings one for each line
         reader:       TextIO = open(filename, "r")
         temporaryList: List[str] = reader.readlines()
@@ -507,60 +656,36 @@ class JavaReader(LinkMakerMixin):
             pos += 1
         return False
 
-    def __addClass(self, className: str) -> OglClass:
+    def __addClass(self, className: str) -> PyutClass:
         """
         Add a class to the dictionary of classes
 
         Args:
             className: Name of the class to be added
 
-        Returns: OglClass instance for the class
+        Returns: PyutClass instance for the class
 
         """
         # If the class name exists already, return the instance
-        if className in self._classes:
-            return self._classes[className]
+        if className in self._pyutClasses:
+            return self._pyutClasses[className]
 
         # Create the class
-        pc: PyutClass = PyutClass(className)  # A new PyutClass
-        po: OglClass = OglClass(pc)  # A new OglClass
-
-        self._classes[className] = po
-
-        return po
-
-    def _connectLinks(self) -> ReversedLinks:
-
-        reversedLinks: ReversedLinks = ReversedLinks([])
-
-        reversedLinks = self._connectSubClasses(reversedLinks)
-        reversedLinks = self._connectInterfaces(reversedLinks)
+        pc: PyutClass = PyutClass(self._internTable.intern(className))  # A new PyutClass
 
-        return reversedLinks
+        self._pyutClasses[className] = pc
 
-    def _connectSubClasses(self, reversedLinks: ReversedLinks) -> ReversedLinks:
+        return pc
 
-        for parent in self._subClassMap.keys():
-            self.logger.info(f'BaseClass: {parent}')
-            extenders: Extenders = self._subClassMap[parent]
-            for child in extenders:
-                self.logger.info(f'{parent} <--- {child}')
+    def _toOglClassMap(self, classNameMap: ClassNameMap) -> Dict['OglClass', Set['OglClass']]:
 
-                oglLink: OglLink = self.createLink(src=child, dst=parent, linkType=PyutLinkType.INHERITANCE)
-                reversedLinks.append(oglLink)
+        reversedClasses: ReversedClasses = self.reversedClasses
 
-        return reversedLinks
+        oglClassMap: Dict['OglClass', Set['OglClass']] = {}
+        for name, classNames in classNameMap.items():
+            oglClassMap[reversedClasses[name]] = {reversedClasses[className] for className in classNames}
 
-    def _connectInterfaces(self, reversedLinks: ReversedLinks) -> ReversedLinks:
-
-        self.logger.info('Connect interfaces')
-        for interface in self._interfaceMap.keys():
-            implementors: Implementors = self._interfaceMap[interface]
-            for implementor in implementors:
-                oglInterface: OglInterface = self.createInterfaceLink(src=implementor, dst=interface)
-                reversedLinks.append(oglInterface)
-
-        return reversedLinks
+        return oglClassMap
 
     def __addClassFields(self, className, modifiers, fieldType, names_values):
         """
@@ -574,8 +699,7 @@ class JavaReader(LinkMakerMixin):
 
         """
         # Get class fields
-        po: OglClass = self._classes[className]
-        pc: PyutClass = cast(PyutClass, po.pyutObject)
+        pc: PyutClass = self._pyutClasses[className]
         classFields = pc.fields
 
         # TODO fix this crazy code to use constructor and catch exception on bad input
@@ -590,9 +714,9 @@ class JavaReader(LinkMakerMixin):
             visibility: PyutVisibilityEnum = PyutVisibilityEnum.PUBLIC
 
         # Add all
+        pyutType: PyutType = self._internTable.pyutType(fieldType)
         for (name, value) in names_values:
-            pyutType: PyutType = PyutType(fieldType)
-            classFields.append(PyutField(name, pyutType, value, visibility))
+            classFields.append(PyutField(self._internTable.intern(name), pyutType, value, visibility))
 
     def __addClassMethod(self, className, modifiers, returnType, name, lstFields):
         """
@@ -619,8 +743,7 @@ class JavaReader(LinkMakerMixin):
         self.__logMessage("Adding method %s for class %s" % (name, className))
         self.__logMessage("(modifiers=%s; returnType=%s)" % (modifiers, returnType))
         # Get class fields
-        po: OglClass = self._classes[className]
-        pc: PyutClass = cast(PyutClass, po.pyutObject)
+        pc: PyutClass = self._pyutClasses[className]
 
         # TODO fix this crazy code to use constructor and catch exception on bad input
         # Get visibility
@@ -636,14 +759,15 @@ class JavaReader(LinkMakerMixin):
         # Add method
         methods = pc.methods
 
+        name = self._internTable.intern(name)
         if returnType == '\n' or returnType == '' or returnType == 'void' or returnType is None:
             pm = PyutMethod(name, visibility)
         else:
-            retType: PyutType = PyutType(returnType)
+            retType: PyutType = self._internTable.pyutType(returnType)
             pm = PyutMethod(name, visibility, retType)
 
-        for (paramType, name, defaultValue) in lstFields:
-            param = PyutParameter(name, paramType, defaultValue)
+        for (paramType, paramName, defaultValue) in lstFields:
+            param = PyutParameter(self._internTable.intern(paramName), self._internTable.pyutType(paramType), defaultValue)
             pm.addParameter(param)
         methods.append(pm)
 
@@ -739,33 +863,19 @@ class JavaReader(LinkMakerMixin):
             className:  The original class
             superClass: The name of the super class
         """
-        oglSuperClass: OglClass = self._classes[superClass]
-        oglClass:      OglClass = self._classes[className]
-
-        if oglSuperClass in self._subClassMap:
-            extenders: Extenders = self._subClassMap[oglSuperClass]
-            extenders.add(oglClass)
-        else:
-            extenders = Extenders(set())
-            extenders.add(oglClass)
+        extenders: List[str] = self._extenders.setdefault(superClass, [])
+        if className not in extenders:
+            extenders.append(className)
 
         self.logger.debug(f'Make extender entry for {superClass} - subclass: {className}')
-        self._subClassMap[oglSuperClass] = extenders
 
     def __updateInterfaceMap(self, className: str, interfaceName: str):
 
-        interfaceClass: OglClass = self._classes[interfaceName]
-        implementor:    OglClass = self._classes[className]
-
-        if interfaceClass in self._interfaceMap:
-            implementors: Implementors = self._interfaceMap[interfaceClass]
-            implementors.add(implementor)
-        else:
-            implementors = Implementors(set())
-            implementors.add(implementor)
+        implementors: List[str] = self._implementors.setdefault(interfaceName, [])
+        if className not in implementors:
+            implementors.append(className)
 
         self.logger.debug(f'Class {className} implements {interfaceName}')
-        self._interfaceMap[interfaceClass] = implementors
 
     def __logMessage(self, theMessage: str):
         """
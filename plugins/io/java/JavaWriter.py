@@ -13,7 +13,6 @@ from os import write
 
 from os import sep as osSep
 
-from ogl.OglClass import OglClass
 
 from pyutmodel.PyutLink import PyutLink
 from pyutmodel.ModelTypes import PyutLinks
@@ -41,6 +40,8 @@ class JavaWriter:
 
     def write(self, oglObjects: OglObjects):
 
+        from ogl.OglClass import OglClass
+
         oglClasses: OglClasses = cast(OglClasses, [oglObject for oglObject in oglObjects if isinstance(oglObject, OglClass)])
 
         # defining Constants    TODO: Make REAL constants
@@ -1,38 +1,49 @@
 
 from typing import Callable
 from typing import Dict
+from typing import Generator
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import Tuple
-from typing import Union
+from typing import TYPE_CHECKING
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
 from os import sep as osSep
+from os.path import getsize
+
+from contextlib import closing
+
+from functools import partial
 
 from antlr4 import CommonTokenStream
 from antlr4 import FileStream
-
-from ogl.OglLink import OglLink
-from ogl.OglClass import OglClass
+from antlr4 import InputStream
 
 from pyutmodel.PyutLinkType import PyutLinkType
 from pyutmodel.PyutClass import PyutClass
 from pyutmodel.PyutField import PyutField
 from pyutmodel.PyutMethod import PyutMethod
 from pyutmodel.PyutMethod import PyutParameters
+from pyutmodel.PyutMethod import SourceCode
 from pyutmodel.PyutParameter import PyutParameter
 from pyutmodel.PyutType import PyutType
 from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
 
-from plugins.common.LinkMakerMixin import LinkMakerMixin
-from plugins.common.Types import OglClasses
-from plugins.common.Types import OglLinks
+from core.CancellationToken import CancellationToken
+from core.ImportCache import ImportCache
+from core.PluginTracer import PluginTracer
+from core.WorkerPool import WorkerPool
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+from plugins.common.InternTable import InternTable
+from plugins.common.ReverseEngineeredModel import ModelLink
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 
 from plugins.io.python.PythonParseException import PythonParseException
-from plugins.io.python.PyutPythonVisitor import ChildName
 from plugins.io.python.PyutPythonVisitor import Children
 from plugins.io.python.PyutPythonVisitor import ClassName
 from plugins.io.python.PyutPythonVisitor import ClassNames
@@ -41,110 +52,237 @@ from plugins.io.python.PyutPythonVisitor import MethodName
 from plugins.io.python.PyutPythonVisitor import MethodNames
 from plugins.io.python.PyutPythonVisitor import MultiParameterNames
 from plugins.io.python.PyutPythonVisitor import Parameters
-from plugins.io.python.PyutPythonVisitor import ParentName
 from plugins.io.python.PyutPythonVisitor import Parents
 from plugins.io.python.PyutPythonVisitor import PyutPythonVisitor
 from plugins.io.python.pyantlrparser.Python3Lexer import Python3Lexer
 from plugins.io.python.pyantlrparser.Python3Parser import Python3Parser
 
+if TYPE_CHECKING:
+    from plugins.common.Types import OglClasses
+    from plugins.common.Types import OglLinks
+
 PyutClassName  = NewType('PyutClassName', str)
 PyutClasses    = NewType('PyutClasses', Dict[PyutClassName, PyutClass])
-OglClassesDict = NewType('OglClassesDict', Dict[Union[PyutClassName, ParentName, ChildName, ClassName], OglClass])
+
+PythonFileModel = Tuple[PyutClasses, Parents]       # What is extracted from one file;  Cached by content
 
 
-class ReverseEngineerPython2(LinkMakerMixin):
+class ReverseEngineerPython2:
+    """
+    The parsing half (`parsePython`) only builds Pyut model objects and does not need ogl,
+    so it can run in a separate process;  The Ogl classes and links (`oglClasses` and
+    `oglLinks`) are created from the model on first access
+    """
 
     PYTHON_ASSIGNMENT:     str = '='
     PYTHON_TYPE_DELIMITER: str = ':'
     PYTHON_EOL_COMMENT:    str = '#'
 
+    WARM_UP_SOURCE: str = (
+        'class WarmUp(Base):\n'
+        '    name: str = \'\'\n'
+        '    def method(self, count: int = 0) -> str:\n'
+        '        return str(count)\n'
+    )
+
     def __init__(self):
 
-        super().__init__()
         self.logger: Logger = getLogger(__name__)
 
-        self._pyutClasses:    PyutClasses     = PyutClasses({})
-        self._oglClassesDict: OglClassesDict  = OglClassesDict({})
-        self._oglClasses:     OglClasses      = cast(OglClasses, None)
-        self._oglLinks:       OglLinks        = OglLinks([])
+        self._pyutClasses: PyutClasses            = PyutClasses({})
+        self._parents:     Parents                = Parents({})
+        self._model:       ReverseEngineeredModel = cast(ReverseEngineeredModel, None)
+        self._oglClasses:  'OglClasses'           = cast('OglClasses', None)
+        self._oglLinks:    'OglLinks'             = cast('OglLinks', [])
 
         self.visitor: PyutPythonVisitor = cast(PyutPythonVisitor, None)
 
-    def reversePython(self,  directoryName: str, files: List[str], progressCallback: Callable):
+        self._internTable: InternTable = InternTable()
+
+    @classmethod
+    def parseFiles(cls, directoryName: str, files: List[str],
+                   cancellationToken: CancellationToken     = cast(CancellationToken, None),
+                   progressCallback:  Callable              = cast(Callable, None),
+                   importCache:       Optional[ImportCache] = None,
+                   workerPool:        Optional[WorkerPool]  = None) -> ReverseEngineeredModel:
         """
-        Reverse engineering Python files to OglClass's
+        Suitable for running in a child process;  Progress is only reported if a callback is given
+
+        Args:
+            directoryName:      The directory name where the selected files reside
+            files:              A list of files to parse
+            cancellationToken:  Checked before each file
+            progressCallback:   The method to call to report progress
+            importCache:        Optional;  Consulted before each file is parsed
+            workerPool:         Optional;  Parse the files at the same time on its worker processes
+
+        Returns:  The reverse engineered model
+        """
+        return ReverseEngineerPython2().parsePython(directoryName=directoryName, files=files,
+                                                    progressCallback=progressCallback if progressCallback is not None else lambda count, msg: None,
+                                                    cancellationToken=cancellationToken,
+                                                    importCache=importCache,
+                                                    workerPool=workerPool)
+
+    @classmethod
+    def parseFileModel(cls, fileName: str, directoryName: str, importCache: Optional[ImportCache] = None) -> PythonFileModel:
+        """
+        Parse a single file on its own;  Suitable for running on a worker process
+
+        Args:
+            fileName:       The file to parse
+            directoryName:  The directory name where the file resides
+            importCache:    Optional;  Consulted before the file is parsed
+
+        Returns:  The classes in the file and the inheritance relationships it declares
+        """
+        fqFileName:      str                    = f'{directoryName}{osSep}{fileName}'
+        reverseEngineer: ReverseEngineerPython2 = ReverseEngineerPython2()
+        if importCache is None:
+            return reverseEngineer._parseFile(fqFileName=fqFileName, fileName=fileName)
+
+        return importCache.fetch(fqFileName, partial(reverseEngineer._parseFile, fqFileName=fqFileName, fileName=fileName))
+
+    def reversePython(self,  directoryName: str, files: List[str], progressCallback: Callable,
+                      importCache: Optional[ImportCache] = None,
+                      workerPool:  Optional[WorkerPool]  = None):
+        """
+        Reverse engineering Python files;  The OglClass's are created when first asked for
 
         Args:
             directoryName:  The directory name where the selected files reside
             files:          A list of files to parse
             progressCallback: The method to call to report progress
+            importCache:    Optional;  Consulted before each file is parsed
+            workerPool:     Optional;  Parse the files at the same time on its worker processes
+        """
+        self.parsePython(directoryName=directoryName, files=files, progressCallback=progressCallback, importCache=importCache, workerPool=workerPool)
+
+    def parsePython(self, directoryName: str, files: List[str], progressCallback: Callable,
+                    cancellationToken: CancellationToken     = cast(CancellationToken, None),
+                    importCache:       Optional[ImportCache] = None,
+                    workerPool:        Optional[WorkerPool]  = None) -> ReverseEngineeredModel:
         """
-        currentFileCount: int = 0
+        Reverse engineering Python files to Pyut classes and the inheritance
+        relationships between them
+
+        Args:
+            directoryName:  The directory name where the selected files reside
+            files:          A list of files to parse
+            progressCallback: The method to call to report progress
+            cancellationToken:  Checked before each file;  Raises `PluginCancelledException` once cancelled
+            importCache:        Optional;  Files whose content is unchanged are not parsed again
+            workerPool:         Optional;  Parse the files at the same time on its worker processes;  The
+                                results are still merged in file order
+
+        Returns:  The reverse engineered model
+        """
+        parseFileModel: Callable = partial(ReverseEngineerPython2.parseFileModel, directoryName=directoryName, importCache=importCache)
+        if workerPool is None:
+            fileModels: Generator[PythonFileModel, None, None] = (parseFileModel(fileName) for fileName in files)
+        else:
+            fileModels = workerPool.mapInProcesses(parseFileModel, files, cancellationToken=cancellationToken)
 
         onGoingParents: Parents = Parents({})
-        for fileName in files:
+        with closing(fileModels):
+            for currentFileCount, fileName in enumerate(files):
+
+                if cancellationToken is not None:
+                    cancellationToken.raiseIfCancelled()
 
-            try:
                 fqFileName: str = f'{directoryName}{osSep}{fileName}'
                 self.logger.info(f'Processing file: {fqFileName}')
 
                 progressCallback(currentFileCount, f'Processing: {fileName}')
+                try:
+                    with PluginTracer().span('parseFile', fileName=fileName, bytes=getsize(fqFileName)):
+                        pyutClasses, parents = next(fileModels)
+                except PluginCancelledException:
+                    raise
+                except (ValueError, Exception) as e:
+                    self.logger.error(e)
+                    raise PythonParseException(e)
+
+                self._internTable.internClasses(pyutClasses.values())        # Copies, if parsed on a worker or cached
+                self._pyutClasses.update(pyutClasses)
+                for parentName, children in parents.items():
+                    onGoingParents.setdefault(parentName, []).extend(children)
+
+        self._parents = onGoingParents
+        self._model      = ReverseEngineeredModel(pyutClasses=dict(self._pyutClasses.items()), links=self._generateInheritanceLinks())
+        self._oglClasses = cast('OglClasses', None)
+
+        return self._model
+
+    @classmethod
+    def warmUpParser(cls):
+        """
+        Run the lexer and parser over a small sample so the ANTLR shared DFA cache
+        is populated before the first real file is parsed
+        """
+        lexer:  Python3Lexer  = Python3Lexer(InputStream(ReverseEngineerPython2.WARM_UP_SOURCE))
+        parser: Python3Parser = Python3Parser(CommonTokenStream(lexer))
 
-                fileStream: FileStream   = FileStream(fqFileName)
-                lexer:      Python3Lexer = Python3Lexer(fileStream)
+        parser.file_input()
 
-                stream: CommonTokenStream = CommonTokenStream(lexer)
-                parser: Python3Parser     = Python3Parser(stream)
+    @property
+    def model(self) -> ReverseEngineeredModel:
+        return self._model
+
+    @property
+    def oglClasses(self) -> 'OglClasses':
+        self._materialize()
+        return self._oglClasses
 
-                tree: Python3Parser.File_inputContext = parser.file_input()
-                if parser.getNumberOfSyntaxErrors() != 0:
-                    eMsg: str = f"File {fileName} contains {parser.getNumberOfSyntaxErrors()} syntax errors"
-                    self.logger.error(eMsg)
-                    raise PythonParseException(eMsg)
+    def oglLinks(self) -> 'OglLinks':
+        self._materialize()
+        return self._oglLinks
 
-                self.visitor = PyutPythonVisitor()
-                self.visitor.parents = onGoingParents
-                self.visitor.visit(tree)
-                self._generatePyutClasses()
+    def _materialize(self):
+        """
+        Create the Ogl classes and links in bulk the first time they are needed
+        """
+        if self._oglClasses is None and self._model is not None:
+            # Imported here so that the parsing half does not pull in ogl
+            from plugins.common.OglMaterializer import OglMaterializer
 
-                onGoingParents = self.visitor.parents
-                currentFileCount += 1
-            except (ValueError, Exception) as e:
-                self.logger.error(e)
-                raise PythonParseException(e)
-        self._generateOglClasses()
-        self._generateInheritanceLinks()
+            self._oglClasses, self._oglLinks = OglMaterializer().materialize(model=self._model)
 
-    @property
-    def oglClasses(self) -> OglClasses:
-        if self._oglClasses is None:
-            self._oglClasses = list(self._oglClassesDict.values())
+    def _parseFile(self, fqFileName: str, fileName: str) -> PythonFileModel:
+        """
+        Args:
+            fqFileName: The file to parse
+            fileName:   The name to report errors with
 
-        return self._oglClasses
+        Returns:  The classes in the file and the inheritance relationships it declares
+        """
+        fileStream: FileStream   = FileStream(fqFileName)
+        lexer:      Python3Lexer = Python3Lexer(fileStream)
 
-    def oglLinks(self) -> OglLinks:
-        return self._oglLinks
+        stream: CommonTokenStream = CommonTokenStream(lexer)
+        parser: Python3Parser     = Python3Parser(stream)
 
-    def _generateOglClasses(self):
+        tree: Python3Parser.File_inputContext = parser.file_input()
+        if parser.getNumberOfSyntaxErrors() != 0:
+            eMsg: str = f"File {fileName} contains {parser.getNumberOfSyntaxErrors()} syntax errors"
+            self.logger.error(eMsg)
+            raise PythonParseException(eMsg)
 
-        for pyutClassName in self._pyutClasses:
-            try:
-                pyutClass: PyutClass = self._pyutClasses[pyutClassName]
-                oglClass:  OglClass  = OglClass(pyutClass)
+        self.visitor = PyutPythonVisitor()
+        self.visitor.visit(tree)
 
-                self._oglClassesDict[pyutClassName] = oglClass
-            except (ValueError, Exception) as e:
-                self.logger.error(f"Error while creating class {pyutClassName},  {e}")
+        return self._generatePyutClasses(), self.visitor.parents
 
-    def _generatePyutClasses(self):
+    def _generatePyutClasses(self) -> PyutClasses:
 
+        pyutClasses: PyutClasses = PyutClasses({})
         for className in self._classNames():
-            pyutClass: PyutClass = PyutClass(name=className)
+            pyutClass: PyutClass = PyutClass(name=self._internTable.intern(className))
 
             pyutClass = self._addFields(pyutClass)
 
             for methodName in self._methodNames(className):
-                pyutMethod: PyutMethod = PyutMethod(name=methodName)
+                pyutMethod: PyutMethod = PyutMethod(name=self._internTable.intern(methodName))
                 if methodName[0:2] == "__":
                     pyutMethod.setVisibility(PyutVisibilityEnum.PRIVATE)
                 elif methodName[0] == "_":
@@ -152,7 +290,7 @@ class ReverseEngineerPython2(LinkMakerMixin):
                 else:
                     pyutMethod.setVisibility(PyutVisibilityEnum.PUBLIC)
                 pyutMethod = self._addParameters(pyutMethod)
-                pyutMethod.sourceCode = self.visitor.methodCode[methodName]
+                pyutMethod.sourceCode = SourceCode(self.visitor.methodCode[methodName])
 
                 pyutClass.addMethod(pyutMethod)
 
@@ -164,8 +302,10 @@ class ReverseEngineerPython2(LinkMakerMixin):
             if className in self.visitor.dataClassNames:
                 self._createDataClassPropertiesAsFields(pyutClass, self.visitor.dataClassProperties)
 
-            self._pyutClasses[className] = pyutClass
-        self.logger.info(f'Generated {len(self._pyutClasses)} classes')
+            pyutClasses[PyutClassName(className)] = pyutClass
+        self.logger.info(f'Generated {len(pyutClasses)} classes')
+
+        return pyutClasses
 
     def _generatePropertiesAsMethods(self, pyutClass: PyutClass, getterProperties, setterProperties) -> PyutClass:
 
@@ -189,6 +329,8 @@ class ReverseEngineerPython2(LinkMakerMixin):
 
     def _createProperties(self, propName: str, setterParams: List[str]) -> Tuple[PyutMethod, PyutMethod]:
 
+        propName = self._internTable.intern(propName)
+
         getter: PyutMethod = PyutMethod(name=propName, visibility=PyutVisibilityEnum.PUBLIC)
         if len(setterParams) == 0:
             setter: PyutMethod = cast(PyutMethod, None)
@@ -201,11 +343,12 @@ class ReverseEngineerPython2(LinkMakerMixin):
 
             if len(potentialNameType) == 2:
 
-                param: PyutParameter = PyutParameter(name=potentialNameType[0], parameterType=PyutType(value=potentialNameType[1]))
+                pyutType: PyutType      = self._internTable.pyutType(potentialNameType[1])
+                param:    PyutParameter = PyutParameter(name=self._internTable.intern(potentialNameType[0]), parameterType=pyutType)
                 setter.addParameter(param)
-                getter.returnType = PyutType(value=potentialNameType[1])
+                getter.returnType = pyutType
             else:
-                param = PyutParameter(name=potentialNameType[0])
+                param = PyutParameter(name=self._internTable.intern(potentialNameType[0]))
                 setter.addParameter(param)
 
         return setter, getter
@@ -260,22 +403,21 @@ class ReverseEngineerPython2(LinkMakerMixin):
 
         return pyutClass
 
-    def _generateInheritanceLinks(self):
+    def _generateInheritanceLinks(self) -> List[ModelLink]:
 
-        parents: Parents = self.visitor.parents
+        modelLinks: List[ModelLink] = []
+        parents:    Parents         = self._parents
 
         for parentName in parents.keys():
             children: Children = parents[parentName]
             for childName in children:
-
-                try:
-                    parentOglClass: OglClass = self._oglClassesDict[parentName]
-                    childOglClass:  OglClass = self._oglClassesDict[childName]
-                    oglLink: OglLink = self.createLink(src=childOglClass, dst=parentOglClass, linkType=PyutLinkType.INHERITANCE)
-                    self._oglLinks.append(oglLink)
-                except KeyError as ke:        # Probably there is no parent we are tracking
-                    self.logger.warning(f'Apparently we are not tracking this parent:  {ke}')
+                if parentName not in self._pyutClasses or childName not in self._pyutClasses:
+                    # Probably there is no parent we are tracking
+                    self.logger.warning(f'Apparently we are not tracking this parent:  {parentName}')
                     continue
+                modelLinks.append(ModelLink(sourceName=childName, destinationName=parentName, linkType=PyutLinkType.INHERITANCE))
+
+        return modelLinks
 
     def _methodNames(self, className: ClassName) -> MethodNames:
 
@@ -323,7 +465,7 @@ class ReverseEngineerPython2(LinkMakerMixin):
             elif ':' in parameterStr:
                 pyutParam = self._typedParameter(parameterStr)
             else:
-                pyutParam = PyutParameter(parameterStr)
+                pyutParam = PyutParameter(self._internTable.intern(parameterStr))
             pyutParams.append(pyutParam)
 
         return pyutParams
@@ -336,8 +478,8 @@ class ReverseEngineerPython2(LinkMakerMixin):
         paramType:      str = paramTypeValue[0]
         paramValue:     str = paramTypeValue[1]
 
-        pyutType: PyutType = PyutType(paramType)
-        return PyutParameter(name=paramName, parameterType=pyutType, defaultValue=paramValue)
+        pyutType: PyutType = self._internTable.pyutType(paramType)
+        return PyutParameter(name=self._internTable.intern(paramName), parameterType=pyutType, defaultValue=paramValue)
 
     def _simpleDefaultValue(self, simpleDefaultValueParam: str) -> PyutParameter:
 
@@ -345,7 +487,7 @@ class ReverseEngineerPython2(LinkMakerMixin):
         paramName:  str = pyutParamAndValue[0]
         paramValue: str = pyutParamAndValue[1]
 
-        pyutParam: PyutParameter = PyutParameter(name=paramName, defaultValue=paramValue)
+        pyutParam: PyutParameter = PyutParameter(name=self._internTable.intern(paramName), defaultValue=paramValue)
 
         return pyutParam
 
@@ -354,7 +496,7 @@ class ReverseEngineerPython2(LinkMakerMixin):
         paramName:        str = pyutParamAndType[0]
         paramType:        str = pyutParamAndType[1]
 
-        pyutParam: PyutParameter = PyutParameter(name=paramName, parameterType=PyutType(value=paramType))
+        pyutParam: PyutParameter = PyutParameter(name=self._internTable.intern(paramName), parameterType=self._internTable.pyutType(paramType))
         return pyutParam
 
     def __simpleParseFieldToPyut(self, fieldData: str) -> PyutField:
@@ -365,7 +507,7 @@ class ReverseEngineerPython2(LinkMakerMixin):
         fieldAndValue: List[str] = noCommentFieldData.split(ReverseEngineerPython2.PYTHON_ASSIGNMENT)
 
         if len(fieldAndValue) == 2:
-            pyutField.name         = fieldAndValue[0].strip()
+            pyutField.name         = self._internTable.intern(fieldAndValue[0].strip())
             pyutField.defaultValue = fieldAndValue[1].strip()
         else:   # might just be a declaration
             pyutField = self.__declarationOnlyParseToPyut(fieldData=fieldAndValue[0])
@@ -391,12 +533,12 @@ class ReverseEngineerPython2(LinkMakerMixin):
 
         fieldName = self.__appropriatelyCleanupName(vis=vis, fieldName=fieldName)
 
-        pyutField: PyutField = PyutField(name=fieldName, visibility=vis)
+        pyutField: PyutField = PyutField(name=self._internTable.intern(fieldName), visibility=vis)
 
         if len(fieldAndType) > 1:
             typeAndDefaultValue: List[str] = fieldAndType[1].split(ReverseEngineerPython2.PYTHON_ASSIGNMENT)
 
-            pyutType: PyutType = PyutType(value=typeAndDefaultValue[0].strip())
+            pyutType: PyutType = self._internTable.pyutType(typeAndDefaultValue[0].strip())
             pyutField.type = pyutType
             if len(typeAndDefaultValue) > 1:
                 pyutField.defaultValue = typeAndDefaultValue[1].strip()
@@ -408,13 +550,13 @@ class ReverseEngineerPython2(LinkMakerMixin):
         self.logger.info(f'{fieldData=}')
         fieldAndType: List[str] = fieldData.split(ReverseEngineerPython2.PYTHON_TYPE_DELIMITER)
 
-        pyutField: PyutField = PyutField(name=fieldAndType[0])
+        pyutField: PyutField = PyutField(name=self._internTable.intern(fieldAndType[0]))
 
         #
         # Might be something complex expression as a default value we can't handle it
         #
         if len(fieldAndType) > 1:
-            pyutField.type       = PyutType(value=fieldAndType[1])
+            pyutField.type       = self._internTable.pyutType(fieldAndType[1])
         pyutField.visibility = PyutVisibilityEnum.PUBLIC
 
         return pyutField
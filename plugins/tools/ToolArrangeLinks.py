@@ -1,33 +1,28 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 
-from ogl.OglLink import OglLink
-
 from core.IMediator import IMediator
 from core.ToolPluginInterface import ToolPluginInterface
 
 from core.types.PluginDataTypes import PluginName
 
-from plugins.common.Types import OglClasses
+from plugins.common.Types import OglLinks
 
 
 class ToolArrangeLinks(ToolPluginInterface):
 
+    PLUGIN_NAME:    PluginName = PluginName('Arrange Links')
+    PLUGIN_AUTHOR:  str        = 'Cedric DUTOIT <dutoitc@shimbawa.ch>'
+    PLUGIN_VERSION: str        = '1.1'
+    MENU_TITLE:     str        = 'Arrange links'
+
     def __init__(self, mediator: IMediator):
 
         super().__init__(mediator)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Arrange Links')
-        self._author    = 'Cedric DUTOIT <dutoitc@shimbawa.ch>'
-        self._version   = '1.1'
-
-        self._menuTitle = 'Arrange links'
-
     def setOptions(self) -> bool:
         """
         Prepare the import.
@@ -39,16 +34,13 @@ class ToolArrangeLinks(ToolPluginInterface):
         return True
 
     def doAction(self):
+        """
+        Optimizes the selected links, e.g. those handed on by a pipeline
+        """
+        oglLinks: OglLinks = self.selection.oglLinks
 
-        self._mediator.selectAllOglObjects()
-        oglObjects: OglClasses = self._mediator.selectedOglObjects
-
-        for oglObject in oglObjects:
-            if isinstance(oglObject, OglLink):
-                oglLink: OglLink = cast(OglLink, oglObject)
-                self.logger.info(f"Optimizing: {oglLink}")
-                oglLink.optimizeLine()
-            else:
-                self.logger.warning(f"No line optimizing for: {oglObject}")
+        for oglLink in oglLinks:
+            self.logger.info(f"Optimizing: {oglLink}")
+            oglLink.optimizeLine()
 
         self._mediator.refreshFrame()
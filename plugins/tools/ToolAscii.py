@@ -10,8 +10,6 @@ from math import ceil
 
 from os import sep as osSep
 
-from ogl.OglClass import OglClass
-
 from pyutmodel.PyutClass import PyutClass
 from pyutmodel.PyutStereotype import PyutStereotype
 
@@ -22,6 +20,7 @@ from plugins.common.Types import OglClasses
 from core.ToolPluginInterface import ToolPluginInterface
 
 from core.IMediator import IMediator
+from core.SelectionSnapshot import SelectionSnapshot
 
 from core.types.ExportDirectoryResponse import ExportDirectoryResponse
 
@@ -30,6 +29,10 @@ class ToolAscii(ToolPluginInterface):
     """
     UML objects to an ASCII representation
     """
+    PLUGIN_NAME:    PluginName = PluginName('ASCII Class Export')
+    PLUGIN_AUTHOR:  str        = 'Philippe Waelti <pwaelti@eivd.ch>'
+    PLUGIN_VERSION: str        = '1.0'
+    MENU_TITLE:     str        = 'ASCII Class Export'
 
     def __init__(self, mediator: IMediator):
 
@@ -37,14 +40,11 @@ class ToolAscii(ToolPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('ASCII Class Export')
-        self._author    = 'Philippe Waelti <pwaelti@eivd.ch>'
-        self._version   = '1.0'
-
-        self._menuTitle = 'ASCII Class Export'
-
         self._exportDirectory: str = ''
 
+    def reset(self):
+        self._exportDirectory = ''
+
     def setOptions(self) -> bool:
 
         response: ExportDirectoryResponse = self.askForExportDirectoryName()
@@ -59,11 +59,11 @@ class ToolAscii(ToolPluginInterface):
         """
 
         """
-        selectedObjects: OglClasses = self._mediator.selectedOglObjects
-        if len(selectedObjects) < 1:
+        selection: SelectionSnapshot = self.selection
+        if len(selection) < 1:
             self.displayNoSelectedOglObjects()
             return
-        self._write(selectedObjects)
+        self._write(selection.oglClasses)
 
     def _write(self, oglObjects: OglClasses):
         """
@@ -74,9 +74,6 @@ class ToolAscii(ToolPluginInterface):
 
         for oglObject in oglObjects:
 
-            if not isinstance(oglObject, OglClass):
-                continue
-
             pyutClass: PyutClass = cast(PyutClass, oglObject.pyutObject)
             filename:  str       = pyutClass.name
 
@@ -1,56 +1,39 @@
 
-from typing import List
-from typing import Union
+from typing import ContextManager
 
 from logging import Logger
 from logging import getLogger
 
+from contextlib import nullcontext
+
 from core.IMediator import IMediator
 from core.ToolPluginInterface import ToolPluginInterface
 
 from core.types.PluginDataTypes import PluginName
 
-from plugins.common.Types import OglClasses
+from plugins.common.Types import OglObjects
 
-from plugins.tools.sugiyama.RealSugiyamaNode import RealSugiyamaNode
 from plugins.tools.sugiyama.Sugiyama import Sugiyama
-from plugins.tools.sugiyama.SugiyamaLink import SugiyamaLink
-from plugins.tools.sugiyama.VirtualSugiyamaNode import VirtualSugiyamaNode
 
 
 class ToolSugiyama(ToolPluginInterface):
     """
     ToSugiyama : Automatic layout algorithm based on Sugiyama levels.
     """
-    def __init__(self, mediator: IMediator):
+    PLUGIN_NAME:    PluginName = PluginName('Sugiyama Automatic Layout')
+    PLUGIN_AUTHOR:  str        = 'Nicolas Dubois <nicdub@gmx.ch>'
+    PLUGIN_VERSION: str        = '1.1'
+    MENU_TITLE:     str        = 'Sugiyama Automatic Layout'
 
-        super().__init__(mediator)
-
-        self.logger: Logger = getLogger(__name__)
+    COMPUTE_IN_BACKGROUND: bool = True
 
-        self._name      = PluginName('Sugiyama Automatic Layout')
-        self._author    = 'Nicolas Dubois <nicdub@gmx.ch>'
-        self._version   = '1.1'
+    PHASE_COUNT: int = 5
 
-        self._menuTitle = 'Sugiyama Automatic Layout'
-
-        #
-        # TODO Move to separate class
-        #
-        # Sugiyama nodes and links
-        self.__realSugiyamaNodesList: List[RealSugiyamaNode] = []   # List of all RealSugiyamaNode
-        self.__sugiyamaLinksList:     List[SugiyamaLink]     = []   # List of all SugiyamaLink
+    def __init__(self, mediator: IMediator):
 
-        #  Hierarchy graph
-        #  List of Real and Virtual Sugiyama nodes that take part in hierarchy
-        self.__hierarchyGraphNodesList:    List[Union[RealSugiyamaNode, VirtualSugiyamaNode]] = []
-        #  List of Sugiyama nodes that are not in hierarchy
-        self.__nonHierarchyGraphNodesList: List[VirtualSugiyamaNode] = []
-        self.__nonHierarchyGraphLinksList: List[SugiyamaLink]        = []
+        super().__init__(mediator)
 
-        #  All nodes of the hierarchy are assigned to a level.
-        #  A level is a list of nodes (real or virtual).
-        self.__levels: List = []  # List of levels
+        self.logger: Logger = getLogger(__name__)
 
     def setOptions(self) -> bool:
         """
@@ -62,21 +45,55 @@ class ToolSugiyama(ToolPluginInterface):
         return True
 
     def doAction(self):
-        selectedObjects: OglClasses = self._mediator.selectedOglObjects
+
+        with self._trackProgress(title='Sugiyama Automatic Layout', total=ToolSugiyama.PHASE_COUNT):
+            self.applyAction(self.computeAction())
+
+    def computeAction(self) -> Sugiyama:
+        """
+        Everything but moving the shapes;  Only reads the selected shapes
+
+        Returns:  The laid out graph
+        """
+        selectedObjects: OglObjects = self.selection.oglObjects
 
         self.logger.info(f'Begin Sugiyama algorithm')
 
-        sugiyama: Sugiyama = Sugiyama(mediator=self._mediator)
-        sugiyama.createInterfaceOglALayout(oglObjects=selectedObjects)
-        sugiyama.levelFind()
-        sugiyama.addVirtualNodes()
-        sugiyama.barycenter()
+        self._reportProgress(0, 'Building the layout graph')
+        sugiyama: Sugiyama = Sugiyama(mediator=self._mediator, cancellationToken=self._cancellationToken,
+                                      maximumIterations=self._preference('maximumIterations', Sugiyama.DEFAULT_MAXIMUM_ITERATIONS),
+                                      timeBudget=self._preference('crossingTimeBudget', Sugiyama.DEFAULT_TIME_BUDGET))
+        with self._span('sugiyama.createInterface', objectCount=len(selectedObjects)):
+            sugiyama.createInterfaceOglALayout(oglObjects=selectedObjects)
+        self._reportProgress(1, 'Finding levels')
+        with self._span('sugiyama.levelFind'):
+            sugiyama.levelFind()
+        with self._span('sugiyama.addVirtualNodes'):
+            sugiyama.addVirtualNodes()
+        self._reportProgress(2, 'Minimizing crossings')
+        with self._span('sugiyama.barycenter'):
+            sugiyama.barycenter()
 
         # self.logger.info(f'Number of hierarchical intersections: {sugiyama._getNbIntersectAll()}')
 
-        sugiyama.addNonHierarchicalNodes()
-        sugiyama.fixPositions()
+        self._reportProgress(3, 'Placing non hierarchical nodes')
+        with self._span('sugiyama.addNonHierarchicalNodes'):
+            sugiyama.addNonHierarchicalNodes()
 
-        self._mediator.refreshFrame()
+        return sugiyama
+
+    def applyAction(self, result: Sugiyama):
+        """
+        Move the shapes to their places
+
+        Args:
+            result: The graph from `computeAction`
+        """
+        self._reportProgress(4, 'Fixing positions')
+        # Step by step mode repaints between its prompts, so the frame must not be frozen
+        batchUpdate: ContextManager = nullcontext() if Sugiyama.STEP_BY_STEP is True else self._mediator.batchUpdate()
+        with self._span('sugiyama.fixPositions'), batchUpdate:
+            result.fixPositions()
+            self._mediator.refreshFrame()
 
         self.logger.info('End Sugiyama algorithm')
@@ -2,19 +2,20 @@
 from typing import List
 from typing import NewType
 from typing import Union
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
 from copy import copy
 
-from ogl.OglInheritance import OglInheritance
-from ogl.OglInterface import OglInterface
-from ogl.OglLink import OglLink
-from ogl.OglObject import OglObject
+from math import inf
+
+from time import perf_counter
 
 from pyutmodel.PyutLinkType import PyutLinkType
 
+from core.CancellationToken import CancellationToken
 from core.IMediator import IMediator
 from plugins.tools.sugiyama.RealSugiyamaNode import RealSugiyamaNode
 from plugins.tools.sugiyama.SugiyamaConstants import H_SPACE
@@ -42,14 +43,28 @@ class Sugiyama:
     a lot of hierarchical relations (inheritance and interface), and poor
     association relations.
 
+    The cancellation token is checked once per level and once per barycenter
+    iteration;  A cancelled layout raises `PluginCancelledException` before any
+    shape is moved.
+
+    Crossing minimization (`barycenter`) stops after `maximumIterations` iterations or,
+    if there is a time budget, once it is spent;  The layout is then kept as it is.
     """
     STEP_BY_STEP: bool = False  # Do Sugiyama Step by step
 
-    def __init__(self, mediator: IMediator):
+    DEFAULT_MAXIMUM_ITERATIONS: int   = 20
+    DEFAULT_TIME_BUDGET:        float = 0.0     # seconds;  0 is no budget
+
+    def __init__(self, mediator: IMediator, cancellationToken: CancellationToken = cast(CancellationToken, None),
+                 maximumIterations: int   = DEFAULT_MAXIMUM_ITERATIONS,
+                 timeBudget:        float = DEFAULT_TIME_BUDGET):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._mediator: IMediator = mediator
+        self._mediator:          IMediator         = mediator
+        self._cancellationToken: CancellationToken = CancellationToken() if cancellationToken is None else cancellationToken
+        self._maximumIterations: int               = maximumIterations
+        self._timeBudget:        float             = timeBudget
         # Sugiyama nodes and links
         self.__realSugiyamaNodesList: List[RealSugiyamaNode] = []   # List of all RealSugiyamaNode's
         self._sugiyamaLinksList:      List[SugiyamaLink]     = []   # List of all SugiyamaLink's
@@ -86,6 +101,11 @@ class Sugiyama:
         Args:
             oglObjects:  The Ogl Objects in the diagram
         """
+        from ogl.OglInheritance import OglInheritance
+        from ogl.OglInterface import OglInterface
+        from ogl.OglLink import OglLink
+        from ogl.OglObject import OglObject
+
         # Dictionary for oglObjects fast research
         # Key = OglObject, Value = RealSugiyamaNode
         dictOgl     = {}
@@ -225,6 +245,7 @@ class Sugiyama:
         # While not all nodes have an attributed level
         # while indexNodes != []:
         while indexNodes:
+            self._cancellationToken.raiseIfCancelled()
             # level = []  # Current level
             level: NodeList = NodeList([])
             indexNodesNotSel = indexNodes[:]
@@ -342,15 +363,21 @@ class Sugiyama:
         """
         Find nodes index for minimizing hierarchical links crossing.
         """
-        MAX_ITER = 20
+        MAX_ITER = self._maximumIterations
 
+        deadline: float = perf_counter() + self._timeBudget if self._timeBudget > 0 else inf
         while self._getNbIntersectAll() > 0 and MAX_ITER > 0:
 
+            self._cancellationToken.raiseIfCancelled()
+            if perf_counter() >= deadline:
+                self.logger.info(f'Crossing minimization stopped after its {self._timeBudget} second budget')
+                break
             # Downward phase
 
             # For each level except first
             for i in range(1, len(self._levels)):
 
+                self._cancellationToken.raiseIfCancelled()
                 # Compute parents down-barycenter
                 if i > 0:
                     self._downBarycenterLevel(i - 1)
@@ -371,6 +398,7 @@ class Sugiyama:
                 indexList.reverse()
                 for i in indexList:
 
+                    self._cancellationToken.raiseIfCancelled()
                     self._downBarycenterLevel(i)
                     self._sortLevel(i)
                     self._shiftSameBarycenter(i)
@@ -517,6 +545,7 @@ class Sugiyama:
 
         # While there are nodes still not in hierarchy
         while externalNodes:
+            self._cancellationToken.raiseIfCancelled()
             # Get external node that has most connections to internalNodes
             extNode = mostConnection(externalNodes)
 
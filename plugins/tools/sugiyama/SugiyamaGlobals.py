@@ -4,13 +4,6 @@ from logging import getLogger
 
 from typing import Tuple
 
-from wx import CENTRE
-from wx import OK
-
-from wx import MessageBox
-
-from wx import Yield as wxYield
-
 from core.IMediator import IMediator
 
 from plugins.tools.sugiyama.SugiyamaNode import SugiyamaNode
@@ -77,9 +70,13 @@ class SugiyamaGlobals:
     @staticmethod
     def waitKey(mediator: IMediator, optionalMessage: str = None):
         # input('Press enter to continue')
+        from wx import CENTRE
+        from wx import OK
+        from wx import MessageBox
+
         if optionalMessage is None:
             MessageBox('Press Ok to continue', 'Confirm', style=OK | CENTRE)
         else:
             MessageBox(optionalMessage, 'Press Ok to continue', style=OK | CENTRE)
         mediator.refreshFrame()
-        wxYield()
+        mediator.processPendingEvents()
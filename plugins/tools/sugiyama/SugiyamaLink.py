@@ -1,8 +1,6 @@
 
 from plugins.tools.sugiyama.ALayoutLink import ALayoutLink
 
-from miniogl.ControlPoint import ControlPoint
-
 
 class SugiyamaLink(ALayoutLink):
     """
@@ -30,6 +28,8 @@ class SugiyamaLink(ALayoutLink):
 
         @author Nicolas Dubois
         """
+        from miniogl.ControlPoint import ControlPoint
+
         # Clear the actual control points of the link (not the anchor points)
         self.removeAllControlPoints()
 
@@ -39,5 +39,8 @@ setup(
         'plugins.tools',
         'core', 'core.types', 'core.exceptions',
     ],
+    entry_points={
+        'console_scripts': ['pyutplugins=core.PluginBatch:commandHandler'],
+    },
     install_requires=['click~=8.1.3', 'ogl==0.53.2', 'pyutmodel', 'untanglepyut==0.2.55', 'wxPython~=4.1.1']
 )
@@ -0,0 +1,11 @@
+
+from os import environ
+
+from os.path import join as osPathJoin
+
+from tempfile import gettempdir
+
+from core.PluginManifest import MANIFEST_FILENAME_VARIABLE
+
+# Keep the test runs away from the developer's own plugin manifest
+environ.setdefault(MANIFEST_FILENAME_VARIABLE, osPathJoin(gettempdir(), 'pyutPluginManifestTests.json'))
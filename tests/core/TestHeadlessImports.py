@@ -0,0 +1,94 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from subprocess import CompletedProcess
+from subprocess import run as subProcessRun
+
+from os.path import abspath
+from os.path import dirname
+
+from sys import executable
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+#
+# Run in a fresh interpreter where importing the GUI toolkit fails
+#
+BLOCKING_IMPORTER: str = '''
+import sys
+from importlib import import_module
+from importlib.abc import MetaPathFinder
+
+class GuiBlocker(MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name.split('.')[0] in ('wx', 'ogl', 'miniogl'):
+            raise ImportError(f'{name} imported')
+
+sys.meta_path.insert(0, GuiBlocker())
+for moduleName in sys.argv[1:]:
+    import_module(moduleName)
+'''
+
+
+class TestHeadlessImports(TestBase):
+    """
+    Workers and command line runs import these modules;  They must not need wx
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    HEADLESS_MODULES: List[str] = [
+        'core.PluginManager',
+        'core.HeadlessMediator',
+        'core.IOPluginInterface',
+        'core.ToolPluginInterface',
+        'core.PluginAsyncExecutor',
+        'core.types.PluginDataTypes',
+        'plugins.io.python.ReverseEngineerPython2',
+        'plugins.io.java.JavaReader',
+        'plugins.io.java.JavaWriter',
+        'plugins.io.gml.GMLExporter',
+        'plugins.tools.sugiyama.Sugiyama',
+        'plugins.io.IOPython',
+        'plugins.io.IOJava',
+        'plugins.tools.ToolSugiyama',
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestHeadlessImports.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestHeadlessImports.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testImportWithoutWx(self):
+
+        completedProcess: CompletedProcess = subProcessRun([executable, '-c', BLOCKING_IMPORTER] + TestHeadlessImports.HEADLESS_MODULES,
+                                                           cwd=dirname(dirname(dirname(abspath(__file__)))), capture_output=True, text=True)
+
+        self.assertEqual(0, completedProcess.returncode, completedProcess.stderr)
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestHeadlessImports))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
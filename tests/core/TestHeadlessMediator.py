@@ -0,0 +1,148 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.HeadlessMediator import HeadlessMediator
+from core.IMediator import IMediator
+from core.ToolPluginInterface import ToolPluginInterface
+
+from tests.TestBase import TestBase
+
+
+class SampleShape:
+    def __init__(self, name: str):
+        self.name: str = name
+
+
+class SampleLinkShape(SampleShape):
+    pass
+
+
+class SelectionCountingTool(ToolPluginInterface):
+    """
+    Records what it sees so that the test can check that tools run headless
+    """
+    def __init__(self, mediator: IMediator):
+        super().__init__(mediator)
+        self.seenShapes: List = []
+
+    def setOptions(self) -> bool:
+        return True
+
+    def doAction(self):
+        self._mediator.selectAllOglObjects()
+        self.seenShapes = self._mediator.selectedOglObjects
+        self._mediator.refreshFrame()
+
+
+class TestHeadlessMediator(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestHeadlessMediator.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestHeadlessMediator.clsLogger
+
+        self._mediator: HeadlessMediator = HeadlessMediator(currentDirectory='/tmp')
+
+        self._shapes: List[SampleShape] = [SampleShape('Base'), SampleShape('Child'), SampleLinkShape('Child->Base')]
+        for shape in self._shapes:
+            self._mediator.addShape(shape)
+
+    def tearDown(self):
+        pass
+
+    def testHasUmlFrame(self):
+        self.assertIsNotNone(self._mediator.umlFrame, 'Plugins test for a frame')
+        self.assertEqual('/tmp', self._mediator.currentDirectory, 'Incorrect directory')
+
+    def testShapesAdded(self):
+        self.assertEqual(self._shapes, self._mediator.diagram.shapes, 'Shapes not kept in order')
+
+    def testSelection(self):
+        self._mediator.diagram.select([self._shapes[1]])
+        self.assertEqual([self._shapes[1]], self._mediator.selectedOglObjects, 'Incorrect selection')
+
+        self._mediator.deselectAllOglObjects()
+        self.assertEqual(0, len(self._mediator.selectedOglObjects), 'Selection not cleared')
+
+    def testRemoveShape(self):
+        self._mediator.diagram.select(self._shapes)
+        self._mediator.diagram.removeShape(self._shapes[1])
+
+        self.assertNotIn(self._shapes[1], self._mediator.diagram, 'Shape not removed')
+        self.assertEqual([self._shapes[0], self._shapes[2]], self._mediator.selectedOglObjects, 'Removed shape still selected')
+        self.assertRaises(ValueError, lambda: self._mediator.diagram.removeShape(self._shapes[1]))
+
+    def testSelectKeepsOrder(self):
+        self._mediator.diagram.select([self._shapes[2], self._shapes[0], self._shapes[2], SampleShape('Stranger')])
+
+        self.assertEqual([self._shapes[2], self._shapes[0]], self._mediator.selectedOglObjects, 'Selection should be unique and in selection order')
+
+    def testReportErrorDoesNotShowDialog(self):
+        tool: SelectionCountingTool = SelectionCountingTool(mediator=self._mediator)
+
+        tool.displayImportError('Bad file')
+
+        self.assertEqual(['Import Failed: Bad file'], self._mediator.errors, 'Error not collected')
+
+    def testShapesOfType(self):
+        links = self._mediator.diagram.shapesOfType(SampleLinkShape)
+
+        self.assertEqual([self._shapes[2]], links, 'Incorrect query result')
+
+    def testAddShapes(self):
+        moreShapes: List[SampleShape] = [SampleShape('Other'), SampleShape('Another')]
+
+        self._mediator.addShapes(moreShapes)
+
+        self.assertEqual(self._shapes + moreShapes, self._mediator.diagram.shapes, 'Bulk add did not keep the order')
+
+    def testBatchUpdateDefersRefresh(self):
+        with self._mediator.batchUpdate():
+            self._mediator.refreshFrame()
+            with self._mediator.batchUpdate():
+                self._mediator.refreshFrame()
+            self.assertEqual(0, self._mediator.diagram.refreshCount, 'Refresh should be held until the batch ends')
+
+        self.assertEqual(1, self._mediator.diagram.refreshCount, 'Held refreshes should collapse into one')
+
+    def testBatchUpdateWithoutRefresh(self):
+        with self._mediator.batchUpdate():
+            self._mediator.addShape(SampleShape('Quiet'))
+
+        self.assertEqual(0, self._mediator.diagram.refreshCount, 'Nobody asked for a refresh')
+
+    def testToolRunsHeadless(self):
+        tool: SelectionCountingTool = SelectionCountingTool(mediator=self._mediator)
+
+        tool.executeTool()
+
+        self.assertEqual(self._shapes, tool.seenShapes, 'The tool did not see every shape')
+        self.assertEqual(1, self._mediator.diagram.refreshCount, 'Refresh not counted')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestHeadlessMediator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
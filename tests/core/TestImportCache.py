@@ -0,0 +1,186 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import listdir
+from os import utime
+from os.path import getsize
+from os.path import join as osPathJoin
+
+from pickle import dumps as pickleDumps
+from pickle import loads as pickleLoads
+
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+from zlib import compress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.ImportCache import ImportCache
+
+from tests.TestBase import TestBase
+
+
+class TestImportCache(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestImportCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestImportCache.clsLogger
+
+        self._directoryName: str       = mkdtemp()
+        self._parsed:        List[str] = []
+
+        self._sourceFileName: str = self._writeSource('Source.py', 'class Source:\n    pass\n')
+
+    def tearDown(self):
+        rmtree(self._directoryName)
+
+    def testHitAfterMiss(self):
+        importCache: ImportCache = self._importCache()
+
+        first:  List[str] = importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+        second: List[str] = importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        self.assertEqual(first, second, 'The cached result differs')
+        self.assertEqual(1, len(self._parsed), 'The file should be parsed once')
+        self.assertEqual((1, 1), (importCache.misses, importCache.hits), 'Wrong statistics')
+
+    def testChangedContentMisses(self):
+        importCache: ImportCache = self._importCache()
+
+        importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+        self._writeSource('Source.py', 'class Changed:\n    pass\n')
+        importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        self.assertEqual(2, len(self._parsed), 'A changed file must be parsed again')
+
+    def testPluginVersionAndOptionsInKey(self):
+        baseKey: str = self._importCache().key(self._sourceFileName)
+
+        self.assertNotEqual(baseKey, self._importCache(pluginVersion='2.0').key(self._sourceFileName), 'The version is not part of the key')
+        self.assertNotEqual(baseKey, self._importCache(options={'fields': True}).key(self._sourceFileName), 'The options are not part of the key')
+        self.assertEqual(baseKey, self._importCache().key(self._sourceFileName), 'The key is not stable')
+
+    def testLeastRecentlyUsedEvicted(self):
+        fileNames:   List[str]   = [self._writeSource(f'Source{index}.py', f'class Source{index}:\n    pass\n') for index in range(3)]
+        importCache: ImportCache = self._importCache(maximumSize=self._oneAndAHalfEntries(fileNames[0]))
+
+        for fileName in fileNames:
+            importCache.fetch(fileName, self._parser(fileName))
+
+        self.assertEqual(1, self._entryCount(), 'Only the newest entry fits')
+
+        importCache.fetch(fileNames[-1], self._parser(fileNames[-1]))
+        self.assertEqual(1, importCache.hits, 'The newest entry should have been kept')
+
+    def testRecentlyUsedEntryKept(self):
+        fileNames:   List[str]   = [self._writeSource(f'Source{index}.py', f'class Source{index}:\n    pass\n') for index in range(3)]
+        importCache: ImportCache = self._importCache()
+
+        for age, fileName in enumerate(fileNames):
+            importCache.fetch(fileName, self._parser(fileName))
+            utime(importCache._entryPath(importCache.key(fileName)), (1000 + age, 1000 + age))
+        importCache.fetch(fileNames[0], self._parser(fileNames[0]))     # Now the most recently used
+
+        boundedCache: ImportCache = self._importCache(maximumSize=self._oneAndAHalfEntries(fileNames[0]))
+        boundedCache._evict()
+
+        self.assertEqual(1, self._entryCount(), 'Wrong entry count')
+        boundedCache.fetch(fileNames[0], self._parser(fileNames[0]))
+        self.assertEqual(1, boundedCache.hits, 'The most recently used entry was evicted')
+
+    def testCorruptEntryReparsed(self):
+        importCache: ImportCache = self._importCache()
+        importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        with open(importCache._entryPath(importCache.key(self._sourceFileName)), 'wb') as entryFile:
+            entryFile.write(b'Not a cache entry')
+
+        result: List[str] = importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        self.assertEqual([self._sourceFileName], result, 'Wrong result')
+        self.assertEqual(2, len(self._parsed), 'A corrupt entry must be parsed again')
+
+    def testCorruptPickleReparsed(self):
+        importCache: ImportCache = self._importCache()
+        importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        with open(importCache._entryPath(importCache.key(self._sourceFileName)), 'wb') as entryFile:
+            entryFile.write(compress(b'Not a pickle'))
+
+        result: List[str] = importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        self.assertEqual([self._sourceFileName], result, 'Wrong result')
+        self.assertEqual(2, len(self._parsed), 'An unreadable pickle must be parsed again')
+
+    def testPicklable(self):
+        importCache: ImportCache = self._importCache()
+        importCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        childCache: ImportCache = pickleLoads(pickleDumps(importCache))
+        childCache.fetch(self._sourceFileName, self._parser(self._sourceFileName))
+
+        self.assertEqual(1, len(self._parsed), 'A copy of the cache should share its entries')
+
+    def _importCache(self, pluginVersion: str = '1.0', options=None, maximumSize: int = 1024 * 1024) -> ImportCache:
+        return ImportCache(pluginName='TestPlugin', pluginVersion=pluginVersion, options=options,
+                           cacheDirectory=osPathJoin(self._directoryName, 'cache'), maximumSize=maximumSize)
+
+    def _parser(self, fileName: str):
+
+        def parse() -> List[str]:
+            self._parsed.append(fileName)
+            return [fileName]
+
+        return parse
+
+    def _writeSource(self, baseName: str, source: str) -> str:
+
+        fileName: str = osPathJoin(self._directoryName, baseName)
+        with open(fileName, 'w') as sourceFile:
+            sourceFile.write(source)
+
+        return fileName
+
+    def _oneAndAHalfEntries(self, fileName: str) -> int:
+        """
+        Returns:  A size cap that holds a single entry like the one for the file
+        """
+        sizingCache: ImportCache = ImportCache(pluginName='Sizing', pluginVersion='1.0', cacheDirectory=osPathJoin(self._directoryName, 'sizing'))
+        sizingCache.fetch(fileName, lambda: [fileName])
+
+        return getsize(sizingCache._entryPath(sizingCache.key(fileName))) * 3 // 2
+
+    def _entryCount(self) -> int:
+
+        cacheDirectory: str = osPathJoin(self._directoryName, 'cache')
+
+        return sum(len(listdir(osPathJoin(cacheDirectory, subDirectory))) for subDirectory in listdir(cacheDirectory))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestImportCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
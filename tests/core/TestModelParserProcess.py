@@ -0,0 +1,112 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import _exit as osExit
+
+from time import perf_counter
+from time import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodel.PyutClass import PyutClass
+
+from core.CancellationToken import CancellationToken
+from core.ModelParserProcess import ModelParserProcess
+from core.exceptions.PluginCancelledException import PluginCancelledException
+from core.exceptions.ModelParserException import ModelParserException
+
+from plugins.common.ReverseEngineeredModel import ModelLink
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+
+from tests.TestBase import TestBase
+
+
+def sampleParser() -> ReverseEngineeredModel:
+    model: ReverseEngineeredModel = ReverseEngineeredModel()
+
+    model.pyutClasses['Base']  = PyutClass(name='Base')
+    model.pyutClasses['Child'] = PyutClass(name='Child')
+    model.links.append(ModelLink(sourceName='Child', destinationName='Base'))
+
+    return model
+
+
+def failingParser() -> ReverseEngineeredModel:
+    raise ValueError('Bad source file')
+
+
+def crashingParser() -> ReverseEngineeredModel:
+    osExit(3)
+
+
+def slowParser() -> ReverseEngineeredModel:
+    sleep(60)
+    return ReverseEngineeredModel()
+
+
+class TestModelParserProcess(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestModelParserProcess.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestModelParserProcess.clsLogger
+
+        self._parserProcess: ModelParserProcess = ModelParserProcess(pollInterval=0.01)
+        self._waitCount:     int                = 0
+
+    def tearDown(self):
+        pass
+
+    def testModelReturned(self):
+        model: ReverseEngineeredModel = self._parserProcess.parse(modelParser=sampleParser)
+
+        self.assertEqual(['Base', 'Child'], list(model.pyutClasses.keys()), 'Classes did not survive the trip')
+        self.assertEqual('Base', model.links[0].destinationName, 'Link did not survive the trip')
+
+    def testWhileWaitingCalled(self):
+        self._parserProcess.parse(modelParser=sampleParser, whileWaiting=self._countWait)
+
+        self.assertGreater(self._waitCount, 0, 'The waiting handler was never called')
+
+    def testParserFailure(self):
+        self.assertRaises(ModelParserException, lambda: self._parserProcess.parse(modelParser=failingParser))
+
+    def testParserCrashContained(self):
+        self.assertRaises(ModelParserException, lambda: self._parserProcess.parse(modelParser=crashingParser))
+
+    def testCancelledParseTerminated(self):
+        cancellationToken: CancellationToken = CancellationToken()
+        cancellationToken.cancelAfter(0.5)
+
+        startTime: float = perf_counter()
+        self.assertRaises(PluginCancelledException, lambda: self._parserProcess.parse(modelParser=slowParser, cancellationToken=cancellationToken))
+
+        self.assertLess(perf_counter() - startTime, 30.0, 'The parser process was not terminated')
+
+    def _countWait(self):
+        self._waitCount += 1
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestModelParserProcess))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
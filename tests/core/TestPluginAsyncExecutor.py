@@ -0,0 +1,293 @@
+
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import run as asyncioRun
+
+from concurrent.futures import Future
+
+from functools import partial
+
+from time import perf_counter
+from time import sleep
+
+from threading import current_thread
+from threading import main_thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.CancellationToken import CancellationToken
+from core.HeadlessMediator import HeadlessMediator
+from core.IOPluginInterface import IOPluginInterface
+from core.ModelParserProcess import ModelParser
+from core.PluginAsyncExecutor import PluginAsyncExecutor
+from core.ToolPluginInterface import ToolPluginInterface
+from core.exceptions.PluginCancelledException import PluginCancelledException
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginDescription
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ReadMode
+from core.types.ResourceLimits import ResourceLimits
+
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+from plugins.common.Types import OglObjects
+
+from tests.TestBase import TestBase
+from tests.core.TestHeadlessMediator import SampleShape
+
+TIMEOUT: float = 10.0
+
+
+class BackgroundTool(ToolPluginInterface):
+    """
+    Records the threads its two halves run on
+    """
+    PLUGIN_NAME:           PluginName = PluginName('Background Tool')
+    COMPUTE_IN_BACKGROUND: bool       = True
+
+    def __init__(self, mediator):
+        super().__init__(mediator)
+        self.threadNames: List[str] = []
+
+    def setOptions(self) -> bool:
+        return True
+
+    def doAction(self):
+        self.applyAction(self.computeAction())
+
+    def computeAction(self) -> int:
+        self.threadNames.append(current_thread().name)
+        return len(self.selection)
+
+    def applyAction(self, result: int):
+        self.threadNames.append(current_thread().name)
+        self._mediator.refreshFrame()
+
+
+def spinUntilCancelled(cancellationToken: CancellationToken, progressCallback: Any) -> ReverseEngineeredModel:
+
+    startTime: float = perf_counter()
+    while perf_counter() - startTime < TIMEOUT:
+        cancellationToken.raiseIfCancelled()
+        sleep(0.01)
+
+    return ReverseEngineeredModel()
+
+
+class SpinningImporter(IOPluginInterface):
+    """
+    Its model parser runs until it is cancelled
+    """
+    PLUGIN_NAME: PluginName = PluginName('Spinning Importer')
+    READ_MODE:   ReadMode   = ReadMode.IN_PROCESS
+
+    def setImportOptions(self) -> bool:
+        return True
+
+    def setExportOptions(self) -> bool:
+        return False
+
+    def read(self) -> bool:
+        return False
+
+    def write(self, oglObjects: OglObjects):
+        pass
+
+    def createModelParser(self) -> Optional[ModelParser]:
+        return partial(spinUntilCancelled)
+
+    def materialize(self, model: ReverseEngineeredModel) -> bool:
+        return True
+
+
+class SpinningExporter(SpinningImporter):
+    """
+    Its background write runs until it is cancelled
+    """
+    PLUGIN_NAME:         PluginName   = PluginName('Spinning Exporter')
+    OUTPUT_FORMAT:       OutputFormat = OutputFormat(formatName=FormatName('Spinning'), extension=PluginExtension('spin'), description=PluginDescription('Spins'))
+    WRITE_IN_BACKGROUND: bool         = True
+
+    def setExportOptions(self) -> bool:
+        return True
+
+    def write(self, oglObjects: OglObjects):
+        spinUntilCancelled(cancellationToken=self._cancellationToken, progressCallback=None)
+
+
+class TestPluginAsyncExecutor(TestBase):
+    """
+    The UI dispatcher queues the UI work;  The tests play the part of the UI thread and
+    run the queued work
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginAsyncExecutor.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginAsyncExecutor.clsLogger
+
+        self._uiQueue:  List                = []
+        self._executor: PluginAsyncExecutor = PluginAsyncExecutor()
+
+        self._savedDispatcher = self._executor.uiDispatcher
+        self._executor.uiDispatcher = self._uiQueue.append
+
+    def tearDown(self):
+        self._executor.uiDispatcher = self._savedDispatcher
+
+    def testBackgroundThenUi(self):
+        future: Future = self._executor.submit(backgroundWork=lambda: current_thread().name, uiWork=lambda threadName: f'{threadName}+ui')
+
+        self._runUiQueue(expectedCount=1)
+
+        result: str = future.result(timeout=TIMEOUT)
+        self.assertTrue(result.startswith('PluginJob'), 'The background work did not run on a worker thread')
+        self.assertTrue(result.endswith('+ui'),         'The UI work did not get the background result')
+
+    def testBackgroundOnly(self):
+        future: Future = self._executor.submit(backgroundWork=lambda: 42)
+
+        self.assertEqual(42, future.result(timeout=TIMEOUT), 'Incorrect result')
+        self.assertEqual(0, len(self._uiQueue), 'Nothing should be sent to the UI thread')
+
+    def testBackgroundFailureSkipsUi(self):
+        future: Future = self._executor.submit(backgroundWork=self._cancelledWork, uiWork=lambda result: result)
+
+        self.assertRaises(PluginCancelledException, lambda: future.result(timeout=TIMEOUT))
+        self.assertEqual(0, len(self._uiQueue), 'A failed job should not reach the UI thread')
+
+    def testCallOnUiThread(self):
+        future: Future = self._executor.callOnUiThread(lambda: current_thread() is main_thread())
+
+        self.assertFalse(future.done(), 'The UI work should be queued')
+        self._runUiQueue(expectedCount=1)
+        self.assertTrue(future.result(timeout=TIMEOUT), 'The UI work did not run on the UI thread')
+
+    def testAwaitable(self):
+
+        async def awaitJob() -> int:
+            return await self._executor.awaitable(self._executor.submit(backgroundWork=lambda: 7))
+
+        self.assertEqual(7, asyncioRun(awaitJob()), 'The awaited result is incorrect')
+
+    def testCancellationToken(self):
+        cancellationToken: CancellationToken = CancellationToken()
+
+        cancellationToken.raiseIfCancelled()
+        cancellationToken.cancel()
+
+        self.assertTrue(cancellationToken.cancelled, 'Token should be cancelled')
+        self.assertRaises(PluginCancelledException, cancellationToken.raiseIfCancelled)
+
+    def testToolComputesInBackground(self):
+        mediator: HeadlessMediator = HeadlessMediator(currentDirectory='/tmp')
+        mediator.addShapes([SampleShape('A'), SampleShape('B')])
+        mediator.diagram.select(mediator.diagram.shapes)
+
+        tool: BackgroundTool = BackgroundTool(mediator)
+        job:  Future         = tool.executeToolAsync()
+
+        self._runUiQueueUntilDone(job)
+
+        self.assertTrue(tool.threadNames[0].startswith('PluginJob'), 'The computation should not run on the UI thread')
+        self.assertEqual(main_thread().name, tool.threadNames[1], 'The diagram should only change on the UI thread')
+
+    def testImportAsyncWatched(self):
+        importer: SpinningImporter = SpinningImporter(HeadlessMediator(currentDirectory='/tmp'))
+        importer.resourceLimits = ResourceLimits(wallTime=0.2, sampleInterval=0.02)
+
+        job: Future = importer.executeImportAsync()
+
+        self.assertFalse(job.result(timeout=TIMEOUT), 'A cancelled import completes with False')
+        self.assertIsNotNone(importer.resourceViolation, 'The watchdog should stop the parse')
+        self.assertEqual(0, len(self._uiQueue), 'A cancelled parse should not reach the UI thread')
+
+    def testImportAsyncCancelled(self):
+        cancellationToken: CancellationToken = CancellationToken()
+        importer:          SpinningImporter  = SpinningImporter(HeadlessMediator(currentDirectory='/tmp'))
+
+        job: Future = importer.executeImportAsync(cancellationToken=cancellationToken)
+        cancellationToken.cancel()
+
+        self.assertFalse(job.result(timeout=TIMEOUT), 'A cancelled import completes with False')
+
+    def testExportAsyncWatched(self):
+        exporter: SpinningExporter = SpinningExporter(self._selectedShapesMediator())
+        exporter.resourceLimits = ResourceLimits(wallTime=0.2, sampleInterval=0.02)
+
+        job: Future = exporter.executeExportAsync()
+
+        self.assertFalse(job.result(timeout=TIMEOUT), 'A cancelled export completes with False')
+        self.assertIsNotNone(exporter.resourceViolation, 'The watchdog should stop the write')
+        self.assertEqual(0, len(self._uiQueue), 'A cancelled write should not reach the UI thread')
+
+    def testExportAsyncCancelled(self):
+        cancellationToken: CancellationToken = CancellationToken()
+        exporter:          SpinningExporter  = SpinningExporter(self._selectedShapesMediator())
+
+        job: Future = exporter.executeExportAsync(cancellationToken=cancellationToken)
+        cancellationToken.cancel()
+
+        self.assertFalse(job.result(timeout=TIMEOUT), 'A cancelled export completes with False')
+
+    def _selectedShapesMediator(self) -> HeadlessMediator:
+        mediator: HeadlessMediator = HeadlessMediator(currentDirectory='/tmp')
+        mediator.addShapes([SampleShape('A'), SampleShape('B')])
+        mediator.diagram.select(mediator.diagram.shapes)
+
+        return mediator
+
+    def _runUiQueueUntilDone(self, job: Future):
+
+        startTime: float = perf_counter()
+        while job.done() is False and perf_counter() - startTime < TIMEOUT:
+            if len(self._uiQueue) > 0:
+                self._uiQueue.pop(0)()
+            else:
+                sleep(0.01)
+
+        job.result(timeout=0)
+
+    def _cancelledWork(self):
+        cancellationToken: CancellationToken = CancellationToken()
+        cancellationToken.cancel()
+        cancellationToken.raiseIfCancelled()
+
+    def _runUiQueue(self, expectedCount: int):
+
+        for job in self._waitForUiWork(expectedCount=expectedCount):
+            job()
+
+    def _waitForUiWork(self, expectedCount: int) -> List:
+        startTime: float = perf_counter()
+        while len(self._uiQueue) < expectedCount and perf_counter() - startTime < TIMEOUT:
+            sleep(0.01)
+
+        return list(self._uiQueue)
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginAsyncExecutor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,113 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import loads as jsonLoads
+
+from os import makedirs
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from click.testing import CliRunner
+from click.testing import Result
+
+from core.PluginBatch import EXIT_FAILURE
+from core.PluginBatch import PluginBatch
+from core.PluginBatch import commandHandler
+from core.exceptions.BatchJobException import BatchJobException
+from core.types.BatchJob import BatchJob
+from core.types.BatchJobResult import BatchJobResult
+from core.types.PluginDataTypes import PluginName
+
+from tests.TestBase import TestBase
+
+
+class NoDisplayBatch(PluginBatch):
+
+    @classmethod
+    def _createApp(cls):
+        raise BatchJobException('No display is available')
+
+
+class TestPluginBatch(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginBatch.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginBatch.clsLogger
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directoryName:      str                = self._temporaryDirectory.name
+
+        makedirs(osPathJoin(self._directoryName, 'b'))
+        makedirs(osPathJoin(self._directoryName, 'a'))
+        for fileName in ['b/z.txt', 'a/y.txt', 'x.txt']:
+            with open(osPathJoin(self._directoryName, fileName), 'w') as file:
+                file.write('Not source code')
+
+    def tearDown(self):
+        self._temporaryDirectory.cleanup()
+
+    def testCollectFilesStableOrder(self):
+        fileNames: List[str] = PluginBatch.collectFiles(self._directoryName)
+
+        expectedNames: List[str] = [osPathJoin(self._directoryName, fileName) for fileName in ['x.txt', 'a/y.txt', 'b/z.txt']]
+        self.assertEqual(expectedNames, fileNames, 'Files not collected in a stable order')
+
+    def testUnknownToolFailsJob(self):
+        job:    BatchJob       = BatchJob(directoryName=self._directoryName, toolNames=[PluginName('No Such Tool')])
+        result: BatchJobResult = PluginBatch.runJob(job)
+
+        self.assertFalse(result.succeeded, 'The job should fail')
+        self.assertIn('No Such Tool', result.error, 'The error should name the tool')
+        self.assertEqual(3, result.fileCount, 'Incorrect file count')
+        self.assertIn('total', result.timings, 'The total time is missing')
+
+    def testNoDisplayFailsJob(self):
+        job: BatchJob = BatchJob(directoryName=self._directoryName)
+
+        result: BatchJobResult = NoDisplayBatch.runJob(job)
+
+        self.assertFalse(result.succeeded, 'The job should fail')
+        self.assertIn('No display', result.error, 'The error should say why')
+
+    def testCommandExitsWithFailure(self):
+        summaryFileName: str = osPathJoin(self._directoryName, 'summary.json')
+
+        runner: CliRunner = CliRunner()
+        result: Result    = runner.invoke(commandHandler, [self._directoryName, '--tool', 'No Such Tool', '--summary', summaryFileName])
+
+        self.assertEqual(EXIT_FAILURE, result.exit_code, 'A failed job must fail the command')
+
+        with open(summaryFileName) as summaryFile:
+            summary = jsonLoads(summaryFile.read())
+        self.assertEqual(1, summary['failures'], 'Incorrect failure count')
+        self.assertEqual(self._directoryName, summary['jobs'][0]['directoryName'], 'Incorrect job')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginBatch))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,132 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.IMediator import IMediator
+from core.PluginInstancePool import PluginInstancePool
+from core.types.PluginDataTypes import PluginType
+
+from tests.TestBase import TestBase
+
+
+class PooledPlugin:
+    constructed: int = 0
+
+    def __init__(self, mediator: IMediator):
+        PooledPlugin.constructed += 1
+
+        self.mediator:     IMediator = mediator
+        self.resetCount:   int       = 0
+        self.fileToImport: str       = ''
+
+    def reset(self):
+        self.resetCount  += 1
+        self.fileToImport = ''
+
+
+class TestPluginInstancePool(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginInstancePool.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginInstancePool.clsLogger
+
+        PooledPlugin.constructed = 0
+        self._pool: PluginInstancePool = PluginInstancePool()
+
+    def tearDown(self):
+        pass
+
+    def testInstanceReused(self):
+        first  = self._acquireAndRelease()
+        second = self._acquireAndRelease()
+
+        self.assertIs(first, second, 'Should reuse the pooled instance')
+        self.assertEqual(1, PooledPlugin.constructed, 'Plugin constructed more than once')
+
+    def testBusyInstanceNotShared(self):
+        first  = self._pool.acquire(cast(PluginType, PooledPlugin), mediator=cast(IMediator, None))
+        first.fileToImport = 'running.dtd'
+
+        second = self._pool.acquire(cast(PluginType, PooledPlugin), mediator=cast(IMediator, object()))
+
+        self.assertIsNot(first, second, 'The running instance was handed out again')
+        self.assertEqual(0, first.resetCount, 'The running instance was reset')
+        self.assertIsNone(first.mediator, 'The running instance was re-bound')
+        self.assertEqual('running.dtd', first.fileToImport, 'The running instance lost its state')
+
+        self._pool.release(first)
+        self._pool.release(second)
+        self.assertEqual(2, len(self._pool), 'Both instances should be pooled')
+
+    def testCheckedOut(self):
+        with self._pool.checkedOut(cast(PluginType, PooledPlugin), mediator=cast(IMediator, None)) as plugin:
+            self.assertFalse(self._pool.isPooled(cast(PluginType, PooledPlugin)), 'The instance is in use')
+
+        self.assertTrue(self._pool.isPooled(cast(PluginType, PooledPlugin)), 'The instance was not released')
+        self.assertIs(plugin, self._acquireAndRelease(), 'Should reuse the released instance')
+
+    def testForeignInstanceNotPooled(self):
+        self._pool.acquire(cast(PluginType, PooledPlugin), mediator=cast(IMediator, None))
+
+        self._pool.release(PooledPlugin(cast(IMediator, None)))
+
+        self.assertFalse(self._pool.isPooled(cast(PluginType, PooledPlugin)), 'An instance the pool did not hand out was pooled')
+        self.assertEqual(1, len(self._pool), 'Only the checked out instance should be counted')
+
+    def testResetBetweenInvocations(self):
+        plugin = self._acquireAndRelease()
+        plugin.fileToImport = 'previous.dtd'
+
+        plugin = self._pool.acquire(cast(PluginType, PooledPlugin), mediator=cast(IMediator, None))
+
+        self.assertEqual(1, plugin.resetCount, 'Reset not called on reuse')
+        self.assertEqual('', plugin.fileToImport, 'State from previous invocation survived')
+
+    def testRebindMediator(self):
+        mediator: IMediator = cast(IMediator, object())
+
+        self._acquireAndRelease()
+        plugin = self._pool.acquire(cast(PluginType, PooledPlugin), mediator=mediator)
+
+        self.assertIs(mediator, plugin.mediator, 'Pooled instance not bound to the new mediator')
+
+    def testDiscard(self):
+        self._acquireAndRelease()
+        self._pool.discard(cast(PluginType, PooledPlugin))
+        self._acquireAndRelease()
+
+        self.assertEqual(2, PooledPlugin.constructed, 'Discarded instance was reused')
+
+    def _acquireAndRelease(self):
+
+        plugin = self._pool.acquire(cast(PluginType, PooledPlugin), mediator=cast(IMediator, None))
+        self._pool.release(plugin)
+
+        return plugin
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginInstancePool))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,129 @@
+
+from typing import Any
+from typing import Dict
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from json import loads as jsonLoads
+
+from threading import Thread
+
+import tracemalloc
+
+from core.PluginLoadProfiler import PluginLoadProfiler
+from core.types.PluginLoadMeasurement import PluginLoadPhase
+
+from tests.TestBase import TestBase
+
+SAMPLE_MODULE_NAME: str = 'plugins.io.IOSample'
+
+
+class TestPluginLoadProfiler(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginLoadProfiler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginLoadProfiler.clsLogger
+
+        self._profiler: PluginLoadProfiler = PluginLoadProfiler()
+        self._profiler.reset()
+
+    def tearDown(self):
+        self._profiler.stopMemoryProfiling()
+        self._profiler.reset()
+
+    def testMeasurePhases(self):
+        with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.IMPORT):
+            pass
+        with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.INSTANTIATION):
+            pass
+
+        phases = self._profiler.measurements[SAMPLE_MODULE_NAME]
+        self.assertEqual(2, len(phases), 'Should have measured two phases')
+        self.assertGreaterEqual(phases[PluginLoadPhase.IMPORT].wallTime, 0.0, 'Wall time cannot be negative')
+
+    def testOnlyFirstMeasurementKept(self):
+        with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.IMPORT):
+            _ = [n for n in range(10000)]
+        firstTime: float = self._profiler.measurements[SAMPLE_MODULE_NAME][PluginLoadPhase.IMPORT].wallTime
+
+        with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.IMPORT):
+            pass
+
+        self.assertEqual(firstTime, self._profiler.measurements[SAMPLE_MODULE_NAME][PluginLoadPhase.IMPORT].wallTime, 'First measurement replaced')
+
+    def testMemoryDelta(self):
+        self._profiler.startMemoryProfiling()
+        with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.INSTANTIATION):
+            keepAlive = bytearray(256 * 1024)
+
+        memoryDelta: int = self._profiler.measurements[SAMPLE_MODULE_NAME][PluginLoadPhase.INSTANTIATION].memoryDelta
+        self.assertGreaterEqual(memoryDelta, len(keepAlive), 'Allocation was not measured')
+
+    def testJsonReport(self):
+        with self._profiler.measureDiscovery():
+            with self._profiler.measure(SAMPLE_MODULE_NAME, PluginLoadPhase.CLASS_LOOKUP):
+                pass
+
+        report: Dict[str, Any] = jsonLoads(self._profiler.toJson())
+
+        self.assertGreater(report['discoveryTime'], 0.0, 'Discovery time not recorded')
+        self.assertIn('classLookup', report['modules'][SAMPLE_MODULE_NAME]['phases'], 'Phase missing from report')
+
+    def testStopEndsOwnTrace(self):
+        self._profiler.startMemoryProfiling()
+        self._profiler.stopMemoryProfiling()
+
+        self.assertFalse(tracemalloc.is_tracing(), 'Profiler left memory tracing on')
+
+    def testStopLeavesForeignTrace(self):
+        tracemalloc.start()
+        try:
+            self._profiler.startMemoryProfiling()
+            self._profiler.stopMemoryProfiling()
+
+            self.assertTrue(tracemalloc.is_tracing(), 'Profiler stopped a trace it did not start')
+        finally:
+            tracemalloc.stop()
+
+    def testConcurrentMeasurements(self):
+
+        def measureModules(threadNumber: int):
+            for moduleNumber in range(100):
+                with self._profiler.measure(f'plugins.io.IOSample{threadNumber}x{moduleNumber}', PluginLoadPhase.IMPORT):
+                    pass
+                self._profiler.report()
+
+        threads = [Thread(target=measureModules, args=(threadNumber, )) for threadNumber in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, len(self._profiler.measurements), 'Lost measurements')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginLoadProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -7,8 +7,13 @@ from logging import getLogger
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from os import sep as osSep
+
 from core.PluginManager import PluginManager
+from core.types.FileRoutes import FileRoutes
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
 from core.types.PluginDataTypes import PluginIDMap
+from core.types.PluginDataTypes import PluginName
 
 from tests.TestBase import TestBase
 
@@ -50,11 +55,40 @@ class TestPluginManager(TestBase):
         inputPlugins = self.pluginManager.inputPlugins
         self.assertIsNotNone(inputPlugins, 'Oh no !!')
 
+    def testInputPluginsMemoized(self):
+        inputPlugins = self.pluginManager.inputPlugins
+        self.assertIs(inputPlugins, self.pluginManager.inputPlugins, 'Input plugin list should be built once')
+        for plugin in inputPlugins:
+            self.assertIsNotNone(plugin.INPUT_FORMAT, 'Only plugins with an input format are input plugins')
+
+    def testOutputPluginsMemoized(self):
+        outputPlugins = self.pluginManager.outputPlugins
+        self.assertIs(outputPlugins, self.pluginManager.outputPlugins, 'Output plugin list should be built once')
+        for plugin in outputPlugins:
+            self.assertIsNotNone(plugin.OUTPUT_FORMAT, 'Only plugins with an output format are output plugins')
+
     def testToolPluginsWxIdGenerated(self):
 
         pluginMap: PluginIDMap = self.pluginManager.toolPluginsIDMap
         self.assertIsNotNone(pluginMap, 'Where is my map')
 
+    def testRouteMixedFiles(self):
+        fileNames = [
+            f'{osSep}src{osSep}Main.java',
+            f'{osSep}src{osSep}util{osSep}Helper.java',
+            f'{osSep}src{osSep}tools{osSep}script.py',
+            f'{osSep}src{osSep}README.txt',
+        ]
+        fileRoutes: FileRoutes = self.pluginManager.routeFiles(fileNames)
+
+        routedNames = {pluginClass.PLUGIN_NAME: response for pluginClass, response in fileRoutes.routes.items()}
+        javaRequest: MultipleFileRequestResponse = routedNames[PluginName('Java Code Reader and Writer')]
+
+        self.assertEqual(f'{osSep}src', javaRequest.directoryName, 'Wrong common directory')
+        self.assertEqual(['Main.java', f'util{osSep}Helper.java'], javaRequest.fileList, 'Java files not grouped')
+        self.assertEqual(['script.py'], routedNames[PluginName('IOPython')].fileList, 'Python file not routed')
+        self.assertEqual([f'{osSep}src{osSep}README.txt'], fileRoutes.unrouted, 'Unknown extension should not be routed')
+
 
 def suite() -> TestSuite:
     """You need to change the name of the test class here also."""
@@ -0,0 +1,182 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Set
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Barrier
+from threading import Lock
+from threading import Thread
+
+from time import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.PluginManager import PluginManager
+from core.PluginRegistry import PluginRegistry
+from core.Singleton import Singleton
+from core.types.InputFormat import InputFormat
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginDescription
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginIDMap
+from core.types.PluginDataTypes import PluginList
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import PluginType
+
+from tests.TestBase import TestBase
+
+THREAD_COUNT:       int = 16
+PLUGINS_PER_THREAD: int = 50
+
+
+class SlowSingleton(Singleton):
+    """
+    Takes long enough to initialize that the threads are sure to overlap
+    """
+    initCount: int = 0
+
+    def init(self):
+        sleep(0.05)
+        SlowSingleton.initCount += 1
+
+
+class ConcurrentPluginManager(PluginManager):
+    """
+    A plugin manager of its own, so its lazily built maps start empty;  Building the
+    wx id maps is slowed down so that the threads overlap
+    """
+    mapCount: int = 0
+
+    def _PluginManager__mapWxIdsToPlugins(self, pluginList: PluginList) -> PluginIDMap:
+        sleep(0.01)
+        ConcurrentPluginManager.mapCount += 1
+        return PluginIDMap({index: plugin for index, plugin in enumerate(pluginList)})
+
+
+def samplePlugin(name: str) -> PluginType:
+
+    inputFormat: InputFormat = InputFormat(formatName=FormatName(f'Format {name}'), extension=PluginExtension(f'x{name}'), description=PluginDescription(name))
+    classAttributes = {
+        'PLUGIN_NAME':   PluginName(name),
+        'INPUT_FORMAT':  inputFormat,
+        'OUTPUT_FORMAT': cast(OutputFormat, None),
+    }
+    return cast(PluginType, type(f'Plugin{name}', (), classAttributes))
+
+
+class TestPluginManagerConcurrency(TestBase):
+    """
+    Every test starts its threads at the same time and fails if any of them raised
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginManagerConcurrency.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginManagerConcurrency.clsLogger
+
+        self._errors:     List[BaseException] = []
+        self._errorsLock: Lock                = Lock()
+
+    def tearDown(self):
+        pass
+
+    def testSingletonInitializedOnce(self):
+        instances: List[SlowSingleton] = []
+
+        self._hammer(lambda threadIndex: instances.append(SlowSingleton()))
+
+        self.assertEqual(1, SlowSingleton.initCount, 'init ran more than once')
+        self.assertEqual(1, len({id(instance) for instance in instances}), 'More than one instance was created')
+
+    def testRegistryUnderConcurrentRegistration(self):
+        registry: PluginRegistry = PluginRegistry()
+
+        def registerAndLookUp(threadIndex: int):
+            for pluginIndex in range(PLUGINS_PER_THREAD):
+                name: str = f'{threadIndex}x{pluginIndex}'
+                self.assertTrue(registry.registerIOPlugin(samplePlugin(name)), f'{name} was not registered')
+                self.assertIsNotNone(registry.pluginByName(PluginName(name)), f'{name} is missing')
+                self.assertEqual(1, len(registry.inputPluginsByExtension(PluginExtension(f'x{name}'))), f'{name} is not indexed')
+                repr(registry)
+                len(registry.ioPlugins)
+
+        self._hammer(registerAndLookUp)
+
+        pluginCount: int = THREAD_COUNT * PLUGINS_PER_THREAD
+        self.assertEqual(pluginCount, len(registry), 'Registrations were lost')
+        self.assertEqual(pluginCount, len(registry.ioPlugins), 'Plugins were lost')
+
+    def testDuplicateRegisteredOnce(self):
+        registry:   PluginRegistry = PluginRegistry()
+        registered: List[bool]     = []
+
+        plugin: PluginType = samplePlugin('Duplicate')
+        self._hammer(lambda threadIndex: registered.append(registry.registerIOPlugin(plugin)))
+
+        self.assertEqual(1, registered.count(True), 'The plugin should be registered by one thread only')
+        self.assertEqual(1, len(registry.ioPlugins), 'The plugin is listed twice')
+
+    def testPluginMapsBuiltOnce(self):
+        pluginManager: ConcurrentPluginManager = ConcurrentPluginManager()
+        toolMaps:      Set[int]                = set()
+        inputMaps:     Set[int]                = set()
+        outputMaps:    Set[int]                = set()
+
+        def readMaps(threadIndex: int):
+            toolMaps.add(id(pluginManager.toolPluginsIDMap))
+            inputMaps.add(id(pluginManager.inputPluginsMap))
+            outputMaps.add(id(pluginManager.outputPluginsMap))
+            self.assertIsNotNone(pluginManager.inputPluginsMap.pluginIdMap, 'A half built map was published')
+
+        self._hammer(readMaps)
+
+        self.assertEqual((1, 1, 1), (len(toolMaps), len(inputMaps), len(outputMaps)), 'A map was built more than once')
+        self.assertEqual(3, ConcurrentPluginManager.mapCount, 'The wx ids were mapped more than once')
+
+    def _hammer(self, work: Callable[[int], Any]):
+        """
+        Run the work on `THREAD_COUNT` threads that start together
+        """
+        barrier: Barrier = Barrier(THREAD_COUNT)
+
+        def run(threadIndex: int):
+            try:
+                barrier.wait(timeout=10)
+                work(threadIndex)
+            except BaseException as e:
+                with self._errorsLock:
+                    self._errors.append(e)
+
+        threads: List[Thread] = [Thread(target=run, args=(threadIndex,)) for threadIndex in range(THREAD_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        self.assertEqual([], self._errors, 'A thread failed')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginManagerConcurrency))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,187 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import environ
+from os import remove as osRemove
+
+from os.path import exists as osPathExists
+
+from tempfile import gettempdir
+
+from importlib.metadata import EntryPoint
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.PluginManifest import MANIFEST_FILENAME_VARIABLE
+from core.PluginManifest import ManifestEntryList
+from core.PluginManifest import PluginManifest
+from core.PluginProxy import PluginProxy
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginManifestEntry import PluginManifestEntry
+
+import plugins.io
+import plugins.tools
+
+from tests.TestBase import TestBase
+
+TEST_MANIFEST_FILENAME: str = f'{gettempdir()}/testPluginManifest.json'
+TEST_ENTRY_POINT_GROUP: str = 'pyutplugins.test'
+
+
+class ToolFirst:
+    PLUGIN_NAME:    PluginName = PluginName('First')
+    PLUGIN_AUTHOR:  str        = 'Humberto A. Sanchez II'
+    PLUGIN_VERSION: str        = '1.0'
+    INPUT_FORMAT               = None
+    OUTPUT_FORMAT              = None
+
+
+class ToolSecond(ToolFirst):
+    PLUGIN_NAME: PluginName = PluginName('Second')
+
+
+class EntryPointManifest(PluginManifest):
+    """
+    Two entry points that name classes in the same module;  Counts the entries it builds
+    """
+    def __init__(self, manifestFileName: str):
+        super().__init__(manifestFileName=manifestFileName)
+        self.createdEntries:  int       = 0
+        self.entryPointNames: List[str] = ['ToolFirst', 'ToolSecond']
+
+    def createEntry(self, moduleName: str, className: str) -> PluginManifestEntry:
+        self.createdEntries += 1
+        return super().createEntry(moduleName=moduleName, className=className)
+
+    def _entryPoints(self, group: str) -> List[EntryPoint]:
+        return [EntryPoint(name=name, value=f'{__name__}:{name}', group=group) for name in self.entryPointNames]
+
+
+class TestPluginManifest(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginManifest.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginManifest.clsLogger
+        if osPathExists(TEST_MANIFEST_FILENAME):
+            osRemove(TEST_MANIFEST_FILENAME)
+
+    def tearDown(self):
+        if osPathExists(TEST_MANIFEST_FILENAME):
+            osRemove(TEST_MANIFEST_FILENAME)
+
+    def testToolEntriesHaveMenuTitles(self):
+
+        manifest: PluginManifest    = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        entries:  ManifestEntryList = manifest.entries(plugins.tools)
+
+        self.assertNotEqual(0, len(entries), 'Where are my tool plugins')
+        for entry in entries:
+            self.assertTrue(entry.className.startswith('Tool'), 'Picked up a non plugin module')
+            self.assertNotEqual('', entry.menuTitle, 'Menu title not recorded')
+
+    def testSavedManifestIsReused(self):
+
+        manifest: PluginManifest    = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        entries:  ManifestEntryList = manifest.entries(plugins.io)
+        manifest.save()
+
+        reloadedManifest: PluginManifest    = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        reloadedEntries:  ManifestEntryList = reloadedManifest.entries(plugins.io)
+
+        self.assertEqual(len(entries), len(reloadedEntries), 'Manifest lost entries')
+        for original, reloaded in zip(entries, reloadedEntries):
+            self.assertEqual(original.pluginName, reloaded.pluginName, 'Plugin name not persisted')
+            self.assertEqual(original.modificationTime, reloaded.modificationTime, 'Entry should not have been rebuilt')
+            if original.inputFormat is None:
+                self.assertIsNone(reloaded.inputFormat, 'Input format should not exist')
+            else:
+                self.assertEqual(original.inputFormat.extension, reloaded.inputFormat.extension, 'Input format not persisted')
+
+    def testEntryPointsInOneModule(self):
+
+        manifest: EntryPointManifest = EntryPointManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        entries:  ManifestEntryList  = manifest.entryPointEntries(group=TEST_ENTRY_POINT_GROUP)
+        manifest.save()
+
+        self.assertEqual(['First', 'Second'], [entry.pluginName for entry in entries], 'Both plugins should be listed')
+
+        reloadedManifest: EntryPointManifest = EntryPointManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        reloadedManifest.entryPointEntries(group=TEST_ENTRY_POINT_GROUP)
+
+        self.assertEqual(0, reloadedManifest.createdEntries, 'The entries should not overwrite each other')
+
+    def testMissingPluginIsDropped(self):
+
+        manifest: PluginManifest = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        manifest._entries['plugins.tools.ToolGone:ToolGone'] = PluginManifestEntry(moduleName='plugins.tools.ToolGone', className='ToolGone')
+        manifest._entries['plugins.io.IoGone:IoGone']       = PluginManifestEntry(moduleName='plugins.io.IoGone',       className='IoGone')
+
+        manifest.entries(plugins.tools)
+
+        self.assertNotIn('plugins.tools.ToolGone:ToolGone', manifest._entries, 'Removed plugin should be dropped')
+        self.assertIn('plugins.io.IoGone:IoGone', manifest._entries, 'Only the scanned package should be pruned')
+
+    def testMissingEntryPointIsDropped(self):
+
+        manifest: EntryPointManifest = EntryPointManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        manifest.entryPointEntries(group=TEST_ENTRY_POINT_GROUP)
+        manifest.entries(plugins.tools)
+
+        manifest.entryPointNames = ['ToolFirst']
+        entries: ManifestEntryList = manifest.entryPointEntries(group=TEST_ENTRY_POINT_GROUP)
+        manifest.save()
+
+        self.assertEqual(['First'], [entry.pluginName for entry in entries], 'Uninstalled plugin still listed')
+
+        reloadedManifest: PluginManifest = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+
+        self.assertNotIn(f'{__name__}:ToolSecond', reloadedManifest._entries, 'Uninstalled plugin still in the manifest')
+        self.assertIn(f'{__name__}:ToolFirst', reloadedManifest._entries, 'Installed plugin lost')
+        self.assertNotEqual(0, len(reloadedManifest.entries(plugins.tools)), 'Package plugins should survive an entry point scan')
+
+    def testManifestFileNameFromEnvironment(self):
+
+        manifest: PluginManifest = PluginManifest()
+
+        self.assertEqual(environ[MANIFEST_FILENAME_VARIABLE], manifest._manifestFileName, 'Environment variable ignored')
+
+    def testProxyDoesNotLoadPlugin(self):
+
+        manifest: PluginManifest      = PluginManifest(manifestFileName=TEST_MANIFEST_FILENAME)
+        entry:    PluginManifestEntry = manifest.entries(plugins.tools)[0]
+
+        proxyClass = PluginProxy.createProxyClass(manifestEntry=entry)
+        proxy      = proxyClass(None)
+
+        self.assertEqual(entry.menuTitle, proxy.menuTitle, 'Proxy should answer from the manifest')
+        self.assertFalse(proxyClass.isLoaded(), 'Reading metadata should not load the plugin')
+
+        self.assertEqual(entry.className, proxyClass.pluginClass().__name__, 'Loaded the wrong class')
+        self.assertTrue(proxyClass.isLoaded(), 'Plugin class should now be loaded')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginManifest))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
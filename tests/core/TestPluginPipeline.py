@@ -0,0 +1,227 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Barrier
+from threading import current_thread
+from threading import main_thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.HeadlessMediator import HeadlessMediator
+from core.IOPluginInterface import IOPluginInterface
+from core.PluginManager import PluginManager
+from core.PluginPipeline import PluginPipeline
+from core.SelectionSnapshot import SelectionSnapshot
+from core.ToolPluginInterface import ToolPluginInterface
+from core.exceptions.PluginPipelineException import PluginPipelineException
+from core.types.FileRoutes import FileRoutes
+from core.types.InputFormat import InputFormat
+from core.types.MultipleFileRequestResponse import MultipleFileRequestResponse
+from core.types.OutputFormat import OutputFormat
+from core.types.PipelineResult import PipelineResult
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginDescription
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import PluginType
+
+from plugins.common.Types import OglLinks
+from plugins.common.Types import OglObjects
+
+from tests.TestBase import TestBase
+from tests.core.TestHeadlessMediator import SampleShape
+
+#
+# What the plugins saw, in the order they ran
+#
+seenSelections: List[SelectionSnapshot] = []
+writerThreads:  List[str]               = []
+
+
+class RecordingTool(ToolPluginInterface):
+
+    PLUGIN_NAME: PluginName = PluginName('Recording Tool')
+
+    def setOptions(self) -> bool:
+        return True
+
+    def doAction(self):
+        seenSelections.append(self.selection)
+        self._mediator.refreshFrame()
+        self._mediator.refreshFrame()
+
+
+class RecordingExporter(IOPluginInterface):
+
+    PLUGIN_NAME:         PluginName   = PluginName('Recording Exporter')
+    OUTPUT_FORMAT:       OutputFormat = OutputFormat(formatName=FormatName('Recording'), extension=PluginExtension('rec'), description=PluginDescription('Records'))
+    WRITE_IN_BACKGROUND: bool         = False
+
+    def setImportOptions(self) -> bool:
+        return False
+
+    def setExportOptions(self) -> bool:
+        return True
+
+    def setExportDestination(self, destination: str) -> bool:
+        return destination != ''
+
+    def read(self) -> bool:
+        return False
+
+    def write(self, oglObjects: OglObjects):
+        seenSelections.append(self.selection)
+        writerThreads.append(current_thread().name)
+
+
+class RecordingImporter(RecordingExporter):
+    """
+    Adds a shape per file
+    """
+    PLUGIN_NAME:  PluginName  = PluginName('Recording Importer')
+    INPUT_FORMAT: InputFormat = InputFormat(formatName=FormatName('Recording'), extension=PluginExtension('rec'), description=PluginDescription('Records'))
+
+    def setImportFiles(self, response: MultipleFileRequestResponse) -> bool:
+        self._fileNames: List[str] = response.fileList
+        return True
+
+    def read(self) -> bool:
+        self._layoutLinks(OglLinks([SampleShape(fileName) for fileName in self._fileNames]))
+        return True
+
+
+class ImportingPluginManager(PluginManager):
+    """
+    Routes every file to the recording importer
+    """
+    def routeFiles(self, fileNames: List[str]) -> FileRoutes:
+
+        fileRoutes: FileRoutes = FileRoutes()
+        fileRoutes.routes[cast(PluginType, RecordingImporter)] = MultipleFileRequestResponse(cancelled=False, directoryName='/tmp', fileList=list(fileNames))
+
+        return fileRoutes
+
+
+class BackgroundExporter(RecordingExporter):
+    """
+    Waits for the other background exporter;  Only succeeds if both write at the same time
+    """
+    PLUGIN_NAME:         PluginName = PluginName('Background Exporter')
+    WRITE_IN_BACKGROUND: bool       = True
+
+    barrier: Barrier = cast(Barrier, None)
+
+    def write(self, oglObjects: OglObjects):
+        BackgroundExporter.barrier.wait()
+        super().write(oglObjects)
+
+
+class OtherBackgroundExporter(BackgroundExporter):
+
+    PLUGIN_NAME: PluginName = PluginName('Other Background Exporter')
+
+
+class TestPluginPipeline(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginPipeline.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginPipeline.clsLogger
+
+        seenSelections.clear()
+        writerThreads.clear()
+        BackgroundExporter.barrier = Barrier(2, timeout=10)
+
+        self._shapes:   List[SampleShape] = [SampleShape('A'), SampleShape('B'), SampleShape('C')]
+        self._mediator: HeadlessMediator  = HeadlessMediator(currentDirectory='/tmp')
+
+        self._mediator.addShapes(self._shapes)
+        self._mediator.diagram.select(self._shapes[:2])
+
+    def tearDown(self):
+        pass
+
+    def testObjectsHandedOn(self):
+        result: PipelineResult = PluginPipeline(self._mediator).tool(RecordingTool).export(RecordingExporter, destination='/tmp/out.rec').run()
+
+        self.assertTrue(result.succeeded, result.error)
+        self.assertEqual(2, len(seenSelections), 'Every stage should run')
+        self.assertIs(seenSelections[0], seenSelections[1], 'The export should get the snapshot the tool worked on')
+        self.assertEqual(self._shapes[:2], seenSelections[0].oglObjects, 'Wrong objects')
+        self.assertEqual(2, result.objectCount, 'Wrong object count')
+        self.assertEqual({'tool:Recording Tool', 'export:Recording Exporter', 'total'}, set(result.timings.keys()), 'Wrong stage timings')
+
+    def testImportedShapesHandedOn(self):
+        result: PipelineResult = (
+            PluginPipeline(self._mediator, pluginManager=ImportingPluginManager())
+            .importFiles(['x.rec', 'y.rec'])
+            .tool(RecordingTool)
+            .run()
+        )
+
+        self.assertTrue(result.succeeded, result.error)
+        self.assertEqual(['x.rec', 'y.rec'], [shape.name for shape in seenSelections[0]], 'The tool should get the imported shapes')
+        self.assertEqual(self._shapes[:2], self._mediator.selectedOglObjects, 'The diagram selection should not change')
+
+    def testToolsRefreshOnce(self):
+        PluginPipeline(self._mediator).tool(RecordingTool).tool(RecordingTool).run()
+
+        self.assertEqual(1, self._mediator.diagram.refreshCount, 'The frame should be refreshed once')
+
+    def testRepeatedStageTimed(self):
+        result: PipelineResult = PluginPipeline(self._mediator).tool(RecordingTool).tool(RecordingTool).run()
+
+        self.assertIn('tool:Recording Tool', result.timings, 'First stage not timed')
+        self.assertIn('tool:Recording Tool#1', result.timings, 'Second stage not timed')
+
+    def testBackgroundExportsConcurrent(self):
+        result: PipelineResult = (
+            PluginPipeline(self._mediator)
+            .export(BackgroundExporter,      destination='/tmp/one.rec')
+            .export(RecordingExporter,       destination='/tmp/two.rec')
+            .export(OtherBackgroundExporter, destination='/tmp/three.rec')
+            .run()
+        )
+
+        self.assertTrue(result.succeeded, result.error)
+        self.assertEqual(3, len(writerThreads), 'Every export should run')
+        self.assertEqual(1, writerThreads.count(main_thread().name), 'Only the UI export runs on the calling thread')
+
+    def testFailedStageStopsPipeline(self):
+        result: PipelineResult = PluginPipeline(self._mediator).export(RecordingExporter, destination='').tool(RecordingTool).run()
+
+        self.assertFalse(result.succeeded, 'The pipeline should fail')
+        self.assertIn('Recording Exporter', result.error, 'The error should name the plugin')
+        self.assertEqual(0, len(seenSelections), 'No stage should run after the failure')
+        self.assertIn('total', result.timings, 'The total time is missing')
+
+    def testUnknownPlugin(self):
+        pipeline: PluginPipeline = PluginPipeline(self._mediator)
+
+        self.assertRaises(PluginPipelineException, lambda: pipeline.tool(PluginName('No Such Tool')))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginPipeline))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,138 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import dump as jsonDump
+
+from os import makedirs
+
+from os.path import dirname
+from os.path import join as osPathJoin
+
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.HeadlessMediator import HeadlessMediator
+from core.PluginPreferences import PluginPreferences
+from core.ProgressTracker import ProgressTracker
+
+from tests.TestBase import TestBase
+from tests.core.TestHeadlessMediator import SampleShape
+from tests.core.TestPluginPipeline import RecordingExporter
+from tests.core.TestPluginPipeline import seenSelections
+
+
+class TestPluginPreferences(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginPreferences.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginPreferences.clsLogger
+
+        self._directoryName:       str               = mkdtemp()
+        self._preferencesFileName: str               = osPathJoin(self._directoryName, 'pyut', 'preferences.json')
+        self._preferences:         PluginPreferences = PluginPreferences()
+
+        self._savedFileName: str = self._preferences.preferencesFileName
+        self._preferences.load(self._preferencesFileName)
+
+    def tearDown(self):
+        self._preferences.load(self._savedFileName)
+        rmtree(self._directoryName)
+
+    def testDefaults(self):
+        self.assertEqual(2, self._preferences.asyncWorkers, 'Wrong default')
+        self.assertEqual(3000, self._preferences.layoutWrapWidth, 'Wrong default')
+        self.assertEqual(ProgressTracker.DEFAULT_MINIMUM_INTERVAL, self._preferences.progressInterval, 'Wrong default')
+        self.assertFalse(self._preferences.autoSelectAll, 'Wrong default')
+
+    def testSaveAndLoad(self):
+        self._preferences.batchWorkers       = 4
+        self._preferences.importCacheEnabled = False
+        self._preferences.save()
+
+        self._preferences.load(self._preferencesFileName)
+
+        self.assertEqual(4, self._preferences.batchWorkers, 'Not saved')
+        self.assertFalse(self._preferences.importCacheEnabled, 'Not saved')
+
+    def testWrongTypeFallsBack(self):
+        self._writePreferences({PluginPreferences.CORE_NAMESPACE: {'asyncWorkers': 'many'}})
+
+        self.assertEqual(2, self._preferences.asyncWorkers, 'A wrong type should fall back to the default')
+
+    def testIntegerForFloat(self):
+        self._writePreferences({PluginPreferences.CORE_NAMESPACE: {'progressInterval': 1}})
+
+        self.assertEqual(1.0, self._preferences.progressInterval, 'An integer is a valid float setting')
+        self.assertIsInstance(self._preferences.progressInterval, float, 'Should be converted')
+
+    def testPluginNamespaces(self):
+        self._writePreferences({'Sugiyama Automatic Layout': {'maximumIterations': 50}})
+
+        self.assertEqual(50, self._preferences.value('Sugiyama Automatic Layout', 'maximumIterations', 20), 'Wrong plugin setting')
+        self.assertEqual(20, self._preferences.value('Other Plugin', 'maximumIterations', 20), 'Namespaces are separate')
+
+    def testOutOfRangeFallsBack(self):
+        self._writePreferences({PluginPreferences.CORE_NAMESPACE: {'asyncWorkers': 0, 'processWorkers': -2, 'wallTimeLimit': -1.0, 'objectLimit': -5}})
+
+        self.assertEqual(2, self._preferences.asyncWorkers, 'At least one thread is needed')
+        self.assertGreaterEqual(self._preferences.processWorkers, 1, 'At least one process is needed')
+        self.assertEqual(0.0, self._preferences.wallTimeLimit, 'A negative limit should fall back to no limit')
+        self.assertEqual(0, self._preferences.objectLimit, 'A negative limit should fall back to no limit')
+
+    def testAutoSelectAllOnlyWithoutSelection(self):
+        shapes:   List[SampleShape] = [SampleShape('A'), SampleShape('B')]
+        mediator: HeadlessMediator  = HeadlessMediator(currentDirectory='/tmp')
+        mediator.addShapes(shapes)
+
+        self._preferences.autoSelectAll = True
+        seenSelections.clear()
+
+        mediator.diagram.select(shapes[1:])
+        RecordingExporter(mediator).executeExport()
+        RecordingExporter(mediator).executeExport()
+
+        self.assertEqual(shapes[1:], seenSelections[0].oglObjects, 'A selection should be exported as is')
+        self.assertEqual(shapes, seenSelections[1].oglObjects, 'Nothing selected should export the whole diagram')
+
+    def testCorruptFileIgnored(self):
+        self._writePreferences(['not', 'a', 'namespace'])
+
+        self.assertEqual(1, self._preferences.batchWorkers, 'A corrupt file should be ignored')
+
+    def _writePreferences(self, preferences):
+
+        makedirs(dirname(self._preferencesFileName), exist_ok=True)
+        with open(self._preferencesFileName, 'w') as preferencesFile:
+            jsonDump(preferences, preferencesFile)
+
+        self._preferences.load(self._preferencesFileName)
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginPreferences))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,85 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.PluginRegistry import PluginRegistry
+
+from core.types.InputFormat import InputFormat
+from core.types.OutputFormat import OutputFormat
+from core.types.PluginDataTypes import FormatName
+from core.types.PluginDataTypes import PluginDescription
+from core.types.PluginDataTypes import PluginExtension
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import PluginType
+
+from tests.TestBase import TestBase
+
+
+class IOSampleReader:
+    PLUGIN_NAME:   PluginName   = PluginName('Sample Reader')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=FormatName('Sample'), extension=PluginExtension('smp'), description=PluginDescription('Sample'))
+    OUTPUT_FORMAT: OutputFormat = cast(OutputFormat, None)
+
+
+class IOSampleWriter:
+    PLUGIN_NAME:   PluginName   = PluginName('Sample Writer')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FormatName('Sample'), extension=PluginExtension('smp'), description=PluginDescription('Sample'))
+
+
+class TestPluginRegistry(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginRegistry.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginRegistry.clsLogger
+
+        self._registry: PluginRegistry = PluginRegistry()
+        self._registry.registerIOPlugin(cast(PluginType, IOSampleReader))
+        self._registry.registerIOPlugin(cast(PluginType, IOSampleWriter))
+
+    def tearDown(self):
+        pass
+
+    def testLookupByName(self):
+        self.assertIs(IOSampleReader, self._registry.pluginByName(PluginName('Sample Reader')), 'Name index is wrong')
+        self.assertIsNone(self._registry.pluginByName(PluginName('Not There')), 'Should not find an unknown plugin')
+
+    def testLookupByExtension(self):
+        self.assertEqual([IOSampleReader], self._registry.inputPluginsByExtension(PluginExtension('.SMP')), 'Input extension index is wrong')
+        self.assertEqual([IOSampleWriter], self._registry.outputPluginsByExtension(PluginExtension('smp')), 'Output extension index is wrong')
+
+    def testLookupByFormatName(self):
+        self.assertEqual(2, len(self._registry.pluginsByFormatName(FormatName('sample'))), 'Format name index is wrong')
+
+    def testDuplicateNameRejected(self):
+        registered: bool = self._registry.registerIOPlugin(cast(PluginType, IOSampleReader))
+
+        self.assertFalse(registered, 'Should not register the same plugin name twice')
+        self.assertEqual(2, len(self._registry), 'Registry size changed')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginRegistry))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
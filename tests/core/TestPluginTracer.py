@@ -0,0 +1,170 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import loads as jsonLoads
+
+from os import remove as osRemove
+
+from tempfile import mkstemp
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.HeadlessMediator import HeadlessMediator
+from core.JsonLinesSpanSink import JsonLinesSpanSink
+from core.OtlpJsonSpanSink import OtlpJsonSpanSink
+from core.PluginTracer import PluginTracer
+from core.SpanSink import SpanSink
+from core.types.PluginSpan import PluginSpan
+
+from tests.TestBase import TestBase
+from tests.core.TestHeadlessMediator import SampleShape
+from tests.core.TestHeadlessMediator import SelectionCountingTool
+
+
+class CollectingSpanSink(SpanSink):
+
+    def __init__(self):
+        self.spans: List[PluginSpan] = []
+
+    def export(self, span: PluginSpan):
+        self.spans.append(span)
+
+    def spansByName(self) -> Dict[str, PluginSpan]:
+        return {span.name: span for span in self.spans}
+
+
+class TestPluginTracer(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginTracer.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginTracer.clsLogger
+
+        self._tracer: PluginTracer       = PluginTracer()
+        self._sink:   CollectingSpanSink = CollectingSpanSink()
+
+        self._tracer.addSink(self._sink)
+
+    def tearDown(self):
+        self._tracer.close()
+
+    def testNestedSpansShareTrace(self):
+        with self._tracer.span('executeImport', plugin='Sample'):
+            with self._tracer.span('read', fileCount=3):
+                pass
+
+        spans: Dict[str, PluginSpan] = self._sink.spansByName()
+
+        self.assertEqual(['read', 'executeImport'], [span.name for span in self._sink.spans], 'Children finish first')
+        self.assertEqual(spans['executeImport'].traceId, spans['read'].traceId, 'Not the same trace')
+        self.assertEqual(spans['executeImport'].spanId, spans['read'].parentSpanId, 'Wrong parent')
+        self.assertEqual('', spans['executeImport'].parentSpanId, 'A root span has no parent')
+        self.assertEqual(3, spans['read'].attributes['fileCount'], 'Attribute lost')
+        self.assertGreaterEqual(spans['executeImport'].endTime, spans['executeImport'].startTime, 'Span not timed')
+
+    def testErrorRecorded(self):
+        def failingPhase():
+            with self._tracer.span('write'):
+                raise OSError('Disk full')
+
+        self.assertRaises(OSError, failingPhase)
+
+        self.assertEqual('OSError: Disk full', self._sink.spans[0].error, 'Error not recorded')
+
+    def testNoSinksNoExport(self):
+        self._tracer.removeSink(self._sink)
+
+        with self._tracer.span('read') as span:
+            span.attributes['classCount'] = 2
+
+        self.assertFalse(self._tracer.enabled, 'Tracer should be disabled')
+        self.assertEqual(0, len(self._sink.spans), 'A removed sink received a span')
+        self.assertEqual(0, span.startTime, 'A disabled tracer should not time spans')
+
+    def testToolPhasesTraced(self):
+        mediator: HeadlessMediator = HeadlessMediator(currentDirectory='/tmp')
+        mediator.addShapes([SampleShape('A'), SampleShape('B')])
+        mediator.selectAllOglObjects()
+
+        SelectionCountingTool(mediator).executeTool()
+
+        spans: Dict[str, PluginSpan] = self._sink.spansByName()
+
+        self.assertEqual({'setOptions', 'doAction', 'executeTool'}, set(spans.keys()), 'Wrong phases')
+        self.assertEqual(2, spans['doAction'].attributes['objectCount'], 'Wrong object count')
+        self.assertEqual(spans['executeTool'].spanId, spans['doAction'].parentSpanId, 'Phase not nested in the invocation')
+
+    def testJsonLinesSink(self):
+        fileName: str = self._temporaryFileName()
+        self._tracer.addSink(JsonLinesSpanSink(fileName))
+
+        with self._tracer.span('parseFile', bytes=1024):
+            pass
+        self._tracer.close()
+
+        with open(fileName) as jsonFile:
+            records: List[Dict] = [jsonLoads(line) for line in jsonFile]
+
+        self.assertEqual(1, len(records), 'One span per line')
+        self.assertEqual('parseFile', records[0]['name'], 'Wrong span')
+        self.assertEqual(1024, records[0]['attributes']['bytes'], 'Attribute not written')
+        self.assertIn('duration', records[0], 'Duration not written')
+
+    def testOtlpJsonSink(self):
+        fileName: str = self._temporaryFileName()
+        self._tracer.addSink(OtlpJsonSpanSink(fileName, serviceName='TestService'))
+
+        with self._tracer.span('executeTool'):
+            with self._tracer.span('doAction', objectCount=4):
+                pass
+        self._tracer.close()
+
+        with open(fileName) as otlpFile:
+            requests: List[Dict] = [jsonLoads(line) for line in otlpFile]
+
+        resourceSpans: Dict = requests[0]['resourceSpans'][0]
+        child:         Dict = resourceSpans['scopeSpans'][0]['spans'][0]
+        parent:        Dict = requests[1]['resourceSpans'][0]['scopeSpans'][0]['spans'][0]
+
+        self.assertEqual([{'key': 'service.name', 'value': {'stringValue': 'TestService'}}], resourceSpans['resource']['attributes'], 'Wrong resource')
+        self.assertEqual([{'key': 'objectCount', 'value': {'intValue': '4'}}], child['attributes'], 'Wrong attribute encoding')
+        self.assertEqual(parent['spanId'], child['parentSpanId'], 'Wrong parent')
+        self.assertNotIn('parentSpanId', parent, 'A root span has no parent')
+        self.assertEqual(1, child['status']['code'], 'Should be OK')
+
+    def _temporaryFileName(self) -> str:
+
+        fileDescriptor, fileName = mkstemp(suffix='.jsonl')
+        self.addCleanup(osRemove, fileName)
+
+        with open(fileDescriptor, 'w'):
+            pass
+
+        return fileName
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginTracer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,90 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.PluginWarmUpScheduler import PluginWarmUpScheduler
+from core.types.PluginDataTypes import PluginType
+
+from tests.TestBase import TestBase
+
+
+class WarmUpRecorder:
+    warmedUp: List[str] = []
+
+    @classmethod
+    def warmUp(cls):
+        WarmUpRecorder.warmedUp.append(cls.__name__)
+
+
+class FirstPlugin(WarmUpRecorder):
+    pass
+
+
+class SecondPlugin(WarmUpRecorder):
+    pass
+
+
+class TestPluginWarmUpScheduler(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginWarmUpScheduler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginWarmUpScheduler.clsLogger
+
+        WarmUpRecorder.warmedUp = []
+        self._scheduler: PluginWarmUpScheduler = PluginWarmUpScheduler()
+
+    def tearDown(self):
+        pass
+
+    def testPriorityOrder(self):
+        self._scheduler.schedule(cast(PluginType, SecondPlugin), priority=10)
+        self._scheduler.schedule(cast(PluginType, FirstPlugin),  priority=1)
+
+        self._scheduler.start()
+        self._scheduler.join(timeout=5.0)
+
+        self.assertEqual(['FirstPlugin', 'SecondPlugin'], WarmUpRecorder.warmedUp, 'Warmed up in the wrong order')
+
+    def testIdleCallbackMode(self):
+        self._scheduler.schedule(cast(PluginType, FirstPlugin))
+        self._scheduler.schedule(cast(PluginType, SecondPlugin))
+
+        self.assertTrue(self._scheduler.runNext(), 'There should be more work')
+        self.assertFalse(self._scheduler.runNext(), 'There should be no more work')
+        self.assertEqual(2, len(self._scheduler.warmedUp), 'Both plugins should be warm')
+
+    def testCancel(self):
+        self._scheduler.schedule(cast(PluginType, FirstPlugin))
+        self._scheduler.cancel()
+
+        self.assertFalse(self._scheduler.runNext(), 'Cancelled scheduler should not run')
+        self.assertEqual([], WarmUpRecorder.warmedUp, 'Nothing should have been warmed up')
+        self.assertEqual(0, self._scheduler.pendingCount, 'Queue should be empty')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginWarmUpScheduler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
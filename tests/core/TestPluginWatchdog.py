@@ -0,0 +1,163 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+from time import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.CancellationToken import CancellationToken
+from core.HeadlessMediator import HeadlessMediator
+from core.PluginWatchdog import PluginWatchdog
+from core.ToolPluginInterface import ToolPluginInterface
+from core.exceptions.PluginCancelledException import PluginCancelledException
+from core.exceptions.ResourceLimitExceededException import ResourceLimitExceededException
+from core.types.PluginDataTypes import PluginName
+from core.types.PluginDataTypes import ResourceLimitType
+from core.types.ResourceLimits import ResourceLimits
+
+from tests.TestBase import TestBase
+from tests.core.TestHeadlessMediator import SampleShape
+
+TIMEOUT: float = 10.0
+
+
+class SpinningTool(ToolPluginInterface):
+    """
+    Checks its token until it is cancelled
+    """
+    PLUGIN_NAME: PluginName = PluginName('Spinning Tool')
+
+    def setOptions(self) -> bool:
+        return True
+
+    def doAction(self):
+        with self._span('spin'):
+            startTime: float = perf_counter()
+            while perf_counter() - startTime < TIMEOUT:
+                self._cancellationToken.raiseIfCancelled()
+                sleep(0.01)
+
+
+class TestPluginWatchdog(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPluginWatchdog.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPluginWatchdog.clsLogger
+
+        self._cancellationToken: CancellationToken = CancellationToken()
+
+    def tearDown(self):
+        pass
+
+    def testWallTimeExceeded(self):
+        watchdog: PluginWatchdog = PluginWatchdog(limits=ResourceLimits(wallTime=0.2, sampleInterval=0.02), cancellationToken=self._cancellationToken)
+
+        with watchdog, watchdog.inPhase('layout'):
+            self._spinUntilCancelled()
+
+        self.assertEqual(ResourceLimitType.WALL_TIME, watchdog.violation.limitType, 'Wrong limit')
+        self.assertEqual('layout', watchdog.violation.phase, 'Wrong phase')
+        self.assertRaises(ResourceLimitExceededException, self._cancellationToken.raiseIfCancelled)
+
+    def testPeakMemoryExceeded(self):
+        limits:   ResourceLimits = ResourceLimits(peakMemory=1_000_000, sampleInterval=0.02, traceAllocations=True)
+        watchdog: PluginWatchdog = PluginWatchdog(limits=limits, cancellationToken=self._cancellationToken)
+
+        with watchdog:
+            with watchdog.inPhase('parse'):
+                allocated: List[bytes] = [bytes(10_000) for _ in range(500)]
+                del allocated
+            with watchdog.inPhase('materialize'):
+                self._spinUntilCancelled()
+
+        self.assertEqual(ResourceLimitType.PEAK_MEMORY, watchdog.violation.limitType, 'Wrong limit')
+        self.assertEqual('materialize', watchdog.violation.phase, 'The peak is only seen at the next sample')
+        self.assertGreater(watchdog.peakMemory, limits.peakMemory, 'The peak was not measured')
+
+    def testObjectCountExceeded(self):
+        watchdog: PluginWatchdog = PluginWatchdog(limits=ResourceLimits(maximumObjects=10), cancellationToken=self._cancellationToken)
+
+        with watchdog, watchdog.inPhase('layout'):
+            watchdog.addObjects(10)
+            self.assertRaises(ResourceLimitExceededException, lambda: watchdog.addObjects(1))
+
+        self.assertEqual(ResourceLimitType.OBJECT_COUNT, watchdog.violation.limitType, 'Wrong limit')
+        self.assertEqual(11, watchdog.violation.measured, 'Wrong count')
+
+    def testWithinLimits(self):
+        limits:   ResourceLimits = ResourceLimits(wallTime=TIMEOUT, peakMemory=1_000_000_000, maximumObjects=100, sampleInterval=0.01)
+        watchdog: PluginWatchdog = PluginWatchdog(limits=limits, cancellationToken=self._cancellationToken)
+
+        with watchdog:
+            watchdog.addObjects(100)
+            sleep(0.05)
+
+        self.assertIsNone(watchdog.violation, 'No limit was exceeded')
+        self.assertFalse(self._cancellationToken.cancelled, 'The run should not be cancelled')
+
+    def testFirstCancelWins(self):
+        self._cancellationToken.cancel()
+        self._cancellationToken.cancel(reason='Too late', exceptionClass=ResourceLimitExceededException)
+
+        try:
+            self._cancellationToken.raiseIfCancelled()
+        except PluginCancelledException as e:
+            self.assertIs(PluginCancelledException, type(e), 'The second cancel should not change the exception')
+
+    def testToolStoppedInPhase(self):
+        mediator: HeadlessMediator = HeadlessMediator(currentDirectory='/tmp')
+        mediator.addShapes([SampleShape('A')])
+        mediator.diagram.select(mediator.diagram.shapes)
+
+        tool: SpinningTool = SpinningTool(mediator)
+        tool.resourceLimits = ResourceLimits(wallTime=0.2, sampleInterval=0.02)
+
+        startTime: float = perf_counter()
+        tool.executeTool()
+
+        self.assertLess(perf_counter() - startTime, TIMEOUT, 'The tool was not stopped')
+        self.assertEqual('spin', tool.resourceViolation.phase, 'Wrong phase')
+
+        tool.resourceLimits = ResourceLimits(maximumObjects=1)
+        mediator.addShapes([SampleShape('B')])
+        mediator.diagram.select(mediator.diagram.shapes)
+        tool.executeTool()
+
+        self.assertEqual(ResourceLimitType.OBJECT_COUNT, tool.resourceViolation.limitType, 'The selection should be counted')
+        self.assertEqual('executeTool', tool.resourceViolation.phase, 'Counted before doAction')
+
+    def _spinUntilCancelled(self):
+
+        startTime: float = perf_counter()
+        while self._cancellationToken.cancelled is False and perf_counter() - startTime < TIMEOUT:
+            sleep(0.01)
+
+        self.assertTrue(self._cancellationToken.cancelled, 'The watchdog did not cancel the run')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPluginWatchdog))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
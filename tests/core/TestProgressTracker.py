@@ -0,0 +1,143 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.CancellationToken import CancellationToken
+from core.HeadlessMediator import HeadlessMediator
+from core.IMediator import IMediator
+from core.ProgressTracker import ProgressTracker
+from core.ToolPluginInterface import ToolPluginInterface
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+from core.types.PluginDataTypes import ProgressUnit
+from core.types.PluginProgress import PluginProgress
+
+from tests.TestBase import TestBase
+
+
+class CountingTool(ToolPluginInterface):
+    """
+    Reports one step per item;  Cancels itself after `cancelAfter` steps if asked to
+    """
+    def __init__(self, mediator: IMediator, steps: int, cancelAfter: int = -1):
+        super().__init__(mediator)
+        self.completedSteps: int = 0
+
+        self._steps:       int = steps
+        self._cancelAfter: int = cancelAfter
+
+    def setOptions(self) -> bool:
+        return True
+
+    def doAction(self):
+        with self._trackProgress(title='Counting', total=self._steps):
+            for step in range(self._steps):
+                if step == self._cancelAfter:
+                    self._cancellationToken.cancel()
+                self._reportProgress(step, f'Step {step}')
+                self.completedSteps += 1
+
+
+class TestProgressTracker(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestProgressTracker.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestProgressTracker.clsLogger
+
+        self._reports: List[PluginProgress] = []
+
+    def tearDown(self):
+        pass
+
+    def testWeightedUnits(self):
+        tracker: ProgressTracker = ProgressTracker(listener=self._reports.append, weights=[100, 300, 600], unit=ProgressUnit.BYTES, minimumInterval=0.0)
+
+        tracker.update(2, 'Third file')
+
+        self.assertEqual(1000, tracker.total, 'The total is the sum of the weights')
+        self.assertEqual(400, self._reports[-1].current, 'Two files are 400 bytes')
+        self.assertAlmostEqual(0.4, self._reports[-1].fraction, msg='Wrong fraction')
+        self.assertEqual(ProgressUnit.BYTES, self._reports[-1].unit, 'Wrong unit')
+
+    def testReportsThrottled(self):
+        tracker: ProgressTracker = ProgressTracker(listener=self._reports.append, total=1000, minimumInterval=60.0)
+
+        for count in range(1000):
+            tracker.advance(1, f'Item {count}')
+        tracker.finish()
+
+        self.assertEqual(2, len(self._reports), 'Only the first and the final report should be sent')
+        self.assertEqual(1000, self._reports[-1].current, 'The final report is complete')
+        self.assertEqual('Done', self._reports[-1].message, 'Wrong final message')
+
+    def testEta(self):
+        tracker: ProgressTracker = ProgressTracker(listener=self._reports.append, total=10)
+
+        self.assertEqual(-1.0, tracker.eta, 'No estimate before any work is done')
+
+        tracker.advance(5)
+        self.assertGreaterEqual(tracker.eta, 0.0, 'Should estimate once work is done')
+
+    def testUpdateCancelled(self):
+        cancellationToken: CancellationToken = CancellationToken()
+        tracker:           ProgressTracker   = ProgressTracker(listener=self._reports.append, total=10, cancellationToken=cancellationToken)
+
+        cancellationToken.cancel()
+
+        self.assertRaises(PluginCancelledException, lambda: tracker.advance(1))
+
+    def testToolProgressThroughHost(self):
+        tool: CountingTool = CountingTool(HeadlessMediator(currentDirectory='/tmp'), steps=10)
+        tool.addProgressListener(self._reports.append)
+
+        tool.executeTool()
+
+        self.assertEqual(10, tool.completedSteps, 'The tool did not run')
+        self.assertEqual(10, self._reports[-1].total, 'Wrong total')
+        self.assertEqual(1.0, self._reports[-1].fraction, 'Should finish complete')
+        self.assertEqual(tool.name, self._reports[-1].pluginName, 'Wrong plugin')
+
+    def testToolCancelled(self):
+        tool: CountingTool = CountingTool(HeadlessMediator(currentDirectory='/tmp'), steps=10, cancelAfter=3)
+
+        tool.executeTool()
+
+        self.assertEqual(3, tool.completedSteps, 'The tool should stop at the first update after the cancel')
+
+    def testNextInvocationNotCancelled(self):
+        tool: CountingTool = CountingTool(HeadlessMediator(currentDirectory='/tmp'), steps=10, cancelAfter=3)
+        tool.executeTool()
+
+        tool._cancelAfter = -1
+        tool.completedSteps = 0
+        tool.executeTool()
+
+        self.assertEqual(10, tool.completedSteps, 'A cancel should not carry over to the next invocation')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestProgressTracker))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
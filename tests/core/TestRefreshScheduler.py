@@ -0,0 +1,138 @@
+
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.RefreshScheduler import Bounds
+from core.RefreshScheduler import RefreshScheduler
+
+from tests.TestBase import TestBase
+
+MARGIN: int = RefreshScheduler.MARGIN
+
+
+class SampleRectangle:
+    def __init__(self, x: int, y: int, width: int = 100, height: int = 50):
+        self.x:    int             = x
+        self.y:    int             = y
+        self.size: Tuple[int, int] = (width, height)
+
+    def GetTopLeft(self) -> Tuple[int, int]:
+        return self.x, self.y
+
+    def GetSize(self) -> Tuple[int, int]:
+        return self.size
+
+
+class SampleLine:
+    def __init__(self, points: List[Tuple[int, int]]):
+        self.points: List[Tuple[int, int]] = points
+
+    def GetSegments(self) -> List[Tuple[int, int]]:
+        return self.points
+
+
+class TestRefreshScheduler(TestBase):
+    """
+    The dispatcher queues the flush;  The tests play the part of the event loop and run it
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestRefreshScheduler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRefreshScheduler.clsLogger
+
+        self._shapes:  List                   = [SampleRectangle(0, 0), SampleRectangle(500, 500)]
+        self._queue:   List[Callable]         = []
+        self._regions: List[Optional[Bounds]] = []
+
+        self._scheduler: RefreshScheduler = RefreshScheduler(painter=self._regions.append, dispatcher=self._queue.append, shapeProvider=lambda: self._shapes)
+
+    def tearDown(self):
+        pass
+
+    def testRequestsCoalesced(self):
+        for _ in range(5):
+            self._scheduler.requestRefresh()
+
+        self.assertEqual(1, len(self._queue), 'Only one flush should be scheduled')
+        self._runEventLoop()
+
+        self.assertEqual(1, len(self._regions), 'The frame should be painted once')
+        self.assertEqual(5, self._scheduler.requestCount, 'Wrong request count')
+
+    def testFirstFlushRepaintsAll(self):
+        self._refresh()
+
+        self.assertIsNone(self._regions[-1], 'Nothing is known about the last paint')
+
+    def testOnlyMovedShapeRepainted(self):
+        self._refresh()
+        self._shapes[0].x = 200
+        self._refresh()
+
+        self.assertEqual((-MARGIN, -MARGIN, 300 + MARGIN, 50 + MARGIN), self._regions[-1], 'Should repaint the old and new bounds of the moved shape')
+
+    def testAddedShapeRepainted(self):
+        self._refresh()
+        self._shapes.append(SampleLine([(10, 300), (60, 200), (110, 350)]))
+        self._refresh()
+
+        self.assertEqual((10 - MARGIN, 200 - MARGIN, 110 + MARGIN, 350 + MARGIN), self._regions[-1], 'Should repaint the new line')
+
+    def testNothingMovedRepaintsAll(self):
+        self._refresh()
+        self._refresh()
+
+        self.assertIsNone(self._regions[-1], 'Something other than the bounds changed')
+
+    def testUnknownShapeRepaintsAll(self):
+        self._refresh()
+        self._shapes.append(object())
+        self._shapes[0].x = 200
+        self._refresh()
+
+        self.assertIsNone(self._regions[-1], 'Cannot tell where the unknown shape is')
+
+    def testInvalidateAll(self):
+        self._refresh()
+        self._shapes[0].x = 200
+        self._scheduler.invalidateAll()
+        self._runEventLoop()
+
+        self.assertIsNone(self._regions[-1], 'The whole frame should be repainted')
+
+    def _refresh(self):
+        self._scheduler.requestRefresh()
+        self._runEventLoop()
+
+    def _runEventLoop(self):
+        while len(self._queue) > 0:
+            self._queue.pop(0)()
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestRefreshScheduler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,77 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from ogl.OglClass import OglClass
+from ogl.OglNote import OglNote
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutNote import PyutNote
+
+from core.SelectionSnapshot import SelectionSnapshot
+
+from tests.TestBase import TestBase
+
+
+class TestSelectionSnapshot(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSelectionSnapshot.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        super().setUp()
+        self.logger: Logger = TestSelectionSnapshot.clsLogger
+
+        self._baseClass:  OglClass = OglClass(PyutClass(name='Base'))
+        self._childClass: OglClass = OglClass(PyutClass(name='Child'))
+        self._note:       OglNote  = OglNote(PyutNote(noteText='A note'))
+        self._other:      object   = object()
+
+        self._snapshot: SelectionSnapshot = SelectionSnapshot([self._baseClass, self._note, self._other, self._childClass])
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPartitioned(self):
+        self.assertEqual([self._baseClass, self._childClass], self._snapshot.oglClasses, 'Incorrect classes')
+        self.assertEqual([self._note],                        self._snapshot.oglNotes,   'Incorrect notes')
+        self.assertEqual([],                                  self._snapshot.oglLinks,   'There are no links')
+        self.assertEqual([self._other],                       self._snapshot.others,     'Incorrect others')
+
+    def testSelectionOrderKept(self):
+        self.assertEqual(4, len(self._snapshot), 'Incorrect size')
+        self.assertEqual([self._baseClass, self._note, self._other, self._childClass], list(self._snapshot), 'Selection order not kept')
+
+    def testClassByName(self):
+        self.assertIs(self._childClass, self._snapshot.oglClassByName('Child'), 'Incorrect class')
+        self.assertIsNone(self._snapshot.oglClassByName('Missing'), 'Should not find a class')
+
+    def testShapeById(self):
+        pyutId: int = self._note.pyutObject.id
+
+        self.assertIs(self._note, self._snapshot.shapeById(pyutId), 'Incorrect shape')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSelectionSnapshot))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
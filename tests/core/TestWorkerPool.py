@@ -0,0 +1,173 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import _exit as osExit
+from os.path import join as osPathJoin
+
+from sys import modules
+
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+from threading import current_thread
+
+from time import sleep
+
+from concurrent.futures.process import BrokenProcessPool
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from core.CancellationToken import CancellationToken
+from core.ModelParserProcess import ModelParserProcess
+from core.WorkerPool import WorkerPool
+from core.exceptions.ModelParserException import ModelParserException
+from core.exceptions.PluginCancelledException import PluginCancelledException
+
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
+from plugins.io.IOJava import IOJava
+from plugins.io.IOPython import IOPython
+from plugins.io.python.ReverseEngineerPython2 import ReverseEngineerPython2
+
+from tests.TestBase import TestBase
+from tests.core.TestModelParserProcess import sampleParser
+
+TIMEOUT: float = 60.0
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def crash():
+    osExit(3)
+
+
+def briefParser() -> ReverseEngineeredModel:
+    sleep(2)
+    return ReverseEngineeredModel()
+
+
+def slowSquare(value: int) -> int:
+    sleep(1)
+    return value * value
+
+
+def parserModulesLoaded() -> bool:
+    return 'plugins.io.java.JavaReader' in modules and 'plugins.io.python.ReverseEngineerPython2' in modules
+
+
+class TestWorkerPool(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestWorkerPool.clsLogger = getLogger(__name__)
+
+    @classmethod
+    def tearDownClass(cls):
+        WorkerPool().shutdown()
+
+    def setUp(self):
+        self.logger: Logger = TestWorkerPool.clsLogger
+
+        self._workerPool: WorkerPool = WorkerPool()
+
+    def tearDown(self):
+        pass
+
+    def testStartedOnFirstSubmit(self):
+        self._workerPool.shutdown()
+        self.assertFalse(self._workerPool.processesStarted, 'The worker processes should not be running')
+
+        self.assertEqual(9, self._workerPool.submitToProcess(square, 3).result(timeout=TIMEOUT), 'Wrong result')
+        self.assertTrue(self._workerPool.processesStarted, 'The worker processes should be running')
+        self.assertFalse(self._workerPool.threadsStarted, 'The worker threads were never used')
+
+    def testWorkersInitialized(self):
+        self._workerPool.shutdown()
+        self._workerPool.registerWorkerInitializers(IOJava.WORKER_INITIALIZERS + IOPython.WORKER_INITIALIZERS)
+
+        self.assertTrue(self._workerPool.submitToProcess(parserModulesLoaded).result(timeout=TIMEOUT), 'The parser modules were not imported')
+
+    def testResultsInItemOrder(self):
+        results: List[int] = list(self._workerPool.mapInProcesses(square, [3, 1, 2]))
+
+        self.assertEqual([9, 1, 4], results, 'Wrong results or wrong order')
+
+    def testDeadWorkerReplaced(self):
+        self.assertRaises(BrokenProcessPool, lambda: self._workerPool.submitToProcess(crash).result(timeout=TIMEOUT))
+
+        self.assertEqual(4, self._workerPool.submitToProcess(square, 2).result(timeout=TIMEOUT), 'New workers should have been started')
+
+    def testThreadWork(self):
+        threadName: str = self._workerPool.submitToThread(lambda: current_thread().name).result(timeout=TIMEOUT)
+
+        self.assertTrue(threadName.startswith('PluginWorker'), f'Ran on {threadName}')
+
+    def testModelParsedInPool(self):
+        model: ReverseEngineeredModel = ModelParserProcess(workerPool=self._workerPool).parse(modelParser=sampleParser)
+
+        self.assertEqual(['Base', 'Child'], list(model.pyutClasses.keys()), 'Classes did not survive the trip')
+
+    def testRegisterWorkerInitializersOnce(self):
+        self._workerPool.registerWorkerInitializers(IOJava.WORKER_INITIALIZERS)
+        self._workerPool.registerWorkerInitializers(IOJava.WORKER_INITIALIZERS)
+
+        self.assertEqual(1, self._workerPool.workerInitializers.count(IOJava.WORKER_INITIALIZERS[0]), 'Registered twice')
+
+    def testCancelledParseLeavesOtherJobs(self):
+        otherJob = self._workerPool.submitToProcess(slowSquare, 3)
+
+        cancellationToken: CancellationToken = CancellationToken()
+        cancellationToken.cancelAfter(0.2)
+
+        parserProcess: ModelParserProcess = ModelParserProcess(pollInterval=0.01, workerPool=self._workerPool)
+
+        self.assertRaises(PluginCancelledException, lambda: parserProcess.parse(modelParser=briefParser, cancellationToken=cancellationToken))
+        self.assertEqual(9, otherJob.result(timeout=TIMEOUT), 'Cancelling a parse must not stop the other jobs')
+
+    def testFailedParseInPool(self):
+        parserProcess: ModelParserProcess = ModelParserProcess(workerPool=self._workerPool)
+
+        self.assertRaises(ModelParserException, lambda: parserProcess.parse(modelParser=crash))
+
+    def testParallelParseMatchesSerialParse(self):
+        directoryName: str = mkdtemp()
+        try:
+            with open(osPathJoin(directoryName, 'Base.py'), 'w') as sourceFile:
+                sourceFile.write('class Base:\n    def method(self, count: int = 0) -> str:\n        return str(count)\n')
+            with open(osPathJoin(directoryName, 'Child.py'), 'w') as sourceFile:
+                sourceFile.write('class Child(Base):\n    name: str = \'\'\n')
+
+            files:    List[str]              = ['Base.py', 'Child.py']
+            serial:   ReverseEngineeredModel = ReverseEngineerPython2.parseFiles(directoryName=directoryName, files=files)
+            parallel: ReverseEngineeredModel = ReverseEngineerPython2.parseFiles(directoryName=directoryName, files=files, workerPool=self._workerPool)
+        finally:
+            rmtree(directoryName)
+
+        self.assertEqual(list(serial.pyutClasses.keys()), list(parallel.pyutClasses.keys()), 'Different classes')
+        self.assertEqual([link.destinationName for link in serial.links], [link.destinationName for link in parallel.links], 'Different links')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestWorkerPool))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
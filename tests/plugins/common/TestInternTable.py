@@ -0,0 +1,122 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pickle import dumps
+from pickle import loads
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutParameters
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutType import PyutType
+
+from plugins.common.InternTable import InternStatistics
+from plugins.common.InternTable import InternTable
+
+from tests.TestBase import TestBase
+
+
+class TestInternTable(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestInternTable.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestInternTable.clsLogger
+
+        self._internTable: InternTable = InternTable()
+        self._internTable.clear()
+
+    def tearDown(self):
+        self._internTable.clear()
+
+    def testNamesShared(self):
+        firstName:  str = ''.join(['fi', 'eld'])
+        secondName: str = ''.join(['fie', 'ld'])
+
+        self.assertIsNot(firstName, secondName, 'The test needs two copies')
+        self.assertIs(self._internTable.intern(firstName), self._internTable.intern(secondName), 'The name should be shared')
+
+    def testTypesShared(self):
+        intType: PyutType = self._internTable.pyutType('int')
+
+        self.assertIs(intType, self._internTable.pyutType('int'), 'The type should be shared')
+        self.assertIsNot(intType, self._internTable.pyutType('str'), 'Different type names')
+        self.assertIs(intType, self._internTable.internType(PyutType('int')), 'A copy should be replaced')
+
+    def testStatistics(self):
+        self._internTable.pyutType('int')
+        self._internTable.pyutType('int')
+        self._internTable.intern(''.join(['se', 'lf']))
+        self._internTable.intern(''.join(['sel', 'f']))
+
+        statistics: InternStatistics = self._internTable.statistics
+
+        self.assertEqual(2, statistics.names, 'int and self')
+        self.assertEqual(1, statistics.types, 'Only int')
+        self.assertEqual(2, statistics.hits, 'The second int and self')
+        self.assertEqual(3, statistics.misses, 'The first int, its name and self')
+        self.assertGreater(statistics.savedBytes, 0, 'The duplicates were not counted')
+
+    def testUnpickledClassesShared(self):
+        pyutClasses: List[PyutClass] = [self._sampleClass('Car'), self._sampleClass('Truck')]
+        self._internTable.internClasses(pyutClasses)
+
+        copies: List[PyutClass] = loads(dumps(pyutClasses))
+        self.assertIsNot(pyutClasses[0].fields[0].type, copies[0].fields[0].type, 'The test needs copies')
+
+        self._internTable.internClasses(copies)
+
+        intType: PyutType = self._internTable.pyutType('int')
+        for pyutClass in copies:
+            pyutMethod: PyutMethod = pyutClass.methods[0]
+            self.assertIs(intType, pyutClass.fields[0].type, 'The field type should be shared')
+            self.assertIs(intType, pyutMethod.returnType, 'The return type should be shared')
+            self.assertIs(intType, pyutMethod.parameters[0].type, 'The parameter type should be shared')
+            self.assertIs(self._internTable.intern('speed'), pyutMethod.parameters[0].name, 'The parameter name should be shared')
+
+    def testClear(self):
+        intType: PyutType = self._internTable.pyutType('int')
+        self._internTable.clear()
+
+        self.assertEqual(InternStatistics(), self._internTable.statistics, 'The counters should be reset')
+        self.assertIsNot(intType, self._internTable.pyutType('int'), 'The cache should be empty')
+
+    def _sampleClass(self, name: str) -> PyutClass:
+
+        pyutClass:  PyutClass  = PyutClass(name)
+        pyutMethod: PyutMethod = PyutMethod(name='accelerate', returnType=PyutType('int'))
+
+        pyutMethod.parameters = PyutParameters([PyutParameter(name='speed', parameterType=PyutType('int'))])
+        pyutClass.fields      = [PyutField(name='speed', fieldType=PyutType('int'))]
+        pyutClass.methods     = [pyutMethod]
+
+        return pyutClass
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestInternTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
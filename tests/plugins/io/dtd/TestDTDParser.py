@@ -12,9 +12,11 @@ from unittest import TestSuite
 
 from pyutmodel.PyutClass import PyutClass
 from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutLinkType import PyutLinkType
 from wx import App
 
 from plugins.common.ElementTreeData import ElementTreeData
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.io.dtd.DTDParser import DTDParser
 
 from tests.TestBase import TestBase
@@ -50,6 +52,19 @@ class TestDTDParser(TestBase):
         self.assertEqual(TestDTDParser.EXPECTED_CLASS_COUNT, actualClassCount, 'Created class count does not match')
         self.assertEqual(TestDTDParser.EXPECTED_LINK_COUNT,  actualLinkCount,  'Incorrect number of links')
 
+    def testModelBuiltWithoutOglClasses(self):
+
+        dtdParser: DTDParser              = self._readDTD()
+        model:     ReverseEngineeredModel = dtdParser.model
+
+        self.assertEqual(TestDTDParser.EXPECTED_CLASS_COUNT, len(model.pyutClasses), 'Model class count does not match')
+        self.assertEqual(TestDTDParser.EXPECTED_LINK_COUNT,  len(model.links),       'Incorrect number of model links')
+        self.assertTrue(all(modelLink.linkType == PyutLinkType.AGGREGATION for modelLink in model.links), 'Elements aggregate their children')
+        self.assertIsNone(dtdParser.classTree['email'].oglClass, 'The Ogl classes should not exist yet')
+
+        self.assertEqual(TestDTDParser.EXPECTED_CLASS_COUNT, len(dtdParser.oglClasses), 'Created class count does not match')
+        self.assertIs(dtdParser.oglClasses[0], dtdParser.classTree[dtdParser.oglClasses[0].pyutObject.name].oglClass, 'The Ogl classes should be created once')
+
     def testPyutInformationPresent(self):
 
         dtdParser: DTDParser = self._readDTD()
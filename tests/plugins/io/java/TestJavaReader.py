@@ -8,17 +8,22 @@ from logging import getLogger
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from pickle import dumps
+from pickle import loads
+
 from pkg_resources import resource_filename
 
 from wx import App
 
 from pyutmodel.ModelTypes import Implementors
+from pyutmodel.PyutLinkType import PyutLinkType
 from ogl.OglClass import OglClass
 
 from plugins.io.java.JavaReader import Extenders
 from plugins.io.java.JavaReader import InterfaceMap
 from plugins.io.java.JavaReader import JavaReader
 from plugins.io.java.JavaReader import ReversedClasses
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 
 from tests.TestBase import TestBase
 
@@ -70,7 +75,7 @@ class TestJavaReader(TestBase):
         reverseJava: JavaReader = self._createReversedOglClasses()
 
         expectedLength: int = 1
-        actualLength:   int = len(reverseJava._subClassMap)
+        actualLength:   int = len(reverseJava.subClassMap)
         self.assertEqual(expectedLength, actualLength, "More than one base class")
 
     def testCorrectlyGeneratedSubClassEntry(self):
@@ -79,7 +84,7 @@ class TestJavaReader(TestBase):
 
         testBaseClass: OglClass = reverseJava.reversedClasses[TEST_BASE_CLASS_NAME]
 
-        self.assertIn(testBaseClass, reverseJava._subClassMap, 'Not the correct base class')
+        self.assertIn(testBaseClass, reverseJava.subClassMap, 'Not the correct base class')
 
     def testCorrectlyGeneratedSubClasses(self):
 
@@ -87,7 +92,7 @@ class TestJavaReader(TestBase):
 
         testBaseClass: OglClass = reverseJava.reversedClasses[TEST_BASE_CLASS_NAME]
 
-        extenders: Extenders = reverseJava._subClassMap[testBaseClass]
+        extenders: Extenders = reverseJava.subClassMap[testBaseClass]
 
         expectedLength: int = 3     # Because Tenant also extends BaseModel
         actualLength:   int = len(extenders)
@@ -123,6 +128,18 @@ class TestJavaReader(TestBase):
         self._checkImplementors(interfaceMap, reversedClasses, TEST_INTERFACE_NAME_2, TEST_BASE_CLASS_NAME)
         self._checkImplementors(interfaceMap, reversedClasses, TEST_INTERFACE_NAME_3, 'Feature')
 
+    def testModelSurvivesPickling(self):
+
+        reverseJava: JavaReader             = self._createReversedOglClasses()
+        model:       ReverseEngineeredModel = loads(dumps(reverseJava.model))
+
+        inheritanceLinks = [link for link in model.links if link.linkType == PyutLinkType.INHERITANCE]
+        interfaceLinks   = [link for link in model.links if link.linkType == PyutLinkType.INTERFACE]
+
+        self.assertIn(TEST_BASE_CLASS_NAME, model.pyutClasses, 'Base class missing from the model')
+        self.assertEqual(3, len(inheritanceLinks), 'Incorrect number of inheritance links')
+        self.assertEqual(3, len(interfaceLinks),   'Incorrect number of interface links')
+
     def _createReversedOglClasses(self) -> JavaReader:
 
         fileNames: List[str] = [f'{TEST_BASE_CLASS_NAME}.java', 'Feature.java', f'{TEST_INTERFACE_NAME_2}.java',
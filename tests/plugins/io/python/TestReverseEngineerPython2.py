@@ -6,6 +6,9 @@ from typing import List
 from logging import Logger
 from logging import getLogger
 
+from pickle import dumps
+from pickle import loads
+
 from miniogl.DiagramFrame import DiagramFrame
 from pkg_resources import resource_filename
 
@@ -27,6 +30,7 @@ from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
 from wx import ID_ANY
 from wx.py.frame import Frame
 
+from plugins.common.ReverseEngineeredModel import ReverseEngineeredModel
 from plugins.common.Types import OglClasses
 from plugins.common.Types import OglLinks
 from plugins.io.python.PyutPythonVisitor import DataClassProperties
@@ -93,6 +97,19 @@ class TestReverseEngineerPython2(TestBase):
         self.assertEqual(2, len(oglClasses), 'Should have gotten a simple class')
         self.assertEqual(1, len(oglLinks),   'There should be a single link')
 
+    def testParseFilesModel(self):
+
+        from os.path import dirname
+
+        fqFileName = resource_filename(TestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+
+        model: ReverseEngineeredModel = ReverseEngineerPython2.parseFiles(directoryName=dirname(fqFileName), files=['GraphElement.py', 'SimpleClass.py'])
+        model = loads(dumps(model))
+
+        self.assertEqual(2, len(model.pyutClasses), 'Should have gotten two classes')
+        self.assertEqual(1, len(model.links),       'There should be a single link')
+        self.assertEqual('GraphElement', model.links[0].destinationName, 'Wrong parent class')
+
     def testParseFieldToPyutMinimal(self):
 
         fieldDataMinimal: str = 'minVal=0'